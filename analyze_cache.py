@@ -1,8 +1,11 @@
-import json
+import sys
+from pathlib import Path
+
+from scrapers.post_cache import open_post_cache
 
 try:
-    with open('/Users/patrickgloria/Hunting-Sightings-Channel/data/cache/parsed_posts.json', 'r') as f:
-        cache = json.load(f)
+    cache_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('data/cache')
+    cache = open_post_cache(cache_dir)
     
     # Count cache entries and sightings
     total_entries = len(cache)
@@ -22,8 +25,7 @@ try:
     print(f'\nTotal cache entries: {total_entries}')
     print(f'Total sightings in arrays: {total_sightings_listed}')
     print(f'Inconsistent entries: {inconsistent_entries}')
+    cache.close()
     
-except json.JSONDecodeError as e:
-    print(f'JSON decode error: {e}')
 except Exception as e:
-    print(f'Error: {e}')
\ No newline at end of file
+    print(f'Error: {e}')
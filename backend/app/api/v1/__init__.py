@@ -1,7 +1,7 @@
 """API v1 router aggregator."""
 
 from fastapi import APIRouter
-from app.api.v1 import sightings, users
+from app.api.v1 import sightings, canonical_sightings, users
 
 api_router = APIRouter()
 
@@ -12,6 +12,12 @@ api_router.include_router(
     tags=["sightings"]
 )
 
+api_router.include_router(
+    canonical_sightings.router,
+    prefix="/canonical-sightings",
+    tags=["canonical-sightings"]
+)
+
 api_router.include_router(
     users.router,
     prefix="/users",
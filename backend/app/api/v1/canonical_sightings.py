@@ -0,0 +1,150 @@
+"""Canonical sightings API endpoints."""
+
+from typing import Optional
+from datetime import datetime
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, cast
+from sqlalchemy.orm import selectinload
+from geoalchemy2 import Geography, Geometry
+from geoalchemy2.functions import ST_MakePoint, ST_SetSRID, ST_DWithin, ST_Distance, ST_X, ST_Y
+
+from app.database import get_db
+from app.models.canonical_sighting import CanonicalSighting
+from app.schemas.sighting import (
+    CanonicalSightingResponse,
+    CanonicalSightingListResponse,
+    SightingSourceResponse
+)
+from app.config import get_settings
+
+router = APIRouter()
+settings = get_settings()
+
+METERS_PER_MILE = 1609.34
+
+
+def _to_response(
+    canonical: CanonicalSighting,
+    lat: Optional[float],
+    lon: Optional[float],
+    distance_meters: Optional[float] = None
+) -> CanonicalSightingResponse:
+    """Build the response for one canonical sighting and its sources."""
+    return CanonicalSightingResponse(
+        id=canonical.id,
+        species=canonical.species,
+        raw_text=canonical.raw_text,
+        location_name=canonical.location_name,
+        location_lat=lat,
+        location_lon=lon,
+        location_confidence_radius=canonical.location_confidence_radius,
+        gmu_unit=canonical.gmu_unit,
+        sighting_date=canonical.sighting_date,
+        last_sighting_date=canonical.last_sighting_date,
+        confidence_score=canonical.confidence_score,
+        source_type=canonical.source_type,
+        source_url=canonical.source_url,
+        report_count=canonical.report_count,
+        source_count=canonical.source_count,
+        source_types=canonical.source_types or [],
+        sources=[SightingSourceResponse.model_validate(source) for source in canonical.sources],
+        created_at=canonical.created_at,
+        distance_miles=distance_meters / METERS_PER_MILE if distance_meters is not None else None
+    )
+
+
+@router.get("/", response_model=CanonicalSightingListResponse)
+async def get_canonical_sightings(
+    db: AsyncSession = Depends(get_db),
+    gmu: Optional[int] = Query(None, description="Filter by GMU unit"),
+    species: Optional[str] = Query(None, description="Filter by species"),
+    source: Optional[str] = Query(None, description="Filter by a reporting source type"),
+    start_date: Optional[datetime] = Query(None, description="Start date filter"),
+    end_date: Optional[datetime] = Query(None, description="End date filter"),
+    min_sources: int = Query(1, ge=1, description="Minimum distinct source types (2+ = cross-source confirmed)"),
+    lat: Optional[float] = Query(None, description="User latitude for distance calculation"),
+    lon: Optional[float] = Query(None, description="User longitude for distance calculation"),
+    radius_miles: Optional[float] = Query(None, description="Filter within radius (miles)"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size)
+):
+    """
+    Get paginated list of canonical sightings, one per real-world sighting,
+    each with the source reports it was merged from.
+    """
+    point = cast(CanonicalSighting.location, Geometry)
+    user_point = None
+    if lat is not None and lon is not None:
+        user_point = cast(ST_SetSRID(ST_MakePoint(lon, lat), 4326), Geography)
+    distance = ST_Distance(CanonicalSighting.location, user_point) if user_point is not None else None
+
+    query = select(CanonicalSighting, ST_Y(point).label("lat"), ST_X(point).label("lon"))
+    if distance is not None:
+        query = query.add_columns(distance.label("distance"))
+
+    filters = []
+    if gmu:
+        filters.append(CanonicalSighting.gmu_unit == gmu)
+    if species:
+        filters.append(CanonicalSighting.species.ilike(f"%{species.lower()}%"))
+    if source:
+        filters.append(CanonicalSighting.source_types.any(source))
+    if start_date:
+        filters.append(CanonicalSighting.sighting_date >= start_date)
+    if end_date:
+        filters.append(CanonicalSighting.sighting_date <= end_date)
+    if min_sources > 1:
+        filters.append(CanonicalSighting.source_count >= min_sources)
+    if user_point is not None and radius_miles:
+        filters.append(ST_DWithin(CanonicalSighting.location, user_point, radius_miles * METERS_PER_MILE))
+
+    if filters:
+        query = query.where(and_(*filters))
+
+    count_query = select(func.count()).select_from(CanonicalSighting)
+    if filters:
+        count_query = count_query.where(and_(*filters))
+    total = await db.scalar(count_query) or 0
+
+    query = query.options(selectinload(CanonicalSighting.sources))
+    query = query.order_by(CanonicalSighting.sighting_date.desc())
+    query = query.offset((page - 1) * page_size).limit(page_size)
+
+    result = await db.execute(query)
+    items = [
+        _to_response(row.CanonicalSighting, row.lat, row.lon, getattr(row, "distance", None))
+        for row in result
+    ]
+
+    return CanonicalSightingListResponse(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        pages=(total + page_size - 1) // page_size
+    )
+
+
+@router.get("/{canonical_id}", response_model=CanonicalSightingResponse)
+async def get_canonical_sighting(
+    canonical_id: UUID,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get a specific canonical sighting and its source reports by ID.
+    """
+    point = cast(CanonicalSighting.location, Geometry)
+    query = (
+        select(CanonicalSighting, ST_Y(point).label("lat"), ST_X(point).label("lon"))
+        .where(CanonicalSighting.id == canonical_id)
+        .options(selectinload(CanonicalSighting.sources))
+    )
+    result = await db.execute(query)
+    row = result.first()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="Sighting not found")
+
+    return _to_response(row.CanonicalSighting, row.lat, row.lon)
@@ -2,8 +2,9 @@
 
 from app.database import Base
 from app.models.sighting import Sighting
+from app.models.canonical_sighting import CanonicalSighting, SightingProvenance
 from app.models.user import UserPreferences
 from app.models.gmu import GMU
 from app.models.trail import Trail
 
-__all__ = ["Base", "Sighting", "UserPreferences", "GMU", "Trail"]
+__all__ = ["Base", "Sighting", "CanonicalSighting", "SightingProvenance", "UserPreferences", "GMU", "Trail"]
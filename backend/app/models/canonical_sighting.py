@@ -0,0 +1,68 @@
+"""Canonical sighting and provenance models."""
+
+from sqlalchemy import Column, String, Float, DateTime, Integer, Text, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy.orm import relationship
+from geoalchemy2 import Geography
+from app.database import Base
+
+
+class CanonicalSighting(Base):
+    """
+    One real-world sighting, merged from the source reports that share a
+    cluster_id. Maintained by the database (scripts/add_canonical_sightings.sql);
+    read-only for the API.
+    """
+
+    __tablename__ = "canonical_sightings"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    species = Column(String(50), nullable=False, index=True)
+    raw_text = Column(Text)
+    location_name = Column(Text)
+    location = Column(Geography(geometry_type='POINT', srid=4326))
+    location_confidence_radius = Column(Float)
+    gmu_unit = Column(Integer, index=True)
+    sighting_date = Column(DateTime(timezone=True), index=True)
+    last_sighting_date = Column(DateTime(timezone=True))
+    confidence_score = Column(Float)
+    source_type = Column(String(50))
+    source_url = Column(Text)
+    report_count = Column(Integer, nullable=False, default=1)
+    source_count = Column(Integer, nullable=False, default=1)
+    source_types = Column(ARRAY(Text))
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+
+    sources = relationship(
+        "SightingProvenance",
+        back_populates="canonical",
+        order_by="SightingProvenance.reported_at"
+    )
+
+    def __repr__(self):
+        return f"<CanonicalSighting {self.species} ({self.report_count} reports)>"
+
+
+class SightingProvenance(Base):
+    """One source report (sightings row) of a canonical sighting."""
+
+    __tablename__ = "sighting_provenance"
+
+    sighting_id = Column(UUID(as_uuid=True), ForeignKey("sightings.id", ondelete="CASCADE"), primary_key=True)
+    canonical_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("canonical_sightings.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    source_type = Column(String(50), index=True)
+    source_url = Column(Text)
+    sighting_date = Column(DateTime(timezone=True))
+    confidence_score = Column(Float)
+    reported_at = Column(DateTime(timezone=True))
+
+    canonical = relationship("CanonicalSighting", back_populates="sources")
+
+    def __repr__(self):
+        return f"<SightingProvenance {self.source_type} -> {self.canonical_id}>"
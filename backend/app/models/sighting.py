@@ -1,7 +1,7 @@
 """Sighting model for wildlife observations."""
 
-from sqlalchemy import Column, String, Float, DateTime, Integer, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Float, DateTime, Integer, Text, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from geoalchemy2 import Geography
 from datetime import datetime
 import uuid
@@ -35,5 +35,14 @@ class Sighting(Base):
     # For deduplication
     content_hash = Column(String(32), unique=True, index=True)
     
+    # Near-duplicate detection (MinHash signature of raw_text and its LSH band keys)
+    minhash = Column(Text)
+    minhash_bands = Column(ARRAY(Text))
+    near_duplicate_of = Column(UUID(as_uuid=True), ForeignKey("sightings.id", ondelete="SET NULL"))
+    
+    # Ingest-time dedup index: candidate keys and the duplicate cluster this sighting belongs to
+    dedup_keys = Column(ARRAY(Text))
+    cluster_id = Column(UUID(as_uuid=True), index=True)
+    
     def __repr__(self):
         return f"<Sighting {self.species} at {self.trail_name or 'Unknown'}>"
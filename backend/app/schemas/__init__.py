@@ -5,7 +5,10 @@ from app.schemas.sighting import (
     SightingCreate,
     SightingResponse,
     SightingListResponse,
-    SightingStats
+    SightingStats,
+    SightingSourceResponse,
+    CanonicalSightingResponse,
+    CanonicalSightingListResponse
 )
 from app.schemas.user import (
     UserSignUp,
@@ -25,6 +28,9 @@ __all__ = [
     "SightingResponse",
     "SightingListResponse",
     "SightingStats",
+    "SightingSourceResponse",
+    "CanonicalSightingResponse",
+    "CanonicalSightingListResponse",
     # User schemas
     "UserSignUp",
     "UserSignIn",
@@ -51,6 +51,50 @@ class SightingListResponse(BaseModel):
     pages: int
 
 
+class SightingSourceResponse(BaseModel):
+    """One source report of a canonical sighting."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    sighting_id: UUID
+    source_type: Optional[str] = None
+    source_url: Optional[str] = None
+    sighting_date: Optional[datetime] = None
+    confidence_score: Optional[float] = None
+    reported_at: Optional[datetime] = None
+
+
+class CanonicalSightingResponse(BaseModel):
+    """A real-world sighting merged from one or more source reports."""
+    id: UUID
+    species: str
+    raw_text: Optional[str] = None
+    location_name: Optional[str] = None
+    location_lat: Optional[float] = None
+    location_lon: Optional[float] = None
+    location_confidence_radius: Optional[float] = None
+    gmu_unit: Optional[int] = None
+    sighting_date: Optional[datetime] = None
+    last_sighting_date: Optional[datetime] = None
+    confidence_score: Optional[float] = None
+    source_type: Optional[str] = None
+    source_url: Optional[str] = None
+    report_count: int = 1
+    source_count: int = 1
+    source_types: List[str] = []
+    sources: List[SightingSourceResponse] = []
+    created_at: Optional[datetime] = None
+    distance_miles: Optional[float] = None  # Distance from user's location
+
+
+class CanonicalSightingListResponse(BaseModel):
+    """Paginated list of canonical sightings."""
+    items: List[CanonicalSightingResponse]
+    total: int
+    page: int = 1
+    page_size: int
+    pages: int
+
+
 class SightingStats(BaseModel):
     """Statistics about sightings."""
     total_sightings: int
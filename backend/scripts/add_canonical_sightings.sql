@@ -0,0 +1,189 @@
+-- Canonical sighting entities with per-report provenance
+-- (requires add_dedup_index_fields.sql). Every sightings row is one source
+-- report; reports sharing a cluster_id form one canonical sighting, and a
+-- report without a cluster is its own entity (keyed by its id).
+
+CREATE TABLE IF NOT EXISTS canonical_sightings (
+    id UUID PRIMARY KEY,
+    species VARCHAR(50) NOT NULL,
+    raw_text TEXT,
+    location_name TEXT,
+    location GEOGRAPHY(POINT, 4326),
+    location_confidence_radius FLOAT,
+    gmu_unit INTEGER,
+    sighting_date TIMESTAMPTZ,
+    last_sighting_date TIMESTAMPTZ,
+    confidence_score FLOAT,
+    source_type VARCHAR(50),
+    source_url TEXT,
+    report_count INTEGER NOT NULL DEFAULT 1,
+    source_count INTEGER NOT NULL DEFAULT 1,
+    source_types TEXT[],
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS sighting_provenance (
+    sighting_id UUID PRIMARY KEY REFERENCES sightings(id) ON DELETE CASCADE,
+    canonical_id UUID NOT NULL REFERENCES canonical_sightings(id) ON DELETE CASCADE,
+    source_type VARCHAR(50),
+    source_url TEXT,
+    sighting_date TIMESTAMPTZ,
+    confidence_score FLOAT,
+    reported_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_canonical_sightings_species ON canonical_sightings(species);
+CREATE INDEX IF NOT EXISTS idx_canonical_sightings_sighting_date ON canonical_sightings(sighting_date DESC);
+CREATE INDEX IF NOT EXISTS idx_canonical_sightings_gmu_unit ON canonical_sightings(gmu_unit);
+CREATE INDEX IF NOT EXISTS idx_canonical_sightings_source_count ON canonical_sightings(source_count) WHERE source_count > 1;
+CREATE INDEX IF NOT EXISTS idx_canonical_sightings_location ON canonical_sightings USING GIST (location);
+-- Entities rebuilt since a given time (scripts/merge_duplicate_sightings.py)
+CREATE INDEX IF NOT EXISTS idx_canonical_sightings_updated_at ON canonical_sightings(updated_at);
+CREATE INDEX IF NOT EXISTS idx_sighting_provenance_canonical_id ON sighting_provenance(canonical_id);
+CREATE INDEX IF NOT EXISTS idx_sighting_provenance_source_type ON sighting_provenance(source_type);
+
+-- Entity key of a report, used to find the members of an entity
+CREATE INDEX IF NOT EXISTS idx_sightings_canonical_key ON sightings ((COALESCE(cluster_id, id)));
+
+
+-- Rebuild the given entities from their member reports.
+-- The entity keeps the best located report's location (smallest radius),
+-- the longest text, the highest confidence and the date span of its
+-- reports; source_url and source_type are those of the first report, and
+-- every report stays listed in sighting_provenance.
+CREATE OR REPLACE FUNCTION refresh_canonical_sightings(canonical_ids UUID[])
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO canonical_sightings (
+        id, species, raw_text, location_name, location, location_confidence_radius, gmu_unit,
+        sighting_date, last_sighting_date, confidence_score, source_type, source_url,
+        report_count, source_count, source_types, created_at, updated_at
+    )
+    SELECT
+        COALESCE(s.cluster_id, s.id),
+        (array_agg(s.species ORDER BY s.created_at))[1],
+        (array_agg(s.raw_text ORDER BY length(s.raw_text) DESC NULLS LAST))[1],
+        (array_agg(s.location_name ORDER BY s.location IS NULL, s.location_confidence_radius NULLS LAST, s.created_at))[1],
+        (array_agg(s.location ORDER BY s.location IS NULL, s.location_confidence_radius NULLS LAST, s.created_at))[1],
+        (array_agg(s.location_confidence_radius ORDER BY s.location IS NULL, s.location_confidence_radius NULLS LAST, s.created_at))[1],
+        (array_agg(s.gmu_unit ORDER BY s.gmu_unit IS NULL, s.created_at))[1],
+        MIN(s.sighting_date),
+        MAX(s.sighting_date),
+        MAX(s.confidence_score),
+        (array_agg(s.source_type ORDER BY s.created_at))[1],
+        (array_agg(s.source_url ORDER BY s.created_at))[1],
+        COUNT(*),
+        COUNT(DISTINCT s.source_type),
+        array_agg(DISTINCT s.source_type),
+        MIN(s.created_at),
+        NOW()
+    FROM sightings s
+    WHERE COALESCE(s.cluster_id, s.id) = ANY(canonical_ids)
+    GROUP BY COALESCE(s.cluster_id, s.id)
+    ON CONFLICT (id) DO UPDATE SET
+        species = EXCLUDED.species,
+        raw_text = EXCLUDED.raw_text,
+        location_name = EXCLUDED.location_name,
+        location = EXCLUDED.location,
+        location_confidence_radius = EXCLUDED.location_confidence_radius,
+        gmu_unit = EXCLUDED.gmu_unit,
+        sighting_date = EXCLUDED.sighting_date,
+        last_sighting_date = EXCLUDED.last_sighting_date,
+        confidence_score = EXCLUDED.confidence_score,
+        source_type = EXCLUDED.source_type,
+        source_url = EXCLUDED.source_url,
+        report_count = EXCLUDED.report_count,
+        source_count = EXCLUDED.source_count,
+        source_types = EXCLUDED.source_types,
+        created_at = EXCLUDED.created_at,
+        updated_at = NOW();
+
+    INSERT INTO sighting_provenance (
+        sighting_id, canonical_id, source_type, source_url, sighting_date, confidence_score, reported_at
+    )
+    SELECT s.id, COALESCE(s.cluster_id, s.id), s.source_type, s.source_url,
+           s.sighting_date, s.confidence_score, s.created_at
+    FROM sightings s
+    WHERE COALESCE(s.cluster_id, s.id) = ANY(canonical_ids)
+    ON CONFLICT (sighting_id) DO UPDATE SET
+        canonical_id = EXCLUDED.canonical_id,
+        source_type = EXCLUDED.source_type,
+        source_url = EXCLUDED.source_url,
+        sighting_date = EXCLUDED.sighting_date,
+        confidence_score = EXCLUDED.confidence_score,
+        reported_at = EXCLUDED.reported_at;
+
+    -- Entities merged into another one, or whose reports were deleted
+    DELETE FROM canonical_sightings c
+    WHERE c.id = ANY(canonical_ids)
+      AND NOT EXISTS (SELECT 1 FROM sighting_provenance p WHERE p.canonical_id = c.id);
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Union step of the server-side union-find: move whole clusters and
+-- unclustered reports into target in one statement (the trigger below
+-- rebuilds the affected entities).
+CREATE OR REPLACE FUNCTION merge_sighting_clusters(target UUID, cluster_ids UUID[], sighting_ids UUID[])
+RETURNS INTEGER AS $$
+DECLARE
+    moved INTEGER;
+BEGIN
+    UPDATE sightings
+    SET cluster_id = target
+    WHERE cluster_id = ANY(cluster_ids) OR id = ANY(sighting_ids);
+    GET DIAGNOSTICS moved = ROW_COUNT;
+    RETURN moved;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Keep entities current for every writer (scrapers, Supabase upserts, scripts)
+CREATE OR REPLACE FUNCTION sightings_refresh_canonical()
+RETURNS TRIGGER AS $$
+DECLARE
+    keys UUID[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT COALESCE(cluster_id, id)) INTO keys FROM new_rows;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT array_agg(DISTINCT key) INTO keys FROM (
+            SELECT COALESCE(cluster_id, id) AS key FROM old_rows
+            UNION
+            SELECT COALESCE(cluster_id, id) FROM new_rows
+        ) affected;
+    ELSE
+        SELECT array_agg(DISTINCT COALESCE(cluster_id, id)) INTO keys FROM old_rows;
+    END IF;
+    IF keys IS NOT NULL THEN
+        PERFORM refresh_canonical_sightings(keys);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS sightings_canonical_insert ON sightings;
+CREATE TRIGGER sightings_canonical_insert
+AFTER INSERT ON sightings
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sightings_refresh_canonical();
+
+DROP TRIGGER IF EXISTS sightings_canonical_update ON sightings;
+CREATE TRIGGER sightings_canonical_update
+AFTER UPDATE ON sightings
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sightings_refresh_canonical();
+
+DROP TRIGGER IF EXISTS sightings_canonical_delete ON sightings;
+CREATE TRIGGER sightings_canonical_delete
+AFTER DELETE ON sightings
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sightings_refresh_canonical();
+
+-- Build entities for the existing reports
+SELECT refresh_canonical_sightings(array_agg(DISTINCT COALESCE(cluster_id, id))) FROM sightings;
+
+COMMENT ON TABLE canonical_sightings IS 'One row per real-world sighting, merged from the reports that share a cluster_id';
+COMMENT ON TABLE sighting_provenance IS 'One row per source report (sightings row) of a canonical sighting';
+COMMENT ON COLUMN canonical_sightings.source_count IS 'Distinct source types reporting this sighting; above 1 means a cross-source confirmation';
@@ -0,0 +1,30 @@
+-- Add the ingest-time dedup index to the sightings tables
+-- (see processors/incremental_dedup.py; requires add_near_duplicate_fields.sql,
+-- enable with INGEST_DEDUP=1 after building the index with scripts/build_dedup_index.py)
+ALTER TABLE sightings
+ADD COLUMN IF NOT EXISTS dedup_keys TEXT[],
+ADD COLUMN IF NOT EXISTS cluster_id UUID;
+
+ALTER TABLE wildlife_sightings
+ADD COLUMN IF NOT EXISTS dedup_keys TEXT[],
+ADD COLUMN IF NOT EXISTS cluster_id UUID;
+
+-- Candidate lookup: dedup_keys && ARRAY[...] uses these
+CREATE INDEX IF NOT EXISTS idx_sightings_dedup_keys
+ON sightings USING GIN (dedup_keys);
+
+CREATE INDEX IF NOT EXISTS idx_wildlife_sightings_dedup_keys
+ON wildlife_sightings USING GIN (dedup_keys);
+
+-- Cluster membership and merges
+CREATE INDEX IF NOT EXISTS idx_sightings_cluster_id
+ON sightings(cluster_id)
+WHERE cluster_id IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_wildlife_sightings_cluster_id
+ON wildlife_sightings(cluster_id)
+WHERE cluster_id IS NOT NULL;
+
+-- Comment on new columns
+COMMENT ON COLUMN sightings.dedup_keys IS 'MinHash band keys and spatio-temporal bucket key used to find duplicate candidates at ingest';
+COMMENT ON COLUMN sightings.cluster_id IS 'Duplicate cluster shared by sightings of the same event; NULL when the sighting has no duplicates';
@@ -0,0 +1,47 @@
+-- Add MinHash near-duplicate fields to the sightings tables
+-- (see processors/near_duplicates.py; enable the insert-time check with NEAR_DUPLICATE_CHECK=1)
+ALTER TABLE sightings
+ADD COLUMN IF NOT EXISTS minhash TEXT,
+ADD COLUMN IF NOT EXISTS minhash_bands TEXT[],
+ADD COLUMN IF NOT EXISTS near_duplicate_of UUID REFERENCES sightings(id) ON DELETE SET NULL;
+
+ALTER TABLE wildlife_sightings
+ADD COLUMN IF NOT EXISTS minhash TEXT,
+ADD COLUMN IF NOT EXISTS minhash_bands TEXT[],
+ADD COLUMN IF NOT EXISTS near_duplicate_of TEXT;
+
+-- Candidate lookup: minhash_bands && ARRAY[...] uses these
+CREATE INDEX IF NOT EXISTS idx_sightings_minhash_bands
+ON sightings USING GIN (minhash_bands);
+
+CREATE INDEX IF NOT EXISTS idx_wildlife_sightings_minhash_bands
+ON wildlife_sightings USING GIN (minhash_bands);
+
+CREATE INDEX IF NOT EXISTS idx_sightings_near_duplicate_of
+ON sightings(near_duplicate_of)
+WHERE near_duplicate_of IS NOT NULL;
+
+-- Bulk update for scripts/find_near_duplicates.py: one statement per batch, so
+-- the canonical refresh trigger (add_canonical_sightings.sql) fires once per
+-- batch rather than once per row. NULL fields keep their current value.
+-- updates is a JSON array of {id, minhash, minhash_bands, near_duplicate_of}.
+CREATE OR REPLACE FUNCTION set_near_duplicate_fields(updates JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated INTEGER;
+BEGIN
+    UPDATE sightings s
+    SET minhash = COALESCE(u.minhash, s.minhash),
+        minhash_bands = COALESCE(u.minhash_bands, s.minhash_bands),
+        near_duplicate_of = COALESCE(u.near_duplicate_of, s.near_duplicate_of)
+    FROM jsonb_to_recordset(updates) AS u(id UUID, minhash TEXT, minhash_bands TEXT[], near_duplicate_of UUID)
+    WHERE s.id = u.id;
+    GET DIAGNOSTICS updated = ROW_COUNT;
+    RETURN updated;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Comment on new columns
+COMMENT ON COLUMN sightings.minhash IS 'Base64 MinHash signature (128 x uint32) of normalized raw_text shingles';
+COMMENT ON COLUMN sightings.minhash_bands IS 'LSH band keys of the signature; sightings sharing a key are near-duplicate candidates';
+COMMENT ON COLUMN sightings.near_duplicate_of IS 'Earlier sighting whose raw_text this one nearly duplicates';
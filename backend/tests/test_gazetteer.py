@@ -0,0 +1,94 @@
+import pytest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from processors.gazetteer import Gazetteer
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return Gazetteer()
+
+
+class TestGazetteer:
+    """Test cases for place-name geocoding against the bundled data."""
+
+    def test_qualifier_selects_landmark(self, gazetteer):
+        """'Bear Lake in RMNP' finds the RMNP landmark, not the Bear Lake trail near Leadville."""
+        for name in ("Bear Lake in RMNP", "Bear Lake (RMNP)", "Bear Lake, RMNP"):
+            result = gazetteer.geocode(name)
+            assert result is not None, name
+            assert result['matched_name'] == 'Bear Lake (RMNP)', name
+            assert result['coordinates'][0] == pytest.approx(40.3845, abs=0.01)
+
+    def test_stripped_name_must_agree_with_qualifier(self, gazetteer):
+        """A place name far from its qualifier falls back to the qualifier."""
+        result = gazetteer.geocode("Bear Lake near Estes Park")
+        assert result['matched_name'] == 'Estes Park'
+
+    def test_stripped_name_must_agree_with_estimate(self, gazetteer):
+        """With an unknown qualifier the caller's estimate decides."""
+        assert gazetteer.geocode("Bear Lake, somewhere", near=[40.38, -105.68]) is None
+        result = gazetteer.geocode("Bear Lake, somewhere", near=[39.30, -106.42])
+        assert result['matched_name'] == 'Bear Lake'
+
+    def test_generic_names_are_not_aliased(self, gazetteer):
+        """Bare generic words never resolve to a trail that happens to contain them."""
+        assert gazetteer.geocode("Lake") is None
+        gazetteer.geocode("Mt. Elbert")  # Load the indexes
+        for word in ('lake', 'park', 'peak', 'north park'):
+            assert word not in gazetteer.alias_index
+
+        result = gazetteer.geocode("North Park")
+        assert result['matched_name'] == 'North Park'
+        assert result['gmu_number'] != 391
+
+    def test_gmu_near_town(self, gazetteer):
+        """'unit 12 near Durango' is placed at Durango, which has no GMU of its own."""
+        result = gazetteer.geocode("unit 12 near Durango")
+        assert result['matched_name'] == 'Durango'
+        assert result['gmu_number'] is None
+
+    def test_gmu_numbers_are_ints(self, gazetteer):
+        """GMUs come back as ints, like the LLM returns them."""
+        assert gazetteer.geocode("unit 12")['gmu_number'] == 12
+        assert gazetteer.geocode("Mt. Elbert")['gmu_number'] == 48
+        assert gazetteer.lookup_gmu(48)['gmu_number'] == 48
+
+    def test_aliases_and_abbreviations(self, gazetteer):
+        """Suffix aliases and abbreviations still resolve."""
+        assert gazetteer.geocode("Conundrum Creek Trailhead")['matched_name'] == 'Conundrum Creek Trail'
+        assert gazetteer.geocode("rawah")['matched_name'] == 'Rawah Trail'
+        assert gazetteer.geocode("Quandary Pk, Breckenridge")['matched_name'] == 'Quandary Peak'
+
+
+class TestApplyGazetteer:
+    """Test how gazetteer hits are merged into LLM location data."""
+
+    @staticmethod
+    def apply(gazetteer, sighting_data):
+        from types import SimpleNamespace
+        from scrapers.llm_validator import LLMValidator
+        LLMValidator._apply_gazetteer(SimpleNamespace(gazetteer=gazetteer), sighting_data)
+        return sighting_data
+
+    def test_keeps_llm_gmu_when_gazetteer_has_none(self, gazetteer):
+        """'Finally got my bull elk in unit 12 near Durango' keeps GMU 12."""
+        data = self.apply(gazetteer, {'location_name': 'near Durango', 'gmu_number': '12',
+                                      'coordinates': [37.30, -107.85]})
+        assert data['gmu_number'] == 12
+        assert data['coordinates'] == [37.2753, -107.8801]
+        assert data['geocode_source'] == 'gazetteer'
+
+    def test_gazetteer_gmu_is_int(self, gazetteer):
+        """The gazetteer's GMU replaces a missing one as an int."""
+        data = self.apply(gazetteer, {'location_name': 'Mt. Elbert'})
+        assert data['gmu_number'] == 48
+
+    def test_distant_match_keeps_llm_coordinates(self, gazetteer):
+        """A same-named place far from the LLM's estimate does not replace it."""
+        data = self.apply(gazetteer, {'location_name': 'Bear Lake', 'gmu_number': 20,
+                                      'coordinates': [40.3845, -105.6824]})
+        assert data['coordinates'] == [40.3845, -105.6824]
+        assert data['gmu_number'] == 20
+        assert data['geocode_source'] == 'llm'
@@ -0,0 +1,102 @@
+import pytest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from processors.near_duplicates import (
+    LSHIndex, MinHasher, band_keys, cluster_near_duplicates, decode_signature,
+    encode_signature, estimate_similarity, shingles
+)
+
+
+REPORT = ("Saw a big black bear crossing the road near the Bear Lake trailhead "
+          "around 7am this morning, it ran off into the aspens when a car came by")
+REPOST = ("> Saw a big black bear crossing the road near the Bear Lake trailhead "
+          "around 7am this morning, it ran off into the aspens when a car came by!! "
+          "https://example.com/photo.jpg")
+EDITED = ("Saw a big black bear crossing the road near the Bear Lake trailhead "
+          "around 7am this morning, it ran off into the aspens when a truck came by")
+OTHER = ("Two bull elk bugling in the meadow below Trail Ridge Road at dusk, "
+         "about forty cows with them and a few photographers watching from the pullout")
+
+
+@pytest.fixture(scope="module")
+def hasher():
+    return MinHasher()
+
+
+class TestMinHasher:
+    """Test cases for MinHash signatures."""
+
+    def test_short_text_is_not_signed(self, hasher):
+        """Texts with too few shingles get no signature instead of a 1.0 match."""
+        assert hasher.signature("Black bear") is None
+        assert hasher.signature("black bear!") is None
+        assert hasher.signature("") is None
+        assert hasher.signature("saw a black bear today") is None
+        assert hasher.signature("saw a black bear near town") is not None
+
+    def test_shorter_than_one_shingle(self):
+        """Fewer words than the shingle size yield no shingles at all."""
+        assert shingles("Black bear") == set()
+        assert shingles("a black bear") == {'a black bear'}
+
+    def test_normalization(self, hasher):
+        """Case, punctuation, quote markers and URLs do not change the signature."""
+        assert (hasher.signature(REPORT) == hasher.signature(REPOST)).all()
+
+    def test_similarity_estimates(self, hasher):
+        """A light edit stays similar; an unrelated report does not."""
+        report = hasher.signature(REPORT)
+        assert estimate_similarity(report, hasher.signature(EDITED)) > 0.75
+        assert estimate_similarity(report, hasher.signature(OTHER)) < 0.1
+
+    def test_signatures_are_stable(self, hasher):
+        """Signatures match across instances and survive encoding."""
+        signature = hasher.signature(REPORT)
+        assert signature.dtype.name == 'uint32' and len(signature) == 128
+        assert (MinHasher().signature(REPORT) == signature).all()
+        assert (decode_signature(encode_signature(signature)) == signature).all()
+
+
+class TestLSHIndex:
+    """Test cases for LSH candidate lookup."""
+
+    def test_query(self, hasher):
+        """Near-duplicates are found and ranked; unrelated texts are not."""
+        index = LSHIndex()
+        index.add('edited', hasher.signature(EDITED))
+        index.add('other', hasher.signature(OTHER))
+        index.add('repost', hasher.signature(REPOST))
+        assert len(index) == 3
+
+        matches = index.query(hasher.signature(REPORT))
+        assert [key for key, _ in matches] == ['repost', 'edited']
+        assert matches[0][1] == 1.0
+
+    def test_threshold(self, hasher):
+        """Candidates below the threshold are dropped."""
+        index = LSHIndex()
+        index.add('edited', hasher.signature(EDITED))
+        assert index.query(hasher.signature(REPORT), threshold=1.0) == []
+
+    def test_band_keys(self, hasher):
+        """Shared band keys mirror shared LSH candidates."""
+        report = band_keys(hasher.signature(REPORT))
+        assert len(report) == 32
+        assert set(report) & set(band_keys(hasher.signature(EDITED)))
+        assert not set(report) & set(band_keys(hasher.signature(OTHER)))
+
+
+class TestClusterNearDuplicates:
+    """Test cases for batch clustering."""
+
+    def test_transitive_clusters(self, hasher):
+        """Pairs join transitively and members keep input order."""
+        signatures = [(key, hasher.signature(text)) for key, text in
+                      (('other', OTHER), ('edited', EDITED), ('report', REPORT), ('repost', REPOST))]
+        assert cluster_near_duplicates(signatures) == [['edited', 'report', 'repost']]
+
+    def test_no_clusters(self, hasher):
+        """Distinct texts form no clusters."""
+        signatures = [('report', hasher.signature(REPORT)), ('other', hasher.signature(OTHER))]
+        assert cluster_near_duplicates(signatures) == []
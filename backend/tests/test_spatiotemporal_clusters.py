@@ -0,0 +1,159 @@
+import math
+import pytest
+import struct
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from processors.incremental_dedup import IncrementalDeduplicator
+from processors.spatiotemporal_clusters import (
+    SpatioTemporalClusterer, cluster_sightings, event_fields, sighting_coordinates
+)
+
+
+def sighting(key, lat, lon, day='2024-09-20', radius=0.0, species='elk', **extra):
+    return dict(id=key, species=species, coordinates=[lat, lon], sighting_date=day,
+                location_confidence_radius=radius, **extra)
+
+
+def clustered_ids(sightings, **kwargs):
+    return [[s['id'] for s in cluster] for cluster in cluster_sightings(sightings, **kwargs)]
+
+
+class TestBuckets:
+    """Test that neighbouring buckets cover every possible match."""
+
+    def test_across_cell_edge(self):
+        """Sightings either side of a grid row boundary still match."""
+        clusterer = SpatioTemporalClusterer()
+        edge = 553 * clusterer.cell_degrees
+        a, b = sighting('a', edge - 0.001, -105.6), sighting('b', edge + 0.001, -105.6)
+        assert clusterer.bucket(event_fields(a)) != clusterer.bucket(event_fields(b))
+        assert clustered_ids([a, b]) == [['a', 'b']]
+
+    def test_across_columns_at_high_latitude(self):
+        """Longitude cells shrink with latitude, so more columns are searched."""
+        clusterer = SpatioTemporalClusterer()
+        edge = math.floor(-105.0 / clusterer.cell_degrees) * clusterer.cell_degrees
+        a, b = sighting('a', 60.0, edge - 0.001, radius=3), sighting('b', 60.0, edge + 0.12, radius=3)
+        bucket_a, bucket_b = clusterer.bucket(event_fields(a)), clusterer.bucket(event_fields(b))
+        assert bucket_b[3] - bucket_a[3] == 2
+        assert bucket_b in clusterer.neighbour_buckets(event_fields(a))
+        assert clustered_ids([a, b]) == [['a', 'b']]
+
+    def test_across_time_bucket_edge(self):
+        """Adjacent days fall in different buckets but within the window."""
+        a, b = sighting('a', 40.0, -105.6, day='2024-09-20'), sighting('b', 40.0, -105.6, day='2024-09-21')
+        c = sighting('c', 40.0, -105.6, day='2024-09-23')
+        assert clustered_ids([a, b, c]) == [['a', 'b']]
+        assert clustered_ids([a, c], window_days=3) == [['a', 'c']]
+
+    def test_species_and_location_name(self):
+        """Different species never match; sightings without coordinates match by name."""
+        assert clustered_ids([sighting('a', 40.0, -105.6), sighting('b', 40.0, -105.6, species='moose')]) == []
+        named = [dict(id=key, species='elk', sighting_date='2024-09-20', location_name=name)
+                 for key, name in (('a', 'Bear Lake'), ('b', 'bear lake '), ('c', 'Sprague Lake'))]
+        assert clustered_ids(named) == [['a', 'b']]
+
+
+class TestMatchDistance:
+    """Test the cap and floor on the combined confidence radius."""
+
+    def test_radius_cap(self):
+        """Vague sightings match only within max_distance_miles."""
+        clusterer = SpatioTemporalClusterer()
+        near = event_fields(sighting('a', 40.0, -105.6, radius=35))
+        assert clusterer.same_event(near, event_fields(sighting('b', 40.06, -105.6, radius=35)))
+        assert not clusterer.same_event(near, event_fields(sighting('c', 40.1, -105.6, radius=35)))
+
+    def test_radius_floor(self):
+        """Sightings without a radius still match within min_distance_miles."""
+        clusterer = SpatioTemporalClusterer()
+        exact = event_fields(sighting('a', 40.0, -105.6))
+        assert clusterer.same_event(exact, event_fields(sighting('b', 40.003, -105.6)))
+        assert not clusterer.same_event(exact, event_fields(sighting('c', 40.006, -105.6)))
+
+    def test_combined_radius(self):
+        """Between the floor and the cap the two radii add up."""
+        clusterer = SpatioTemporalClusterer()
+        a = event_fields(sighting('a', 40.0, -105.6, radius=1))
+        assert clusterer.same_event(a, event_fields(sighting('b', 40.025, -105.6, radius=1)))
+        assert not clusterer.same_event(a, event_fields(sighting('c', 40.025, -105.6, radius=0.5)))
+
+
+class TestCoordinates:
+    """Test parsing of the location formats the database returns."""
+
+    @pytest.mark.parametrize("location", [
+        (b'\x01' + struct.pack('<I', 1) + struct.pack('<dd', -105.6, 40.3)).hex(),
+        (b'\x00' + struct.pack('>I', 1) + struct.pack('>dd', -105.6, 40.3)).hex(),
+        (b'\x01' + struct.pack('<II', 0x20000001, 4326) + struct.pack('<dd', -105.6, 40.3)).hex().upper(),
+        'POINT(-105.6 40.3)',
+        'SRID=4326;POINT(-105.6 40.3)',
+    ])
+    def test_location_formats(self, location):
+        """WKT, WKB and EWKB (either byte order) give (lat, lon)."""
+        assert sighting_coordinates({'location': location}) == pytest.approx((40.3, -105.6))
+
+    def test_coordinates_take_precedence(self):
+        """Scraper coordinates are used before the location column."""
+        assert sighting_coordinates({'coordinates': [39.1, -106.4], 'location': 'POINT(-105.6 40.3)'}) == (39.1, -106.4)
+
+    @pytest.mark.parametrize("location", [None, '', 'not hex', '0101', 'POINT(oops)'])
+    def test_invalid_location(self, location):
+        """Unparseable locations give None instead of raising."""
+        assert sighting_coordinates({'location': location}) is None
+
+
+class TestIncrementalDeduplicator:
+    """Test cluster assignment with stubbed lookup and relink."""
+
+    @staticmethod
+    def stored(deduplicator, key, lat, cluster_id, created_at, **extra):
+        row = sighting(key, lat, -105.6, raw_text='', created_at=created_at, **extra)
+        deduplicator._prepare(row, 'raw_text')
+        row['cluster_id'] = cluster_id
+        return row
+
+    @pytest.fixture
+    def setup(self):
+        rows, relinks = [], []
+
+        def lookup(keys):
+            return [row for row in rows if set(row['dedup_keys']) & set(keys)]
+
+        deduplicator = IncrementalDeduplicator(lookup, lambda *args: relinks.append(args))
+        return deduplicator, rows, relinks
+
+    def test_bridging_record_merges_clusters(self, setup):
+        """A record matching two clusters joins the oldest and relinks the other."""
+        deduplicator, rows, relinks = setup
+        rows.append(self.stored(deduplicator, 's1', 40.0, 'c-new', '2024-09-21T00:00:00'))
+        rows.append(self.stored(deduplicator, 's2', 40.002, 'c-old', '2024-09-20T00:00:00'))
+        rows.append(self.stored(deduplicator, 's3', 40.002, None, '2024-09-22T00:00:00'))
+        rows.append(self.stored(deduplicator, 'far', 41.0, 'c-far', '2024-09-19T00:00:00'))
+
+        records = [sighting(None, 40.001, -105.6)]
+        result = deduplicator.assign(records)
+        assert result == {'matched': 1, 'new_clusters': 0, 'merged_clusters': 1}
+        assert records[0]['cluster_id'] == 'c-old'
+        assert relinks == [('c-old', ['c-new'], ['s3'])]
+
+    def test_batch_only_matches(self, setup):
+        """Records matching only each other share a new cluster; loners keep None."""
+        deduplicator, rows, relinks = setup
+        records = [sighting(None, 40.0, -105.6), sighting(None, 40.001, -105.6), sighting(None, 41.0, -105.6)]
+        result = deduplicator.assign(records)
+        assert result == {'matched': 0, 'new_clusters': 1, 'merged_clusters': 0}
+        assert records[0]['cluster_id'] and records[0]['cluster_id'] == records[1]['cluster_id']
+        assert records[2]['cluster_id'] is None
+        assert records[2]['dedup_keys']
+        assert relinks == []
+
+    def test_stored_content_hash_is_skipped(self, setup):
+        """A record the insert will drop as an exact duplicate links nothing."""
+        deduplicator, rows, relinks = setup
+        rows.append(self.stored(deduplicator, 's1', 40.0, None, '2024-09-20T00:00:00', content_hash='abc'))
+        records = [sighting(None, 40.0, -105.6, content_hash='abc')]
+        assert deduplicator.assign(records) == {'matched': 0, 'new_clusters': 0, 'merged_clusters': 0}
+        assert records[0]['cluster_id'] is None
+        assert relinks == []
@@ -2,6 +2,7 @@
 """
 Demo script to show point-to-GMU lookup functionality.
 Usage: python demo_point_to_gmu.py <latitude> <longitude>
+       python demo_point_to_gmu.py --csv <file with lat,lon columns>
 Example: python demo_point_to_gmu.py 39.7392 -105.2277
 """
 
@@ -11,15 +12,24 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from processors.gmu_processor import GMUProcessor
 import argparse
+import time
+import pandas as pd
 
 def main():
     parser = argparse.ArgumentParser(description="Look up GMU for a given lat/lon coordinate")
-    parser.add_argument("latitude", type=float, help="Latitude (e.g., 39.7392)")
-    parser.add_argument("longitude", type=float, help="Longitude (e.g., -105.2277)")
+    parser.add_argument("latitude", type=float, nargs="?", help="Latitude (e.g., 39.7392)")
+    parser.add_argument("longitude", type=float, nargs="?", help="Longitude (e.g., -105.2277)")
+    parser.add_argument("--csv", help="Map every row of a CSV with lat/lon columns in one bulk lookup")
     args = parser.parse_args()
     
+    if not args.csv and (args.latitude is None or args.longitude is None):
+        parser.error("latitude and longitude are required unless --csv is given")
+    
     # Initialize GMU processor
-    print(f"Looking up GMU for coordinates: {args.latitude}, {args.longitude}")
+    if args.csv:
+        print(f"Looking up GMUs for coordinates in: {args.csv}")
+    else:
+        print(f"Looking up GMU for coordinates: {args.latitude}, {args.longitude}")
     print("-" * 50)
     
     try:
@@ -30,6 +40,18 @@ def main():
         print(f"Loaded {len(gmu_processor.gmu_gdf)} GMU polygons")
         print()
         
+        if args.csv:
+            points = pd.read_csv(args.csv)
+            print(f"Performing bulk point-in-polygon lookup for {len(points)} points...")
+            start = time.perf_counter()
+            gmus = gmu_processor.find_gmus_for_points(points)
+            elapsed = time.perf_counter() - start
+            
+            matched = [gmu for gmu in gmus if gmu]
+            print(f"\nMapped {len(matched)}/{len(points)} points to GMUs in {elapsed * 1000:.1f} ms")
+            print(pd.Series(matched, dtype=object).value_counts().head(10).to_string())
+            return
+        
         # Perform lookup
         print(f"Performing point-in-polygon lookup...")
         gmu = gmu_processor.find_gmu_for_point(args.latitude, args.longitude)
@@ -7,7 +7,6 @@ import 'leaflet.markercluster/dist/MarkerCluster.Default.css';
 import { useStore } from '../../store/store';
 import { Sighting } from '../../types';
 import { featureFlags } from '../../services/featureFlags';
-import { deduplicateSightings } from '../../utils/deduplicateSightings';
 
 // Custom icon for wildlife sightings
 const createSightingIcon = (species: string) => {
@@ -40,9 +39,6 @@ export const SightingClusters: React.FC = () => {
   const hasFullAccess = featureFlags.hasFeature('fullSightingDetails');
 
   useEffect(() => {
-    // Deduplicate sightings before displaying
-    const deduplicatedSightings = deduplicateSightings(sightings);
-    
     // Create marker cluster group
     const markers = L.markerClusterGroup({
       chunkedLoading: true,
@@ -72,7 +68,8 @@ export const SightingClusters: React.FC = () => {
     });
 
     // Add individual markers for each sighting
-    deduplicatedSightings.forEach((sighting: Sighting) => {
+    // Sightings are canonical: duplicate reports are merged server-side
+    sightings.forEach((sighting: Sighting) => {
       const lat = sighting.location?.lat || sighting.lat;
       const lon = sighting.location?.lon || sighting.lon;
       
@@ -99,6 +96,11 @@ export const SightingClusters: React.FC = () => {
                 <strong>Source:</strong> ${sighting.source_type}
               </p>
             ` : ''}
+            ${sighting.report_count && sighting.report_count > 1 ? `
+              <p class="text-sm text-gray-600 mb-1">
+                <strong>Reports:</strong> ${sighting.report_count}${sighting.source_count && sighting.source_count > 1 ? ` from ${sighting.source_count} sources` : ''}
+              </p>
+            ` : ''}
             ${sighting.gmu_unit ? `
               <p class="text-sm text-gray-600">
                 <strong>GMU:</strong> ${sighting.gmu_unit}
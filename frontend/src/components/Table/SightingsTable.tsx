@@ -2,7 +2,6 @@ import React, { useState, useMemo } from 'react';
 import { useStore } from '@/store/store';
 import { format } from 'date-fns';
 import { ExternalLink, Info, ChevronDown, ChevronUp, ArrowUpDown, ArrowUp, ArrowDown, ChevronLeft, ChevronRight } from 'lucide-react';
-import { deduplicateSightings, getDuplicateStats } from '@/utils/deduplicateSightings';
 
 type SortField = 'date' | 'gmu' | 'species' | 'source';
 type SortDirection = 'asc' | 'desc';
@@ -73,22 +72,9 @@ export const SightingsTable: React.FC = () => {
     }
   };
 
-  // Track deduplication stats
-  const duplicateStats = useMemo(() => {
-    return sightings.length > 0 ? getDuplicateStats(sightings) : null;
-  }, [sightings]);
-
   const sortedSightings = useMemo(() => {
-    // First deduplicate the sightings
-    const deduplicatedSightings = deduplicateSightings(sightings);
-    
-    // Log duplicate stats in development
-    if (process.env.NODE_ENV === 'development' && sightings.length > 0 && duplicateStats?.duplicateCount) {
-      console.log('Duplicate stats:', duplicateStats);
-    }
-    
-    // Then filter out invalid species
-    const validSightings = deduplicatedSightings.filter(sighting => isValidSpecies(sighting.species));
+    // Sightings are canonical (merged server-side); filter out invalid species
+    const validSightings = sightings.filter(sighting => isValidSpecies(sighting.species));
     
     const sorted = [...validSightings].sort((a, b) => {
       let aVal, bVal;
@@ -1,9 +1,18 @@
 import api from './api';
 import type { Sighting, SightingStats, Filters, PaginatedResponse } from '@/types';
 
+// Expose the API's location_lat/location_lon as lat/lon for the map
+function withCoordinates(sighting: Sighting): Sighting {
+  return {
+    ...sighting,
+    lat: sighting.lat ?? sighting.location_lat,
+    lon: sighting.lon ?? sighting.location_lon,
+  };
+}
+
 // Sightings API service
 export const sightingsService = {
-  // Get paginated sightings with filters
+  // Get paginated canonical sightings (duplicates already merged server-side)
   async getSightings(filters: Filters, page = 1, pageSize = 20): Promise<PaginatedResponse<Sighting>> {
     const params = new URLSearchParams();
     
@@ -25,18 +34,20 @@ export const sightingsService = {
     if (filters.lon) params.append('lon', filters.lon.toString());
     if (filters.radiusMiles) params.append('radius_miles', filters.radiusMiles.toString());
     if (filters.excludeNoGmu) params.append('exclude_no_gmu', 'true');
+    if (filters.minSources) params.append('min_sources', filters.minSources.toString());
     
     params.append('page', page.toString());
     params.append('page_size', pageSize.toString());
     
-    const { data } = await api.get<PaginatedResponse<Sighting>>(`/sightings?${params}`);
+    const { data } = await api.get<PaginatedResponse<Sighting>>(`/canonical-sightings?${params}`);
+    data.items = data.items.map(withCoordinates);
     return data;
   },
 
-  // Get sighting by ID
+  // Get canonical sighting by ID, with its source reports
   async getSightingById(id: string): Promise<Sighting> {
-    const { data } = await api.get<Sighting>(`/sightings/${id}`);
-    return data;
+    const { data } = await api.get<Sighting>(`/canonical-sightings/${id}`);
+    return withCoordinates(data);
   },
 
   // Get sightings statistics
@@ -33,6 +33,23 @@ export interface Sighting {
   lon?: number;
   latitude?: number;
   longitude?: number;
+  location_lat?: number;
+  location_lon?: number;
+  last_sighting_date?: string;
+  report_count?: number;  // Source reports merged into this sighting
+  source_count?: number;  // Distinct source types (2+ = cross-source confirmed)
+  source_types?: string[];
+  sources?: SightingSource[];
+}
+
+// One source report of a canonical sighting
+export interface SightingSource {
+  sighting_id: string;
+  source_type?: string;
+  source_url?: string;
+  sighting_date?: string;
+  confidence_score?: number;
+  reported_at?: string;
 }
 
 export interface SightingStats {
@@ -85,6 +102,7 @@ export interface Filters {
   enableAccuracyFilter?: boolean;  // Enable/disable accuracy filtering
   sourceType?: string;  // Alternative to source
   sourceTypes?: string[];  // Alternative to sourceList
+  minSources?: number;  // Only sightings confirmed by this many source types
 }
 
 // API Response types
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import hashlib
 import logging
+import threading
 
 # Set up logging
 logger = logging.getLogger()
@@ -23,83 +24,75 @@ REDDIT_CLIENT_SECRET = os.environ.get('REDDIT_CLIENT_SECRET')
 REDDIT_USER_AGENT = os.environ.get('REDDIT_USER_AGENT')
 GOOGLE_PLACES_API_KEY = os.environ.get('GOOGLE_PLACES_API_KEY')
 
+# Per-source time budget in seconds (overridable per event with 'source_timeout')
+SOURCE_TIMEOUT = int(os.environ.get('SCRAPE_SOURCE_TIMEOUT', 12 * 60))
+
 def generate_content_hash(sighting: Dict[str, Any]) -> str:
     """Generate unique hash for deduplication."""
     content = f"{sighting.get('species', '')}_{sighting.get('sighting_date', '')}_{sighting.get('location_name', '')}_{sighting.get('source_type', '')}"
     return hashlib.md5(content.encode()).hexdigest()
 
-def save_to_supabase(sightings: List[Dict[str, Any]], source_name: str) -> Dict[str, int]:
-    """Save sightings to Supabase."""
-    
-    conn = psycopg2.connect(SUPABASE_DB_URL)
-    cursor = conn.cursor()
-    
-    saved_count = 0
-    duplicate_count = 0
-    
-    for sighting in sightings:
+# Columns written to the Supabase sightings table
+SIGHTINGS_COLUMNS = [
+    'species', 'raw_text', 'source_url', 'source_type',
+    'extracted_at', 'location_name', 'sighting_date', 'gmu_unit', 'location',
+    'confidence_score', 'location_confidence_radius', 'content_hash'
+]
+
+# Kept across warm invocations so the database connection is reused
+_sightings_writer = None
+_sightings_writer_lock = threading.Lock()
+
+def sightings_row(sighting: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a scraped sighting to Supabase sightings columns."""
+    # Convert sighting date
+    sighting_date = sighting.get('sighting_date')
+    if isinstance(sighting_date, str):
         try:
-            content_hash = generate_content_hash(sighting)
-            
-            # Convert sighting date
-            sighting_date = sighting.get('sighting_date')
-            if isinstance(sighting_date, str):
-                try:
-                    sighting_date = datetime.fromisoformat(sighting_date.replace('Z', '+00:00'))
-                    sighting_date = sighting_date.date()
-                except:
-                    sighting_date = None
-            elif hasattr(sighting_date, 'date'):
-                sighting_date = sighting_date.date()
-            
-            # Create PostGIS point
-            location = None
-            if sighting.get('latitude') and sighting.get('longitude'):
-                location = f"POINT({sighting['longitude']} {sighting['latitude']})"
-            
-            cursor.execute("""
-                INSERT INTO sightings (
-                    species, raw_text, source_url, source_type,
-                    extracted_at, location_name, sighting_date, gmu_unit, location,
-                    confidence_score, location_confidence_radius, content_hash
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, ST_GeogFromText(%s),
-                    %s, %s, %s
-                )
-                ON CONFLICT (content_hash) DO NOTHING
-            """, (
-                sighting.get('species'),
-                sighting.get('raw_text', '')[:500],
-                sighting.get('source_url'),
-                sighting.get('source_type'),
-                sighting.get('extracted_at', datetime.now()),
-                sighting.get('location_name'),
-                sighting_date,
-                sighting.get('gmu'),
-                location,
-                sighting.get('confidence', 80) / 100.0,
-                sighting.get('location_confidence_radius'),
-                content_hash
-            ))
-            
-            if cursor.rowcount > 0:
-                saved_count += 1
-            else:
-                duplicate_count += 1
-                
-        except Exception as e:
-            logger.error(f"Error saving sighting: {e}")
+            sighting_date = datetime.fromisoformat(sighting_date.replace('Z', '+00:00'))
+            sighting_date = sighting_date.date()
+        except:
+            sighting_date = None
+    elif hasattr(sighting_date, 'date'):
+        sighting_date = sighting_date.date()
     
-    conn.commit()
-    cursor.close()
-    conn.close()
+    # Create PostGIS point
+    location = None
+    if sighting.get('latitude') and sighting.get('longitude'):
+        location = f"POINT({sighting['longitude']} {sighting['latitude']})"
     
-    return {'saved': saved_count, 'duplicates': duplicate_count}
+    return {
+        'species': sighting.get('species'),
+        'raw_text': sighting.get('raw_text', '')[:500],
+        'source_url': sighting.get('source_url'),
+        'source_type': sighting.get('source_type'),
+        'extracted_at': sighting.get('extracted_at', datetime.now()),
+        'location_name': sighting.get('location_name'),
+        'sighting_date': sighting_date,
+        'gmu_unit': sighting.get('gmu'),
+        'location': location,
+        'confidence_score': sighting.get('confidence', 80) / 100.0,
+        'location_confidence_radius': sighting.get('location_confidence_radius'),
+        'content_hash': generate_content_hash(sighting)
+    }
+
+def save_to_supabase(sightings: List[Dict[str, Any]], source_name: str) -> Dict[str, int]:
+    """Save sightings to Supabase in one batched insert."""
+    global _sightings_writer
+    with _sightings_writer_lock:
+        if _sightings_writer is None:
+            from scrapers.bulk_writer import BulkSightingWriter
+            _sightings_writer = BulkSightingWriter(
+                lambda: psycopg2.connect(SUPABASE_DB_URL), 'sightings', SIGHTINGS_COLUMNS, sightings_row,
+                expressions={'location': 'ST_GeogFromText(%s)'}
+            )
+    return _sightings_writer.write(sightings, source_name)
 
 def lambda_handler(event, context):
     """
     Lambda handler for daily scraping.
     Uses 1-day lookback for daily runs, unless specified otherwise in event.
+    Sources run concurrently, so the run takes about as long as the slowest one.
     """
     
     # Get lookback days from event or default to 1 for daily runs
@@ -107,14 +100,11 @@ def lambda_handler(event, context):
     
     logger.info(f"Starting daily scrape with {lookback_days} day lookback")
     
-    # Import scrapers (these will be included in deployment package)
+    # Import the scraper registry (included in the deployment package); each
+    # scraper module and its dependencies are imported only when it runs
     try:
-        from scrapers import (
-            RedditScraper,
-            GooglePlacesScraper,
-            FourteenersRealScraper,
-            INaturalistScraper
-        )
+        from scrapers import create_scraper
+        from scrapers.orchestrator import ScrapeOrchestrator, source_timeout
     except ImportError as e:
         logger.error(f"Failed to import scrapers: {e}")
         return {
@@ -122,53 +112,52 @@ def lambda_handler(event, context):
             'body': json.dumps({'error': 'Failed to import scrapers'})
         }
     
-    results = {
-        'start_time': datetime.now().isoformat(),
-        'lookback_days': lookback_days,
-        'sources': {}
-    }
-    
-    # Run each scraper
+    # Run every scraper concurrently; each one gets the same time budget,
+    # capped so the run finishes inside the Lambda timeout. An event may
+    # name a subset of sources, e.g. {"sources": ["inaturalist"]}.
     scrapers = [
-        ('Reddit', RedditScraper),
-        ('Google Places', GooglePlacesScraper),
-        ('14ers.com', FourteenersRealScraper),
-        ('iNaturalist', INaturalistScraper)
+        ('Reddit', 'reddit'),
+        ('Google Places', 'google_places'),
+        ('14ers.com', '14ers'),
+        ('iNaturalist', 'inaturalist')
     ]
+    if event.get('sources'):
+        requested = set(event['sources'])
+        scrapers = [(name, key) for name, key in scrapers if key in requested or name in requested]
     
-    total_saved = 0
-    total_found = 0
+    orchestrator = ScrapeOrchestrator(
+        [(name, lambda key=key: create_scraper(key)) for name, key in scrapers],
+        save_batch=save_to_supabase,
+        timeout=source_timeout(context, event.get('source_timeout', SOURCE_TIMEOUT))
+    )
+    report = orchestrator.run(lookback_days=lookback_days)
     
-    for name, scraper_class in scrapers:
-        logger.info(f"Running {name} scraper...")
-        
-        try:
-            scraper = scraper_class()
-            sightings = scraper.scrape(lookback_days=lookback_days)
-            
-            # Save to Supabase
-            save_result = save_to_supabase(sightings, name)
-            
-            results['sources'][name] = {
-                'found': len(sightings),
-                'saved': save_result['saved'],
-                'duplicates': save_result['duplicates']
-            }
-            
-            total_found += len(sightings)
-            total_saved += save_result['saved']
-            
-            logger.info(f"{name}: Found {len(sightings)}, Saved {save_result['saved']}")
-            
-        except Exception as e:
-            logger.error(f"Error in {name} scraper: {e}")
-            results['sources'][name] = {'error': str(e)}
+    results = {
+        'start_time': report['start_time'],
+        'end_time': report['end_time'],
+        'lookback_days': lookback_days,
+        'duration_seconds': report['duration_seconds'],
+        'sources': {},
+        'total_found': report['total_found'],
+        'total_saved': report['total_saved']
+    }
     
-    results['end_time'] = datetime.now().isoformat()
-    results['total_found'] = total_found
-    results['total_saved'] = total_saved
+    for name, stats in report['sources'].items():
+        results['sources'][name] = {
+            'status': stats['status'],
+            'found': stats['found'],
+            'saved': stats['saved'],
+            'duplicates': stats['duplicates'],
+            'duration_seconds': stats['duration_seconds']
+        }
+        if 'error' in stats:
+            results['sources'][name]['error'] = stats['error']
+            logger.error(f"Error in {name} scraper: {stats['error']}")
+        
+        logger.info(f"{name}: Found {stats['found']}, Saved {stats['saved']} ({stats['duration_seconds']:.1f}s)")
     
-    logger.info(f"Scraping complete. Total found: {total_found}, Total saved: {total_saved}")
+    logger.info(f"Scraping complete in {report['duration_seconds']:.1f}s. "
+                f"Total found: {report['total_found']}, Total saved: {report['total_saved']}")
     
     return {
         'statusCode': 200,
@@ -1,8 +1,34 @@
 """
 Processing modules for geospatial operations and data transformation.
+
+Processors are imported lazily on first attribute access, so e.g. the
+Gazetteer can be used without loading geopandas and shapely.
 """
 
-from .gmu_processor import GMUProcessor
-from .trail_processor import TrailProcessor
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'GMUProcessor': '.gmu_processor',
+    'TrailProcessor': '.trail_processor',
+    'Gazetteer': '.gazetteer',
+    'MinHasher': '.near_duplicates',
+    'NearDuplicateChecker': '.near_duplicates',
+    'SpatioTemporalClusterer': '.spatiotemporal_clusters',
+    'IncrementalDeduplicator': '.incremental_dedup'
+}
+
+__all__ = ['GMUProcessor', 'TrailProcessor', 'Gazetteer', 'MinHasher', 'NearDuplicateChecker',
+           'SpatioTemporalClusterer', 'IncrementalDeduplicator']
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['GMUProcessor', 'TrailProcessor']
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,380 @@
+"""
+Local gazetteer for geocoding Colorado place names without an LLM call.
+Resolves location names against the bundled peak/trail index and GMU centers.
+"""
+
+import re
+import csv
+import json
+import math
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from loguru import logger
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Token abbreviations expanded during normalization
+ABBREVIATIONS = {
+    'mt': 'mount',
+    'mtn': 'mountain',
+    'mtns': 'mountains',
+    'pk': 'peak',
+    'tr': 'trail',
+    'trl': 'trail',
+    'th': 'trailhead',
+    'ck': 'creek',
+    'lk': 'lake',
+    'rd': 'road',
+    'natl': 'national',
+    'np': 'national park',
+}
+
+# Generic trailing words dropped to build the alias index ("Rawah Trail" -> "rawah")
+GENERIC_SUFFIXES = ('trailhead', 'trail', 'summit', 'loop')
+
+# Words that do not name a place on their own. A feature name or alias made
+# only of these ("Lake" from "Lake Trail", "North Park" from "North Park
+# Trail") is not indexed, since free text uses them for unrelated places.
+GENERIC_WORDS = frozenset({
+    'a', 'access', 'and', 'area', 'basin', 'big', 'butte', 'camp', 'canyon', 'connector', 'creek',
+    'cutoff', 'divide', 'east', 'falls', 'forest', 'fork', 'gulch', 'high', 'hill', 'hills', 'lake',
+    'lakes', 'little', 'loop', 'lower', 'main', 'meadow', 'meadows', 'mesa', 'middle', 'mount',
+    'mountain', 'mountains', 'national', 'nature', 'new', 'north', 'of', 'old', 'open', 'overlook',
+    'park', 'pass', 'path', 'peak', 'peaks', 'point', 'pond', 'reservoir', 'ridge', 'rim', 'river',
+    'road', 'rock', 'route', 'south', 'space', 'spring', 'springs', 'spur', 'state', 'summit', 'the',
+    'to', 'trail', 'trailhead', 'upper', 'valley', 'view', 'west', 'wilderness',
+})
+
+# Words introducing a qualifier: "Bear Lake in RMNP", "Quandary Peak, Breckenridge"
+QUALIFIER_PATTERN = re.compile(r',|\bnear\b|\bin\b|\bat\b|\babove\b|\bbelow\b|\boff\b')
+PARENTHETICAL_PATTERN = re.compile(r'\(([^)]*[a-zA-Z][^)]*)\)')
+
+# Well-known places that are missing from the OSM feature index or whose OSM
+# name differs from common usage. Coordinates match the LLM prompt examples.
+LANDMARKS = {
+    'bear lake rmnp': ('Bear Lake (RMNP)', 40.3845, -105.6824, 'landmark'),
+    'north park': ('North Park', 40.7314, -106.2836, 'park'),
+    'mount evans': ('Mount Blue Sky', 39.5883, -105.6438, 'peak'),
+    'mount blue sky': ('Mount Blue Sky', 39.5883, -105.6438, 'peak'),
+    'maroon bells': ('Maroon Bells', 39.0708, -106.9890, 'landmark'),
+    'trail ridge road': ('Trail Ridge Road', 40.3925, -105.6836, 'landmark'),
+    'rocky mountain national park': ('Rocky Mountain National Park', 40.3428, -105.6836, 'park'),
+    'rmnp': ('Rocky Mountain National Park', 40.3428, -105.6836, 'park'),
+    'estes park': ('Estes Park', 40.3775, -105.5253, 'town'),
+    'grand lake': ('Grand Lake', 40.2520, -105.8233, 'town'),
+    'durango': ('Durango', 37.2753, -107.8801, 'town'),
+    'aspen': ('Aspen', 39.1911, -106.8175, 'town'),
+    'vail': ('Vail', 39.6403, -106.3742, 'town'),
+}
+
+# Confidence radius (miles) by feature type
+FEATURE_RADIUS_MILES = {
+    'peak': 1.0,
+    'trail': 2.0,
+    'landmark': 2.0,
+    'town': 5.0,
+    'park': 15.0,
+}
+DEFAULT_RADIUS_MILES = 3.0
+
+# Names whose features are spread wider than this are treated as ambiguous
+MAX_SPREAD_MILES = 15.0
+
+MILES_PER_DEGREE_LAT = 69.0
+
+GMU_PATTERN = re.compile(r'^(?:gmu|unit|game management unit)\s*(\d{1,3})$')
+
+
+def _distance_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Equirectangular distance approximation, accurate enough at Colorado scale."""
+    dx = (lon2 - lon1) * MILES_PER_DEGREE_LAT * math.cos(math.radians((lat1 + lat2) / 2))
+    dy = (lat2 - lat1) * MILES_PER_DEGREE_LAT
+    return math.hypot(dx, dy)
+
+
+class Gazetteer:
+    """
+    In-memory place-name index over the bundled Colorado feature data.
+
+    Names are normalized (case, punctuation, abbreviations such as Mt/Mtn)
+    and indexed exactly and by alias (generic suffixes like "Trail" removed);
+    names made only of generic words ("Lake", "North Park") are not indexed.
+    Features sharing a name are merged into one entry whose radius covers
+    their spread; names spread across the state are treated as ambiguous.
+    """
+
+    def __init__(self, features_path: str = str(DATA_DIR / "trails" / "colorado_trails_peaks_with_gmu.csv"),
+                 gmu_centers_path: str = str(DATA_DIR / "gmu_centers.json")):
+        """
+        Initialize the gazetteer. Data is loaded on first lookup.
+
+        Args:
+            features_path: CSV with name, lat, lon, type and gmu columns
+            gmu_centers_path: JSON mapping GMU id to center and bounds
+        """
+        self.features_path = Path(features_path)
+        self.gmu_centers_path = Path(gmu_centers_path)
+        self.name_index: Dict[str, Dict] = {}
+        self.alias_index: Dict[str, Dict] = {}
+        self.gmu_index: Dict[str, Dict] = {}
+        self.loaded = False
+        self._load_lock = threading.Lock()
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Normalize a place name for indexing and lookup.
+
+        Args:
+            name: Original place name
+
+        Returns:
+            Lowercase name with punctuation removed and abbreviations expanded
+        """
+        normalized = name.lower()
+        normalized = re.sub(r'\(.*?\)', ' ', normalized)  # Trail numbers like "(673)"
+        normalized = re.sub(r"['’]", '', normalized)
+        normalized = re.sub(r'[^a-z0-9]+', ' ', normalized)
+        tokens = [ABBREVIATIONS.get(token, token) for token in normalized.split()]
+        if tokens and tokens[0] == 'the':
+            tokens = tokens[1:]
+        return ' '.join(tokens)
+
+    @staticmethod
+    def _is_generic(normalized: str) -> bool:
+        """True if a normalized name is made only of generic words."""
+        return all(token in GENERIC_WORDS for token in normalized.split())
+
+    @classmethod
+    def _alias(cls, normalized: str) -> Optional[str]:
+        """Alias for a normalized name with its generic suffix removed."""
+        for suffix in GENERIC_SUFFIXES:
+            if normalized.endswith(' ' + suffix):
+                alias = normalized[:-len(suffix) - 1].strip()
+                return alias if alias and not cls._is_generic(alias) else None
+        return None
+
+    def _ensure_loaded(self):
+        """Load the indexes once, even when called from several threads."""
+        if not self.loaded:
+            with self._load_lock:
+                if not self.loaded:
+                    self.load()
+
+    def load(self):
+        """Build the name, alias and GMU indexes and publish them together."""
+        grouped: Dict[str, List[Tuple[str, float, float, str, Optional[int]]]] = {}
+
+        if self.features_path.exists():
+            with open(self.features_path, newline='') as f:
+                for row in csv.DictReader(f):
+                    try:
+                        lat, lon = float(row['lat']), float(row['lon'])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    normalized = self.normalize_name(row.get('name') or '')
+                    if not normalized or self._is_generic(normalized):
+                        continue
+                    gmu = (row.get('gmu') or '').strip()
+                    gmu = int(gmu) if gmu.isdigit() else None
+                    grouped.setdefault(normalized, []).append(
+                        (row['name'], lat, lon, row.get('type') or 'unknown', gmu)
+                    )
+        else:
+            logger.warning(f"Gazetteer feature file not found: {self.features_path}")
+
+        name_index: Dict[str, Dict] = {}
+        ambiguous = set()
+        for normalized, features in grouped.items():
+            entry = self._merge_features(features)
+            if entry:
+                name_index[normalized] = entry
+            else:
+                ambiguous.add(normalized)
+
+        for normalized, (name, lat, lon, feature_type) in LANDMARKS.items():
+            name_index[normalized] = {
+                'matched_name': name,
+                'coordinates': [lat, lon],
+                'gmu_number': None,
+                'feature_type': feature_type,
+                'location_confidence_radius': FEATURE_RADIUS_MILES.get(feature_type, DEFAULT_RADIUS_MILES)
+            }
+
+        # Aliases only point at a single unambiguous entry
+        alias_candidates: Dict[str, List[Dict]] = {}
+        for normalized, entry in name_index.items():
+            alias = self._alias(normalized)
+            if alias and alias not in name_index and alias not in ambiguous:
+                alias_candidates.setdefault(alias, []).append(entry)
+        alias_index: Dict[str, Dict] = {}
+        for alias, entries in alias_candidates.items():
+            merged = entries[0] if len(entries) == 1 else self._merge_entries(entries)
+            if merged:
+                alias_index[alias] = merged
+
+        gmu_index: Dict[str, Dict] = {}
+        if self.gmu_centers_path.exists():
+            with open(self.gmu_centers_path, 'r') as f:
+                for gmu_id, info in json.load(f).items():
+                    bounds = info.get('bounds') or {}
+                    radius = DEFAULT_RADIUS_MILES
+                    if bounds:
+                        radius = _distance_miles(bounds['south'], bounds['west'],
+                                                 bounds['north'], bounds['east']) / 2
+                    gmu_index[str(gmu_id)] = {
+                        'matched_name': info.get('name', f"GMU {gmu_id}"),
+                        'coordinates': list(info['center']),
+                        'gmu_number': int(gmu_id),
+                        'feature_type': 'gmu',
+                        'location_confidence_radius': round(radius, 1)
+                    }
+
+        self.name_index = name_index
+        self.alias_index = alias_index
+        self.gmu_index = gmu_index
+        self.loaded = True
+        logger.info(f"Gazetteer loaded {len(self.name_index)} names, "
+                    f"{len(self.alias_index)} aliases, {len(self.gmu_index)} GMUs")
+
+    def _merge_features(self, features: List[Tuple[str, float, float, str, Optional[int]]]) -> Optional[Dict]:
+        """Merge same-named features into one entry, or None if they are too spread out."""
+        lat = sum(f[1] for f in features) / len(features)
+        lon = sum(f[2] for f in features) / len(features)
+        spread = max(_distance_miles(lat, lon, f[1], f[2]) for f in features)
+        if spread > MAX_SPREAD_MILES:
+            return None
+
+        # Prefer peaks over trail segments when a name covers both
+        types = [f[3] for f in features]
+        feature_type = 'peak' if 'peak' in types else types[0]
+        gmus = [f[4] for f in features if f[4]]
+        gmu = max(set(gmus), key=gmus.count) if gmus else None
+        radius = max(FEATURE_RADIUS_MILES.get(feature_type, DEFAULT_RADIUS_MILES), spread)
+
+        return {
+            'matched_name': features[0][0],
+            'coordinates': [round(lat, 6), round(lon, 6)],
+            'gmu_number': gmu,
+            'feature_type': feature_type,
+            'location_confidence_radius': round(radius, 1)
+        }
+
+    def _merge_entries(self, entries: List[Dict]) -> Optional[Dict]:
+        """Merge alias candidates, or None if they point at different places."""
+        features = [
+            (e['matched_name'], e['coordinates'][0], e['coordinates'][1], e['feature_type'], e['gmu_number'])
+            for e in entries
+        ]
+        return self._merge_features(features)
+
+    def _lookup(self, key: str) -> Optional[Dict]:
+        """Entry for a normalized key: a GMU, an exact name or an alias."""
+        if not key:
+            return None
+        gmu_match = GMU_PATTERN.match(key)
+        if gmu_match:
+            return self.gmu_index.get(gmu_match.group(1))
+        entry = self.name_index.get(key) or self.alias_index.get(key)
+        if entry:
+            return entry
+        # "Conundrum Creek Trailhead" should still find "Conundrum Creek Trail"
+        alias = self._alias(key)
+        return (self.name_index.get(alias) or self.alias_index.get(alias)) if alias else None
+
+    def _split_qualifier(self, location_name: str) -> Tuple[str, str]:
+        """
+        Split a location into its place name and qualifier, both normalized:
+        "Bear Lake in RMNP" and "Bear Lake (RMNP)" give ("bear lake", "rmnp").
+        """
+        parenthetical = PARENTHETICAL_PATTERN.search(location_name)
+        if parenthetical:
+            head = location_name[:parenthetical.start()] + location_name[parenthetical.end():]
+            return self.normalize_name(head), self.normalize_name(parenthetical.group(1))
+        parts = QUALIFIER_PATTERN.split(location_name.lower(), maxsplit=1)
+        if len(parts) == 1:
+            return self.normalize_name(parts[0]), ''
+        return self.normalize_name(parts[0]), self.normalize_name(parts[1])
+
+    @staticmethod
+    def within_radius(entry: Dict, coordinates: Sequence[float], margin: float = 0.0) -> bool:
+        """
+        Check whether coordinates fall inside an entry's confidence radius.
+
+        Args:
+            entry: Gazetteer entry (or geocode result)
+            coordinates: [lat, lon]
+            margin: Miles added to the entry's radius
+
+        Returns:
+            True if the coordinates are within radius + margin of the entry
+        """
+        distance = _distance_miles(entry['coordinates'][0], entry['coordinates'][1],
+                                   coordinates[0], coordinates[1])
+        return distance <= entry['location_confidence_radius'] + margin
+
+    def geocode(self, location_name: Optional[str], near: Optional[Sequence[float]] = None,
+                near_radius: float = DEFAULT_RADIUS_MILES) -> Optional[Dict]:
+        """
+        Resolve a place name to coordinates, GMU and confidence radius.
+
+        The whole name is tried first, then the place name with its qualifier
+        ("bear lake rmnp" for "Bear Lake in RMNP"). The place name alone is
+        only accepted if it lies near the qualifier, or near the caller's
+        estimate when the qualifier is unknown; otherwise the qualifier itself
+        is returned, as the place the location is described relative to.
+
+        Args:
+            location_name: Free-text place name (e.g. "Mt. Elbert", "unit 12")
+            near: [lat, lon] estimate of the location from elsewhere (the LLM)
+            near_radius: Uncertainty of that estimate in miles
+
+        Returns:
+            Dict with coordinates [lat, lon], gmu_number (int or None),
+            location_confidence_radius, feature_type, matched_name and
+            geocode_source, or None on a miss
+        """
+        if not location_name or not location_name.strip():
+            return None
+        self._ensure_loaded()
+
+        normalized = self.normalize_name(location_name)
+        head, qualifier = self._split_qualifier(location_name)
+        if not qualifier:
+            entry = self._lookup(normalized)
+        else:
+            entry = self._lookup(f"{head} {qualifier}")
+            if not entry and normalized != head:
+                entry = self._lookup(normalized)
+            reference = self._lookup(qualifier)
+            if not entry and head:
+                entry = self._lookup(head)
+                if entry and reference:
+                    if not self.within_radius(entry, reference['coordinates'], reference['location_confidence_radius']):
+                        entry = None
+                elif entry and near and not self.within_radius(entry, near, near_radius):
+                    entry = None
+            entry = entry or reference
+        if not entry:
+            return None
+
+        result = dict(entry)
+        result['coordinates'] = list(entry['coordinates'])
+        result['geocode_source'] = 'gazetteer'
+        return result
+
+    def lookup_gmu(self, gmu_id: str) -> Optional[Dict]:
+        """
+        Get the center and radius of a GMU.
+
+        Args:
+            gmu_id: GMU unit ID
+
+        Returns:
+            Gazetteer entry for the GMU or None
+        """
+        self._ensure_loaded()
+        entry = self.gmu_index.get(str(gmu_id))
+        return dict(entry, geocode_source='gazetteer') if entry else None
@@ -4,14 +4,43 @@ Handles loading GMU polygons and determining which GMU contains a given point.
 """
 
 import json
+import math
+import pickle
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
 import geopandas as gpd
-from shapely.geometry import Point, Polygon
-from pyproj import CRS
+import shapely
+from shapely.geometry import Point, Polygon, LineString, MultiLineString
+from shapely.strtree import STRtree
+from pyproj import CRS, Transformer
 from loguru import logger
 
 
+# Lookup grid cell codes; other values are 1-based indexes into the grid's GMU ids
+GRID_OUTSIDE = 0
+GRID_BOUNDARY = np.iinfo(np.uint16).max
+
+DEFAULT_GRID_CELL_SIZE = 0.01  # degrees, roughly 1 km in Colorado
+
+# Bump when the layout of the pickled layer cache changes
+LAYER_CACHE_VERSION = 1
+
+METERS_PER_MILE = 1609.344
+
+
+@lru_cache(maxsize=1)
+def _utm_transformer() -> Transformer:
+    """WGS84 -> UTM zone 13N (covers Colorado), used to measure trail lengths."""
+    return Transformer.from_crs("EPSG:4326", "EPSG:26913", always_xy=True)
+
+
+def _to_utm(x: np.ndarray, y: np.ndarray):
+    return _utm_transformer().transform(x, y)
+
+
 class GMUProcessor:
     """
     Handles GMU polygon operations including loading boundaries and point-in-polygon queries.
@@ -28,28 +57,51 @@ class GMUProcessor:
         self.gmu_gdf = None
         self.target_gmus = []
         
-    def load_gmu_data(self, target_gmus: Optional[List[str]] = None):
+        # Spatial index state, rebuilt whenever gmu_gdf changes
+        self.gmu_id_column = None
+        self.gmu_ids = []
+        self.geometries = []
+        self.spatial_index = None
+        self._indexed_gdf_id = None
+        
+        # Optional precomputed lookup grid, see build_lookup_grid()
+        self.grid = None
+        self.grid_meta = None
+        self.grid_gmu_ids = None
+        
+    def load_gmu_data(self, target_gmus: Optional[List[str]] = None, use_cache: bool = True):
         """
         Load GMU boundary data from file.
         
+        The parsed, reprojected layer is cached as a pickle next to the source
+        file (see layer_cache_path). The cache is rebuilt automatically when the
+        source file's size or mtime changes.
+        
         Args:
             target_gmus: List of GMU unit IDs to filter (e.g., ['12', '201'])
+            use_cache: Read and write the binary layer cache
         """
         if not self.gmu_data_path.exists():
             raise FileNotFoundError(f"GMU data file not found: {self.gmu_data_path}")
         
         try:
-            # Load based on file extension
-            if self.gmu_data_path.suffix == '.geojson':
-                self.gmu_gdf = gpd.read_file(self.gmu_data_path)
-            elif self.gmu_data_path.suffix in ['.shp', '.shapefile']:
-                self.gmu_gdf = gpd.read_file(self.gmu_data_path)
-            else:
-                raise ValueError(f"Unsupported file format: {self.gmu_data_path.suffix}")
+            self.gmu_gdf = self._read_layer_cache() if use_cache else None
             
-            # Ensure CRS is WGS84 (EPSG:4326) for lat/lon operations
-            if self.gmu_gdf.crs != CRS.from_epsg(4326):
-                self.gmu_gdf = self.gmu_gdf.to_crs(epsg=4326)
+            if self.gmu_gdf is None:
+                # Load based on file extension
+                if self.gmu_data_path.suffix == '.geojson':
+                    self.gmu_gdf = gpd.read_file(self.gmu_data_path)
+                elif self.gmu_data_path.suffix in ['.shp', '.shapefile']:
+                    self.gmu_gdf = gpd.read_file(self.gmu_data_path)
+                else:
+                    raise ValueError(f"Unsupported file format: {self.gmu_data_path.suffix}")
+                
+                # Ensure CRS is WGS84 (EPSG:4326) for lat/lon operations
+                if self.gmu_gdf.crs != CRS.from_epsg(4326):
+                    self.gmu_gdf = self.gmu_gdf.to_crs(epsg=4326)
+                
+                if use_cache:
+                    self._write_layer_cache(self.gmu_gdf)
             
             # Filter to target GMUs if specified
             if target_gmus:
@@ -63,16 +115,106 @@ class GMUProcessor:
                 else:
                     logger.warning("Could not find GMU ID column for filtering")
             
+            self._build_spatial_index()
+            
             logger.info(f"Loaded {len(self.gmu_gdf)} GMU polygons")
             
         except Exception as e:
             logger.error(f"Error loading GMU data: {e}")
             raise
     
+    @property
+    def layer_cache_path(self) -> Path:
+        """Path of the binary layer cache for the GMU source file."""
+        return self.gmu_data_path.with_suffix('.cache.pkl')
+    
+    def _source_signature(self) -> Dict:
+        """Identify the current GMU source file for cache validation."""
+        stat = self.gmu_data_path.stat()
+        return {
+            'version': LAYER_CACHE_VERSION,
+            'source': str(self.gmu_data_path.resolve()),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+    
+    def _read_layer_cache(self) -> Optional[gpd.GeoDataFrame]:
+        """Load the cached layer, or None if it is missing, stale or unreadable."""
+        cache_path = self.layer_cache_path
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable GMU layer cache {cache_path}: {e}")
+            return None
+        
+        if cached.get('signature') != self._source_signature():
+            logger.info(f"GMU layer cache {cache_path} is stale, rebuilding")
+            return None
+        
+        logger.debug(f"Loaded GMU layer from cache {cache_path}")
+        return cached['gdf']
+    
+    def _write_layer_cache(self, gdf: gpd.GeoDataFrame):
+        """Pickle the parsed, reprojected layer; failures only cost the next load."""
+        cache_path = self.layer_cache_path
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'signature': self._source_signature(), 'gdf': gdf}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(cache_path)
+            logger.debug(f"Wrote GMU layer cache {cache_path}")
+        except Exception as e:
+            logger.warning(f"Could not write GMU layer cache {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def _build_spatial_index(self):
+        """
+        Build the STRtree over GMU polygons and resolve GMU ids once.
+        
+        Geometries are prepared so repeated contains() tests are fast, and the
+        GMU id column is chosen here instead of on every lookup.
+        """
+        if 'GMUID' in self.gmu_gdf.columns:
+            self.gmu_id_column = 'GMUID'
+            ids = self.gmu_gdf['GMUID']
+        elif 'DAU' in self.gmu_gdf.columns:
+            self.gmu_id_column = 'DAU'
+            ids = self.gmu_gdf['DAU']
+        else:
+            self.gmu_id_column = None
+            ids = self.gmu_gdf.index
+        
+        self.gmu_ids = [str(gmu_id) for gmu_id in ids]
+        self.geometries = list(self.gmu_gdf.geometry.values)
+        shapely.prepare(self.geometries)
+        self.spatial_index = STRtree(self.geometries)
+        self._indexed_gdf_id = id(self.gmu_gdf)
+    
+    def _ensure_spatial_index(self):
+        """Build (or rebuild) the spatial index if gmu_gdf was loaded or replaced."""
+        if self.gmu_gdf is None and self.grid is not None:
+            # Boundary cells of a standalone grid need the polygons for an exact test
+            self.load_gmu_data(self.target_gmus or None)
+        if self.gmu_gdf is None:
+            raise ValueError("GMU data not loaded. Call load_gmu_data() first.")
+        if self.spatial_index is None or self._indexed_gdf_id != id(self.gmu_gdf):
+            self._build_spatial_index()
+    
     def find_gmu_for_point(self, lat: float, lon: float) -> Optional[str]:
         """
         Find which GMU contains a given lat/lon point.
         
+        Uses the STRtree bounding-box prefilter, then exact contains() tests on
+        the few prepared candidate polygons.
+        
+        If a lookup grid is loaded, interior cells are answered from the grid
+        and only boundary cells fall through to the polygon test.
+        
         Args:
             lat: Latitude
             lon: Longitude
@@ -80,42 +222,299 @@ class GMUProcessor:
         Returns:
             GMU unit ID or None if point is not in any GMU
         """
-        if self.gmu_gdf is None:
-            raise ValueError("GMU data not loaded. Call load_gmu_data() first.")
+        if self.grid is not None:
+            code = self._grid_code(lat, lon)
+            if code == GRID_OUTSIDE:
+                return None
+            if code != GRID_BOUNDARY:
+                return self.grid_gmu_ids[code - 1]
+        
+        self._ensure_spatial_index()
         
         point = Point(lon, lat)  # Note: Point takes (lon, lat) not (lat, lon)
         
-        # Find which polygon contains the point
-        for idx, row in self.gmu_gdf.iterrows():
-            if row.geometry.contains(point):
-                # Return the GMU ID (adjust column name as needed)
-                if 'GMUID' in row:
-                    return str(row['GMUID'])
-                elif 'DAU' in row:
-                    return str(row['DAU'])
-                else:
-                    return str(idx)
+        # Candidates are checked in layer order so overlaps resolve as before
+        for idx in sorted(self.spatial_index.query(point)):
+            if self.geometries[idx].contains(point):
+                return self.gmu_ids[idx]
         
         return None
+
+    def find_gmus_for_points(self, lats: Union[np.ndarray, pd.DataFrame, List[float]],
+                             lons: Optional[Union[np.ndarray, List[float]]] = None,
+                             missing: Optional[str] = None) -> np.ndarray:
+        """
+        Find the GMU containing each of many lat/lon points in one bulk query.
+
+        Runs a single STRtree query with a 'within' predicate over all points,
+        so the bounding-box filter and exact polygon tests happen in shapely's
+        vectorized C loops instead of one Python call per point. Results match
+        find_gmu_for_point: overlaps resolve to the first polygon in layer order.
+
+        If a lookup grid is loaded, only points in boundary cells are sent to
+        the STRtree query.
+
+        Args:
+            lats: Array-like of latitudes, or a DataFrame with 'lat' and 'lon' columns
+            lons: Array-like of longitudes (omit when passing a DataFrame)
+            missing: Value returned for points outside every GMU or with NaN coordinates
+
+        Returns:
+            1-D object array of GMU unit IDs, aligned with the input points
+        """
+        if isinstance(lats, pd.DataFrame):
+            if lons is not None:
+                raise ValueError("Pass either a DataFrame or separate lats/lons arrays")
+            lons = lats['lon']
+            lats = lats['lat']
+        elif lons is None:
+            raise ValueError("lons is required when lats is not a DataFrame")
+
+        lats = np.asarray(lats, dtype=float).ravel()
+        lons = np.asarray(lons, dtype=float).ravel()
+        if lats.shape != lons.shape:
+            raise ValueError(f"lats and lons must have the same shape: {lats.shape} != {lons.shape}")
+
+        result = np.full(lats.shape, missing, dtype=object)
+        valid = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+
+        if self.grid is not None and valid.size:
+            codes = self._grid_codes(lats[valid], lons[valid])
+            interior = (codes != GRID_OUTSIDE) & (codes != GRID_BOUNDARY)
+            grid_ids = np.asarray(self.grid_gmu_ids, dtype=object)
+            result[valid[interior]] = grid_ids[codes[interior].astype(np.intp) - 1]
+            valid = valid[codes == GRID_BOUNDARY]
+
+        if valid.size == 0:
+            return result
+
+        self._ensure_spatial_index()
+        points = shapely.points(lons[valid], lats[valid])  # (lon, lat) order
+        point_idx, gmu_idx = self.spatial_index.query(points, predicate='within')
+
+        # Keep the first polygon in layer order for points inside overlapping GMUs
+        order = np.lexsort((gmu_idx, point_idx))
+        matched, first = np.unique(point_idx[order], return_index=True)
+        gmu_ids = np.asarray(self.gmu_ids, dtype=object)
+        result[valid[matched]] = gmu_ids[gmu_idx[order][first]]
+
+        return result
+
+    def build_lookup_grid(self, output_path: Optional[str] = None,
+                          cell_size: float = DEFAULT_GRID_CELL_SIZE) -> Path:
+        """
+        Bake the loaded GMU layer into a quantized lat/lon lookup grid.
+        
+        The grid covers the layer's bounding box and stores one uint16 code per
+        cell: GRID_OUTSIDE, GRID_BOUNDARY for cells that are not strictly inside
+        exactly one GMU, or a 1-based index into the GMU id list. The codes are
+        saved as a .npy file next to a JSON sidecar with bounds, cell size, GMU
+        ids and the source file's mtime.
+        
+        Args:
+            output_path: Path for the .npy file (defaults to <gmu file>.grid.npy)
+            cell_size: Cell edge length in degrees
+            
+        Returns:
+            Path to the written .npy file
+        """
+        self._ensure_spatial_index()
+        if len(self.gmu_ids) >= GRID_BOUNDARY:
+            raise ValueError(f"Too many GMUs for a uint16 grid: {len(self.gmu_ids)}")
+        
+        west, south, east, north = (float(v) for v in self.gmu_gdf.total_bounds)
+        n_rows = max(1, math.ceil((north - south) / cell_size))
+        n_cols = max(1, math.ceil((east - west) / cell_size))
+        
+        rows, cols = np.divmod(np.arange(n_rows * n_cols), n_cols)
+        cell_west = west + cols * cell_size
+        cell_south = south + rows * cell_size
+        cells = shapely.box(cell_west, cell_south, cell_west + cell_size, cell_south + cell_size)
+        
+        codes = np.full(n_rows * n_cols, GRID_OUTSIDE, dtype=np.uint16)
+        cell_idx, gmu_idx = self.spatial_index.query(cells, predicate='intersects')
+        hits = np.bincount(cell_idx, minlength=len(cells))
+        codes[hits > 0] = GRID_BOUNDARY
+        
+        # A cell gets a GMU code only if it touches one polygon and lies strictly inside it
+        single = hits[cell_idx] == 1
+        geometries = np.asarray(self.geometries, dtype=object)
+        inside = shapely.contains_properly(geometries[gmu_idx[single]], cells[cell_idx[single]])
+        codes[cell_idx[single][inside]] = gmu_idx[single][inside] + 1
+        
+        grid_path = Path(output_path) if output_path else self.gmu_data_path.with_suffix('.grid.npy')
+        grid_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(grid_path, codes.reshape(n_rows, n_cols))
+        
+        meta = {
+            'bounds': [west, south, east, north],
+            'cell_size': cell_size,
+            'shape': [n_rows, n_cols],
+            'gmu_ids': self.gmu_ids,
+            'target_gmus': self.target_gmus,
+            'source': str(self.gmu_data_path),
+            'source_mtime': self.gmu_data_path.stat().st_mtime if self.gmu_data_path.exists() else None
+        }
+        with open(grid_path.with_suffix('.json'), 'w') as f:
+            json.dump(meta, f, indent=2)
+        
+        boundary_share = float(np.mean(codes == GRID_BOUNDARY))
+        logger.info(f"Built {n_rows}x{n_cols} GMU lookup grid at {grid_path} "
+                    f"({boundary_share:.1%} boundary cells)")
+        return grid_path
+    
+    def load_lookup_grid(self, grid_path: Optional[str] = None) -> bool:
+        """
+        Memory-map a lookup grid written by build_lookup_grid().
+        
+        The polygons are not needed to load the grid; they are loaded lazily
+        the first time a point lands in a boundary cell.
+        
+        Args:
+            grid_path: Path to the .npy file (defaults to <gmu file>.grid.npy)
+            
+        Returns:
+            True if the grid was loaded, False if it is missing or older than the GMU file
+        """
+        grid_path = Path(grid_path) if grid_path else self.gmu_data_path.with_suffix('.grid.npy')
+        meta_path = grid_path.with_suffix('.json')
+        if not grid_path.exists() or not meta_path.exists():
+            logger.warning(f"GMU lookup grid not found: {grid_path}")
+            return False
+        
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        
+        if self.gmu_data_path.exists() and meta.get('source_mtime') is not None:
+            if self.gmu_data_path.stat().st_mtime > meta['source_mtime']:
+                logger.warning(f"GMU lookup grid {grid_path} is older than {self.gmu_data_path}; rebuild it")
+                return False
+        
+        grid = np.load(grid_path, mmap_mode='r')
+        if list(grid.shape) != meta['shape']:
+            logger.warning(f"GMU lookup grid {grid_path} does not match its metadata")
+            return False
+        
+        self.grid = grid
+        self.grid_meta = meta
+        self.grid_gmu_ids = [str(gmu_id) for gmu_id in meta['gmu_ids']]
+        if meta.get('target_gmus'):
+            self.target_gmus = meta['target_gmus']
+        logger.info(f"Loaded {grid.shape[0]}x{grid.shape[1]} GMU lookup grid from {grid_path}")
+        return True
+    
+    def _grid_code(self, lat: float, lon: float) -> int:
+        """Look up the grid code for one point; points off the grid are GRID_OUTSIDE."""
+        west, south, _, _ = self.grid_meta['bounds']
+        cell_size = self.grid_meta['cell_size']
+        if math.isnan(lat) or math.isnan(lon):
+            return GRID_OUTSIDE
+        row = math.floor((lat - south) / cell_size)
+        col = math.floor((lon - west) / cell_size)
+        if 0 <= row < self.grid.shape[0] and 0 <= col < self.grid.shape[1]:
+            return int(self.grid[row, col])
+        return GRID_OUTSIDE
+    
+    def _grid_codes(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Look up grid codes for coordinate arrays; points off the grid are GRID_OUTSIDE."""
+        west, south, _, _ = self.grid_meta['bounds']
+        cell_size = self.grid_meta['cell_size']
+        n_rows, n_cols = self.grid.shape
+        
+        rows = np.floor((lats - south) / cell_size)
+        cols = np.floor((lons - west) / cell_size)
+        on_grid = (rows >= 0) & (rows < n_rows) & (cols >= 0) & (cols < n_cols)
+        
+        codes = np.full(lats.shape, GRID_OUTSIDE, dtype=np.uint16)
+        codes[on_grid] = self.grid[rows[on_grid].astype(np.intp), cols[on_grid].astype(np.intp)]
+        return codes
+    
+    def find_gmus_for_trail(self, trail: Union[LineString, np.ndarray, List[Tuple[float, float]]]) -> Dict[str, float]:
+        """
+        Find all GMUs that a trail passes through and how much of it lies in each.
+        
+        The trail is intersected as a line against the indexed GMU polygons, so
+        units crossed between vertices are found too.
+        
+        Args:
+            trail: LineString in (lon, lat) order, or a sequence/array of (lat, lon) points
+            
+        Returns:
+            Dict of GMU ID -> trail length inside it in miles, longest first
+        """
+        return self.find_gmus_for_trails([trail])[0]
     
-    def find_gmus_for_trail(self, trail_points: List[Tuple[float, float]]) -> List[str]:
+    def find_gmus_for_trails(self, trails: List[Union[LineString, np.ndarray, List[Tuple[float, float]]]]
+                             ) -> List[Dict[str, float]]:
         """
-        Find all GMUs that a trail passes through.
+        Batch version of find_gmus_for_trail for whole trail collections.
+        
+        All trails go through one STRtree query and one vectorized intersection,
+        and the clipped pieces are measured in UTM zone 13N. Single-point trails
+        are assigned to the GMU containing the point with a length of 0.
         
         Args:
-            trail_points: List of (lat, lon) tuples representing trail
+            trails: LineStrings in (lon, lat) order, or sequences/arrays of (lat, lon) points
             
         Returns:
-            List of unique GMU IDs the trail passes through
+            One dict of GMU ID -> miles inside per trail, longest first
         """
-        gmus = set()
+        self._ensure_spatial_index()
+        
+        results: List[Dict[str, float]] = [{} for _ in trails]
+        lines, line_trails, point_trails, point_coords = [], [], [], []
+        for i, trail in enumerate(trails):
+            geometry = self._trail_geometry(trail)
+            if geometry is None:
+                continue
+            if isinstance(geometry, Point):
+                point_trails.append(i)
+                point_coords.append((geometry.y, geometry.x))
+            else:
+                lines.append(geometry)
+                line_trails.append(i)
+        
+        if point_trails:
+            lats, lons = zip(*point_coords)
+            for i, gmu in zip(point_trails, self.find_gmus_for_points(lats, lons)):
+                if gmu:
+                    results[i][gmu] = 0.0
         
-        for lat, lon in trail_points:
-            gmu = self.find_gmu_for_point(lat, lon)
-            if gmu:
-                gmus.add(gmu)
+        if lines:
+            lines = np.asarray(lines, dtype=object)
+            line_idx, gmu_idx = self.spatial_index.query(lines, predicate='intersects')
+            geometries = np.asarray(self.geometries, dtype=object)
+            
+            # Lines wholly inside a GMU need no overlay; only crossings are clipped
+            pieces = lines[line_idx]
+            crossing = ~shapely.contains_properly(geometries[gmu_idx], pieces)
+            pieces[crossing] = shapely.intersection(pieces[crossing], geometries[gmu_idx[crossing]])
+            lengths = shapely.length(shapely.transform(pieces, _to_utm, interleaved=False)) / METERS_PER_MILE
+            
+            for li, gi, length in zip(line_idx, gmu_idx, lengths):
+                if length > 0:
+                    gmu = self.gmu_ids[gi]
+                    trail_result = results[line_trails[li]]
+                    trail_result[gmu] = trail_result.get(gmu, 0.0) + float(length)
         
-        return list(gmus)
+        return [
+            {gmu: round(length, 3) for gmu, length in sorted(result.items(), key=lambda item: -item[1])}
+            for result in results
+        ]
+    
+    @staticmethod
+    def _trail_geometry(trail: Union[LineString, np.ndarray, List[Tuple[float, float]]]):
+        """Convert a trail to a (lon, lat) LineString, a Point for single-vertex trails, or None."""
+        if isinstance(trail, (LineString, MultiLineString)):
+            return None if trail.is_empty else trail
+        
+        coords = np.asarray(trail, dtype=float).reshape(-1, 2)
+        coords = coords[~np.isnan(coords).any(axis=1)]
+        if len(coords) == 0:
+            return None
+        if len(coords) == 1 or (coords == coords[0]).all():
+            return Point(coords[0][1], coords[0][0])
+        return LineString(coords[:, ::-1])  # (lat, lon) -> (lon, lat)
     
     def get_gmu_bounds(self, gmu_id: str) -> Optional[Dict[str, float]]:
         """
@@ -0,0 +1,182 @@
+"""
+Ingest-time deduplication against a persistent key index.
+
+Every stored sighting carries dedup_keys: its MinHash band keys and the
+spatio-temporal bucket it falls in (see near_duplicates and
+spatiotemporal_clusters). A new batch computes the keys it could collide
+with (its band keys plus its neighbouring buckets), fetches the stored
+sightings holding any of them with one indexed array-overlap query, and
+verifies those candidates exactly. Matching sightings share a cluster_id;
+a batch that bridges two existing clusters merges them with one update.
+The cost is proportional to the batch and its candidates, not the table,
+so the periodic full-table duplicate scans are no longer needed.
+"""
+
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .near_duplicates import (
+    DEFAULT_BANDS, DEFAULT_THRESHOLD, MinHasher, UnionFind,
+    band_keys, decode_signature, encode_signature, estimate_similarity
+)
+from .spatiotemporal_clusters import SpatioTemporalClusterer, bucket_key, event_fields
+
+
+class IncrementalDeduplicator:
+    """
+    Assign cluster ids to a batch of new sightings.
+
+    lookup(keys) must return the stored sightings whose dedup_keys overlap
+    keys, as dicts with id, cluster_id, species, a location (coordinates or
+    location), location_name, location_confidence_radius, sighting_date,
+    created_at, minhash, content_hash and dedup_keys.
+
+    relink(cluster_id, cluster_ids, sighting_ids) must set cluster_id on
+    stored sightings whose cluster_id is in cluster_ids or whose id is in
+    sighting_ids. It may defer the update until the batch is written, as
+    bulk_save_sightings does; assign never reads the relinked rows back.
+    """
+
+    def __init__(self, lookup: Callable[[List[str]], Iterable[Dict[str, Any]]],
+                 relink: Callable[[str, List[str], List[Any]], Any],
+                 hasher: Optional[MinHasher] = None,
+                 threshold: float = DEFAULT_THRESHOLD,
+                 bands: int = DEFAULT_BANDS,
+                 clusterer: Optional[SpatioTemporalClusterer] = None):
+        """
+        Args:
+            lookup: Fetches stored candidates for a list of dedup keys
+            relink: Moves stored sightings into a cluster
+            hasher: MinHasher (defaults to MinHasher())
+            threshold: Minimum estimated Jaccard similarity of raw_text
+            bands: LSH bands
+            clusterer: Spatio-temporal bucketing and matching rules
+        """
+        self.lookup = lookup
+        self.relink = relink
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold
+        self.bands = bands
+        self.clusterer = clusterer or SpatioTemporalClusterer()
+
+    def _prepare(self, record: Dict[str, Any], text_key: str):
+        """Signature, event fields, stored keys and query keys of one record."""
+        signature = self.hasher.signature(record.get(text_key) or '')
+        fields = event_fields(record)
+        bands = band_keys(signature, self.bands) if signature is not None else []
+        keys = list(bands)
+        query_keys = list(bands)
+        if fields is not None:
+            keys.append(bucket_key(self.clusterer.bucket(fields)))
+            query_keys.extend(bucket_key(bucket) for bucket in self.clusterer.neighbour_buckets(fields))
+        record.update(
+            minhash=encode_signature(signature) if signature is not None else None,
+            minhash_bands=bands or None,
+            near_duplicate_of=None,
+            dedup_keys=keys or None,
+            cluster_id=None
+        )
+        return signature, fields, query_keys
+
+    def _matches(self, a, b) -> bool:
+        """Same species and near-identical text, or the same event."""
+        signature_a, fields_a, species_a = a
+        signature_b, fields_b, species_b = b
+        if species_a and species_a == species_b and signature_a is not None and signature_b is not None:
+            if estimate_similarity(signature_a, signature_b) >= self.threshold:
+                return True
+        return fields_a is not None and fields_b is not None and self.clusterer.same_event(fields_a, fields_b)
+
+    def assign(self, records: List[Dict[str, Any]], text_key: str = 'raw_text') -> Dict[str, int]:
+        """
+        Set minhash, minhash_bands, near_duplicate_of, dedup_keys and cluster_id
+        on records about to be inserted.
+
+        A record matching stored sightings joins their cluster (merging the
+        clusters it bridges); records matching only each other start a new
+        cluster; a record matching nothing keeps cluster_id None.
+
+        Args:
+            records: Sighting dictionaries (modified in place)
+            text_key: Key holding the text to compare
+
+        Returns:
+            {'matched': records joining an existing cluster,
+             'new_clusters': clusters created, 'merged_clusters': clusters merged away}
+        """
+        result = {'matched': 0, 'new_clusters': 0, 'merged_clusters': 0}
+        new = []
+        query_keys = []
+        all_keys = set()
+        for record in records:
+            signature, fields, keys = self._prepare(record, text_key)
+            species = (record.get('species') or '').lower().strip()
+            new.append((signature, fields, species))
+            query_keys.append(keys)
+            all_keys.update(keys)
+        if not all_keys:
+            return result
+
+        stored = {}
+        by_key: Dict[str, List[Any]] = defaultdict(list)
+        for row in self.lookup(sorted(all_keys)):
+            minhash = row.get('minhash')
+            signature = decode_signature(minhash) if minhash else None
+            stored[row['id']] = (row, (signature, event_fields(row), (row.get('species') or '').lower().strip()))
+            for key in row.get('dedup_keys') or ():
+                by_key[key].append(row['id'])
+        # Records whose content hash is already stored are dropped by the insert
+        stored_hashes = {row.get('content_hash') for row, _ in stored.values() if row.get('content_hash')}
+
+        union_find = UnionFind()
+        batch_by_key: Dict[str, List[int]] = defaultdict(list)
+        for index, item in enumerate(new):
+            union_find.find(('new', index))
+            if records[index].get('content_hash') in stored_hashes:
+                continue
+            best = None
+            candidates = {stored_id for key in query_keys[index] for stored_id in by_key.get(key, ())}
+            for stored_id in candidates:
+                stored_item = stored[stored_id][1]
+                if self._matches(item, stored_item):
+                    union_find.union(('new', index), ('stored', stored_id))
+                # near_duplicate_of links the most similar stored text, whatever its species
+                if item[0] is not None and stored_item[0] is not None:
+                    similarity = estimate_similarity(item[0], stored_item[0])
+                    if similarity >= self.threshold and (best is None or similarity > best[1]):
+                        best = (stored_id, similarity)
+            if best is not None:
+                records[index]['near_duplicate_of'] = best[0]
+            peers = {other for key in query_keys[index] for other in batch_by_key.get(key, ())}
+            for other in peers:
+                if self._matches(item, new[other]):
+                    union_find.union(('new', index), ('new', other))
+            for key in records[index]['dedup_keys'] or ():
+                batch_by_key[key].append(index)
+
+        for group in union_find.groups():
+            indexes = [key[1] for key in group if key[0] == 'new']
+            if not indexes:
+                continue
+            stored_rows = [stored[key[1]][0] for key in group if key[0] == 'stored']
+            cluster_ids = sorted({str(row['cluster_id']) for row in stored_rows if row.get('cluster_id')})
+            if stored_rows:
+                # Keep the cluster of the oldest stored member
+                oldest = min(stored_rows, key=lambda row: str(row.get('created_at') or ''))
+                target = str(oldest['cluster_id']) if oldest.get('cluster_id') else (
+                    cluster_ids[0] if cluster_ids else str(uuid.uuid4()))
+                others = [cluster_id for cluster_id in cluster_ids if cluster_id != target]
+                unclustered = [row['id'] for row in stored_rows if not row.get('cluster_id')]
+                if others or unclustered:
+                    self.relink(target, others, unclustered)
+                if not cluster_ids:
+                    result['new_clusters'] += 1
+                result['merged_clusters'] += len(others)
+                result['matched'] += len(indexes)
+            else:
+                target = str(uuid.uuid4())
+                result['new_clusters'] += 1
+            for index in indexes:
+                records[index]['cluster_id'] = target
+        return result
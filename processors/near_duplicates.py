@@ -0,0 +1,321 @@
+"""
+Near-duplicate detection for sighting text with MinHash and LSH banding.
+
+raw_text is normalized and split into word shingles; each sighting gets a
+MinHash signature whose agreement with another signature estimates the
+Jaccard similarity of their shingle sets. Signatures are split into bands,
+and only sightings sharing at least one identical band become candidate
+pairs, so crossposts, quoted comments and lightly edited reposts are found
+without comparing every pair.
+
+Signatures are stored with each sighting (minhash: base64 text) together
+with their band keys (minhash_bands: text[] with a GIN index), which lets
+an insert look up its candidates with a single array-overlap query.
+"""
+
+import re
+import base64
+import hashlib
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+DEFAULT_NUM_PERM = 128
+# 32 bands of 4 rows: pairs above ~0.42 Jaccard very likely become candidates
+DEFAULT_BANDS = 32
+# Estimated Jaccard similarity at which a candidate counts as a near-duplicate
+DEFAULT_THRESHOLD = 0.6
+SHINGLE_SIZE = 3
+# Fewer shingles than this (under six words) is too little text to compare:
+# "Black bear" and "black bear!" would estimate a Jaccard similarity of 1.0
+MIN_SHINGLES = 4
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
+NON_WORD_PATTERN = re.compile(r'[^a-z0-9\s]+')
+QUOTE_PREFIX_PATTERN = re.compile(r'^\s*>+\s?', re.MULTILINE)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and drop URLs, quote markers and punctuation."""
+    text = QUOTE_PREFIX_PATTERN.sub('', text or '')
+    text = URL_PATTERN.sub(' ', text.lower())
+    text = NON_WORD_PATTERN.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """
+    Word shingles of normalized text.
+
+    Texts shorter than one shingle yield no shingles.
+    """
+    words = normalize_text(text).split()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _hash_shingle(shingle: str) -> int:
+    # blake2b rather than hash() so signatures are stable across processes
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+class MinHasher:
+    """
+    MinHash signatures with num_perm universal hash functions.
+
+    The permutation parameters derive from the seed, so signatures built by
+    different processes (scrapers, batch jobs) are comparable as long as
+    num_perm and seed match.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1,
+                 min_shingles: int = MIN_SHINGLES):
+        self.num_perm = num_perm
+        self.min_shingles = max(1, min_shingles)
+        rng = np.random.RandomState(seed)
+        # Parameters below 2^32 keep a * x + b inside uint64 for 32-bit x
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        MinHash signature of a text.
+
+        Returns:
+            uint32 array of length num_perm, or None for text with fewer
+            than min_shingles distinct shingles
+        """
+        shingle_set = shingles(text)
+        if len(shingle_set) < self.min_shingles:
+            return None
+        hashes = np.fromiter((_hash_shingle(s) for s in shingle_set), dtype=np.uint64, count=len(shingle_set))
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+
+def estimate_similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity: the fraction of equal signature slots."""
+    return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+def encode_signature(signature: np.ndarray) -> str:
+    """Signature as base64 text for the minhash column."""
+    return base64.b64encode(signature.astype('<u4').tobytes()).decode('ascii')
+
+
+def decode_signature(value: str) -> np.ndarray:
+    """Inverse of encode_signature()."""
+    return np.frombuffer(base64.b64decode(value), dtype='<u4').astype(np.uint32)
+
+
+def _band_slices(signature: np.ndarray, bands: int) -> List[bytes]:
+    """Raw bytes of each band, prefixed with the band number."""
+    width = (len(signature) // bands) * 4
+    data = signature.astype('<u4').tobytes()
+    return [bytes([band]) + data[band * width:(band + 1) * width] for band in range(bands)]
+
+
+def band_keys(signature: np.ndarray, bands: int = DEFAULT_BANDS) -> List[str]:
+    """
+    LSH band keys of a signature ('<band>:<hash of the band's rows>') for the
+    minhash_bands column.
+
+    Two signatures are candidates when they share any key.
+    """
+    return [f"{band[0]}:{hashlib.blake2b(band[1:], digest_size=6).hexdigest()}"
+            for band in _band_slices(signature, bands)]
+
+
+class LSHIndex:
+    """In-memory LSH index from band keys to sighting keys."""
+
+    def __init__(self, bands: int = DEFAULT_BANDS):
+        self.bands = bands
+        self._buckets: Dict[bytes, List[Hashable]] = defaultdict(list)
+        self.signatures: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def add(self, key: Hashable, signature: np.ndarray):
+        """Index a signature under key."""
+        self.signatures[key] = signature
+        for band in _band_slices(signature, self.bands):
+            self._buckets[band].append(key)
+
+    def candidates(self, signature: np.ndarray) -> Set[Hashable]:
+        """Keys sharing at least one band with the signature."""
+        found: Set[Hashable] = set()
+        for band in _band_slices(signature, self.bands):
+            found.update(self._buckets.get(band, ()))
+        return found
+
+    def query(self, signature: np.ndarray, threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[Hashable, float]]:
+        """
+        Indexed sightings whose estimated similarity reaches threshold.
+
+        Returns:
+            (key, similarity) pairs, most similar first
+        """
+        matches = []
+        for key in self.candidates(signature):
+            similarity = estimate_similarity(signature, self.signatures[key])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        return sorted(matches, key=lambda match: -match[1])
+
+
+class UnionFind:
+    """Disjoint sets with path compression and union by size."""
+
+    def __init__(self):
+        self._parent: Dict[Hashable, Hashable] = {}
+        self._size: Dict[Hashable, int] = {}
+
+    def find(self, key: Hashable) -> Hashable:
+        parent = self._parent.setdefault(key, key)
+        if parent == key:
+            self._size.setdefault(key, 1)
+            return key
+        root = self.find(parent)
+        self._parent[key] = root
+        return root
+
+    def union(self, a: Hashable, b: Hashable) -> Hashable:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size.pop(root_b)
+        return root_a
+
+    def groups(self) -> List[List[Hashable]]:
+        """Sets with more than one member."""
+        members: Dict[Hashable, List[Hashable]] = defaultdict(list)
+        for key in self._parent:
+            members[self.find(key)].append(key)
+        return [group for group in members.values() if len(group) > 1]
+
+
+def find_near_duplicate_pairs(signatures: Iterable[Tuple[Hashable, np.ndarray]],
+                              threshold: float = DEFAULT_THRESHOLD,
+                              bands: int = DEFAULT_BANDS) -> List[Tuple[Hashable, Hashable, float]]:
+    """
+    Near-duplicate pairs among signatures in one pass.
+
+    Each signature is checked against those indexed before it, then added,
+    so work grows with the number of candidate pairs rather than n^2.
+
+    Args:
+        signatures: (key, signature) pairs
+        threshold: Minimum estimated Jaccard similarity
+        bands: LSH bands
+
+    Returns:
+        (earlier key, later key, similarity) for every matching pair
+    """
+    index = LSHIndex(bands)
+    pairs = []
+    for key, signature in signatures:
+        for match, similarity in index.query(signature, threshold):
+            pairs.append((match, key, similarity))
+        index.add(key, signature)
+    return pairs
+
+
+def cluster_near_duplicates(signatures: Iterable[Tuple[Hashable, np.ndarray]],
+                            threshold: float = DEFAULT_THRESHOLD,
+                            bands: int = DEFAULT_BANDS) -> List[List[Hashable]]:
+    """
+    Group signatures into near-duplicate clusters (transitively connected pairs).
+
+    Returns:
+        Clusters of two or more keys, members in input order
+    """
+    order: Dict[Hashable, int] = {}
+
+    def numbered():
+        for key, signature in signatures:
+            order[key] = len(order)
+            yield key, signature
+
+    union_find = UnionFind()
+    for a, b, _ in find_near_duplicate_pairs(numbered(), threshold, bands):
+        union_find.union(a, b)
+    return [sorted(group, key=order.__getitem__) for group in union_find.groups()]
+
+
+class NearDuplicateChecker:
+    """
+    Insert-time near-duplicate check against stored signatures.
+
+    lookup(band_keys) must return (id, minhash) for stored sightings whose
+    minhash_bands overlap band_keys; with the GIN index that is one cheap
+    query per batch.
+    """
+
+    def __init__(self, lookup: Callable[[List[str]], Iterable[Tuple[Any, str]]],
+                 hasher: Optional[MinHasher] = None,
+                 threshold: float = DEFAULT_THRESHOLD,
+                 bands: int = DEFAULT_BANDS):
+        """
+        Args:
+            lookup: Fetches stored candidates for a list of band keys
+            hasher: MinHasher (defaults to MinHasher())
+            threshold: Minimum estimated Jaccard similarity
+            bands: LSH bands
+        """
+        self.lookup = lookup
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold
+        self.bands = bands
+
+    def annotate(self, records: List[Dict[str, Any]], text_key: str = 'raw_text') -> int:
+        """
+        Set minhash, minhash_bands and near_duplicate_of on each record.
+
+        near_duplicate_of is the id of the most similar stored sighting, or
+        None. Near-duplicates within the batch itself have no id yet; the
+        batch job (scripts/find_near_duplicates.py) links those.
+
+        Args:
+            records: Rows about to be inserted (modified in place)
+            text_key: Key holding the text to compare
+
+        Returns:
+            Number of records flagged as near-duplicates
+        """
+        signed = []
+        all_keys: Set[str] = set()
+        for record in records:
+            signature = self.hasher.signature(record.get(text_key) or '')
+            if signature is None:
+                record.update(minhash=None, minhash_bands=None, near_duplicate_of=None)
+                continue
+            keys = band_keys(signature, self.bands)
+            record.update(minhash=encode_signature(signature), minhash_bands=keys, near_duplicate_of=None)
+            all_keys.update(keys)
+            signed.append((record, signature))
+        if not signed:
+            return 0
+
+        index = LSHIndex(self.bands)
+        for stored_id, minhash in self.lookup(sorted(all_keys)):
+            if minhash:
+                index.add(stored_id, decode_signature(minhash))
+        if not len(index):
+            return 0
+
+        flagged = 0
+        for record, signature in signed:
+            matches = index.query(signature, self.threshold)
+            if matches:
+                record['near_duplicate_of'] = matches[0][0]
+                flagged += 1
+        return flagged
@@ -0,0 +1,227 @@
+"""
+Spatio-temporal clustering of sightings that describe the same event.
+
+Sightings are bucketed by species, a lat/lon grid cell and a time bucket.
+Each sighting is compared only with sightings already seen in its own and
+the neighbouring buckets, and two sightings are unioned when their distance
+is within their combined location_confidence_radius and their dates are
+within the time window. One pass over the table yields clusters of reports
+of the same herd even when they are a few hundred metres or a day apart,
+which exact keys (rounded coordinates, identical dates) never group.
+"""
+
+import math
+import struct
+import hashlib
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .near_duplicates import UnionFind
+
+
+MILES_PER_DEGREE_LAT = 69.17
+EARTH_RADIUS_MILES = 3958.8
+
+# Sightings whose dates are at most this many days apart can be the same event
+DEFAULT_WINDOW_DAYS = 1
+# Upper bound on the match distance, so vague sightings (a whole GMU, ~35 mi)
+# do not swallow every report in the region. Also the grid cell size.
+DEFAULT_MAX_DISTANCE_MILES = 5.0
+# Lower bound, for sightings whose radius is missing or 0
+DEFAULT_MIN_DISTANCE_MILES = 0.25
+
+
+def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in miles."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+
+def sighting_coordinates(sighting: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """
+    (lat, lon) of a sighting.
+
+    Understands scraper output (coordinates: [lat, lon]) and the database
+    location column as WKT ('POINT(lon lat)') or (E)WKB hex as PostgREST
+    returns it.
+    """
+    coords = sighting.get('coordinates')
+    if isinstance(coords, (list, tuple)) and len(coords) == 2 and None not in coords:
+        return float(coords[0]), float(coords[1])
+
+    location = sighting.get('location')
+    if not location or not isinstance(location, str):
+        return None
+    try:
+        if 'POINT' in location.upper():
+            inner = location[location.index('(') + 1:location.rindex(')')]
+            lon, lat = (float(value) for value in inner.split())
+            return lat, lon
+        data = bytes.fromhex(location)
+        byte_order = '<' if data[0] == 1 else '>'
+        geometry_type, = struct.unpack(byte_order + 'I', data[1:5])
+        offset = 9 if geometry_type & 0x20000000 else 5  # EWKB carries an SRID
+        lon, lat = struct.unpack(byte_order + 'dd', data[offset:offset + 16])
+        return lat, lon
+    except (ValueError, struct.error):
+        return None
+
+
+def sighting_day(sighting: Dict[str, Any]) -> Optional[int]:
+    """Day number (proleptic ordinal) of sighting_date, falling back to created_at."""
+    for field in ('sighting_date', 'created_at'):
+        value = sighting.get(field)
+        if isinstance(value, datetime):
+            return value.toordinal()
+        if isinstance(value, date):
+            return value.toordinal()
+        if isinstance(value, str) and len(value) >= 10:
+            try:
+                return date.fromisoformat(value[:10]).toordinal()
+            except ValueError:
+                continue
+    return None
+
+
+def event_fields(sighting: Dict[str, Any]) -> Optional[tuple]:
+    """
+    The fields that decide whether two sightings are the same event.
+
+    Returns:
+        (species, day, lat, lon, radius, location name hash), with lat/lon
+        None when the sighting has no coordinates; None when the sighting
+        has no species, no date, or neither coordinates nor a location name
+    """
+    species = (sighting.get('species') or '').lower().strip()
+    day = sighting_day(sighting)
+    if not species or day is None:
+        return None
+    radius = float(sighting.get('location_confidence_radius') or 0)
+    point = sighting_coordinates(sighting)
+    if point is not None:
+        return species, day, point[0], point[1], radius, None
+    name = (sighting.get('location_name') or '').lower().strip()
+    if not name:
+        return None
+    return species, day, None, None, radius, hashlib.md5(name.encode()).hexdigest()[:12]
+
+
+def bucket_key(bucket: tuple) -> str:
+    """Text form of a bucket, for the dedup_keys column."""
+    return 'st:' + ':'.join(map(str, bucket))
+
+
+class SpatioTemporalClusterer:
+    """
+    Single-pass clustering over species, grid cell and time bucket.
+
+    Grid cells are max_distance_miles tall (in latitude); in longitude a
+    sighting searches as many neighbouring cells as its latitude needs to
+    cover max_distance_miles. Time buckets are window_days long and the
+    adjacent bucket on each side is searched.
+    """
+
+    def __init__(self, window_days: int = DEFAULT_WINDOW_DAYS,
+                 max_distance_miles: float = DEFAULT_MAX_DISTANCE_MILES,
+                 min_distance_miles: float = DEFAULT_MIN_DISTANCE_MILES):
+        """
+        Args:
+            window_days: Maximum difference between sighting dates
+            max_distance_miles: Cap on the combined confidence radius
+            min_distance_miles: Floor on the combined confidence radius
+        """
+        self.window_days = window_days
+        self.max_distance_miles = max_distance_miles
+        self.min_distance_miles = min_distance_miles
+        self.cell_degrees = max_distance_miles / MILES_PER_DEGREE_LAT
+        self._buckets: Dict[tuple, List[Tuple[Hashable, tuple]]] = defaultdict(list)
+        self.union_find = UnionFind()
+        self.skipped = 0
+
+    def bucket(self, fields: tuple) -> tuple:
+        """Bucket a sighting is stored under."""
+        species, day, lat, lon, _, name = fields
+        time_bucket = day // max(self.window_days, 1)
+        if lat is None:
+            # Sightings without coordinates fall back to their exact location name
+            return ('name', species, name, time_bucket)
+        return ('cell', species, int(lat // self.cell_degrees), int(lon // self.cell_degrees), time_bucket)
+
+    def neighbour_buckets(self, fields: tuple) -> List[tuple]:
+        """Buckets that can hold sightings of the same event (including its own)."""
+        own = self.bucket(fields)
+        time_bucket = own[-1]
+        if own[0] == 'name':
+            return [own[:-1] + (bucket,) for bucket in range(time_bucket - 1, time_bucket + 2)]
+        _, species, row, col, _ = own
+        # A degree of longitude shrinks with latitude; search far enough east/west
+        # at the poleward edge of the neighbouring row
+        edge = min(abs(fields[2]) + self.cell_degrees, 89.0)
+        col_span = math.ceil(1 / math.cos(math.radians(edge)))
+        return [('cell', species, r, c, bucket)
+                for bucket in range(time_bucket - 1, time_bucket + 2)
+                for r in range(row - 1, row + 2)
+                for c in range(col - col_span, col + col_span + 1)]
+
+    def same_event(self, a: tuple, b: tuple) -> bool:
+        """Whether two sightings' event_fields() describe the same event."""
+        if a[0] != b[0] or abs(a[1] - b[1]) > self.window_days:
+            return False
+        if a[2] is None or b[2] is None:
+            return a[2] is None and b[2] is None and a[5] == b[5]
+        limit = min(max(a[4] + b[4], self.min_distance_miles), self.max_distance_miles)
+        return haversine_miles(a[2], a[3], b[2], b[3]) <= limit
+
+    def add(self, key: Hashable, sighting: Dict[str, Any]):
+        """
+        Compare a sighting with those already added and union it with its matches.
+
+        Sightings without species, date or location are skipped.
+        """
+        fields = event_fields(sighting)
+        if fields is None:
+            self.skipped += 1
+            return
+        self.union_find.find(key)
+        for bucket in self.neighbour_buckets(fields):
+            for other, other_fields in self._buckets.get(bucket, ()):
+                if self.same_event(fields, other_fields):
+                    self.union_find.union(other, key)
+        self._buckets[self.bucket(fields)].append((key, fields))
+
+    def clusters(self) -> List[List[Hashable]]:
+        """Clusters of two or more keys."""
+        return self.union_find.groups()
+
+
+def cluster_sightings(sightings: Iterable[Dict[str, Any]], key: str = 'id',
+                      window_days: int = DEFAULT_WINDOW_DAYS,
+                      max_distance_miles: float = DEFAULT_MAX_DISTANCE_MILES,
+                      min_distance_miles: float = DEFAULT_MIN_DISTANCE_MILES) -> List[List[Dict[str, Any]]]:
+    """
+    Group sightings of the same event into clusters.
+
+    Args:
+        sightings: Sighting dictionaries
+        key: Field identifying a sighting
+        window_days: Maximum difference between sighting dates
+        max_distance_miles: Cap on the combined confidence radius
+        min_distance_miles: Floor on the combined confidence radius
+
+    Returns:
+        Clusters of two or more sightings, members in input order (so the
+        first member is the canonical one when the input is oldest first)
+    """
+    clusterer = SpatioTemporalClusterer(window_days, max_distance_miles, min_distance_miles)
+    by_key: Dict[Hashable, Dict[str, Any]] = {}
+    order: Dict[Hashable, int] = {}
+    for sighting in sightings:
+        sighting_key = sighting[key]
+        by_key[sighting_key] = sighting
+        order[sighting_key] = len(order)
+        clusterer.add(sighting_key, sighting)
+    return [[by_key[k] for k in sorted(group, key=order.__getitem__)] for group in clusterer.clusters()]
@@ -34,7 +34,8 @@ class TrailProcessor:
         Args:
             trail_data: Dict containing trail information
                 Required: name, lat, lon, source
-                Optional: elevation, difficulty, gmu_units
+                Optional: elevation, difficulty, gmu_units,
+                coordinates (list of [lat, lon] points along the trail)
         """
         required_fields = ['name', 'lat', 'lon', 'source']
         if not all(field in trail_data for field in required_fields):
@@ -257,18 +258,35 @@ class TrailProcessor:
         """
         Map trails to their corresponding GMUs.
         
+        Trails with a 'coordinates' track are intersected as lines, so a trail
+        crossing several units gets all of them (longest first) plus the miles
+        inside each in 'gmu_lengths_miles'. Other trails are mapped by their
+        lat/lon point.
+        
         Args:
             gmu_processor: GMUProcessor instance with loaded GMU data
         """
-        for trail in self.trails:
-            if 'lat' in trail and 'lon' in trail:
-                gmu = gmu_processor.find_gmu_for_point(trail['lat'], trail['lon'])
-                if gmu:
-                    trail['gmu_units'] = [gmu]
-                else:
-                    trail['gmu_units'] = []
-        
-        logger.info("Mapped trails to GMUs")
+        tracks = [trail for trail in self.trails if trail.get('coordinates')]
+        located = [
+            trail for trail in self.trails
+            if not trail.get('coordinates') and 'lat' in trail and 'lon' in trail
+        ]
+        
+        if tracks:
+            for trail, lengths in zip(tracks, gmu_processor.find_gmus_for_trails(
+                    [trail['coordinates'] for trail in tracks])):
+                trail['gmu_units'] = list(lengths)
+                trail['gmu_lengths_miles'] = lengths
+        
+        if located:
+            gmus = gmu_processor.find_gmus_for_points(
+                [trail['lat'] for trail in located],
+                [trail['lon'] for trail in located]
+            )
+            for trail, gmu in zip(located, gmus):
+                trail['gmu_units'] = [gmu] if gmu else []
+        
+        logger.info(f"Mapped {len(tracks)} trail tracks and {len(located)} trail points to GMUs")
     
     def get_trails_by_gmu(self, gmu_id: str) -> List[Dict]:
         """
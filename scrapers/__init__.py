@@ -1,17 +1,44 @@
 """
 Web scrapers for extracting wildlife sightings from various outdoor recreation websites.
+
+Scraper classes are imported lazily on first attribute access, so importing
+this package (or using the registry for a single source) does not pull in
+every scraper's dependencies.
 """
 
-from .base import BaseScraper
-from .fourteeners_scraper_real import FourteenersRealScraper
-from .reddit_scraper import RedditScraper
-from .google_places_scraper import GooglePlacesScraper
-from .inaturalist_scraper import INaturalistScraper
+import importlib
+
+from .registry import available_sources, create_scraper, get_scraper_class, register_scraper
+
+_LAZY_ATTRIBUTES = {
+    'BaseScraper': '.base',
+    'FourteenersRealScraper': '.fourteeners_scraper_real',
+    'RedditScraper': '.reddit_scraper',
+    'GooglePlacesScraper': '.google_places_scraper',
+    'INaturalistScraper': '.inaturalist_scraper'
+}
 
 __all__ = [
     'BaseScraper',
-    'FourteenersRealScraper', 
+    'FourteenersRealScraper',
     'RedditScraper',
     'GooglePlacesScraper',
-    'INaturalistScraper'
+    'INaturalistScraper',
+    'available_sources',
+    'create_scraper',
+    'get_scraper_class',
+    'register_scraper'
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -3,45 +3,269 @@ Base scraper class with common functionality for all wildlife sighting scrapers.
 """
 
 import time
+import asyncio
+import importlib.util
 import logging
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Union
+from urllib.parse import urlsplit
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
 
+from .keyword_matcher import get_keyword_matcher
+from .rate_limiter import TokenBucketLimiter
+from .http_cache import HTTPResponseCache, get_http_cache, DEFAULT_TTL_SECONDS
+
+# httpx is optional - fetch_many falls back to sequential requests without it.
+# It is only imported when the first AsyncFetcher is created.
+HTTPX_AVAILABLE = importlib.util.find_spec('httpx') is not None
+if not HTTPX_AVAILABLE:
+    logger.warning("httpx not available - fetch_many will make requests sequentially")
+
+USER_AGENT = 'Mozilla/5.0 (Hunting Sightings Bot 1.0; Contact: patrg444@gmail.com)'
+
+
+class AsyncFetcher:
+    """
+    Pooled async HTTP client with per-host concurrency caps and rate limits.
+    
+    The client and its event loop live on a background thread, so keep-alive
+    connections are reused across fetch_many() calls from synchronous
+    scraper code. Each host gets its own semaphore and token bucket; hosts
+    without an explicit limit use the defaults.
+    """
+    
+    def __init__(self, requests_per_minute: float = 60.0, concurrency: int = 4,
+                 host_limits: Optional[Dict[str, Dict[str, float]]] = None,
+                 max_connections: int = 20, timeout: float = 30.0,
+                 headers: Optional[Dict[str, str]] = None,
+                 cache: Optional[HTTPResponseCache] = None,
+                 cache_ttl: Optional[float] = DEFAULT_TTL_SECONDS, source: str = 'default'):
+        """
+        Initialize the fetcher. The client is created on first use.
+        
+        Args:
+            requests_per_minute: Default per-host request budget
+            concurrency: Default maximum in-flight requests per host
+            host_limits: Per-host overrides, e.g. {'api.inaturalist.org':
+                {'requests_per_minute': 60, 'concurrency': 2}}
+            max_connections: Connection pool size across all hosts
+            timeout: Request timeout in seconds
+            headers: Default request headers
+            cache: Optional on-disk response cache
+            cache_ttl: Seconds a cached response is served without revalidation
+            source: Scraper source name used for cache counters
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for AsyncFetcher")
+        import httpx
+        self._httpx = httpx
+        
+        self.requests_per_minute = requests_per_minute
+        self.concurrency = concurrency
+        self.host_limits = host_limits or {}
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.source = source
+        
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._limiters: Dict[str, TokenBucketLimiter] = {}
+        self._start_lock = threading.Lock()
+    
+    def _ensure_loop(self):
+        """Start the background event loop and HTTP client once."""
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="scraper-fetcher", daemon=True)
+            self._thread.start()
+            
+            async def create_client():
+                return self._httpx.AsyncClient(
+                    headers=self.headers,
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    limits=self._httpx.Limits(max_connections=self.max_connections,
+                                        max_keepalive_connections=self.max_connections)
+                )
+            self._client = asyncio.run_coroutine_threadsafe(create_client(), self._loop).result()
+    
+    def _host_controls(self, host: str):
+        """Get (creating on first use) the semaphore and token bucket for a host."""
+        if host not in self._semaphores:
+            limits = self.host_limits.get(host, {})
+            self._semaphores[host] = asyncio.Semaphore(int(limits.get('concurrency', self.concurrency)))
+            # burst=1 keeps requests to one host evenly spaced
+            self._limiters[host] = TokenBucketLimiter(
+                limits.get('requests_per_minute', self.requests_per_minute), burst=1
+            )
+        return self._semaphores[host], self._limiters[host]
+    
+    async def fetch(self, url: str, params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None,
+                    cache_ttl: Optional[float] = None) -> Optional['httpx.Response']:
+        """
+        GET a URL within its host's concurrency cap and rate limit.
+        
+        Fresh cached responses are returned without a request; stale ones
+        are revalidated with a conditional GET.
+        
+        Must run on the fetcher's event loop (see fetch_many).
+        
+        Args:
+            url: URL to request
+            params: Query parameters
+            headers: Extra request headers
+            cache_ttl: Override the fetcher's cache TTL for this request
+            
+        Returns:
+            Response object or None if the request failed
+        """
+        cache_key = entry = None
+        if self.cache is not None:
+            ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+            cache_key = self.cache.make_key(url, params)
+            entry = self.cache.get(cache_key)
+            if entry and self.cache.is_fresh(entry, ttl):
+                self.cache.record_hit(cache_key, entry, self.source)
+                return self._cached_response(entry)
+            if entry:
+                headers = dict(headers or {}, **self.cache.conditional_headers(entry))
+        
+        semaphore, limiter = self._host_controls(urlsplit(url).netloc)
+        async with semaphore:
+            while True:
+                wait = limiter.try_acquire()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            
+            try:
+                started = time.perf_counter()
+                response = await self._client.get(url, params=params, headers=headers)
+                if response.status_code == 304 and entry:
+                    self.cache.record_hit(cache_key, entry, self.source, revalidated=True)
+                    return self._cached_response(entry)
+                response.raise_for_status()
+            except self._httpx.HTTPError as e:
+                logger.error(f"Request failed for {url}: {e}")
+                return None
+            except Exception as e:
+                # Bad URLs or params must not abort the other requests of a fetch_many batch
+                logger.error(f"Request failed for {url}: {e!r}")
+                return None
+        
+        if self.cache is not None:
+            self.cache.record_miss(self.source)
+            self.cache.store(cache_key, str(response.url), response.status_code, dict(response.headers),
+                             response.content, time.perf_counter() - started, self.source)
+        return response
+    
+    def _cached_response(self, entry: Dict[str, Any]) -> 'httpx.Response':
+        """Rebuild an httpx response from a cache entry."""
+        return self._httpx.Response(
+            entry['status_code'],
+            headers=entry['headers'],
+            content=entry['body'],
+            request=self._httpx.Request('GET', entry['url'])
+        )
+    
+    def fetch_many(self, urls: List[str],
+                   params: Optional[Union[Dict[str, Any], List[Optional[Dict[str, Any]]]]] = None,
+                   cache_ttl: Optional[float] = None) -> List[Optional['httpx.Response']]:
+        """
+        Fetch many URLs concurrently and wait for all of them.
+        
+        Args:
+            urls: URLs to request
+            params: Query parameters shared by every URL, or one dict per URL
+            cache_ttl: Override the fetcher's cache TTL for these requests
+            
+        Returns:
+            Responses (None for failures) in the same order as urls
+        """
+        if not urls:
+            return []
+        if not isinstance(params, list):
+            params = [params] * len(urls)
+        
+        self._ensure_loop()
+        
+        async def gather():
+            return await asyncio.gather(*(self.fetch(url, p, cache_ttl=cache_ttl) for url, p in zip(urls, params)),
+                                        return_exceptions=True)
+        
+        responses = asyncio.run_coroutine_threadsafe(gather(), self._loop).result()
+        for url, response in zip(urls, responses):
+            if isinstance(response, BaseException):
+                logger.error(f"Request failed for {url}: {response!r}")
+        return [None if isinstance(response, BaseException) else response for response in responses]
+    
+    def close(self):
+        """Close the HTTP client and stop the background loop."""
+        with self._start_lock:
+            if self._loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+            self._loop = self._thread = self._client = None
+            self._semaphores.clear()
+            self._limiters.clear()
+
+
 class BaseScraper(ABC):
     """
     Abstract base class for all wildlife sighting scrapers.
     Provides rate limiting, error handling, and common extraction methods.
     """
     
-    def __init__(self, source_name: str, rate_limit: float = 1.0):
+    def __init__(self, source_name: str, rate_limit: float = 1.0, max_concurrency: int = 4,
+                 host_limits: Optional[Dict[str, Dict[str, float]]] = None,
+                 cache_ttl: Optional[float] = None):
         """
         Initialize the base scraper.
         
         Args:
             source_name: Name of the data source (e.g., '14ers', 'reddit')
-            rate_limit: Seconds to wait between requests
+            rate_limit: Seconds to wait between requests (per host for fetch_many)
+            max_concurrency: Maximum in-flight fetch_many requests per host
+            host_limits: Per-host overrides for fetch_many, see AsyncFetcher
+            cache_ttl: Seconds a cached response is reused without revalidation
+                (0 always revalidates). None, the default, keeps this source
+                out of the response cache; the cache itself is configured by
+                the SCRAPER_HTTP_CACHE* environment variables
         """
         self.source_name = source_name
         self.rate_limit = rate_limit
         self.last_request_time = 0
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Hunting Sightings Bot 1.0; Contact: patrg444@gmail.com)'
+            'User-Agent': USER_AGENT
         })
         
-        # Game species keywords
-        self.game_species = {
-            'elk': ['elk', 'bull', 'cow', 'wapiti', 'bugle', 'bugling'],
-            'deer': ['deer', 'buck', 'doe', 'muley', 'mule deer', 'whitetail', 'white-tail'],
-            'bear': ['bear', 'black bear', 'griz', 'grizzly', 'bruin'],
-            'pronghorn': ['pronghorn', 'antelope', 'speed goat'],
-            'bighorn_sheep': ['bighorn', 'sheep', 'ram', 'ewe'],
-            'mountain_goat': ['mountain goat', 'goat', 'billy', 'nanny']
-        }
+        self.max_concurrency = max_concurrency
+        self.host_limits = host_limits or {}
+        self._fetcher = None
+        
+        # Shared on-disk response cache (None when disabled or not opted in)
+        self.http_cache = get_http_cache() if cache_ttl is not None else None
+        self.cache_ttl = cache_ttl
+        
+        # Game species keywords from config/settings.yaml, compiled once per process
+        self.keyword_matcher = get_keyword_matcher()
+        self.game_species = self.keyword_matcher.game_species
         
     def _rate_limit(self):
         """Enforce rate limiting between requests."""
@@ -51,25 +275,119 @@ class BaseScraper(ABC):
             time.sleep(self.rate_limit - time_since_last)
         self.last_request_time = time.time()
     
-    def _make_request(self, url: str, **kwargs) -> Optional[requests.Response]:
+    def _make_request(self, url: str, cache_ttl: Optional[float] = None,
+                      **kwargs) -> Optional[requests.Response]:
         """
         Make an HTTP request with rate limiting and error handling.
         
+        GET responses go through the on-disk response cache: fresh entries are
+        returned without a request, stale ones are revalidated with
+        If-None-Match / If-Modified-Since and reused on a 304.
+        
         Args:
             url: URL to request
+            cache_ttl: Override the scraper's cache TTL for this request
             **kwargs: Additional arguments for requests.get()
             
         Returns:
             Response object or None if request failed
         """
+        cache = self.http_cache
+        cache_key = entry = None
+        if cache is not None:
+            ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+            cache_key = cache.make_key(url, kwargs.get('params'))
+            entry = cache.get(cache_key)
+            if entry and cache.is_fresh(entry, ttl):
+                cache.record_hit(cache_key, entry, self.source_name)
+                return self._cached_response(entry)
+            if entry:
+                kwargs['headers'] = dict(kwargs.get('headers') or {}, **cache.conditional_headers(entry))
+        
         self._rate_limit()
         try:
+            started = time.perf_counter()
             response = self.session.get(url, timeout=30, **kwargs)
+            if response.status_code == 304 and entry:
+                cache.record_hit(cache_key, entry, self.source_name, revalidated=True)
+                return self._cached_response(entry)
             response.raise_for_status()
-            return response
         except requests.RequestException as e:
             logger.error(f"Request failed for {url}: {e}")
             return None
+        
+        if cache is not None:
+            cache.record_miss(self.source_name)
+            cache.store(cache_key, response.url, response.status_code, dict(response.headers),
+                        response.content, time.perf_counter() - started, self.source_name)
+        return response
+    
+    @staticmethod
+    def _cached_response(entry: Dict[str, Any]) -> requests.Response:
+        """Rebuild a requests response from a cache entry."""
+        response = requests.Response()
+        response.status_code = entry['status_code']
+        response.url = entry['url']
+        response.headers = requests.structures.CaseInsensitiveDict(entry['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = entry['body']
+        return response
+    
+    def get_http_cache_stats(self) -> Dict[str, Any]:
+        """
+        Response cache counters for this scraper's source.
+        
+        Returns:
+            Dict of hit/miss/revalidation counts, bytes and seconds saved
+            (empty if caching is disabled)
+        """
+        return self.http_cache.stats(self.source_name) if self.http_cache else {}
+    
+    @property
+    def fetcher(self) -> AsyncFetcher:
+        """Async fetcher sharing this scraper's politeness budget, created on first use."""
+        if self._fetcher is None:
+            self._fetcher = AsyncFetcher(
+                requests_per_minute=60.0 / self.rate_limit if self.rate_limit > 0 else 600.0,
+                concurrency=self.max_concurrency,
+                host_limits=self.host_limits,
+                headers={'User-Agent': USER_AGENT},
+                cache=self.http_cache,
+                cache_ttl=self.cache_ttl,
+                source=self.source_name
+            )
+        return self._fetcher
+    
+    def fetch_many(self, urls: List[str],
+                   params: Optional[Union[Dict[str, Any], List[Optional[Dict[str, Any]]]]] = None,
+                   cache_ttl: Optional[float] = None) -> List[Any]:
+        """
+        Fetch many URLs concurrently within each host's rate limit.
+        
+        Network waits overlap, but every host still sees at most one request
+        per rate_limit seconds and max_concurrency requests in flight. Falls
+        back to sequential _make_request calls if httpx is not installed.
+        
+        Args:
+            urls: URLs to request
+            params: Query parameters shared by every URL, or one dict per URL
+            cache_ttl: Override the scraper's cache TTL for these requests
+            
+        Returns:
+            Response objects (None for failures) in the same order as urls
+        """
+        if not HTTPX_AVAILABLE:
+            if not isinstance(params, list):
+                params = [params] * len(urls)
+            return [self._make_request(url, cache_ttl=cache_ttl, params=p) for url, p in zip(urls, params)]
+        return self.fetcher.fetch_many(urls, params, cache_ttl=cache_ttl)
+    
+    def close(self):
+        """Release pooled HTTP connections."""
+        if self._fetcher is not None:
+            self._fetcher.close()
+            self._fetcher = None
+        self.session.close()
     
     def _extract_sightings_from_text(self, text: str, url: str) -> List[Dict[str, Any]]:
         """
@@ -82,37 +400,25 @@ class BaseScraper(ABC):
         Returns:
             List of sighting dictionaries
         """
-        import re
-        
         sightings = []
-        text_lower = text.lower()
-        
-        for species, keywords in self.game_species.items():
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                
-                # Use word boundary regex to match whole words only
-                # \b ensures we match word boundaries
-                pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-                
-                for match in re.finditer(pattern, text_lower):
-                    index = match.start()
-                    
-                    # Extract 100-character window around keyword for better context
-                    start = max(0, index - 50)
-                    end = min(len(text), index + len(keyword) + 50)
-                    context = text[start:end].strip()
-                    
-                    # Validate it's a real sighting mention
-                    if self._validate_sighting_context(context, keyword):
-                        sightings.append({
-                            'species': species,
-                            'raw_text': context,
-                            'keyword_matched': keyword,
-                            'source_url': url,
-                            'source_type': self.source_name,
-                            'extracted_at': datetime.utcnow()
-                        })
+        
+        # One pass over the text finds every whole-word keyword hit
+        for species, keyword, index in self.keyword_matcher.find_all(text):
+            # Extract 100-character window around keyword for better context
+            start = max(0, index - 50)
+            end = min(len(text), index + len(keyword) + 50)
+            context = text[start:end].strip()
+            
+            # Validate it's a real sighting mention
+            if self._validate_sighting_context(context, keyword):
+                sightings.append({
+                    'species': species,
+                    'raw_text': context,
+                    'keyword_matched': keyword,
+                    'source_url': url,
+                    'source_type': self.source_name,
+                    'extracted_at': datetime.utcnow()
+                })
         
         return sightings
     
@@ -128,19 +434,10 @@ class BaseScraper(ABC):
         Returns:
             List of potential wildlife mentions for LLM validation
         """
-        import re
-        
         mentions = []
-        text_lower = text.lower()
         
         # Check if any wildlife species are mentioned
-        species_found = set()
-        for species, keywords in self.game_species.items():
-            for keyword in keywords:
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    species_found.add(species)
-                    break
+        species_found = self.keyword_matcher.first_hit_per_species(text)
         
         # If wildlife mentioned, return the full text for LLM analysis
         if species_found:
@@ -243,6 +540,33 @@ class BaseScraper(ABC):
         """
         pass
     
+    def iter_sightings(self, lookback_days: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Yield sightings from the data source as they are found.
+        
+        Pipelines consume this instead of scrape() to start saving and
+        validating while scraping continues, without holding the whole run
+        in memory. Scrapers override it with a real generator; this default
+        just wraps scrape().
+        
+        Args:
+            lookback_days: Number of days to look back for content
+            
+        Yields:
+            Sighting dictionaries
+        """
+        yield from self.scrape(lookback_days=lookback_days)
+    
+    def commit(self):
+        """
+        Record that everything iter_sightings() yielded has been saved.
+        
+        Consumers call this after a run's sightings are written. Scrapers
+        that sweep incrementally advance their progress markers here rather
+        than while yielding, so sightings whose save failed are found again
+        next run. The default does nothing.
+        """
+    
     @abstractmethod
     def get_trail_locations(self) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,278 @@
+"""
+Batched PostgreSQL writer for sighting rows.
+
+Rows are sent with one multi-row INSERT (psycopg2 execute_values) or one
+COPY into a temporary staging table followed by a single merge INSERT, both
+with ON CONFLICT (content_hash) DO NOTHING. The inserted rows come back via
+RETURNING, so each batch reports inserted and duplicate counts for a single
+round-trip instead of one statement per sighting. The connection is kept
+open between batches and re-opened if the server drops it.
+"""
+
+import io
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+
+DEFAULT_PAGE_SIZE = 500
+
+
+class BulkSightingWriter:
+    """
+    Write sighting dictionaries to one table in batches.
+
+    Example:
+        writer = BulkSightingWriter(
+            lambda: psycopg2.connect(url), 'sightings',
+            columns=['species', 'location', 'content_hash'],
+            row_builder=lambda s: {'species': s['species'], ...},
+            expressions={'location': 'ST_GeogFromText(%s)'}
+        )
+        writer.write(sightings, 'reddit')  # {'saved': 12, 'duplicates': 3, 'failed': 0}
+    """
+
+    def __init__(self, connect: Callable[[], Any], table: str, columns: List[str],
+                 row_builder: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 expressions: Optional[Dict[str, str]] = None,
+                 constants: Optional[Dict[str, str]] = None,
+                 conflict_column: str = 'content_hash',
+                 method: str = 'values', page_size: int = DEFAULT_PAGE_SIZE):
+        """
+        Args:
+            connect: Returns a new psycopg2 connection
+            table: Target table
+            columns: Columns filled from row_builder's output
+            row_builder: Maps a sighting to {column: value}
+            expressions: SQL wrapping a column's value, e.g. 'ST_GeogFromText(%s)'
+                (execute_values only; COPY relies on the column type's input format)
+            constants: Columns set to a SQL expression instead of a value, e.g. 'NOW()'
+            conflict_column: Unique column used for deduplication
+            method: 'values' (execute_values) or 'copy' (COPY into staging, then merge)
+            page_size: Rows per INSERT statement for execute_values
+        """
+        if method not in ('values', 'copy'):
+            raise ValueError(f"Unknown bulk write method: {method}")
+        if conflict_column not in columns:
+            raise ValueError(f"Conflict column {conflict_column} must be one of the columns")
+        self.connect = connect
+        self.table = table
+        self.columns = list(columns)
+        self.row_builder = row_builder
+        self.expressions = expressions or {}
+        self.constants = constants or {}
+        self.conflict_column = conflict_column
+        self.method = method
+        self.page_size = page_size
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def write(self, sightings: List[Dict[str, Any]], source_name: str = '',
+              inserted_keys: Optional[List[Any]] = None) -> Dict[str, int]:
+        """
+        Insert sightings, skipping ones whose content hash already exists.
+
+        A batch that fails for a reason other than a lost connection is
+        retried row by row so one bad sighting does not drop the others.
+
+        Args:
+            sightings: Sighting dictionaries
+            source_name: Name used in log messages
+            inserted_keys: If given, the conflict column values of the rows
+                actually inserted are appended to it
+
+        Returns:
+            {'saved': inserted rows, 'duplicates': rows skipped as duplicates,
+             'failed': rows that could not be built or inserted}
+        """
+        rows, failed = self._build_rows(sightings)
+        unique = {}
+        for row in rows:
+            unique.setdefault(row[self.columns.index(self.conflict_column)], row)
+        batch_duplicates = len(rows) - len(unique)
+        rows = list(unique.values())
+        result = {'saved': 0, 'duplicates': batch_duplicates, 'failed': failed}
+        if not rows:
+            return result
+
+        with self._lock:
+            try:
+                inserted = self._run(rows)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                logger.warning(f"{source_name}: database connection lost ({e}); reconnecting")
+                self.close()
+                inserted = self._run(rows)
+            except Exception as e:
+                logger.warning(f"{source_name}: batch insert failed ({e}); retrying row by row")
+                self._rollback()
+                inserted = []
+                for row in list(rows):
+                    try:
+                        inserted.extend(self._run([row]))
+                    except Exception as row_error:
+                        self._rollback()
+                        rows.remove(row)
+                        result['failed'] += 1
+                        logger.warning(f"Failed to save sighting: {row_error}")
+
+        if inserted_keys is not None:
+            inserted_keys.extend(inserted)
+        result['saved'] = len(inserted)
+        result['duplicates'] += len(rows) - len(inserted)
+        self._log(source_name, result)
+        return result
+
+    def fetch_all(self, query, params=None) -> List[tuple]:
+        """
+        Run a read-only query on the writer's connection.
+
+        Args:
+            query: SQL string or psycopg2.sql object
+            params: Query parameters
+
+        Returns:
+            All result rows
+        """
+        return self._query(query, params, fetch=True)
+
+    def execute(self, query, params=None):
+        """Run one statement on the writer's connection and commit it."""
+        self._query(query, params, fetch=False)
+
+    def _query(self, query, params, fetch: bool):
+        with self._lock:
+            try:
+                return self._execute(query, params, fetch)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                self.close()
+                return self._execute(query, params, fetch)
+            except Exception:
+                self._rollback()
+                raise
+
+    def close(self):
+        """Close the cached connection."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def _build_rows(self, sightings: List[Dict[str, Any]]):
+        rows = []
+        failed = 0
+        for sighting in sightings:
+            try:
+                values = self.row_builder(sighting)
+                rows.append(tuple(values.get(column) for column in self.columns))
+            except Exception as e:
+                failed += 1
+                logger.warning(f"Failed to prepare sighting: {e}")
+                logger.debug(f"Sighting data: {sighting}")
+        return rows, failed
+
+    def _connection(self):
+        if self._conn is None or self._conn.closed:
+            self._conn = self.connect()
+        return self._conn
+
+    def _rollback(self):
+        if self._conn is not None and not self._conn.closed:
+            try:
+                self._conn.rollback()
+            except Exception:
+                self.close()
+
+    def _execute(self, query, params, fetch: bool) -> Optional[List[tuple]]:
+        conn = self._connection()
+        with conn.cursor() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall() if fetch else None
+        # Also ends read-only transactions so the connection is not left idle in one
+        conn.commit()
+        return rows
+
+    def _target_columns(self) -> sql.Composed:
+        return sql.SQL(', ').join(sql.Identifier(c) for c in self.columns + list(self.constants))
+
+    def _run(self, rows: List[tuple]) -> List[Any]:
+        """Insert rows in one transaction and return the conflict keys of the new ones."""
+        conn = self._connection()
+        with conn.cursor() as cursor:
+            if self.method == 'copy':
+                inserted = self._copy_merge(cursor, rows)
+            else:
+                inserted = self._insert_values(cursor, rows)
+        conn.commit()
+        return inserted
+
+    def _insert_values(self, cursor, rows: List[tuple]) -> List[Any]:
+        template = '(' + ', '.join(
+            [self.expressions.get(column, '%s') for column in self.columns] + list(self.constants.values())
+        ) + ')'
+        query = sql.SQL("INSERT INTO {table} ({columns}) VALUES %s "
+                        "ON CONFLICT ({conflict}) DO NOTHING RETURNING {conflict}").format(
+            table=sql.Identifier(self.table),
+            columns=self._target_columns(),
+            conflict=sql.Identifier(self.conflict_column)
+        ).as_string(cursor)
+        returned = execute_values(cursor, query, rows, template=template,
+                                  page_size=self.page_size, fetch=True)
+        return [row[0] for row in returned]
+
+    def _copy_merge(self, cursor, rows: List[tuple]) -> List[Any]:
+        staging = sql.Identifier(f"_staging_{self.table}")
+        value_columns = sql.SQL(', ').join(sql.Identifier(c) for c in self.columns)
+        cursor.execute(sql.SQL(
+            "CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA"
+        ).format(staging=staging, columns=value_columns, table=sql.Identifier(self.table)))
+
+        buffer = io.StringIO(''.join(
+            ','.join(_copy_field(value) for value in row) + '\n' for row in rows
+        ))
+        cursor.copy_expert(sql.SQL("COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv)").format(
+            staging=staging, columns=value_columns
+        ).as_string(cursor), buffer)
+
+        select_list = sql.SQL(', ').join(
+            [sql.Identifier(c) for c in self.columns] + [sql.SQL(expr) for expr in self.constants.values()]
+        )
+        cursor.execute(sql.SQL(
+            "INSERT INTO {table} ({columns}) SELECT {select_list} FROM {staging} "
+            "ON CONFLICT ({conflict}) DO NOTHING RETURNING {conflict}"
+        ).format(
+            table=sql.Identifier(self.table),
+            columns=self._target_columns(),
+            select_list=select_list,
+            staging=staging,
+            conflict=sql.Identifier(self.conflict_column)
+        ))
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _log(source_name: str, result: Dict[str, int]):
+        message = f"{source_name}: Saved {result['saved']} new sightings ({result['duplicates']} duplicates skipped)"
+        if result['failed']:
+            message += f", {result['failed']} failed"
+        logger.info(message)
+
+
+def _copy_field(value: Any) -> str:
+    """
+    Render one CSV COPY field.
+
+    None becomes an unquoted empty field (NULL); everything else is quoted,
+    so empty strings stay empty strings.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        value = '{' + ','.join('NULL' if v is None else str(v) for v in value) + '}'
+    elif hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
@@ -2,11 +2,16 @@
 AWS Lambda handler for daily wildlife scraping.
 """
 
+import os
 import json
 from loguru import logger
 from .reddit_scraper import RedditScraper
 from .inaturalist_scraper import INaturalistScraper
-from .database_saver import save_sightings_to_db
+from .database_saver import bulk_save_sightings
+from .orchestrator import ScrapeOrchestrator, source_timeout
+
+# Per-source time budget in seconds; a source over budget is cancelled
+SOURCE_TIMEOUT = int(os.getenv('SCRAPE_SOURCE_TIMEOUT', 10 * 60))
 
 def lambda_handler(event, context):
     """Lambda handler function for daily scraping."""
@@ -20,27 +25,49 @@ def lambda_handler(event, context):
     }
     
     try:
-        # Run Reddit scraper
-        logger.info("Running Reddit scraper...")
-        reddit = RedditScraper()
-        reddit_sightings = reddit.scrape(lookback_days=1)
-        results['reddit']['found'] = len(reddit_sightings)
-        logger.info(f"Found {len(reddit_sightings)} Reddit sightings")
-        
-        # Run iNaturalist scraper
-        logger.info("Running iNaturalist scraper...")
-        inat = INaturalistScraper()
-        inat_sightings = inat.scrape(lookback_days=1)
-        results['inaturalist']['found'] = len(inat_sightings)
-        logger.info(f"Found {len(inat_sightings)} iNaturalist sightings")
+        # Run the Reddit and iNaturalist scrapers concurrently
+        scrapers = {'reddit': RedditScraper, 'inaturalist': INaturalistScraper}
+        instances = {}
         
-        # Calculate totals
-        results['total_found'] = results['reddit']['found'] + results['inaturalist']['found']
+        def factory(name):
+            def build():
+                instances[name] = scrapers[name]()
+                return instances[name]
+            return build
+        
+        orchestrator = ScrapeOrchestrator(
+            [(name, factory(name)) for name in scrapers],
+            save_batch=bulk_save_sightings,
+            timeout=source_timeout(context, SOURCE_TIMEOUT)
+        )
+        report = orchestrator.run(lookback_days=1)
         
-        # Count saved (already handled by scrapers)
-        results['total_saved'] = results['total_found']  # Approximate
+        for name, stats in report['sources'].items():
+            results[name] = {
+                'found': stats['found'],
+                'saved': stats['saved'],
+                'status': stats['status'],
+                'duration_seconds': stats['duration_seconds']
+            }
+            if 'error' in stats:
+                results[name]['error'] = stats['error']
+            logger.info(f"Found {stats['found']} {name} sightings ({stats['status']}, {stats['duration_seconds']:.1f}s)")
+        
+        # Report HTTP response cache effectiveness for sources that fetch through it
+        # (Reddit goes through PRAW and never touches the cache)
+        for name, scraper in instances.items():
+            cache_stats = scraper.get_http_cache_stats()
+            if cache_stats and cache_stats['hits'] + cache_stats['revalidated'] + cache_stats['misses']:
+                results[name]['http_cache'] = cache_stats
+                logger.info(f"{name} HTTP cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated, "
+                            f"{cache_stats['misses']} misses, {cache_stats['seconds_saved']}s saved")
+        
+        # Calculate totals
+        results['total_found'] = report['total_found']
+        results['total_saved'] = report['total_saved']
+        results['duration_seconds'] = report['duration_seconds']
         
-        logger.info(f"Daily scraping complete: {results['total_found']} total sightings")
+        logger.info(f"Daily scraping complete: {results['total_found']} total sightings in {report['duration_seconds']:.1f}s")
         
         return {
             'statusCode': 200,
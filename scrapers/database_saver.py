@@ -4,14 +4,333 @@ Database saving utilities for scrapers to save incrementally.
 
 import os
 import hashlib
+import threading
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable
 import psycopg2
 from loguru import logger
 from dotenv import load_dotenv
 
+from .bulk_writer import BulkSightingWriter
+
 load_dotenv()
 
+# Columns written to wildlife_sightings, in insert order
+WILDLIFE_SIGHTINGS_COLUMNS = [
+    'species', 'confidence', 'location_name', 'location_confidence_radius',
+    'sighting_date', 'source_type', 'source_url', 'raw_text',
+    'gmu_number', 'county', 'coordinates', 'elevation', 'location_description',
+    'content_hash'
+]
+# Written as well when NEAR_DUPLICATE_CHECK is on (backend/scripts/add_near_duplicate_fields.sql)
+NEAR_DUPLICATE_COLUMNS = ['minhash', 'minhash_bands', 'near_duplicate_of']
+# Written as well when INGEST_DEDUP is on (backend/scripts/add_dedup_index_fields.sql)
+DEDUP_COLUMNS = ['dedup_keys', 'cluster_id']
+# Columns of stored sightings the ingest-time dedup compares against
+DEDUP_CANDIDATE_COLUMNS = [
+    'id', 'cluster_id', 'species', 'location_name', 'location_confidence_radius',
+    'sighting_date', 'created_at', 'minhash', 'content_hash', 'dedup_keys'
+]
+# Keys per Supabase candidate query, keeping the request URL short
+SUPABASE_LOOKUP_KEYS = 256
+
+# Ingest-time dedup looks up candidates, inserts and relinks in separate
+# steps. Batches are serialized around all three so concurrent sources see
+# each other's rows: by a process-wide lock, and on PostgreSQL also by a
+# session advisory lock shared with other writer processes.
+INGEST_DEDUP_LOCK_ID = 7301
+_ingest_dedup_lock = threading.Lock()
+
+_writer: Optional[BulkSightingWriter] = None
+_writer_lock = threading.Lock()
+
+
+def sighting_content_hash(sighting: Dict[str, Any]) -> str:
+    """Deduplication hash of species, location name and sighting date."""
+    content = f"{sighting.get('species', '')}_{sighting.get('location_name', '')}_{sighting.get('sighting_date', '')}"
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+def near_duplicate_check_enabled() -> bool:
+    """Whether inserts are checked for near-duplicates (NEAR_DUPLICATE_CHECK)."""
+    return os.getenv('NEAR_DUPLICATE_CHECK', '0').lower() in ('1', 'true', 'yes', 'on')
+
+
+def ingest_dedup_enabled() -> bool:
+    """Whether new sightings are clustered with stored duplicates at insert (INGEST_DEDUP)."""
+    return os.getenv('INGEST_DEDUP', '0').lower() in ('1', 'true', 'yes', 'on')
+
+
+def _wildlife_sightings_row(sighting: Dict[str, Any]) -> Dict[str, Any]:
+    row = {column: sighting.get(column)
+           for column in WILDLIFE_SIGHTINGS_COLUMNS + NEAR_DUPLICATE_COLUMNS + DEDUP_COLUMNS}
+    row['content_hash'] = sighting_content_hash(sighting)
+    return row
+
+
+def get_bulk_writer() -> BulkSightingWriter:
+    """
+    Process-wide writer for the wildlife_sightings table.
+
+    The connection is opened on the first write and reused afterwards.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            database_url = os.getenv('DATABASE_URL')
+            columns = WILDLIFE_SIGHTINGS_COLUMNS
+            if ingest_dedup_enabled():
+                columns = columns + NEAR_DUPLICATE_COLUMNS + DEDUP_COLUMNS
+            elif near_duplicate_check_enabled():
+                columns = columns + NEAR_DUPLICATE_COLUMNS
+            _writer = BulkSightingWriter(
+                lambda: psycopg2.connect(database_url),
+                'wildlife_sightings',
+                columns,
+                row_builder=_wildlife_sightings_row,
+                constants={'created_at': 'NOW()', 'updated_at': 'NOW()'},
+                method=os.getenv('BULK_WRITE_METHOD', 'values')
+            )
+        return _writer
+
+
+def _supabase_row(sighting: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a sighting to the Supabase sightings schema."""
+    # Convert all datetime objects to ISO strings
+    sighting = {key: value.isoformat() if hasattr(value, 'isoformat') else value
+                for key, value in sighting.items()}
+    now = datetime.now().isoformat()
+    row = {
+        'species': sighting.get('species'),
+        'sighting_date': sighting.get('sighting_date'),
+        'location_name': sighting.get('location_name'),
+        'location_confidence_radius': sighting.get('location_confidence_radius'),
+        'gmu_unit': sighting.get('gmu_number'),
+        'source_type': sighting.get('source_type'),
+        'source_url': sighting.get('source_url'),
+        'description': sighting.get('location_description'),
+        'confidence_score': sighting.get('confidence'),
+        'raw_text': sighting.get('raw_text'),
+        'content_hash': sighting_content_hash(sighting),
+        'created_at': now,
+        'updated_at': now
+    }
+    if 'minhash' in sighting:
+        row.update({column: sighting.get(column) for column in NEAR_DUPLICATE_COLUMNS})
+    if 'cluster_id' in sighting:
+        row.update({column: sighting.get(column) for column in DEDUP_COLUMNS})
+    
+    # Add coordinates if available
+    coords = sighting.get('coordinates')
+    if isinstance(coords, list) and len(coords) == 2:
+        lat, lng = coords[0], coords[1]
+        # PostGIS format for Supabase
+        row['location'] = f'POINT({lng} {lat})'
+    return row
+
+
+def _postgres_candidates(keys: List[str]):
+    """Stored wildlife_sightings sharing any of the band keys, as (id, minhash)."""
+    return get_bulk_writer().fetch_all(
+        "SELECT id::text, minhash FROM wildlife_sightings WHERE minhash_bands && %s::text[]",
+        (keys,)
+    )
+
+
+def _supabase_candidates(keys: List[str]):
+    """Stored Supabase sightings sharing any of the band keys, as (id, minhash)."""
+    from .supabase_writer import get_supabase_client
+
+    table = get_supabase_client().table('sightings')
+    candidates = []
+    for start in range(0, len(keys), SUPABASE_LOOKUP_KEYS):
+        response = table.select('id,minhash').overlaps('minhash_bands', keys[start:start + SUPABASE_LOOKUP_KEYS]).execute()
+        candidates.extend((row['id'], row['minhash']) for row in response.data or [])
+    return candidates
+
+
+def _check_near_duplicates(sightings: List[Dict[str, Any]], source_name: str, use_supabase: bool):
+    """Add MinHash fields and near_duplicate_of to sightings about to be saved."""
+    from processors.near_duplicates import NearDuplicateChecker
+
+    checker = NearDuplicateChecker(_supabase_candidates if use_supabase else _postgres_candidates)
+    flagged = checker.annotate(sightings)
+    if flagged:
+        logger.info(f"{source_name}: {flagged} sightings are near-duplicates of stored ones")
+
+
+def _postgres_dedup_candidates(keys: List[str]) -> List[Dict[str, Any]]:
+    """Stored wildlife_sightings whose dedup_keys overlap keys."""
+    rows = get_bulk_writer().fetch_all(
+        "SELECT id::text, cluster_id::text, species, location_name, location_confidence_radius, "
+        "sighting_date, created_at, minhash, content_hash, dedup_keys, coordinates "
+        "FROM wildlife_sightings WHERE dedup_keys && %s::text[]",
+        (keys,)
+    )
+    return [dict(zip(DEDUP_CANDIDATE_COLUMNS + ['coordinates'], row)) for row in rows]
+
+
+def _postgres_relink(cluster_id: str, cluster_ids: List[str], sighting_ids: List[Any]):
+    """Move stored wildlife_sightings into cluster_id in one statement."""
+    get_bulk_writer().execute(
+        "UPDATE wildlife_sightings SET cluster_id = %s::uuid "
+        "WHERE cluster_id = ANY(%s::uuid[]) OR id = ANY(%s::uuid[])",
+        (cluster_id, list(cluster_ids), [str(sighting_id) for sighting_id in sighting_ids])
+    )
+
+
+def _supabase_dedup_candidates(keys: List[str]) -> List[Dict[str, Any]]:
+    """Stored Supabase sightings whose dedup_keys overlap keys."""
+    from .supabase_writer import get_supabase_client
+
+    table = get_supabase_client().table('sightings')
+    candidates = {}
+    for start in range(0, len(keys), SUPABASE_LOOKUP_KEYS):
+        response = table.select(','.join(DEDUP_CANDIDATE_COLUMNS + ['location'])) \
+            .overlaps('dedup_keys', keys[start:start + SUPABASE_LOOKUP_KEYS]).execute()
+        for row in response.data or []:
+            candidates[row['id']] = row
+    return list(candidates.values())
+
+
+def _supabase_relink(cluster_id: str, cluster_ids: List[str], sighting_ids: List[Any]):
+    """
+    Move stored Supabase sightings into cluster_id.
+
+    Runs merge_sighting_clusters (backend/scripts/add_canonical_sightings.sql)
+    so the union is one atomic statement and the canonical sightings it
+    touches are rebuilt once.
+    """
+    from .supabase_writer import get_supabase_client
+
+    get_supabase_client().rpc('merge_sighting_clusters', {
+        'target': cluster_id,
+        'cluster_ids': list(cluster_ids),
+        'sighting_ids': [str(sighting_id) for sighting_id in sighting_ids]
+    }).execute()
+
+
+@contextmanager
+def _ingest_dedup_serialized(use_supabase: bool):
+    """Hold the ingest dedup locks (see INGEST_DEDUP_LOCK_ID) for one batch."""
+    with _ingest_dedup_lock:
+        if use_supabase:
+            yield
+            return
+        writer = get_bulk_writer()
+        writer.fetch_all("SELECT pg_advisory_lock(%s)", (INGEST_DEDUP_LOCK_ID,))
+        try:
+            yield
+        finally:
+            try:
+                writer.fetch_all("SELECT pg_advisory_unlock(%s)", (INGEST_DEDUP_LOCK_ID,))
+            except Exception as e:
+                # A lost connection has released the lock already
+                logger.warning(f"Failed to release the ingest dedup lock: {e}")
+
+
+def _deduplicate_at_ingest(sightings: List[Dict[str, Any]], source_name: str,
+                           use_supabase: bool) -> Callable[[List[str]], None]:
+    """
+    Attach sightings about to be saved to the duplicate clusters of stored ones.
+
+    Returns a callable taking the content hashes the write actually
+    inserted. It moves stored sightings into the clusters of those inserted
+    rows only, so the stored side of a cluster is linked exactly when its
+    new member is stored; a row that failed is retried later and matched
+    again then.
+    """
+    from processors.incremental_dedup import IncrementalDeduplicator
+
+    relinks = []
+    relink = _supabase_relink if use_supabase else _postgres_relink
+    lookup = _supabase_dedup_candidates if use_supabase else _postgres_dedup_candidates
+    deduplicator = IncrementalDeduplicator(lookup, lambda *args: relinks.append(args))
+    # The hash the insert will store, so already-stored rows are recognised
+    # (the Supabase row hashes ISO-formatted dates)
+    for sighting in sightings:
+        sighting['content_hash'] = (_supabase_row(sighting)['content_hash'] if use_supabase
+                                    else sighting_content_hash(sighting))
+    result = deduplicator.assign(sightings)
+    if any(result.values()):
+        logger.info(f"{source_name}: {result['matched']} sightings joined existing duplicate clusters, "
+                    f"{result['new_clusters']} clusters created, {result['merged_clusters']} merged")
+
+    def apply_relinks(inserted_hashes: List[str]):
+        inserted = set(inserted_hashes)
+        targets = {sighting['cluster_id'] for sighting in sightings
+                   if sighting.get('cluster_id') and sighting['content_hash'] in inserted}
+        for args in relinks:
+            if args[0] in targets:
+                relink(*args)
+
+    return apply_relinks
+
+
+def bulk_save_sightings(sightings: List[Dict[str, Any]], source_name: str,
+                        raise_errors: bool = False) -> Dict[str, int]:
+    """
+    Save sightings in batches with deduplication.
+
+    Uses PostgreSQL (DATABASE_URL) when configured, otherwise Supabase
+    (SUPABASE_URL / SUPABASE_SERVICE_KEY) through chunked upserts. With
+    NEAR_DUPLICATE_CHECK on, each sighting also gets its MinHash signature
+    and a link to the stored sighting it nearly duplicates, if any; with
+    INGEST_DEDUP on it is additionally attached to the duplicate cluster of
+    the stored sightings it matches; such batches are written one at a time
+    (see INGEST_DEDUP_LOCK_ID) so concurrent sources see each other's rows.
+
+    Args:
+        sightings: List of sighting dictionaries
+        source_name: Name of the source, used when a sighting has no source_type
+        raise_errors: Raise when the database is unreachable instead of
+            logging and reporting every sighting as failed
+
+    Returns:
+        {'saved': n, 'duplicates': n, 'failed': n}
+    """
+    if not sightings:
+        return {'saved': 0, 'duplicates': 0, 'failed': 0}
+    sightings = [dict(sighting, source_type=sighting.get('source_type', source_name)) for sighting in sightings]
+    use_supabase = (not os.getenv('DATABASE_URL')
+                    and os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_SERVICE_KEY'))
+    dedup = ingest_dedup_enabled()
+    try:
+        with _ingest_dedup_serialized(use_supabase) if dedup else nullcontext():
+            return _write_sightings(sightings, source_name, use_supabase, dedup)
+    except Exception as e:
+        if raise_errors:
+            raise
+        logger.error(f"Database connection failed: {e}")
+        return {'saved': 0, 'duplicates': 0, 'failed': len(sightings)}
+
+
+def _write_sightings(sightings: List[Dict[str, Any]], source_name: str,
+                     use_supabase: bool, dedup: bool) -> Dict[str, int]:
+    """Annotate and write one batch for bulk_save_sightings; raises if the database is unreachable."""
+    apply_relinks = None
+    if dedup:
+        apply_relinks = _deduplicate_at_ingest(sightings, source_name, use_supabase)
+    elif near_duplicate_check_enabled():
+        _check_near_duplicates(sightings, source_name, use_supabase)
+    inserted_hashes: List[str] = []
+    if use_supabase:
+        from .supabase_writer import get_supabase_writer
+        result = get_supabase_writer().write([_supabase_row(sighting) for sighting in sightings],
+                                             source_name, inserted_keys=inserted_hashes)
+    else:
+        result = get_bulk_writer().write(sightings, source_name, inserted_keys=inserted_hashes)
+
+    # Link stored rows into the clusters of the rows that were inserted
+    if apply_relinks is not None and inserted_hashes:
+        try:
+            apply_relinks(inserted_hashes)
+        except Exception as e:
+            logger.error(f"{source_name}: failed to merge duplicate clusters after saving: {e}")
+    return result
+
+
 def save_sightings_to_db(sightings: List[Dict[str, Any]], source_name: str) -> int:
     """
     Save sightings to the database with deduplication.
@@ -23,137 +342,4 @@ def save_sightings_to_db(sightings: List[Dict[str, Any]], source_name: str) -> i
     Returns:
         Number of sightings saved
     """
-    
-    # Get database connection
-    DATABASE_URL = os.getenv('DATABASE_URL')
-    if not DATABASE_URL:
-        # Try Supabase
-        SUPABASE_URL = os.getenv('SUPABASE_URL')
-        SUPABASE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
-        
-        if SUPABASE_URL and SUPABASE_KEY:
-            # Use Supabase
-            try:
-                from supabase import create_client
-                supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
-                
-                saved_count = 0
-                for sighting in sightings:
-                    # Convert all datetime objects to ISO strings
-                    for key, value in list(sighting.items()):
-                        if hasattr(value, 'isoformat'):
-                            sighting[key] = value.isoformat()
-                    
-                    # Add metadata
-                    sighting['created_at'] = datetime.now().isoformat()
-                    sighting['updated_at'] = datetime.now().isoformat()
-                    
-                    # Generate content hash for deduplication
-                    content = f"{sighting.get('species', '')}_{sighting.get('location_name', '')}_{sighting.get('sighting_date', '')}"
-                    sighting['content_hash'] = hashlib.md5(content.encode()).hexdigest()
-                    
-                    try:
-                        # Map fields to match Supabase schema
-                        supabase_sighting = {
-                            'species': sighting.get('species'),
-                            'sighting_date': sighting.get('sighting_date'),
-                            'location_name': sighting.get('location_name'),
-                            'location_confidence_radius': sighting.get('location_confidence_radius'),
-                            'gmu_unit': sighting.get('gmu_number'),
-                            'source_type': sighting.get('source_type'),
-                            'source_url': sighting.get('source_url'),
-                            'description': sighting.get('location_description'),
-                            'confidence_score': sighting.get('confidence'),
-                            'raw_text': sighting.get('raw_text'),
-                            'content_hash': sighting.get('content_hash'),
-                            'created_at': sighting.get('created_at'),
-                            'updated_at': sighting.get('updated_at')
-                        }
-                        
-                        # Add coordinates if available
-                        if sighting.get('coordinates'):
-                            coords = sighting['coordinates']
-                            if isinstance(coords, list) and len(coords) == 2:
-                                lat, lng = coords[0], coords[1]
-                                # PostGIS format for Supabase
-                                supabase_sighting['location'] = f'POINT({lng} {lat})'
-                        
-                        # Insert to Supabase
-                        response = supabase.table('sightings').insert(supabase_sighting).execute()
-                        if response.data:
-                            saved_count += 1
-                            logger.debug(f"Successfully saved: {sighting.get('species')} at {sighting.get('location_name')}")
-                        else:
-                            logger.warning(f"No data in response: {response}")
-                    except Exception as e:
-                        if 'duplicate' in str(e).lower():
-                            logger.debug(f"Duplicate sighting skipped: {sighting.get('species')} at {sighting.get('location_name')}")
-                        else:
-                            logger.warning(f"Failed to save sighting: {e}")
-                            logger.debug(f"Sighting data that failed: {sighting}")
-                
-                logger.success(f"Saved {saved_count} sightings from {source_name} to Supabase")
-                return saved_count
-                
-            except Exception as e:
-                logger.error(f"Failed to connect to Supabase: {e}")
-                return 0
-    
-    # PostgreSQL connection
-    try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor()
-        
-        saved_count = 0
-        duplicate_count = 0
-        
-        for sighting in sightings:
-            # Generate content hash for deduplication
-            content = f"{sighting.get('species', '')}_{sighting.get('location_name', '')}_{sighting.get('sighting_date', '')}"
-            content_hash = hashlib.md5(content.encode()).hexdigest()
-            
-            try:
-                cursor.execute("""
-                    INSERT INTO wildlife_sightings (
-                        species, confidence, location_name, location_confidence_radius,
-                        sighting_date, source_type, source_url, raw_text,
-                        gmu_number, county, coordinates, elevation, location_description,
-                        content_hash, created_at, updated_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW()
-                    )
-                    ON CONFLICT (content_hash) DO NOTHING
-                """, (
-                    sighting.get('species'),
-                    sighting.get('confidence'),
-                    sighting.get('location_name'),
-                    sighting.get('location_confidence_radius'),
-                    sighting.get('sighting_date'),
-                    sighting.get('source_type', source_name),
-                    sighting.get('source_url'),
-                    sighting.get('raw_text'),
-                    sighting.get('gmu_number'),
-                    sighting.get('county'),
-                    sighting.get('coordinates'),
-                    sighting.get('elevation'),
-                    sighting.get('location_description'),
-                    content_hash
-                ))
-                
-                if cursor.rowcount > 0:
-                    saved_count += 1
-                else:
-                    duplicate_count += 1
-                    
-            except Exception as e:
-                logger.warning(f"Failed to save sighting: {e}")
-        
-        conn.commit()
-        conn.close()
-        
-        logger.info(f"{source_name}: Saved {saved_count} new sightings ({duplicate_count} duplicates skipped)")
-        return saved_count
-        
-    except Exception as e:
-        logger.error(f"Database connection failed: {e}")
-        return 0
\ No newline at end of file
+    return bulk_save_sightings(sightings, source_name)['saved']
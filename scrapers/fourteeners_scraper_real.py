@@ -5,7 +5,7 @@ This version actually scrapes the website with updated parsing logic.
 
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from bs4 import BeautifulSoup
 from loguru import logger
 import time
@@ -23,7 +23,8 @@ class FourteenersRealScraper(BaseScraper):
     BASE_URL = "https://www.14ers.com"
     
     def __init__(self):
-        super().__init__(source_name="14ers.com", rate_limit=1.0)
+        # Published trip reports rarely change; the report list is refreshed more often
+        super().__init__(source_name="14ers.com", rate_limit=1.0, cache_ttl=7 * 24 * 3600)
         self.llm_validator = LLMValidator()
         
     def scrape(self, lookback_days: int = 1) -> List[Dict[str, Any]]:
@@ -36,18 +37,31 @@ class FourteenersRealScraper(BaseScraper):
         Returns:
             List of wildlife sightings
         """
-        all_sightings = []
+        all_sightings = list(self.iter_sightings(lookback_days))
+        logger.info(f"Found {len(all_sightings)} total sightings from 14ers.com")
+        return all_sightings
+    
+    def iter_sightings(self, lookback_days: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Yield sightings from recent trip reports as each batch of pages arrives.
         
+        Args:
+            lookback_days: Number of days to look back for reports
+            
+        Yields:
+            Wildlife sighting dictionaries
+        """
         # Get recent trip reports from the trip reports page
         trip_reports = self._get_recent_trip_reports_real(lookback_days)
         
-        # Extract sightings from each report
-        for report in trip_reports:
-            sightings = self._extract_sightings_from_report(report)
-            all_sightings.extend(sightings)
-        
-        logger.info(f"Found {len(all_sightings)} total sightings from 14ers.com")
-        return all_sightings
+        # Download report pages concurrently a batch at a time, extracting
+        # sightings from each batch before fetching the next
+        batch_size = self.max_concurrency * 2
+        for start in range(0, len(trip_reports), batch_size):
+            batch = trip_reports[start:start + batch_size]
+            responses = self.fetch_many([report['url'] for report in batch])
+            for report, response in zip(batch, responses):
+                yield from self._extract_sightings_from_report(report, response=response)
     
     def _get_recent_trip_reports_real(self, lookback_days: int) -> List[Dict[str, Any]]:
         """
@@ -66,7 +80,7 @@ class FourteenersRealScraper(BaseScraper):
         reports_url = f"{self.BASE_URL}/php14ers/tripmain.php"
         
         logger.info(f"Fetching trip reports from {reports_url}")
-        response = self._make_request(reports_url)
+        response = self._make_request(reports_url, cache_ttl=15 * 60)
         
         if not response:
             logger.error("Failed to fetch trip reports page")
@@ -149,13 +163,14 @@ class FourteenersRealScraper(BaseScraper):
         logger.info(f"Found {len(reports)} recent trip reports within {lookback_days} days")
         return reports
     
-    def _extract_sightings_from_report(self, report: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _extract_sightings_from_report(self, report: Dict[str, Any], response=None) -> List[Dict[str, Any]]:
         """
         Extract wildlife sightings from a single trip report.
         Updated to parse current HTML structure.
         
         Args:
             report: Trip report metadata
+            response: Already-fetched report page (fetched here if omitted)
             
         Returns:
             List of sightings found in this report
@@ -163,8 +178,9 @@ class FourteenersRealScraper(BaseScraper):
         sightings = []
         
         # Fetch the report page
-        logger.info(f"Fetching report: {report['title']}")
-        response = self._make_request(report['url'])
+        if response is None:
+            logger.info(f"Fetching report: {report['title']}")
+            response = self._make_request(report['url'])
         if not response:
             return sightings
         
@@ -237,29 +253,32 @@ class FourteenersRealScraper(BaseScraper):
         if not potential_mentions:
             return sightings
         
-        # Use LLM to validate each potential mention
+        # Extract the peak name from URL for context
+        peak_name = "Colorado 14er"
+        if '/route.php' in url:
+            try:
+                import urllib.parse
+                parsed = urllib.parse.urlparse(url)
+                params = urllib.parse.parse_qs(parsed.query)
+                if 'peak' in params:
+                    peak_name = params['peak'][0].replace('+', ' ')
+            except:
+                pass
+        
+        # Queue LLM validation for every potential mention so they run concurrently
+        mention_futures = []
         for mention in potential_mentions:
-            # Extract the peak name from URL for context
-            peak_name = "Colorado 14er"
-            if '/route.php' in url:
-                try:
-                    import urllib.parse
-                    parsed = urllib.parse.urlparse(url)
-                    params = urllib.parse.parse_qs(parsed.query)
-                    if 'peak' in params:
-                        peak_name = params['peak'][0].replace('+', ' ')
-                except:
-                    pass
-            
             # Enhanced context for LLM
             enhanced_text = f"Trip report from {peak_name}: {mention['full_text']}"
             
-            # Use LLM validator
-            analysis = self.llm_validator.analyze_full_text_for_sighting(
+            mention_futures.append((mention, self.llm_validator.submit_full_text_analysis(
                 enhanced_text,
                 mention['species_mentioned'],
                 '14ers.com'  # Pass source context
-            )
+            )))
+        
+        for mention, future in mention_futures:
+            analysis = future.result()
             
             if analysis:
                 # Create sighting with LLM validation data
@@ -294,24 +313,20 @@ class FourteenersRealScraper(BaseScraper):
     def _extract_potential_wildlife_mentions(self, text: str, source_url: str) -> List[Dict[str, Any]]:
         """Helper method to extract potential mentions for LLM validation."""
         mentions = []
-        text_lower = text.lower()
-        
-        for species, keywords in self.game_species.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    # Find context around keyword
-                    index = text_lower.find(keyword.lower())
-                    start = max(0, index - 100)
-                    end = min(len(text), index + len(keyword) + 100)
-                    
-                    mentions.append({
-                        'species_mentioned': species,
-                        'keyword_matched': keyword,
-                        'source_url': source_url,
-                        'full_text': text[start:end],
-                        'raw_text': text[start:end]
-                    })
-                    break  # Only need one keyword match per species
+        
+        # Only need the first keyword match per species
+        for species, (_, keyword, index) in self.keyword_matcher.first_hit_per_species(text).items():
+            # Find context around keyword
+            start = max(0, index - 100)
+            end = min(len(text), index + len(keyword) + 100)
+            
+            mentions.append({
+                'species_mentioned': species,
+                'keyword_matched': keyword,
+                'source_url': source_url,
+                'full_text': text[start:end],
+                'raw_text': text[start:end]
+            })
         
         return mentions
     
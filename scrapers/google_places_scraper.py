@@ -5,9 +5,8 @@ Updated to return data in the same format as Reddit and 14ers scrapers.
 
 import os
 import json
-import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from loguru import logger
 import hashlib
 import time
@@ -23,7 +22,8 @@ class GooglePlacesScraper(BaseScraper):
     """
     
     def __init__(self):
-        super().__init__(source_name='google_places', rate_limit=0.5)  # 2 requests per second
+        # 2 requests per second; reviews change slowly, so cache responses for a day
+        super().__init__(source_name='google_places', rate_limit=0.5, cache_ttl=24 * 3600)
         self.api_key = os.getenv('GOOGLE_PLACES_API_KEY')
         if not self.api_key:
             raise ValueError("GOOGLE_PLACES_API_KEY not found in environment variables")
@@ -62,43 +62,34 @@ class GooglePlacesScraper(BaseScraper):
     def _extract_potential_wildlife_mentions(self, text: str, source_url: str) -> List[Dict[str, Any]]:
         """Extract potential wildlife mentions from text."""
         mentions = []
-        text_lower = text.lower()
         
-        for species, keywords in self.game_species.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    mentions.append({
-                        'species_mentioned': species,
-                        'keyword_matched': keyword,
-                        'source_url': source_url,
-                        'full_text': text
-                    })
-                    break  # Only need one keyword match per species
+        # Only need the first keyword match per species
+        for species, hit in self.keyword_matcher.first_hit_per_species(text).items():
+            mentions.append({
+                'species_mentioned': species,
+                'keyword_matched': hit.keyword,
+                'source_url': source_url,
+                'full_text': text
+            })
         
         return mentions
     
-    def _make_request(self, url: str, params: Dict[str, Any]) -> Optional[requests.Response]:
-        """Make a rate-limited request to Google Places API."""
-        self._rate_limit()
-        
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            return None
+    def _place_details_params(self, place_id: str, fields: str = 'reviews,name,geometry') -> Dict[str, Any]:
+        """Query parameters for a Place Details request."""
+        return {
+            'place_id': place_id,
+            'fields': fields,
+            'key': self.api_key
+        }
     
     def _fetch_place_reviews(self, place_id: str, max_reviews: int = 5) -> List[Dict[str, Any]]:
         """Fetch reviews for a specific place."""
         url = f"{self.base_url}/details/json"
-        params = {
-            'place_id': place_id,
-            'fields': 'reviews,name,geometry',
-            'key': self.api_key
-        }
-        
-        response = self._make_request(url, params=params)
+        response = self._make_request(url, params=self._place_details_params(place_id))
+        return self._parse_place_reviews(response, max_reviews)
+    
+    def _parse_place_reviews(self, response, max_reviews: int = 5) -> List[Dict[str, Any]]:
+        """Extract reviews (with place coordinates) from a Place Details response."""
         if not response:
             return []
         
@@ -262,7 +253,18 @@ class GooglePlacesScraper(BaseScraper):
         Returns:
             List of wildlife sighting dictionaries matching Reddit/14ers format
         """
-        wildlife_sightings = []
+        return list(self.iter_sightings(lookback_days))
+    
+    def iter_sightings(self, lookback_days: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Yield wildlife sightings from trailhead reviews as each batch of places arrives.
+        
+        Args:
+            lookback_days: Not used for Google Places (we get latest reviews)
+            
+        Yields:
+            Wildlife sighting dictionaries matching Reddit/14ers format
+        """
         trailheads = self._get_colorado_trailhead_places()
         
         # Get already processed review IDs
@@ -273,38 +275,47 @@ class GooglePlacesScraper(BaseScraper):
         
         total_reviews = 0
         new_reviews = 0
+        found = 0
         
-        for trailhead in trailheads:
-            logger.debug(f"Fetching reviews for {trailhead['name']}")
-            
-            reviews = self._fetch_place_reviews(trailhead['place_id'])
-            if not reviews:
-                continue
-            
-            total_reviews += len(reviews)
+        # Fetch trailhead details concurrently within the API rate limit, a
+        # batch at a time so sightings are yielded while later batches load
+        url = f"{self.base_url}/details/json"
+        batch_size = self.max_concurrency * 4
+        for start in range(0, len(trailheads), batch_size):
+            batch = trailheads[start:start + batch_size]
+            responses = self.fetch_many(
+                [url] * len(batch),
+                [self._place_details_params(trailhead['place_id']) for trailhead in batch]
+            )
             
-            for review in reviews:
-                # Generate review ID for deduplication
-                review_id = self._generate_review_id(review)
-                
-                # Skip if already processed
-                if review_id in processed_ids:
-                    logger.debug(f"Skipping already processed review {review_id}")
+            for trailhead, response in zip(batch, responses):
+                reviews = self._parse_place_reviews(response)
+                if not reviews:
                     continue
                 
-                new_reviews += 1
-                
-                # Process review for wildlife mentions
-                sighting = self._process_review_for_wildlife(review, trailhead)
+                total_reviews += len(reviews)
                 
-                if sighting:
-                    wildlife_sightings.append(sighting)
-                    logger.info(f"Found {sighting['species']} sighting in Google review at {trailhead['name']}")
+                for review in reviews:
+                    # Generate review ID for deduplication
+                    review_id = self._generate_review_id(review)
+                    
+                    # Skip if already processed
+                    if review_id in processed_ids:
+                        logger.debug(f"Skipping already processed review {review_id}")
+                        continue
+                    
+                    new_reviews += 1
+                    
+                    # Process review for wildlife mentions
+                    sighting = self._process_review_for_wildlife(review, trailhead)
+                    
+                    if sighting:
+                        found += 1
+                        logger.info(f"Found {sighting['species']} sighting in Google review at {trailhead['name']}")
+                        yield sighting
         
         logger.info(f"Processed {new_reviews} new reviews out of {total_reviews} total")
-        logger.info(f"Found {len(wildlife_sightings)} wildlife sightings in Google reviews")
-        
-        return wildlife_sightings
+        logger.info(f"Found {found} wildlife sightings in Google reviews")
     
     def get_trail_locations(self) -> List[Dict[str, Any]]:
         """
@@ -316,16 +327,14 @@ class GooglePlacesScraper(BaseScraper):
         locations = []
         trailheads = self._get_colorado_trailhead_places()
         
-        for trailhead in trailheads:
-            # Fetch place details including coordinates
-            url = f"{self.base_url}/details/json"
-            params = {
-                'place_id': trailhead['place_id'],
-                'fields': 'name,geometry',
-                'key': self.api_key
-            }
-            
-            response = self._make_request(url, params=params)
+        # Fetch place details including coordinates
+        url = f"{self.base_url}/details/json"
+        responses = self.fetch_many(
+            [url] * len(trailheads),
+            [self._place_details_params(trailhead['place_id'], fields='name,geometry') for trailhead in trailheads]
+        )
+        
+        for trailhead, response in zip(trailheads, responses):
             if response:
                 try:
                     data = response.json()
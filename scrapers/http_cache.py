@@ -0,0 +1,334 @@
+"""
+On-disk HTTP response cache for scraper requests.
+
+Responses are stored in a single SQLite file keyed by URL plus query
+parameters, together with their ETag / Last-Modified validators. Fresh
+entries (younger than the caller's TTL) are served without touching the
+network; stale entries are revalidated with a conditional GET, and a 304
+reply is served from disk. The cache is size-bounded and evicts the least
+recently used entries first.
+
+Caching is opt-in per scraper (see BaseScraper's cache_ttl), so sources
+that must always be fetched live, such as the iNaturalist and
+Observation.org APIs, never touch it. Secret query parameters are
+stripped from stored URLs as well as from cache keys.
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from loguru import logger
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "cache" / "http"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 3600
+
+# Query parameters that must not end up in cache keys, stored URLs or logs
+SECRET_PARAMS = ('key', 'api_key', 'token', 'access_token')
+
+# Bodies are stored decoded, so transfer-level headers are dropped
+HOP_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+def redact_url(url: str) -> str:
+    """URL with SECRET_PARAMS removed from its query string."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SECRET_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class HTTPResponseCache:
+    """
+    Size-bounded LRU cache of GET responses with conditional revalidation.
+
+    Counters are kept per source (e.g. '14ers.com') and in total:
+    hits (served fresh from disk), revalidated (304 from the server),
+    misses, stores, evictions, bytes_saved and seconds_saved (the original
+    download time of every response served from disk).
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory holding responses.db
+            max_bytes: Maximum total size of cached bodies before LRU eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "responses.db"
+        self.max_bytes = max_bytes
+        self.counters: Dict[str, Counter] = {}
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                fetch_seconds REAL NOT NULL DEFAULT 0,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self._redact_stored_urls()
+        self._conn.commit()
+        self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Cache key for a GET request.
+
+        Args:
+            url: Request URL
+            params: Query parameters (order-insensitive; secrets are excluded)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        items = sorted(
+            (str(k), str(v)) for k, v in (params or {}).items()
+            if v is not None and k not in SECRET_PARAMS
+        )
+        return hashlib.sha256(f"{url}?{urlencode(items)}".encode('utf-8')).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            cache_key: Key from make_key()
+
+        Returns:
+            Dict with url, status_code, headers, body, etag, last_modified,
+            stored_at and fetch_seconds, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, body, etag, last_modified, stored_at, fetch_seconds "
+                "FROM responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            'url': row[0],
+            'status_code': row[1],
+            'headers': json.loads(row[2]),
+            'body': bytes(row[3]),
+            'etag': row[4],
+            'last_modified': row[5],
+            'stored_at': row[6],
+            'fetch_seconds': row[7]
+        }
+
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any], ttl: Optional[float]) -> bool:
+        """True if the entry is younger than ttl seconds (None/0 means always revalidate)."""
+        return bool(ttl) and time.time() - entry['stored_at'] < ttl
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidating an entry."""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, cache_key: str, url: str, status_code: int, headers: Dict[str, str],
+              body: bytes, fetch_seconds: float = 0.0, source: str = 'default'):
+        """
+        Store (or replace) a response and evict old entries if over budget.
+
+        Only 200 responses without Cache-Control: no-store are kept.
+
+        Args:
+            cache_key: Key from make_key()
+            url: Final response URL (secret parameters are stripped)
+            status_code: HTTP status
+            headers: Response headers
+            body: Raw response body
+            fetch_seconds: Time the download took, credited on later hits
+            source: Counter bucket (scraper source name)
+        """
+        size = len(body)
+        if status_code != 200 or size > self.max_bytes:
+            return
+        if 'no-store' in {k.lower(): v for k, v in headers.items()}.get('cache-control', '').lower():
+            return
+        headers = {k: v for k, v in headers.items() if k.lower() not in HOP_HEADERS}
+        lowered = {k.lower(): v for k, v in headers.items()}
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(cache_key, url, status_code, headers, body, etag, last_modified, "
+                "stored_at, last_access, fetch_seconds, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, redact_url(str(url)), status_code, json.dumps(dict(headers)), sqlite3.Binary(body),
+                 lowered.get('etag'), lowered.get('last-modified'), now, now, fetch_seconds, size)
+            )
+            self.total_bytes += size - (previous[0] if previous else 0)
+            self._count(source, 'stores')
+            self._evict()
+            self._conn.commit()
+
+    def record_hit(self, cache_key: str, entry: Dict[str, Any], source: str = 'default',
+                   revalidated: bool = False):
+        """
+        Count a response served from disk and mark it recently used.
+
+        Args:
+            cache_key: Key from make_key()
+            entry: The entry returned by get()
+            source: Counter bucket (scraper source name)
+            revalidated: True for a 304, which also restarts the entry's TTL
+        """
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._conn.execute(
+                    "UPDATE responses SET last_access = ?, stored_at = ? WHERE cache_key = ?",
+                    (now, now, cache_key)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE responses SET last_access = ? WHERE cache_key = ?", (now, cache_key)
+                )
+            self._conn.commit()
+            self._count(source, 'revalidated' if revalidated else 'hits')
+            if not revalidated:
+                # A 304 still costs a round trip; only fresh hits skip the network entirely
+                self._count(source, 'seconds_saved', entry.get('fetch_seconds') or 0.0)
+            self._count(source, 'bytes_saved', len(entry['body']))
+
+    def record_miss(self, source: str = 'default'):
+        """Count a request that had to download the full response."""
+        with self._lock:
+            self._count(source, 'misses')
+
+    def _redact_stored_urls(self):
+        """Strip secrets from URLs stored before store() redacted them."""
+        for cache_key, url in self._conn.execute("SELECT cache_key, url FROM responses").fetchall():
+            redacted = redact_url(url)
+            if redacted != url:
+                self._conn.execute("UPDATE responses SET url = ? WHERE cache_key = ?", (redacted, cache_key))
+
+    def _count(self, source: str, counter: str, amount: float = 1):
+        self.counters.setdefault(source, Counter())[counter] += amount
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        if self.total_bytes <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        for cache_key, size in rows:
+            if self.total_bytes <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE cache_key = ?", (cache_key,))
+            self.total_bytes -= size
+            self._count('default', 'evictions')
+
+    def stats(self, source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Cache effectiveness counters.
+
+        Args:
+            source: Limit counters to one scraper source (None for all)
+
+        Returns:
+            Dict with hits, revalidated, misses, stores, evictions, bytes_saved,
+            seconds_saved, hit_rate, entries and total_bytes
+        """
+        with self._lock:
+            if source is None:
+                totals = Counter()
+                for counter in self.counters.values():
+                    totals.update(counter)
+            else:
+                totals = Counter(self.counters.get(source, {}))
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+        requests_seen = totals['hits'] + totals['revalidated'] + totals['misses']
+        return {
+            'hits': int(totals['hits']),
+            'revalidated': int(totals['revalidated']),
+            'misses': int(totals['misses']),
+            'stores': int(totals['stores']),
+            'evictions': int(totals['evictions']),
+            'bytes_saved': int(totals['bytes_saved']),
+            'seconds_saved': round(totals['seconds_saved'], 2),
+            'hit_rate': round((totals['hits'] + totals['revalidated']) / requests_seen, 3) if requests_seen else 0.0,
+            'entries': entries,
+            'total_bytes': self.total_bytes
+        }
+
+    def clear(self):
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self.total_bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache: Optional[HTTPResponseCache] = None
+_shared_cache_failed = False
+_shared_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPResponseCache]:
+    """
+    Get the process-wide response cache, configured from the environment.
+
+    Only scrapers that opt in with a cache_ttl use it. SCRAPER_HTTP_CACHE=0
+    disables caching for all of them, SCRAPER_HTTP_CACHE_DIR moves it
+    (e.g. to /tmp on Lambda) and SCRAPER_HTTP_CACHE_MB bounds its size.
+
+    Returns:
+        Shared HTTPResponseCache, or None if caching is disabled or unavailable
+    """
+    global _shared_cache, _shared_cache_failed
+    if os.getenv('SCRAPER_HTTP_CACHE', '1').lower() in ('0', 'false', 'no', 'off'):
+        return None
+
+    with _shared_cache_lock:
+        if _shared_cache is None and not _shared_cache_failed:
+            cache_dir = Path(os.getenv('SCRAPER_HTTP_CACHE_DIR', str(DEFAULT_CACHE_DIR)))
+            max_bytes = int(float(os.getenv('SCRAPER_HTTP_CACHE_MB', DEFAULT_MAX_BYTES / 1024 / 1024)) * 1024 * 1024)
+            try:
+                _shared_cache = HTTPResponseCache(cache_dir, max_bytes=max_bytes)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"HTTP response cache unavailable at {cache_dir}: {e}")
+                _shared_cache_failed = True
+        return _shared_cache
@@ -4,7 +4,7 @@ Scraper for iNaturalist wildlife observations in Colorado.
 
 import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from loguru import logger
 from .base import BaseScraper
 from .llm_validator import LLMValidator
@@ -46,20 +46,34 @@ class INaturalistScraper(BaseScraper):
         Returns:
             List of wildlife sightings with location, species, and time data
         """
-        all_sightings = []
+        all_sightings = list(self.iter_sightings(lookback_days))
+        logger.info(f"Found {len(all_sightings)} total observations from iNaturalist")
+        return all_sightings
+    
+    def iter_sightings(self, lookback_days: int = 30) -> Iterator[Dict[str, Any]]:
+        """
+        Yield recent wildlife observations from iNaturalist species by species.
+        
+        Args:
+            lookback_days: Number of days to look back for observations
+            
+        Yields:
+            Wildlife sightings with location, species, and time data
+        """
         start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
         
-        for species_key, species_info in self.game_species_taxa.items():
-            logger.info(f"Fetching {species_info['name']} observations...")
-            sightings = self._fetch_species_observations(
-                species_info['taxon_id'],
-                species_key,
-                start_date
-            )
-            all_sightings.extend(sightings)
+        # One request per species, fetched concurrently within the API rate limit
+        species_keys = list(self.game_species_taxa)
+        logger.info(f"Fetching observations for {len(species_keys)} species...")
+        responses = self.fetch_many(
+            [f"{self.base_url}/observations"] * len(species_keys),
+            [self._observation_params(self.game_species_taxa[key]['taxon_id'], start_date) for key in species_keys]
+        )
         
-        logger.info(f"Found {len(all_sightings)} total observations from iNaturalist")
-        return all_sightings
+        for species_key, response in zip(species_keys, responses):
+            sightings = self._process_species_response(response, species_key)
+            logger.info(f"Fetched {len(sightings)} {self.game_species_taxa[species_key]['name']} observations")
+            yield from sightings
     
     def _fetch_species_observations(self, taxon_id: int, species_key: str, 
                                    start_date: str) -> List[Dict[str, Any]]:
@@ -74,7 +88,13 @@ class INaturalistScraper(BaseScraper):
         Returns:
             List of processed observations
         """
-        params = {
+        url = f"{self.base_url}/observations"
+        response = self._make_request(url, params=self._observation_params(taxon_id, start_date))
+        return self._process_species_response(response, species_key)
+    
+    def _observation_params(self, taxon_id: int, start_date: str) -> Dict[str, Any]:
+        """Query parameters for one species' observations."""
+        return {
             'taxon_id': taxon_id,
             'place_id': self.colorado_place_id,
             'd1': start_date,
@@ -84,10 +104,18 @@ class INaturalistScraper(BaseScraper):
             'per_page': 200,
             'order_by': 'observed_on'
         }
+    
+    def _process_species_response(self, response, species_key: str) -> List[Dict[str, Any]]:
+        """
+        Turn an observations API response into sightings.
         
-        url = f"{self.base_url}/observations"
-        response = self._make_request(url, params=params)
-        
+        Args:
+            response: Response from the observations endpoint (None if the request failed)
+            species_key: Our internal species key
+            
+        Returns:
+            List of processed observations
+        """
         if not response:
             return []
         
@@ -0,0 +1,174 @@
+"""
+Single-pass wildlife keyword matching shared by all text scrapers.
+
+The game species keywords from config/settings.yaml are compiled once into
+one alternation regex with word boundaries, so a document is scanned once
+instead of once per keyword.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+from loguru import logger
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML is in requirements.txt
+    yaml = None
+
+
+SETTINGS_PATH = Path(__file__).resolve().parent.parent / "config" / "settings.yaml"
+
+# Used when the settings file (or PyYAML) is unavailable, e.g. in Lambda packages
+DEFAULT_GAME_SPECIES = {
+    'elk': ['elk', 'bull', 'cow', 'wapiti', 'bugle', 'bugling'],
+    'deer': ['deer', 'buck', 'doe', 'muley', 'mule deer', 'whitetail', 'white-tail'],
+    'bear': ['bear', 'black bear', 'griz', 'grizzly', 'bruin'],
+    'pronghorn': ['pronghorn', 'antelope', 'speed goat'],
+    'bighorn_sheep': ['bighorn', 'sheep', 'ram', 'ewe'],
+    'mountain_goat': ['mountain goat', 'goat', 'billy', 'nanny']
+}
+
+
+def _trie_pattern(keywords) -> str:
+    """
+    Build a regex alternation for keywords, factored as a prefix trie.
+
+    Longer continuations are tried first, so "grizzly" wins over "griz" when
+    both would match at the same offset.
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return build(trie)
+
+
+class KeywordHit(NamedTuple):
+    """One keyword occurrence in a text."""
+    species: str
+    keyword: str
+    offset: int
+
+
+class KeywordMatcher:
+    """
+    Compiled matcher returning every (species, keyword, offset) hit in one pass.
+
+    Keywords are matched as whole words against the lowercased text. The
+    keywords are compiled as a prefix trie ("b(?:ear|uck|...)") so the regex
+    engine does not retry every keyword at each word start, and the pattern
+    sits inside a lookahead so overlapping hits starting at different offsets
+    are all reported ("mule deer" yields both 'mule deer' and 'deer'), the
+    same hits the old one-regex-per-keyword loops produced.
+    """
+
+    def __init__(self, game_species: Dict[str, List[str]]):
+        """
+        Compile the matcher.
+
+        Args:
+            game_species: Mapping of species name to keyword list
+        """
+        self.game_species = {species: list(keywords) for species, keywords in game_species.items()}
+        self.keyword_species: Dict[str, List[str]] = {}
+        for species, keywords in self.game_species.items():
+            for keyword in keywords:
+                owners = self.keyword_species.setdefault(keyword.lower(), [])
+                if species not in owners:
+                    owners.append(species)
+
+        alternation = _trie_pattern(self.keyword_species)
+        self.pattern = re.compile(rf'\b(?=({alternation})\b)') if alternation else None
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """
+        Find every keyword hit in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Hits ordered by offset
+        """
+        if not text or self.pattern is None:
+            return []
+
+        hits = []
+        for match in self.pattern.finditer(text.lower()):
+            keyword = match.group(1)
+            for species in self.keyword_species[keyword]:
+                hits.append(KeywordHit(species, keyword, match.start()))
+        return hits
+
+    def first_hit_per_species(self, text: str) -> Dict[str, KeywordHit]:
+        """
+        Find the earliest hit for each species mentioned in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dict of species -> first KeywordHit, in order of first mention
+        """
+        first: Dict[str, KeywordHit] = {}
+        for hit in self.find_all(text):
+            if hit.species not in first:
+                first[hit.species] = hit
+                if len(first) == len(self.game_species):
+                    break
+        return first
+
+
+def load_game_species(settings_path: Optional[Path] = None) -> Dict[str, List[str]]:
+    """
+    Read enabled game species keywords from the settings file.
+
+    Args:
+        settings_path: Path to settings.yaml (defaults to config/settings.yaml)
+
+    Returns:
+        Dict of species -> keywords, or DEFAULT_GAME_SPECIES if unavailable
+    """
+    settings_path = Path(settings_path) if settings_path else SETTINGS_PATH
+    if yaml is None or not settings_path.exists():
+        return dict(DEFAULT_GAME_SPECIES)
+
+    try:
+        with open(settings_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except Exception as e:
+        logger.warning(f"Failed to read game species from {settings_path}: {e}")
+        return dict(DEFAULT_GAME_SPECIES)
+
+    game_species = {
+        species: list(info.get('keywords', []))
+        for species, info in (config.get('game_species') or {}).items()
+        if info and info.get('enabled', True)
+    }
+    return game_species or dict(DEFAULT_GAME_SPECIES)
+
+
+@lru_cache(maxsize=None)
+def get_keyword_matcher(settings_path: Optional[str] = None) -> KeywordMatcher:
+    """
+    Get the process-wide matcher for the configured game species.
+
+    Args:
+        settings_path: Path to settings.yaml (defaults to config/settings.yaml)
+
+    Returns:
+        Shared KeywordMatcher, compiled on first use
+    """
+    return KeywordMatcher(load_game_species(Path(settings_path) if settings_path else None))
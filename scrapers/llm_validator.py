@@ -5,41 +5,81 @@ LLM-based validation for wildlife sightings with caching support.
 import os
 import json
 import hashlib
+import importlib.util
+import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Callable, Dict, List, Tuple, Optional, Any
 from pathlib import Path
 from loguru import logger
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from validators.location_validator import LocationValidator
+from processors.gazetteer import DEFAULT_RADIUS_MILES, Gazetteer
+from .post_cache import open_post_cache
+from .rate_limiter import TokenBucketLimiter
 
-# OpenAI will be optional - fallback to keyword validation if not available
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI will be optional - fallback to keyword validation if not available.
+# The SDK is only imported when a client is created.
+OPENAI_AVAILABLE = importlib.util.find_spec('openai') is not None
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available - wildlife validation will use keyword matching only")
 
+# analyze_texts_batch result for an item that could not be analyzed (no LLM,
+# failed call or unparseable answer), as opposed to None for "not a sighting"
+ANALYSIS_FAILED = {'is_sighting': False, 'analysis_failed': True}
+
+
+def _normalize_gmu(value: Any) -> Optional[int]:
+    """GMU number as an int (from 12, '12' or 'GMU 12'), or None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    match = re.search(r'\d{1,3}', str(value or ''))
+    return int(match.group()) if match else None
+
 
 class LLMValidator:
     """
     Validates wildlife sightings using LLM with caching to reduce API costs.
     """
     
-    def __init__(self, cache_dir: str = None):
+    # Upper bound on posts per batched completion; larger batches degrade answer quality
+    MAX_BATCH_SIZE = 20
+    
+    def __init__(self, cache_dir: str = None, cache_backend: str = None):
+        """
+        Args:
+            cache_dir: Directory for the parsed-post cache
+            cache_backend: 'sqlite' (default) or 'json'; see scrapers.post_cache
+        """
         # Use /tmp for Lambda, local data/cache otherwise
         if cache_dir is None:
             cache_dir = "/tmp/cache" if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else "data/cache"
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "parsed_posts.json"
-        self.cache = self._load_cache()
+        self.cache = open_post_cache(self.cache_dir, cache_backend)
+        self.cache_file = self.cache.cache_file
+        
+        # Rate limiting - token bucket shared by all in-flight requests.
+        # Defaults match the free-tier 3 RPM limit; raise OPENAI_RPM/OPENAI_TPM for paid accounts.
+        self.rate_limiter = TokenBucketLimiter(
+            requests_per_minute=float(os.getenv('OPENAI_RPM', '3')),
+            tokens_per_minute=float(os.getenv('OPENAI_TPM', '0')) or None
+        )
+        self.max_concurrency = int(os.getenv('OPENAI_MAX_CONCURRENCY', '8'))
+        self.max_retries = 5
+        self._executor = None
         
-        # Rate limiting
-        self.last_api_call = 0
-        self.min_time_between_calls = 20.5  # 20.5 seconds between calls for 3 RPM limit
+        # Local place-name lookup; LLM coordinates are only used when it misses
+        self.gazetteer = Gazetteer()
+        
+        # Posts packed into one completion by analyze_texts_batch
+        self.batch_size = min(int(os.getenv('OPENAI_BATCH_SIZE', '8')), self.MAX_BATCH_SIZE)
         
         # Initialize OpenAI if available
         self.llm_available = False
@@ -74,23 +114,106 @@ class LLMValidator:
             if OPENAI_AVAILABLE:
                 logger.warning("OpenAI available but no API key found in environment")
     
-    def _load_cache(self) -> Dict:
-        """Load cache from file."""
-        if self.cache_file.exists():
+    def _save_cache(self):
+        """Persist any buffered cache writes."""
+        self.cache.flush()
+    
+    def _create_chat_completion(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float = 0.1):
+        """
+        Send a chat completion through the shared rate limiter.
+        
+        Retries on 429 responses, pausing every in-flight request for the
+        server's Retry-After interval (or an exponential backoff).
+        
+        Args:
+            messages: Chat messages
+            max_tokens: Completion token limit
+            temperature: Sampling temperature
+            
+        Returns:
+            OpenAI chat completion response
+        """
+        # Rough token estimate: ~4 characters per token plus the completion budget
+        estimated_tokens = sum(len(m['content']) for m in messages) // 4 + max_tokens
+        
+        for attempt in range(self.max_retries + 1):
+            waited = self.rate_limiter.acquire(estimated_tokens)
+            if waited:
+                logger.debug(f"Rate limiting: waited {waited:.1f} seconds")
             try:
-                with open(self.cache_file, 'r') as f:
-                    return json.load(f)
+                return self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
             except Exception as e:
-                logger.error(f"Failed to load cache: {e}")
-        return {}
+                if getattr(e, 'status_code', None) != 429 or attempt == self.max_retries:
+                    raise
+                delay = self._retry_after_seconds(e) or min(60.0, 2.0 ** attempt)
+                logger.warning(f"OpenAI rate limit hit, pausing requests for {delay:.1f} seconds")
+                self.rate_limiter.pause(delay)
     
-    def _save_cache(self):
-        """Save cache to file."""
+    def _retry_after_seconds(self, error: Exception) -> Optional[float]:
+        """Read the Retry-After delay from an OpenAI error response, if present."""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or {}
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+            if headers.get('retry-after-ms'):
+                return float(headers['retry-after-ms']) / 1000.0
+            if headers.get('retry-after'):
+                return float(headers['retry-after'])
+        except (TypeError, ValueError):
+            pass
+        return None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix="llm")
+        return self._executor
+    
+    def submit_full_text_analysis(self, full_text: str, species_mentioned: List[str],
+                                  subreddit: str = None) -> Future:
+        """
+        Queue analyze_full_text_for_sighting on the worker pool.
+        
+        Up to max_concurrency requests are kept in flight; the shared token
+        bucket keeps them within the RPM/TPM budget.
+        
+        Returns:
+            Future resolving to the analyze_full_text_for_sighting result
+        """
+        if not self.llm_available:
+            future = Future()
+            future.set_result(None)
+            return future
+        return self._get_executor().submit(
+            self.analyze_full_text_for_sighting, full_text, species_mentioned, subreddit
+        )
+    
+    def analyze_full_texts(self, items: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze many texts concurrently.
+        
+        Args:
+            items: Dicts with 'full_text', 'species_mentioned' and optional 'subreddit'
+            
+        Returns:
+            Analysis results in the same order as items
+        """
+        futures = [
+            self.submit_full_text_analysis(item['full_text'], item['species_mentioned'], item.get('subreddit'))
+            for item in items
+        ]
+        return [future.result() for future in futures]
+    
+    def shutdown(self):
+        """Wait for in-flight requests and flush the cache."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._save_cache()
     
     def _get_content_hash(self, content: str) -> str:
         """Generate hash of content for change detection.
@@ -113,11 +236,10 @@ class LLMValidator:
         Returns:
             True if post should be processed
         """
-        if post_id not in self.cache:
+        cached_data = self.cache.get(post_id)
+        if cached_data is None:
             return True
         
-        cached_data = self.cache[post_id]
-        
         # New approach: Check datetime + title if provided
         if post_datetime and post_title:
             # Compare datetime (convert to ISO string for consistency)
@@ -152,8 +274,9 @@ class LLMValidator:
     
     def get_cached_sightings(self, post_id: str) -> List[Dict[str, Any]]:
         """Get cached sightings for a post."""
-        if post_id in self.cache:
-            return self.cache[post_id].get('sightings', [])
+        cached_data = self.cache.get(post_id)
+        if cached_data:
+            return cached_data.get('sightings', [])
         return []
     
     def validate_sighting_with_llm(self, context: str, keyword: str, species: str, subreddit: str = None) -> Tuple[bool, float, Dict[str, Any]]:
@@ -174,14 +297,6 @@ class LLMValidator:
             is_valid, confidence = self._simple_validation(context, keyword)
             return is_valid, confidence, {}
         
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_api_call
-        if time_since_last < self.min_time_between_calls:
-            sleep_time = self.min_time_between_calls - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.1f} seconds")
-            time.sleep(sleep_time)
-        
         try:
             subreddit_context = f"Posted in r/{subreddit}" if subreddit else "Context unknown"
             prompt = f"""
@@ -219,15 +334,12 @@ class LLMValidator:
             {LocationValidator.get_validation_prompt_addition()}
             """
             
-            self.last_api_call = time.time()
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._create_chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a wildlife sighting and location extractor. Always respond with valid JSON."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=200,  # Increased for coordinate data
-                temperature=0.1
+                max_tokens=200  # Increased for coordinate data
             )
             
             if not response or not response.choices:
@@ -244,25 +356,8 @@ class LLMValidator:
             # Debug: log the raw response
             logger.debug(f"LLM raw response: {result[:500]}")
             
-            # Extract JSON from markdown code blocks if present
-            if "```json" in result:
-                start = result.find("```json") + 7
-                end = result.find("```", start)
-                if end > start:
-                    result = result[start:end].strip()
-            elif "```" in result:
-                # Generic code block
-                start = result.find("```") + 3
-                end = result.find("```", start)
-                if end > start:
-                    result = result[start:end].strip()
-            
-            # Remove comments from JSON (nano model adds them)
-            import re
-            result = re.sub(r'//.*$', '', result, flags=re.MULTILINE)
-            
             # Parse JSON response
-            data = json.loads(result)
+            data = self._parse_llm_json(result)
             is_valid = data.get('is_sighting', False)
             confidence = data.get('confidence', 50) / 100.0
             
@@ -283,6 +378,9 @@ class LLMValidator:
             # Remove None values
             location_data = {k: v for k, v in location_data.items() if v is not None}
             
+            # Prefer gazetteer coordinates over LLM-estimated ones
+            self._apply_gazetteer(location_data)
+            
             return is_valid, confidence, location_data
             
         except Exception as e:
@@ -309,36 +407,180 @@ class LLMValidator:
             # Can't do full analysis without LLM
             return None
         
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_api_call
-        if time_since_last < self.min_time_between_calls:
-            sleep_time = self.min_time_between_calls - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.1f} seconds")
-            time.sleep(sleep_time)
-        
         try:
-            subreddit_context = f"Posted in r/{subreddit}" if subreddit else "Reddit post"
-            prompt = f"""
-            Analyze this Reddit post/comment for wildlife sightings and extract location information.
-            {subreddit_context}
+            return self._analyze_full_text(full_text, species_mentioned, subreddit)
+        except Exception as e:
+            logger.error(f"Full text LLM analysis failed: {e}")
+            return None
+    
+    def _analyze_full_text(self, full_text: str, species_mentioned: List[str],
+                           subreddit: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Single-post analysis behind analyze_full_text_for_sighting.
+        
+        Raises:
+            Exception: If the completion fails or its answer cannot be parsed
+        """
+        subreddit_context = f"Posted in r/{subreddit}" if subreddit else "Reddit post"
+        prompt = f"""
+        Analyze this Reddit post/comment for wildlife sightings and extract location information.
+        {subreddit_context}
 
-            Text: "{full_text[:1500]}"  # Limit to 1500 chars to avoid token limits
-            
-            Species mentioned: {', '.join(species_mentioned)}
+        Text: "{full_text[:1500]}"  # Limit to 1500 chars to avoid token limits
+        
+        Species mentioned: {', '.join(species_mentioned)}
 
-            Return a JSON object with:
-            {{
-                "is_sighting": true/false (actual encounter, not plans/wishes),
-                "species": primary species if sighting,
-                "confidence": 0-100 (confidence this is a real wildlife sighting),
-                "gmu_number": null or number (e.g., 12 from "GMU 12" or "unit 12"),
-                "location_name": null or specific place (trail, peak, town),
-                "coordinates": null or [lat, lon] if mentioned,
-                "elevation": null or elevation in feet,
-                "location_confidence_radius": estimated geographical area radius in miles where the sighting occurred,
-                "location_description": brief location summary
-            }}
+        Return a JSON object with:
+        {{
+            "is_sighting": true/false (actual encounter, not plans/wishes),
+            "species": primary species if sighting,
+            "confidence": 0-100 (confidence this is a real wildlife sighting),
+            "gmu_number": null or number (e.g., 12 from "GMU 12" or "unit 12"),
+            "location_name": null or specific place (trail, peak, town),
+            "coordinates": null or [lat, lon] if mentioned,
+            "elevation": null or elevation in feet,
+            "location_confidence_radius": estimated geographical area radius in miles where the sighting occurred,
+            "location_description": brief location summary
+        }}
+        
+        Consider hunting success ("got my elk", "tagged out", "harvested") as valid sightings.
+        
+        Examples:
+        - "Finally got my bull elk in unit 12 near Durango" → {{"is_sighting": true, "species": "elk", "confidence": 95, "gmu_number": 12, "location_name": "Durango", "location_confidence_radius": 8}}
+        - "Saw 6 deer at the bridge on Maroon Creek trail" → {{"is_sighting": true, "species": "deer", "confidence": 100, "location_name": "Maroon Creek trail", "location_confidence_radius": 1}}
+        - "Bear tracks somewhere in GMU 39" → {{"is_sighting": true, "species": "bear", "confidence": 90, "gmu_number": 39, "location_confidence_radius": 40}}
+        
+        IMPORTANT: If a location name is mentioned, you MUST provide estimated coordinates:
+        - "Bear Lake" → "coordinates": [40.3845, -105.6824]
+        - "Estes Park" → "coordinates": [40.3775, -105.5253]
+        - "Mount Evans" → "coordinates": [39.5883, -105.6438]
+        - "Maroon Bells" → "coordinates": [39.0708, -106.9890]
+        - "Durango" → "coordinates": [37.2753, -107.8801]
+        Always include coordinates for known Colorado locations. Use null only if location is completely unknown.
+        
+        {LocationValidator.get_validation_prompt_addition()}
+        """
+        
+        response = self._create_chat_completion(
+            messages=[
+                {"role": "system", "content": "You are a wildlife sighting and location extractor for Colorado hunting/outdoor forums. Always respond with valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=200
+        )
+        
+        result = response.choices[0].message.content.strip()
+        
+        # Parse JSON response
+        data = self._parse_llm_json(result)
+        logger.info(f"LLM response data: {data}")
+        
+        return self._build_full_text_result(data, full_text, species_mentioned)
+    
+    def analyze_texts_batch(self, posts: List[Dict[str, Any]],
+                            on_result: Optional[Callable[[int, Optional[Dict[str, Any]]], None]] = None,
+                            batch_size: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze many posts with one completion call per batch of up to batch_size posts.
+        
+        The static instructions and examples are sent once per batch instead of once
+        per post. Batches are dispatched concurrently through the worker pool. Items
+        missing from a batch answer (or all items, if the answer is not a valid JSON
+        array) fall back to analyze_full_text_for_sighting individually.
+        
+        An item that could not be analyzed gets a copy of ANALYSIS_FAILED
+        instead of None, so callers can retry it rather than cache it as a
+        post without sightings.
+        
+        Args:
+            posts: Dicts with 'full_text', 'species_mentioned' and optional 'subreddit'
+            on_result: Called as on_result(index, analysis) as soon as each item's batch
+                resolves, on the calling thread; use it for per-item cache writes
+            batch_size: Posts per completion (defaults to self.batch_size, capped at MAX_BATCH_SIZE)
+            
+        Returns:
+            Analysis results (same shape as analyze_full_text_for_sighting, or
+            ANALYSIS_FAILED) in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(posts)
+        if not posts:
+            return results
+        
+        if not self.llm_available:
+            for index in range(len(posts)):
+                results[index] = dict(ANALYSIS_FAILED)
+                if on_result:
+                    on_result(index, results[index])
+            return results
+        
+        size = max(1, min(batch_size or self.batch_size, self.MAX_BATCH_SIZE))
+        chunks = [list(range(i, min(i + size, len(posts)))) for i in range(0, len(posts), size)]
+        
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._analyze_batch, [posts[i] for i in chunk]): chunk
+            for chunk in chunks
+        }
+        
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                chunk_results = future.result()
+            except Exception as e:
+                logger.error(f"Batched LLM analysis failed: {e}")
+                chunk_results = [dict(ANALYSIS_FAILED) for _ in chunk]
+            
+            for index, analysis in zip(chunk, chunk_results):
+                results[index] = analysis
+                if on_result:
+                    on_result(index, analysis)
+        
+        return results
+    
+    def _analyze_batch(self, posts: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run one batched completion for a chunk of posts, with per-item fallback.
+        
+        Args:
+            posts: Chunk of post dicts (see analyze_texts_batch)
+            
+        Returns:
+            Analysis results for the chunk, in order
+        """
+        answers: Dict[int, Dict[str, Any]] = {}
+        
+        try:
+            post_blocks = []
+            for index, post in enumerate(posts):
+                source = f"r/{post['subreddit']}" if post.get('subreddit') else "Reddit post"
+                species = ', '.join(post.get('species_mentioned') or [])
+                post_blocks.append(
+                    f'[{index}] ({source}; species mentioned: {species})\n'
+                    f'Text: "{post["full_text"][:1500]}"'
+                )
+            posts_text = "\n\n".join(post_blocks)
+            
+            prompt = f"""
+            Analyze each of the following {len(posts)} Reddit posts/comments for wildlife sightings and extract location information.
+            Judge each post independently.
+            
+            {posts_text}
+            
+            Return a JSON array with exactly one object per post, in this form:
+            [
+                {{
+                    "index": post number in brackets above,
+                    "is_sighting": true/false (actual encounter, not plans/wishes),
+                    "species": primary species if sighting,
+                    "confidence": 0-100 (confidence this is a real wildlife sighting),
+                    "gmu_number": null or number (e.g., 12 from "GMU 12" or "unit 12"),
+                    "location_name": null or specific place (trail, peak, town),
+                    "coordinates": null or [lat, lon] if mentioned,
+                    "elevation": null or elevation in feet,
+                    "location_confidence_radius": estimated geographical area radius in miles where the sighting occurred,
+                    "location_description": brief location summary
+                }}
+            ]
             
             Consider hunting success ("got my elk", "tagged out", "harvested") as valid sightings.
             
@@ -358,90 +600,183 @@ class LLMValidator:
             {LocationValidator.get_validation_prompt_addition()}
             """
             
-            self.last_api_call = time.time()
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._create_chat_completion(
                 messages=[
-                    {"role": "system", "content": "You are a wildlife sighting and location extractor for Colorado hunting/outdoor forums. Always respond with valid JSON."},
+                    {"role": "system", "content": "You are a wildlife sighting and location extractor for Colorado hunting/outdoor forums. Always respond with a valid JSON array."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=200,
-                temperature=0.1
+                max_tokens=200 * len(posts)
             )
             
-            result = response.choices[0].message.content.strip()
-            
-            # Extract JSON from markdown code blocks if present
-            if "```json" in result:
-                start = result.find("```json") + 7
-                end = result.find("```", start)
-                if end > start:
-                    result = result[start:end].strip()
-            elif "```" in result:
-                # Generic code block
-                start = result.find("```") + 3
-                end = result.find("```", start)
-                if end > start:
-                    result = result[start:end].strip()
-            
-            # Remove comments from JSON (nano model adds them)
-            import re
-            result = re.sub(r'//.*$', '', result, flags=re.MULTILINE)
+            data = self._parse_llm_json(response.choices[0].message.content.strip())
+            if isinstance(data, dict):
+                # Some answers wrap the array, e.g. {"results": [...]}
+                data = next((v for v in data.values() if isinstance(v, list)), [])
             
-            # Parse JSON response
-            data = json.loads(result)
-            logger.info(f"LLM response data: {data}")
-            
-            if data.get('is_sighting', False):
-                # Build response with location data
-                sighting_data = {
-                    'is_sighting': True,
-                    'species': data.get('species', species_mentioned[0] if species_mentioned else 'unknown'),
-                    'confidence': data.get('confidence', 50) / 100.0,
-                    'llm_analyzed': True
-                }
-                
-                # Add location fields if present
-                location_fields = ['gmu_number', 'location_name', 'coordinates', 'elevation', 'location_confidence_radius', 'location_description']
-                for field in location_fields:
-                    if data.get(field) is not None:
-                        sighting_data[field] = data[field]
-                        if field == 'coordinates':
-                            logger.info(f"✓ Added coordinates to sighting: {data[field]}")
-                
-                # Validate location assignment
-                lat = data.get('coordinates', [None, None])[0] if data.get('coordinates') else None
-                lon = data.get('coordinates', [None, None])[1] if data.get('coordinates') else None
-                validation = LocationValidator.validate_location_assignment(
-                    text=full_text,
-                    lat=lat,
-                    lon=lon,
-                    gmu=str(data.get('gmu_number')) if data.get('gmu_number') else None
-                )
-                
-                if not validation['is_valid']:
-                    logger.warning(f"Location validation failed: {validation['issues']}")
-                    # If validation fails badly, remove coordinates and GMU
-                    if validation['confidence'] < 0.2:
-                        sighting_data.pop('coordinates', None)
-                        sighting_data.pop('gmu_number', None)
-                        logger.info("Removed invalid location data from sighting")
-                
-                # Add validation metadata
-                sighting_data['location_validation'] = {
-                    'confidence': validation['confidence'],
-                    'issues': validation['issues'],
-                    'mentioned_states': validation['mentioned_states']
-                }
-                
-                logger.debug(f"Returning sighting data: {sighting_data}")
-                return sighting_data
+            for item in data if isinstance(data, list) else []:
+                if not isinstance(item, dict):
+                    continue
+                try:
+                    index = int(item.get('index'))
+                except (TypeError, ValueError):
+                    continue
+                if 0 <= index < len(posts):
+                    answers[index] = item
             
-            return None
+            logger.info(f"Batched LLM analysis answered {len(answers)}/{len(posts)} posts")
             
         except Exception as e:
-            logger.error(f"Full text LLM analysis failed: {e}")
-            return None
+            logger.error(f"Batched LLM analysis failed, falling back to per-post calls: {e}")
+        
+        results = []
+        for index, post in enumerate(posts):
+            if index in answers:
+                try:
+                    results.append(self._build_full_text_result(
+                        answers[index], post['full_text'], post.get('species_mentioned') or []
+                    ))
+                    continue
+                except Exception as e:
+                    logger.warning(f"Could not use batched answer for post {index}: {e}")
+            
+            # Per-item fallback
+            try:
+                results.append(self._analyze_full_text(
+                    post['full_text'], post.get('species_mentioned') or [], post.get('subreddit')
+                ))
+            except Exception as e:
+                logger.error(f"Full text LLM analysis failed: {e}")
+                results.append(dict(ANALYSIS_FAILED))
+        
+        return results
+    
+    def _parse_llm_json(self, result: str) -> Any:
+        """
+        Parse a JSON object or array from an LLM response.
+        Strips markdown code fences and the // comments the nano model adds.
+        """
+        # Extract JSON from markdown code blocks if present
+        if "```json" in result:
+            start = result.find("```json") + 7
+            end = result.find("```", start)
+            if end > start:
+                result = result[start:end].strip()
+        elif "```" in result:
+            # Generic code block
+            start = result.find("```") + 3
+            end = result.find("```", start)
+            if end > start:
+                result = result[start:end].strip()
+        
+        # Remove comments from JSON (nano model adds them)
+        import re
+        result = re.sub(r'//.*$', '', result, flags=re.MULTILINE)
+        
+        return json.loads(result)
+    
+    def _build_full_text_result(self, data: Dict[str, Any], full_text: str,
+                                species_mentioned: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Turn a parsed full-text LLM answer into sighting data, validating the location.
+        
+        Returns:
+            Sighting details with location data, or None if not a sighting
+        """
+        if data.get('is_sighting', False):
+            # Build response with location data
+            sighting_data = {
+                'is_sighting': True,
+                'species': data.get('species', species_mentioned[0] if species_mentioned else 'unknown'),
+                'confidence': data.get('confidence', 50) / 100.0,
+                'llm_analyzed': True
+            }
+            
+            # Add location fields if present
+            location_fields = ['gmu_number', 'location_name', 'coordinates', 'elevation', 'location_confidence_radius', 'location_description']
+            for field in location_fields:
+                if data.get(field) is not None:
+                    sighting_data[field] = data[field]
+                    if field == 'coordinates':
+                        logger.info(f"✓ Added coordinates to sighting: {data[field]}")
+            
+            # Prefer gazetteer coordinates over LLM-estimated ones
+            self._apply_gazetteer(sighting_data)
+            
+            # Validate location assignment
+            coordinates = sighting_data.get('coordinates')
+            lat = coordinates[0] if coordinates else None
+            lon = coordinates[1] if coordinates else None
+            validation = LocationValidator.validate_location_assignment(
+                text=full_text,
+                lat=lat,
+                lon=lon,
+                gmu=str(sighting_data.get('gmu_number')) if sighting_data.get('gmu_number') else None
+            )
+            
+            if not validation['is_valid']:
+                logger.warning(f"Location validation failed: {validation['issues']}")
+                # If validation fails badly, remove coordinates and GMU
+                if validation['confidence'] < 0.2:
+                    sighting_data.pop('coordinates', None)
+                    sighting_data.pop('gmu_number', None)
+                    logger.info("Removed invalid location data from sighting")
+            
+            # Add validation metadata
+            sighting_data['location_validation'] = {
+                'confidence': validation['confidence'],
+                'issues': validation['issues'],
+                'mentioned_states': validation['mentioned_states']
+            }
+            
+            logger.debug(f"Returning sighting data: {sighting_data}")
+            return sighting_data
+        
+        return None
+    
+    def _apply_gazetteer(self, sighting_data: Dict[str, Any]) -> bool:
+        """
+        Geocode location_name (or gmu_number) with the local gazetteer.
+        
+        A hit replaces the LLM's coordinates only if the LLM gave none or its
+        estimate falls within the gazetteer entry's radius; a hit elsewhere is
+        ignored and the LLM's location kept. The gazetteer's GMU is used when
+        it has one, otherwise the GMU named by the LLM is kept. gmu_number is
+        stored as an int.
+        
+        Returns:
+            True if the gazetteer resolved the location
+        """
+        gmu = _normalize_gmu(sighting_data.get('gmu_number'))
+        if gmu is None:
+            sighting_data.pop('gmu_number', None)
+        else:
+            sighting_data['gmu_number'] = gmu
+        
+        coordinates = sighting_data.get('coordinates')
+        if not (isinstance(coordinates, (list, tuple)) and len(coordinates) == 2
+                and all(isinstance(value, (int, float)) for value in coordinates)):
+            coordinates = None
+        radius = sighting_data.get('location_confidence_radius') or DEFAULT_RADIUS_MILES
+        
+        geo = self.gazetteer.geocode(sighting_data.get('location_name'), near=coordinates, near_radius=radius)
+        if not geo and gmu is not None and not coordinates:
+            geo = self.gazetteer.lookup_gmu(gmu)
+        if geo and coordinates and not self.gazetteer.within_radius(geo, coordinates):
+            logger.debug(f"Gazetteer match {geo['matched_name']} is away from the LLM estimate; keeping the LLM's")
+            geo = None
+        if not geo:
+            if sighting_data.get('coordinates'):
+                sighting_data['geocode_source'] = 'llm'
+            return False
+        
+        sighting_data['coordinates'] = geo['coordinates']
+        if geo.get('gmu_number') is not None:
+            sighting_data['gmu_number'] = geo['gmu_number']
+        if sighting_data.get('location_confidence_radius') is None:
+            sighting_data['location_confidence_radius'] = geo['location_confidence_radius']
+        sighting_data['geocode_source'] = 'gazetteer'
+        logger.debug(f"Gazetteer resolved '{sighting_data.get('location_name')}' to {geo['matched_name']}")
+        return True
     
     def _simple_validation(self, context: str, keyword: str) -> Tuple[bool, float]:
         """
@@ -556,18 +891,11 @@ class LLMValidator:
         # Keep content_hash for backward compatibility with existing cache
         cache_entry['content_hash'] = self._get_content_hash(content)
         
+        # The cache backend batches commits; call _save_cache() to force a flush
         self.cache[post_id] = cache_entry
-        self._save_cache()
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get statistics about the cache."""
-        total_posts = len(self.cache)
-        posts_with_sightings = sum(1 for p in self.cache.values() if p['has_sightings'])
-        total_sightings = sum(p['sighting_count'] for p in self.cache.values())
-        
-        return {
-            'total_posts_cached': total_posts,
-            'posts_with_sightings': posts_with_sightings,
-            'total_sightings': total_sightings,
-            'cache_file': str(self.cache_file)
-        }
+        stats = self.cache.stats()
+        stats['cache_file'] = str(self.cache_file)
+        return stats
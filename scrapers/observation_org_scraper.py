@@ -2,9 +2,8 @@
 Scraper for Observation.org (Waarneming) wildlife observations in Colorado.
 """
 
-import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from loguru import logger
 from .base import BaseScraper
 
@@ -54,28 +53,34 @@ class ObservationOrgScraper(BaseScraper):
         Returns:
             List of wildlife sightings with location, species, and time data
         """
-        all_sightings = []
+        all_sightings = list(self.iter_sightings(lookback_days))
+        logger.info(f"Found {len(all_sightings)} wildlife observations from Observation.org")
+        return all_sightings
+    
+    def iter_sightings(self, lookback_days: int = 30) -> Iterator[Dict[str, Any]]:
+        """
+        Yield recent wildlife observations from Observation.org as pages arrive.
         
+        Args:
+            lookback_days: Number of days to look back for observations
+            
+        Yields:
+            Wildlife sightings with location, species, and time data
+        """
         # Calculate date range
         end_date = datetime.now()
         start_date = end_date - timedelta(days=lookback_days)
         
         logger.info(f"Fetching wildlife observations from last {lookback_days} days...")
         
-        # Fetch observations for the date range
-        observations = self._fetch_observations(
+        # Process each observation as its page of results arrives
+        for obs in self._iter_observations(
             start_date.strftime('%Y-%m-%d'),
             end_date.strftime('%Y-%m-%d')
-        )
-        
-        # Process each observation
-        for obs in observations:
+        ):
             sighting = self._process_observation(obs)
             if sighting:
-                all_sightings.append(sighting)
-        
-        logger.info(f"Found {len(all_sightings)} wildlife observations from Observation.org")
-        return all_sightings
+                yield sighting
     
     def _fetch_observations(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """
@@ -88,28 +93,54 @@ class ObservationOrgScraper(BaseScraper):
         Returns:
             List of raw observations
         """
+        return list(self._iter_observations(start_date, end_date))
+    
+    def _iter_observations(self, start_date: str, end_date: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield game species observations for a date range.
+        
+        The range is split into week-long windows whose pages are fetched
+        concurrently; windows that fill a page are paginated in further waves.
+        Each wave's observations are yielded before the next wave is fetched.
+        
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            
+        Yields:
+            Raw observations
+        """
         url = f"{self.base_url}/observations"
+        limit = 1000  # Max results per request
         
-        params = {
+        base_params = {
             'bbox': self.colorado_bbox,
-            'startdate': start_date,
-            'enddate': end_date,
             'geojson': 'true',
-            'limit': 1000,  # Max results per request
+            'limit': limit,
             'has_photo': 'true',  # Only observations with photos
             'format': 'json'
         }
         
-        all_observations = []
-        offset = 0
+        pending = [(window_start, window_end, 0) for window_start, window_end in self._date_windows(start_date, end_date)]
         
-        while True:
-            params['offset'] = offset
+        while pending:
+            page_params = [
+                dict(base_params, startdate=window_start, enddate=window_end, offset=offset)
+                for window_start, window_end, offset in pending
+            ]
+            responses = self.fetch_many([url] * len(pending), page_params)
             
-            try:
-                response = requests.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
+            next_pages = []
+            for (window_start, window_end, offset), response in zip(pending, responses):
+                if not response:
+                    logger.error(f"Error fetching Observation.org data for {window_start} to {window_end}")
+                    continue
+                
+                try:
+                    data = response.json()
+                except ValueError as e:
+                    logger.error(f"Error parsing Observation.org data: {e}")
+                    continue
                 
                 # Extract observations from response
                 if 'features' in data:
@@ -119,31 +150,37 @@ class ObservationOrgScraper(BaseScraper):
                 else:
                     observations = []
                 
-                if not observations:
-                    break
-                
                 # Filter for game species
                 for obs in observations:
                     species_name = self._extract_species_name(obs)
                     if species_name in self.game_species:
-                        all_observations.append(obs)
+                        yield obs
                 
                 # Check if there are more results
-                if len(observations) < params['limit']:
-                    break
-                
-                offset += params['limit']
+                if len(observations) < limit:
+                    continue
                 
                 # Safety check to avoid infinite loops
-                if offset > 10000:
+                if offset + limit > 10000:
                     logger.warning("Reached maximum offset, stopping pagination")
-                    break
-                    
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error fetching Observation.org data: {e}")
-                break
+                    continue
+                
+                next_pages.append((window_start, window_end, offset + limit))
+            
+            pending = next_pages
+    
+    @staticmethod
+    def _date_windows(start_date: str, end_date: str, days: int = 7) -> List[tuple]:
+        """Split an inclusive YYYY-MM-DD range into consecutive windows of up to ``days`` days."""
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
         
-        return all_observations
+        windows = []
+        while start <= end:
+            window_end = min(start + timedelta(days=days - 1), end)
+            windows.append((start.strftime('%Y-%m-%d'), window_end.strftime('%Y-%m-%d')))
+            start = window_end + timedelta(days=1)
+        return windows
     
     def _extract_species_name(self, obs: Dict[str, Any]) -> Optional[str]:
         """
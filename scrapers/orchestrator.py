@@ -0,0 +1,303 @@
+"""
+Concurrent multi-source scrape orchestration.
+
+Each source runs in its own worker thread, consuming the scraper's
+iter_sightings() generator and saving sightings in batches as they arrive.
+A source that exceeds its time budget is cancelled and reported as timed
+out; a source that raises is reported as failed. Cancellation is
+cooperative: the worker only notices it between yielded sightings, so a
+source blocked in an HTTP or LLM call keeps its thread until it next
+yields. Once a source is cancelled nothing more of it is saved, so the
+report covers everything the run wrote. A source that finishes with every
+batch saved has its scraper's commit() called, which is where incremental
+scrapers advance their progress markers. Neither affects the other sources, so a run takes
+about as long as its slowest source instead of the sum of all of them.
+"""
+
+import time
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+
+
+DEFAULT_SOURCE_TIMEOUT = 15 * 60
+DEFAULT_BATCH_SIZE = 50
+
+# How often the coordinator checks for finished or overdue sources
+POLL_INTERVAL = 0.25
+
+
+def source_timeout(context: Any = None, default: float = DEFAULT_SOURCE_TIMEOUT,
+                   reserve_seconds: float = 30.0) -> float:
+    """
+    Per-source time budget that fits in the remaining Lambda execution time.
+
+    Args:
+        context: AWS Lambda context (None or a dict when running locally)
+        default: Budget to use when there is no Lambda deadline
+        reserve_seconds: Time kept back for saving the report and returning
+
+    Returns:
+        Timeout in seconds
+    """
+    remaining_ms = getattr(context, 'get_remaining_time_in_millis', None)
+    if remaining_ms is None:
+        return default
+    return max(min(default, remaining_ms() / 1000.0 - reserve_seconds), 1.0)
+
+
+class SourceCancelled(Exception):
+    """Raised inside a worker when its source is cancelled."""
+
+
+class _SourceRun:
+    """Mutable state for one source, shared by its worker and the coordinator."""
+
+    def __init__(self, name: str, scraper_factory: Callable[[], Any], timeout: float):
+        self.name = name
+        self.scraper_factory = scraper_factory
+        self.timeout = timeout
+        self.cancel_event = threading.Event()
+        self.done_event = threading.Event()
+        # Held while saving; cancellation takes it so no save outlives the run
+        self.save_lock = threading.Lock()
+        self.started_at: Optional[float] = None
+        self.slot_released = False
+        # Set when save_batch reported failed rows; the scraper is then not committed
+        self.save_failed = False
+        self.stats = {
+            'status': 'pending',
+            'found': 0,
+            'saved': 0,
+            'duplicates': 0,
+            'with_radius': 0,
+            'duration_seconds': 0.0
+        }
+
+
+class ScrapeOrchestrator:
+    """
+    Run several scrapers concurrently with per-source timeouts.
+
+    Scrapers are I/O bound and share process-wide state (HTTP cache, keyword
+    matcher, LLM rate limiter), so sources run in threads rather than
+    processes. Cancellation is cooperative and only takes effect between
+    yielded sightings: a timed-out source stops at its next yielded sighting
+    (its thread may outlive run() while blocked in a call), its unsaved
+    sightings are dropped, and its slot is handed to the next waiting source
+    straight away. A batch save already in progress is waited for, so no
+    save lands after run() returns.
+    """
+
+    def __init__(self, sources: List[Tuple[str, Callable[[], Any]]],
+                 save_batch: Optional[Callable[[List[Dict[str, Any]], str], Any]] = None,
+                 on_sighting: Optional[Callable[[Dict[str, Any], str], None]] = None,
+                 timeout: float = DEFAULT_SOURCE_TIMEOUT,
+                 source_timeouts: Optional[Dict[str, float]] = None,
+                 max_workers: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Configure a run.
+
+        Args:
+            sources: (name, scraper factory) pairs; each factory is called in
+                the source's worker thread, e.g. the scraper class itself
+            save_batch: Called as save_batch(sightings, name) from the worker
+                thread; may return a saved count or a dict with 'saved' and
+                'duplicates'
+            on_sighting: Called as on_sighting(sighting, name) for every
+                sighting; calls are serialized across sources
+            timeout: Default time budget per source in seconds
+            source_timeouts: Per-source overrides of timeout, keyed by name
+            max_workers: Maximum sources running at once (default: all)
+            batch_size: Sightings buffered per source before save_batch
+        """
+        source_timeouts = source_timeouts or {}
+        self.runs = [
+            _SourceRun(name, factory, source_timeouts.get(name, timeout))
+            for name, factory in sources
+        ]
+        self.save_batch = save_batch
+        self.on_sighting = on_sighting
+        self.batch_size = batch_size
+        self._slots = threading.Semaphore(max_workers or max(len(self.runs), 1))
+        self._sighting_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+
+    def run(self, lookback_days: int = 1) -> Dict[str, Any]:
+        """
+        Run every source and wait until each finishes, fails or times out.
+
+        Args:
+            lookback_days: Passed to each scraper's iter_sightings()
+
+        Returns:
+            Run report with start/end times, total duration, per-source stats
+            (status, found, saved, duplicates, with_radius, duration_seconds,
+            error) and totals
+        """
+        start_time = datetime.now()
+        started = time.monotonic()
+
+        for source_run in self.runs:
+            threading.Thread(
+                target=self._run_source,
+                args=(source_run, lookback_days),
+                name=f"scrape-{source_run.name}",
+                daemon=True  # A stuck source must not keep the process alive
+            ).start()
+
+        pending = list(self.runs)
+        while pending:
+            still_pending = []
+            for source_run in pending:
+                if source_run.done_event.is_set():
+                    continue
+                with self._state_lock:
+                    overdue = (source_run.started_at is not None and
+                               time.monotonic() - source_run.started_at > source_run.timeout)
+                if overdue:
+                    self._cancel(source_run)
+                    continue
+                still_pending.append(source_run)
+            pending = still_pending
+            if pending:
+                pending[0].done_event.wait(POLL_INTERVAL)
+
+        report = {
+            'start_time': start_time.isoformat(),
+            'end_time': datetime.now().isoformat(),
+            'lookback_days': lookback_days,
+            'duration_seconds': round(time.monotonic() - started, 2),
+            'sources': {},
+            'total_found': 0,
+            'total_saved': 0
+        }
+        with self._state_lock:
+            for source_run in self.runs:
+                stats = dict(source_run.stats)
+                report['sources'][source_run.name] = stats
+                report['total_found'] += stats['found']
+                report['total_saved'] += stats['saved']
+
+        slowest = max(report['sources'].items(), key=lambda item: item[1]['duration_seconds'], default=None)
+        logger.info(f"Scrape run finished in {report['duration_seconds']:.1f}s: "
+                    f"{report['total_found']} found, {report['total_saved']} saved"
+                    + (f" (slowest: {slowest[0]} {slowest[1]['duration_seconds']:.1f}s)" if slowest else ""))
+        return report
+
+    def _cancel(self, source_run: _SourceRun):
+        """Mark an overdue source as timed out and free its worker slot."""
+        source_run.cancel_event.set()
+        # Wait for a batch save already in progress; later ones see the event and skip
+        with source_run.save_lock:
+            pass
+        with self._state_lock:
+            source_run.stats['status'] = 'timeout'
+            source_run.stats['error'] = f"Timed out after {source_run.timeout:g}s"
+            source_run.stats['duration_seconds'] = round(time.monotonic() - source_run.started_at, 2)
+            self._release_slot(source_run)
+        source_run.done_event.set()
+        logger.warning(f"{source_run.name}: cancelled after {source_run.timeout:g}s "
+                       f"({source_run.stats['found']} sightings found so far)")
+
+    def _release_slot(self, source_run: _SourceRun):
+        """Release a source's worker slot once (caller holds _state_lock)."""
+        if not source_run.slot_released:
+            source_run.slot_released = True
+            self._slots.release()
+
+    def _run_source(self, source_run: _SourceRun, lookback_days: int):
+        """Worker thread body: scrape one source, saving batches as they fill."""
+        self._slots.acquire()
+        with self._state_lock:
+            source_run.started_at = time.monotonic()
+            source_run.stats['status'] = 'running'
+        logger.info(f"Running {source_run.name} scraper...")
+
+        batch: List[Dict[str, Any]] = []
+        scraper = None
+        sightings = None
+        try:
+            scraper = source_run.scraper_factory()
+            sightings = scraper.iter_sightings(lookback_days=lookback_days)
+            for sighting in sightings:
+                if source_run.cancel_event.is_set():
+                    raise SourceCancelled()
+                self._record_sighting(source_run, sighting)
+                batch.append(sighting)
+                if len(batch) >= self.batch_size:
+                    self._save(source_run, batch)
+                    batch = []
+            status, error = 'ok', None
+        except SourceCancelled:
+            status, error = 'timeout', None
+        except Exception as e:
+            logger.error(f"Error running {source_run.name} scraper: {e}")
+            status, error = 'error', str(e)
+        finally:
+            if sightings is not None and hasattr(sightings, 'close'):
+                sightings.close()
+
+        # Keep whatever the source produced before it finished or failed
+        # (_save drops it if the source was cancelled)
+        if batch:
+            try:
+                self._save(source_run, batch)
+            except Exception as e:
+                logger.error(f"Could not save final {source_run.name} batch: {e}")
+                status, error = 'error', error or str(e)
+
+        # Let the scraper advance its incremental state (e.g. Reddit
+        # watermarks) only once everything it yielded has been saved
+        if status == 'ok' and self.save_batch and not source_run.save_failed:
+            try:
+                with source_run.save_lock:
+                    if not source_run.cancel_event.is_set() and hasattr(scraper, 'commit'):
+                        scraper.commit()
+            except Exception as e:
+                logger.error(f"Could not commit {source_run.name} progress: {e}")
+
+        with self._state_lock:
+            if source_run.stats['status'] != 'timeout':
+                source_run.stats['status'] = status
+                source_run.stats['duration_seconds'] = round(time.monotonic() - source_run.started_at, 2)
+                if error:
+                    source_run.stats['error'] = error
+            self._release_slot(source_run)
+        source_run.done_event.set()
+
+        if status == 'ok':
+            logger.success(f"{source_run.name} complete: {source_run.stats['found']} found, "
+                           f"{source_run.stats['saved']} saved in {source_run.stats['duration_seconds']:.1f}s")
+
+    def _record_sighting(self, source_run: _SourceRun, sighting: Dict[str, Any]):
+        with self._state_lock:
+            source_run.stats['found'] += 1
+            if sighting.get('location_confidence_radius') is not None:
+                source_run.stats['with_radius'] += 1
+        if self.on_sighting:
+            with self._sighting_lock:
+                # The run may already have returned for a cancelled source
+                if not source_run.cancel_event.is_set():
+                    self.on_sighting(sighting, source_run.name)
+
+    def _save(self, source_run: _SourceRun, batch: List[Dict[str, Any]]):
+        if not self.save_batch:
+            return
+        with source_run.save_lock:
+            # run() may already have reported a cancelled source; don't write behind it
+            if source_run.cancel_event.is_set():
+                logger.warning(f"{source_run.name}: cancelled, dropping {len(batch)} unsaved sightings")
+                return
+            result = self.save_batch(batch, source_run.name)
+            if isinstance(result, dict):
+                saved, duplicates = result.get('saved', 0), result.get('duplicates', 0)
+                if result.get('failed'):
+                    source_run.save_failed = True
+            else:
+                saved, duplicates = int(result or 0), 0
+            with self._state_lock:
+                source_run.stats['saved'] += saved
+                source_run.stats['duplicates'] += duplicates
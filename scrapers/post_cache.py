@@ -0,0 +1,302 @@
+"""
+Storage backends for the LLM parsed-post cache.
+
+The cache maps a post ID (e.g. 'reddit_abc123') to the entry written by
+LLMValidator.update_cache. Two backends are provided behind the same
+dict-like interface:
+
+- SQLitePostCache: indexed point lookups and batched commits (default)
+- JSONPostCache: the original single parsed_posts.json file
+"""
+
+import os
+import json
+import time
+import atexit
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Any
+from loguru import logger
+
+
+LEGACY_JSON_FILENAME = "parsed_posts.json"
+SQLITE_FILENAME = "parsed_posts.db"
+
+
+class JSONPostCache:
+    """
+    Legacy cache backend that keeps every entry in memory and rewrites
+    the whole JSON file on flush.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = Path(cache_file)
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._writable = False
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    self._data = json.load(f)
+            except Exception as e:
+                # Keep the unreadable file instead of overwriting it on the next flush
+                backup = self.cache_file.with_name(f"{self.cache_file.name}.corrupt-{int(time.time())}")
+                logger.error(f"Failed to load cache: {e}; moving it to {backup}")
+                try:
+                    self.cache_file.rename(backup)
+                except OSError as rename_error:
+                    logger.error(f"Failed to back up cache ({rename_error}); it will not be written")
+                    return
+        atexit.register(self.flush)
+        self._writable = True
+
+    def __contains__(self, post_id: str) -> bool:
+        return post_id in self._data
+
+    def __getitem__(self, post_id: str) -> Dict[str, Any]:
+        return self._data[post_id]
+
+    def __setitem__(self, post_id: str, entry: Dict[str, Any]):
+        self._data[post_id] = entry
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, post_id: str, default: Any = None) -> Any:
+        return self._data.get(post_id, default)
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return iter(self._data.items())
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._data.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Return post/sighting counts for the cache."""
+        return {
+            'total_posts_cached': len(self._data),
+            'posts_with_sightings': sum(1 for p in self._data.values() if p.get('has_sightings')),
+            'total_sightings': sum(p.get('sighting_count', 0) for p in self._data.values())
+        }
+
+    def flush(self):
+        """Write the whole cache to disk (skipped if the file could not be loaded or backed up)."""
+        if not self._writable:
+            return
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump(self._data, f, indent=2, default=str)
+        except Exception as e:
+            logger.error(f"Failed to save cache: {e}")
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+
+
+class SQLitePostCache:
+    """
+    Indexed cache backend stored in a single SQLite file.
+
+    Each entry is one row keyed by post_id, so lookups and writes cost
+    O(1) regardless of cache size. Writes are committed in batches of
+    ``commit_every`` rows, and any pending rows are committed on flush(),
+    close() or interpreter exit.
+    """
+
+    def __init__(self, db_path: Path, commit_every: int = 50):
+        """
+        Open (or create) the SQLite cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            commit_every: Number of writes to buffer before committing
+        """
+        self.cache_file = Path(db_path)
+        self.commit_every = max(1, commit_every)
+        self._pending = 0
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS parsed_posts (
+                post_id TEXT PRIMARY KEY,
+                parsed_date TEXT,
+                source TEXT,
+                has_sightings INTEGER NOT NULL DEFAULT 0,
+                sighting_count INTEGER NOT NULL DEFAULT 0,
+                entry TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        self._conn.commit()
+        atexit.register(self.flush)
+
+    def __contains__(self, post_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM parsed_posts WHERE post_id = ?", (post_id,)
+            ).fetchone()
+        return row is not None
+
+    def __getitem__(self, post_id: str) -> Dict[str, Any]:
+        entry = self.get(post_id)
+        if entry is None:
+            raise KeyError(post_id)
+        return entry
+
+    def __setitem__(self, post_id: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._upsert(post_id, entry)
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self._commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM parsed_posts").fetchone()[0]
+
+    def get(self, post_id: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT entry FROM parsed_posts WHERE post_id = ?", (post_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT post_id, entry FROM parsed_posts").fetchall()
+        for post_id, entry in rows:
+            yield post_id, json.loads(entry)
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        for _, entry in self.items():
+            yield entry
+
+    def stats(self) -> Dict[str, int]:
+        """Return post/sighting counts for the cache."""
+        with self._lock:
+            total, with_sightings, sightings = self._conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(has_sightings), 0), COALESCE(SUM(sighting_count), 0)
+                FROM parsed_posts
+            """).fetchone()
+        return {
+            'total_posts_cached': total,
+            'posts_with_sightings': with_sightings,
+            'total_sightings': sightings
+        }
+
+    def import_json(self, json_path: Path) -> int:
+        """
+        One-time import of a legacy parsed_posts.json file.
+
+        The import is recorded in cache_meta so it is not repeated on
+        later runs. Entries already present in SQLite are kept.
+
+        Args:
+            json_path: Path to the legacy JSON cache
+
+        Returns:
+            Number of entries imported
+        """
+        json_path = Path(json_path)
+        marker = f"imported:{json_path.resolve()}"
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM cache_meta WHERE key = ?", (marker,)).fetchone():
+                return 0
+            if not json_path.exists():
+                return 0
+
+            try:
+                with open(json_path, 'r') as f:
+                    legacy = json.load(f)
+            except Exception as e:
+                logger.error(f"Failed to import legacy cache {json_path}: {e}")
+                return 0
+
+            imported = 0
+            for post_id, entry in legacy.items():
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO parsed_posts "
+                    "(post_id, parsed_date, source, has_sightings, sighting_count, entry) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    self._row(post_id, entry)
+                )
+                imported += cursor.rowcount
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_meta (key, value) VALUES (?, ?)",
+                (marker, str(imported))
+            )
+            self._commit()
+
+        logger.info(f"Imported {imported} cached posts from {json_path}")
+        return imported
+
+    def flush(self):
+        """Commit any buffered writes."""
+        with self._lock:
+            if self._pending:
+                self._commit()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._conn.close()
+        atexit.unregister(self.flush)
+
+    def _row(self, post_id: str, entry: Dict[str, Any]) -> Tuple:
+        return (
+            post_id,
+            entry.get('parsed_date'),
+            entry.get('source'),
+            1 if entry.get('has_sightings') else 0,
+            entry.get('sighting_count', 0),
+            json.dumps(entry, default=str)
+        )
+
+    def _upsert(self, post_id: str, entry: Dict[str, Any]):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO parsed_posts "
+            "(post_id, parsed_date, source, has_sightings, sighting_count, entry) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            self._row(post_id, entry)
+        )
+
+    def _commit(self):
+        try:
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to commit cache: {e}")
+        self._pending = 0
+
+
+def open_post_cache(cache_dir: Path, backend: Optional[str] = None):
+    """
+    Open the parsed-post cache in ``cache_dir``.
+
+    Args:
+        cache_dir: Directory holding the cache files
+        backend: 'sqlite' (default) or 'json'; falls back to the
+            LLM_CACHE_BACKEND environment variable
+
+    Returns:
+        A SQLitePostCache or JSONPostCache instance
+    """
+    cache_dir = Path(cache_dir)
+    backend = (backend or os.getenv('LLM_CACHE_BACKEND', 'sqlite')).lower()
+    legacy_file = cache_dir / LEGACY_JSON_FILENAME
+
+    if backend == 'json':
+        return JSONPostCache(legacy_file)
+    if backend != 'sqlite':
+        raise ValueError(f"Unknown cache backend: {backend}")
+
+    cache = SQLitePostCache(cache_dir / SQLITE_FILENAME)
+    cache.import_json(legacy_file)
+    return cache
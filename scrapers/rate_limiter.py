@@ -0,0 +1,119 @@
+"""
+Thread-safe token-bucket rate limiting shared by concurrent API callers.
+"""
+
+import time
+import threading
+from typing import Optional
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket enforcing a requests-per-minute budget and, optionally,
+    a tokens-per-minute budget (e.g. OpenAI TPM limits).
+
+    Both buckets refill continuously and start full, so short bursts up to
+    the per-minute budget are allowed. Callers block in acquire() until
+    both buckets have capacity. pause() stops every caller until a given
+    time, which is how 429 / Retry-After responses are honored.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None,
+                 burst: Optional[float] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Sustained request budget
+            tokens_per_minute: Sustained token budget (None to disable)
+            burst: Maximum requests allowed back-to-back (defaults to one minute's budget)
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute) if tokens_per_minute else None
+        self.request_capacity = float(burst) if burst else self.requests_per_minute
+
+        self._requests = self.request_capacity
+        self._tokens = self.tokens_per_minute or 0.0
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._requests = min(self.request_capacity,
+                             self._requests + elapsed * self.requests_per_minute / 60.0)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute,
+                               self._tokens + elapsed * self.tokens_per_minute / 60.0)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request (and ``tokens`` tokens) can be spent.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def try_acquire(self, tokens: int = 0) -> float:
+        """
+        Spend one request (and ``tokens`` tokens) if available, without blocking.
+
+        Async callers use this with ``await asyncio.sleep(wait)`` instead of
+        acquire(), which would block the event loop.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+
+        Returns:
+            0.0 if the request was admitted, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            wait = self._blocked_until - now
+            if wait > 0:
+                return wait
+
+            needed_tokens = min(tokens, self.tokens_per_minute) if self.tokens_per_minute else 0
+            request_deficit = 1.0 - self._requests
+            token_deficit = needed_tokens - self._tokens if self.tokens_per_minute else 0.0
+
+            if request_deficit <= 0 and token_deficit <= 0:
+                self._requests -= 1.0
+                if self.tokens_per_minute:
+                    self._tokens -= needed_tokens
+                return 0.0
+
+            wait = request_deficit * 60.0 / self.requests_per_minute
+            if token_deficit > 0:
+                wait = max(wait, token_deficit * 60.0 / self.tokens_per_minute)
+            return wait
+
+    def pause(self, seconds: float):
+        """
+        Stop all callers for ``seconds`` (e.g. after a 429 with Retry-After).
+
+        Args:
+            seconds: How long to block new requests
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            # Drain the request bucket so callers don't burst as soon as the pause ends
+            self._requests = min(self._requests, 0.0)
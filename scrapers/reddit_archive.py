@@ -0,0 +1,267 @@
+"""
+Offline Reddit backfill from compressed NDJSON dump files.
+
+Reads Pushshift / Arctic Shift style submission and comment dumps (one JSON
+object per line, zstd- or gzip-compressed or plain), keeps items from the
+configured subreddits and date range that mention a game species, and runs
+them through the same extraction and LLM analysis as RedditScraper.
+
+Decompression, JSON parsing and keyword prefiltering run in a pool of
+worker processes, one dump file per task (large single files are split
+into line batches instead), so only the few matching items reach the
+main process and the LLM.
+"""
+
+import io
+import gzip
+import json
+import itertools
+import multiprocessing
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from loguru import logger
+
+from .keyword_matcher import get_keyword_matcher
+
+# zstandard is optional - only needed for .zst dumps
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    logger.warning("zstandard not available - .zst Reddit dumps cannot be read")
+
+# Pushshift dumps use long-distance matching windows up to 2 GB
+ZSTD_MAX_WINDOW_SIZE = 2 ** 31
+
+LINE_BATCH_SIZE = 20000
+
+
+def open_dump(path: Path) -> io.TextIOBase:
+    """
+    Open a dump file as a text stream, decompressing by extension.
+
+    Args:
+        path: .zst, .gz or uncompressed NDJSON file
+
+    Returns:
+        Text stream yielding one JSON document per line
+    """
+    path = Path(path)
+    if path.suffix == '.zst':
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is required to read .zst dumps (pip install zstandard)")
+        raw = open(path, 'rb')
+        reader = zstandard.ZstdDecompressor(max_window_size=ZSTD_MAX_WINDOW_SIZE).stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(reader), encoding='utf-8', errors='replace')
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def _filter_lines(lines: Iterable[str], subreddits: frozenset, start_utc: float, end_utc: float,
+                  counts: Dict[str, int]) -> List[Dict[str, Any]]:
+    """
+    Parse and prefilter dump lines.
+
+    A cheap substring test on the raw line skips JSON parsing for items from
+    other subreddits, which is almost every line of a full dump.
+    """
+    matcher = get_keyword_matcher()
+    needles = [f'"{name}"' for name in subreddits]
+    matches = []
+    for line in lines:
+        counts['lines'] += 1
+        lowered = line.lower()
+        if not any(needle in lowered for needle in needles):
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            counts['bad_lines'] += 1
+            continue
+        if str(record.get('subreddit', '')).lower() not in subreddits:
+            continue
+        try:
+            created_utc = float(record.get('created_utc') or 0)
+        except (TypeError, ValueError):
+            continue
+        if not start_utc <= created_utc < end_utc:
+            continue
+        counts['in_range'] += 1
+
+        is_submission = 'title' in record
+        text = f"{record.get('title', '')} {record.get('selftext', '')}" if is_submission else record.get('body', '')
+        if not text or text in ('[deleted]', '[removed]') or not matcher.first_hit_per_species(text):
+            continue
+        counts['matched'] += 1
+        record['created_utc'] = created_utc
+        record['_kind'] = 'submission' if is_submission else 'comment'
+        matches.append({key: record.get(key) for key in (
+            '_kind', 'id', 'subreddit', 'created_utc', 'title', 'selftext', 'body',
+            'url', 'permalink', 'link_id', 'link_title', 'num_comments'
+        )})
+    return matches
+
+
+def _scan_file(task: Tuple[str, frozenset, float, float]) -> Tuple[str, List[Dict[str, Any]], Dict[str, int]]:
+    """Worker: decompress and prefilter one whole dump file."""
+    path, subreddits, start_utc, end_utc = task
+    counts = {'lines': 0, 'bad_lines': 0, 'in_range': 0, 'matched': 0}
+    with open_dump(Path(path)) as f:
+        matches = _filter_lines(f, subreddits, start_utc, end_utc, counts)
+    return path, matches, counts
+
+
+def _scan_lines(task: Tuple[List[str], frozenset, float, float]) -> Tuple[None, List[Dict[str, Any]], Dict[str, int]]:
+    """Worker: prefilter one batch of lines from a large file."""
+    lines, subreddits, start_utc, end_utc = task
+    counts = {'lines': 0, 'bad_lines': 0, 'in_range': 0, 'matched': 0}
+    return None, _filter_lines(lines, subreddits, start_utc, end_utc, counts), counts
+
+
+def _line_batches(path: Path, batch_size: int) -> Iterator[List[str]]:
+    with open_dump(path) as f:
+        while True:
+            batch = list(itertools.islice(f, batch_size))
+            if not batch:
+                return
+            yield batch
+
+
+def _to_utc(date_str: Optional[str], default: float) -> float:
+    if not date_str:
+        return default
+    return datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc).timestamp()
+
+
+def iter_dump_records(paths: List[Path], subreddits: Iterable[str], start_date: Optional[str] = None,
+                      end_date: Optional[str] = None, processes: Optional[int] = None,
+                      stats: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield prefiltered submission/comment records from dump files.
+
+    Args:
+        paths: Dump files
+        subreddits: Subreddits to keep (case-insensitive)
+        start_date: First day to keep (YYYY-MM-DD, inclusive)
+        end_date: Last day to keep (YYYY-MM-DD, inclusive)
+        processes: Worker processes (default: CPU count)
+        stats: Optional dict updated with lines/bad_lines/in_range/matched counts
+
+    Yields:
+        Record dicts with a '_kind' of 'submission' or 'comment'
+    """
+    subreddits = frozenset(name.lower() for name in subreddits)
+    start_utc = _to_utc(start_date, 0.0)
+    end_utc = _to_utc(end_date, float('inf')) + (86400 if end_date else 0)
+    processes = processes or multiprocessing.cpu_count()
+    stats = stats if stats is not None else {}
+
+    if len(paths) == 1 and processes > 1:
+        # One large file: decompress here and fan line batches out for parsing
+        tasks = ((batch, subreddits, start_utc, end_utc) for batch in _line_batches(paths[0], LINE_BATCH_SIZE))
+        worker = _scan_lines
+    else:
+        tasks = ((str(path), subreddits, start_utc, end_utc) for path in paths)
+        worker = _scan_file
+
+    with multiprocessing.Pool(processes) as pool:
+        for path, matches, counts in pool.imap(worker, tasks):
+            for key, value in counts.items():
+                stats[key] = stats.get(key, 0) + value
+            if path:
+                logger.info(f"{Path(path).name}: {counts['lines']} lines, {counts['in_range']} in range, "
+                            f"{counts['matched']} keyword matches")
+            yield from matches
+
+
+class RedditArchiveBackfill:
+    """
+    Run dump records through RedditScraper's extraction and LLM analysis.
+
+    Posts are analyzed in batches through the LLM validator's batched path
+    and comments one by one, both using the parsed-post cache, so re-running
+    a backfill over the same dumps does not repeat LLM calls.
+    """
+
+    def __init__(self, scraper, analysis_batch_size: int = 50):
+        """
+        Args:
+            scraper: RedditScraper (a PRAW client is not needed)
+            analysis_batch_size: Posts queued per batched LLM analysis
+        """
+        self.scraper = scraper
+        self.analysis_batch_size = analysis_batch_size
+
+    def iter_sightings(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield validated sightings for dump records.
+
+        Args:
+            records: Records from iter_dump_records()
+
+        Yields:
+            Sighting dictionaries in the RedditScraper format
+        """
+        pending: Dict[str, List[tuple]] = {}
+        for record in records:
+            subreddit_name = record['subreddit']
+            if record['_kind'] == 'comment':
+                yield from self.scraper._process_comment(
+                    self._comment(record), record.get('link_title') or '', subreddit_name
+                )
+                continue
+
+            submission = self._submission(record)
+            post_id = f"reddit_{submission.id}"
+            content = f"{submission.title} {submission.selftext}"
+            post_date = datetime.fromtimestamp(submission.created_utc)
+            validator = self.scraper.validator
+            if not validator.should_process_post(post_id, content, post_datetime=post_date,
+                                                 post_title=submission.title):
+                yield from validator.get_cached_sightings(post_id)
+                continue
+
+            mentions = self.scraper._extract_potential_wildlife_mentions(content, submission.url)
+            if not mentions:
+                validator.update_cache(post_id, content, [], post_datetime=post_date,
+                                       post_title=submission.title)
+                continue
+            queue = pending.setdefault(subreddit_name, [])
+            queue.append((submission, post_id, content, post_date, mentions))
+            if len(queue) >= self.analysis_batch_size:
+                yield from self.scraper._analyze_pending_posts(queue, subreddit_name)
+                pending[subreddit_name] = []
+
+        for subreddit_name, queue in pending.items():
+            if queue:
+                yield from self.scraper._analyze_pending_posts(queue, subreddit_name)
+
+    @staticmethod
+    def _submission(record: Dict[str, Any]) -> SimpleNamespace:
+        """PRAW-like submission built from a dump record."""
+        permalink = record.get('permalink') or f"/r/{record['subreddit']}/comments/{record['id']}/"
+        return SimpleNamespace(
+            id=record['id'],
+            fullname=f"t3_{record['id']}",
+            title=record.get('title') or '',
+            selftext=record.get('selftext') or '',
+            created_utc=record['created_utc'],
+            url=f"https://reddit.com{permalink}",
+            num_comments=record.get('num_comments') or 0
+        )
+
+    @staticmethod
+    def _comment(record: Dict[str, Any]) -> SimpleNamespace:
+        """PRAW-like comment built from a dump record."""
+        link_id = (record.get('link_id') or '').replace('t3_', '')
+        permalink = record.get('permalink') or f"/r/{record['subreddit']}/comments/{link_id}/_/{record['id']}/"
+        return SimpleNamespace(
+            id=record['id'],
+            body=record.get('body') or '',
+            created_utc=record['created_utc'],
+            permalink=permalink
+        )
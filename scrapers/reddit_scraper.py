@@ -3,24 +3,24 @@ Scraper for Reddit to extract wildlife sightings from hiking-related subreddits.
 """
 
 import os
+import importlib.util
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from loguru import logger
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Note: PRAW will be used when API credentials are available
-try:
-    import praw
-    PRAW_AVAILABLE = True
-except ImportError:
-    PRAW_AVAILABLE = False
+# Note: PRAW will be used when API credentials are available; it is only
+# imported when a RedditScraper is created with credentials
+PRAW_AVAILABLE = importlib.util.find_spec('praw') is not None
+if not PRAW_AVAILABLE:
     logger.warning("PRAW not available - Reddit scraper will use simulation mode")
 
 from .base import BaseScraper
 from .llm_validator import LLMValidator
+from .reddit_watermarks import RedditWatermarks, WATERMARK_FILENAME
 
 
 class RedditScraper(BaseScraper):
@@ -28,11 +28,38 @@ class RedditScraper(BaseScraper):
     Scraper for Reddit posts and comments in hiking/outdoor subreddits.
     """
     
-    def __init__(self):
+    # Target subreddits - hunting-focused for better wildlife sighting coverage
+    SUBREDDITS = [
+        'cohunting',          # Colorado-specific hunting hub
+        'elkhunting',         # ~70% Colorado elk content
+        'Hunting',            # Search for Colorado-specific posts
+        'bowhunting',         # Bow hunters post lots of real-time sightings
+        'trailcam',           # Trail-cam dumps with EXIF coords
+        'Colorado',           # General state sub with wildlife pics
+        'ColoradoSprings',    # Front Range wildlife sightings
+        'RMNP',              # Rocky Mountain National Park
+        'coloradohikers'      # Keep for incidental sightings
+    ]
+    
+    def __init__(self, use_watermarks: bool = True):
+        """
+        Initialize the scraper.
+        
+        Args:
+            use_watermarks: Sweep incrementally from per-subreddit high-water
+                marks (False walks every post in the lookback window)
+        """
         super().__init__(source_name="reddit", rate_limit=1.0)
         self.reddit = None
         self.validator = LLMValidator()  # Initialize LLM validator with caching
         
+        # Per-subreddit sweep state, kept next to the parsed-post cache
+        self.watermarks = None
+        if use_watermarks and os.getenv('REDDIT_WATERMARKS', '1').lower() not in ('0', 'false', 'no', 'off'):
+            self.watermarks = RedditWatermarks(self.validator.cache_dir / WATERMARK_FILENAME)
+        # Watermark updates of finished sweeps, applied by commit() once saved
+        self._pending_watermarks: Dict[str, Dict[str, Any]] = {}
+        
         # Initialize Reddit instance if credentials are available
         if PRAW_AVAILABLE and all([
             os.getenv('REDDIT_CLIENT_ID'),
@@ -40,6 +67,7 @@ class RedditScraper(BaseScraper):
             os.getenv('REDDIT_USER_AGENT')
         ]):
             try:
+                import praw
                 user_agent = os.getenv('REDDIT_USER_AGENT')
                 
                 # Check if it's an installed app (uses client_credentials)
@@ -93,37 +121,98 @@ class RedditScraper(BaseScraper):
         """
         all_sightings = []
         
-        # Target subreddits - hunting-focused for better wildlife sighting coverage
-        subreddits = [
-            'cohunting',          # Colorado-specific hunting hub
-            'elkhunting',         # ~70% Colorado elk content
-            'Hunting',            # Search for Colorado-specific posts
-            'bowhunting',         # Bow hunters post lots of real-time sightings
-            'trailcam',           # Trail-cam dumps with EXIF coords
-            'Colorado',           # General state sub with wildlife pics
-            'ColoradoSprings',    # Front Range wildlife sightings
-            'RMNP',              # Rocky Mountain National Park
-            'coloradohikers'      # Keep for incidental sightings
-        ]
-        
-        for subreddit_name in subreddits:
+        for subreddit_name in self.SUBREDDITS:
             sightings = self._scrape_subreddit(subreddit_name, lookback_days)
             all_sightings.extend(sightings)
             
-            # Save after each subreddit to avoid losing data
+            # Save after each subreddit to avoid losing data; iter_sightings
+            # saves nothing, so this is the only write for scrape()
             if sightings:
                 logger.info(f"Saving {len(sightings)} sightings from r/{subreddit_name} to database")
                 try:
-                    from .database_saver import save_sightings_to_db
-                    saved = save_sightings_to_db(sightings, f"reddit_{subreddit_name}")
-                    logger.success(f"Saved {saved} sightings from r/{subreddit_name}")
+                    from .sighting_buffer import get_sighting_buffer
+                    buffer = get_sighting_buffer()
+                    buffer.extend(sightings, f"reddit_{subreddit_name}")
+                    buffer.flush()
                 except Exception as e:
                     logger.warning(f"Could not save to database immediately: {e}")
-                    # Continue anyway, will be saved at the end
+                    # Sweep this subreddit again next run instead of advancing its watermark
+                    self._pending_watermarks.pop(subreddit_name, None)
+            self.commit()
         
         logger.info(f"Found {len(all_sightings)} total sightings from Reddit")
         return all_sightings
     
+    def stream(self, catch_up: bool = True, **kwargs):
+        """
+        Run as a long-lived daemon on the subreddits' submission and comment streams.
+        
+        Blocks until SIGINT/SIGTERM. See RedditStreamDaemon for the options.
+        
+        Args:
+            catch_up: Sweep anything posted since the last checkpoint first
+            **kwargs: Passed to RedditStreamDaemon
+        """
+        from .reddit_stream import RedditStreamDaemon
+        RedditStreamDaemon(self, **kwargs).run(catch_up=catch_up)
+
+    def iter_archive_sightings(self, paths: List[str], start_date: Optional[str] = None,
+                               end_date: Optional[str] = None, subreddits: Optional[List[str]] = None,
+                               processes: Optional[int] = None,
+                               stats: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield sightings from offline Reddit dump files (zstd/gzip NDJSON).
+
+        Nothing is saved here; see scripts/backfill_reddit_archive.py.
+
+        Args:
+            paths: Submission and/or comment dump files
+            start_date: First day to keep (YYYY-MM-DD)
+            end_date: Last day to keep (YYYY-MM-DD)
+            subreddits: Subreddits to keep (default: SUBREDDITS)
+            processes: Worker processes for decompression and prefiltering
+            stats: Optional dict receiving line and match counts
+
+        Yields:
+            Wildlife sighting dictionaries
+        """
+        from .reddit_archive import RedditArchiveBackfill, iter_dump_records
+        records = iter_dump_records(paths, subreddits or self.SUBREDDITS, start_date, end_date,
+                                    processes=processes, stats=stats)
+        yield from RedditArchiveBackfill(self).iter_sightings(records)
+
+    def iter_sightings(self, lookback_days: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Yield sightings subreddit by subreddit as they are found.
+        
+        Unlike scrape(), nothing is saved to the database here; the consumer
+        decides what to do with each sighting, and calls commit() once they
+        are saved so the watermarks advance.
+        
+        Args:
+            lookback_days: Number of days to look back for posts
+            
+        Yields:
+            Wildlife sighting dictionaries
+        """
+        for subreddit_name in self.SUBREDDITS:
+            yield from self._iter_subreddit(subreddit_name, lookback_days)
+    
+    def commit(self):
+        """
+        Advance the watermarks of the sweeps finished so far.
+        
+        Watermarked posts are skipped by later sweeps, so the consumer calls
+        this only after saving everything the sweeps yielded; if the save
+        fails or is cancelled, the next run sweeps those posts again.
+        """
+        if not self.watermarks or not self._pending_watermarks:
+            return
+        for subreddit_name, update in self._pending_watermarks.items():
+            self.watermarks.update(subreddit_name, **update)
+        self._pending_watermarks.clear()
+        self.watermarks.save()
+    
     def _scrape_subreddit(self, subreddit_name: str, lookback_days: int) -> List[Dict[str, Any]]:
         """
         Scrape a single subreddit for wildlife sightings with caching and LLM validation.
@@ -135,8 +224,32 @@ class RedditScraper(BaseScraper):
         Returns:
             List of validated sightings from this subreddit
         """
-        sightings = []
+        return list(self._iter_subreddit(subreddit_name, lookback_days))
+    
+    def _iter_subreddit(self, subreddit_name: str, lookback_days: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield validated sightings from a single subreddit.
+        
+        Cached and comment sightings are yielded while the subreddit is walked;
+        posts needing full LLM analysis are batched and yielded after the walk.
+        
+        With watermarks enabled, the walk skips posts already covered by an
+        earlier sweep (stopping at the first one when earlier sweeps reach
+        back past the lookback cutoff), comments of earlier posts are
+        re-read only when their num_comments changed (yielding sightings from
+        new comments only), and earlier posts whose analysis failed are retried.
+        A finished sweep's watermark update is held until commit().
+        
+        Args:
+            subreddit_name: Name of the subreddit
+            lookback_days: Number of days to look back
+            
+        Yields:
+            Validated sightings from this subreddit
+        """
+        found = 0
         cutoff_date = datetime.now() - timedelta(days=lookback_days)
+        cutoff_utc = cutoff_date.timestamp()
         cache_hits = 0
         new_posts = 0
         
@@ -144,16 +257,41 @@ class RedditScraper(BaseScraper):
             # Use actual Reddit API
             try:
                 subreddit = self.reddit.subreddit(subreddit_name)
+                watermarks = self.watermarks
+                mark = watermarks.get(subreddit_name) if watermarks else None
                 
                 # Get recent posts (increased limit for 30-day lookback)
                 posts_checked = 0
+                posts_skipped = 0
+                pending_posts = []
+                seen_posts = {}
+                newest = None
+                oldest_utc = None
+                reached_cutoff = False
                 for submission in subreddit.new(limit=1000):
                     posts_checked += 1
+                    if newest is None:
+                        newest = (submission.created_utc, submission.fullname)
                     # Check date
                     post_date = datetime.fromtimestamp(submission.created_utc)
                     if post_date < cutoff_date:
+                        reached_cutoff = True
                         break  # Stop when we reach posts older than our lookback period
                     
+                    # Posts inside the range walked by earlier sweeps are already
+                    # processed; their comments are checked below by num_comments
+                    if mark and watermarks.covers(subreddit_name, submission.created_utc):
+                        if mark['oldest_utc'] <= cutoff_utc:
+                            reached_cutoff = True
+                            break  # Everything older is covered too
+                        posts_skipped += 1
+                        continue
+                    oldest_utc = submission.created_utc
+                    seen_posts[submission.fullname] = {
+                        'created_utc': submission.created_utc,
+                        'num_comments': submission.num_comments
+                    }
+                    
                     post_id = f"reddit_{submission.id}"
                     content = f"{submission.title} {submission.selftext}"
                     
@@ -163,7 +301,8 @@ class RedditScraper(BaseScraper):
                                                             post_title=submission.title):
                         # Use cached results
                         cached_sightings = self.validator.get_cached_sightings(post_id)
-                        sightings.extend(cached_sightings)
+                        found += len(cached_sightings)
+                        yield from cached_sightings
                         cache_hits += 1
                         continue
                     
@@ -173,57 +312,11 @@ class RedditScraper(BaseScraper):
                     # Use simplified extraction - find any wildlife mentions
                     potential_mentions = self._extract_potential_wildlife_mentions(content, submission.url)
                     
-                    # Track sightings for this specific post
-                    post_sightings = []
-                    
                     if potential_mentions:
                         logger.debug(f"Found wildlife mentions in post: {submission.title[:50]}...")
-                        # Analyze full text with LLM
-                        for mention in potential_mentions:
-                            analysis = self.validator.analyze_full_text_for_sighting(
-                                mention['full_text'], 
-                                mention['species_mentioned'],
-                                subreddit_name  # Pass subreddit for location context
-                            )
-                            
-                            if analysis and analysis.get('is_sighting'):
-                                # Create validated sighting with location data
-                                sighting = {
-                                    'species': analysis['species'],
-                                    'confidence': analysis['confidence'],
-                                    'llm_validated': True,
-                                    'location_confidence_radius': analysis.get('location_confidence_radius'),
-                                    'reddit_post_title': submission.title,
-                                    'sighting_date': post_date,
-                                    'subreddit': subreddit_name,
-                                    'post_id': submission.id,
-                                    'source_url': mention['source_url'],
-                                    'source_type': 'reddit',
-                                    'raw_text': mention['full_text'][:200] + '...' if len(mention['full_text']) > 200 else mention['full_text']
-                                }
-                                
-                                # Add location data from LLM analysis
-                                location_fields = ['gmu_number', 'county', 'location_name', 'coordinates', 'elevation', 'location_description']
-                                for field in location_fields:
-                                    if field in analysis:
-                                        sighting[field] = analysis[field]
-                                
-                                post_sightings.append(sighting)
-                                sightings.append(sighting)
-                                
-                                # Save immediately
-                                try:
-                                    from .database_saver import save_sightings_to_db
-                                    saved = save_sightings_to_db([sighting], f"reddit_{subreddit_name}")
-                                    if saved > 0:
-                                        logger.success(f"Saved sighting: {sighting['species']} at {sighting.get('location_name', 'unknown')}")
-                                except Exception as e:
-                                    logger.error(f"Failed to save sighting immediately: {e}")
-                        
-                        # Update cache with results FOR THIS POST ONLY - include datetime and title
-                        self.validator.update_cache(post_id, content, post_sightings,
-                                                   post_datetime=post_date,
-                                                   post_title=submission.title)
+                        # Queue full-text LLM analysis; queued posts are analyzed in
+                        # batched, concurrent completions after the walk
+                        pending_posts.append((submission, post_id, content, post_date, potential_mentions))
                     else:
                         # No wildlife mentions at all
                         self.validator.update_cache(post_id, content, [],
@@ -231,54 +324,240 @@ class RedditScraper(BaseScraper):
                                                    post_title=submission.title)
                     
                     # Also check top comments (with caching)
-                    submission.comments.replace_more(limit=0)
-                    for comment in submission.comments[:10]:  # Top 10 comments
-                        comment_id = f"reddit_comment_{comment.id}"
-                        comment_content = comment.body
-                        
-                        # Check cache for comment - use comment datetime for caching
-                        comment_date = datetime.fromtimestamp(comment.created_utc)
-                        if not self.validator.should_process_post(comment_id, comment_content,
-                                                                post_datetime=comment_date,
-                                                                post_title=f"Comment on: {submission.title}"):
-                            cached_comment_sightings = self.validator.get_cached_sightings(comment_id)
-                            sightings.extend(cached_comment_sightings)
+                    for sighting in self._iter_comment_sightings(submission, subreddit_name):
+                        found += 1
+                        yield sighting
+                
+                # Re-read comments only on earlier posts whose comment count changed,
+                # yielding sightings from new or edited comments only
+                comment_rechecks = 0
+                retried = 0
+                walked = set(seen_posts)
+                if mark:
+                    tracked = watermarks.tracked_posts(subreddit_name, cutoff_utc)
+                    stale = [fullname for fullname in tracked if fullname not in seen_posts]
+                    for submission in (self.reddit.info(fullnames=stale) if stale else []):
+                        seen_posts[submission.fullname] = {
+                            'created_utc': submission.created_utc,
+                            'num_comments': submission.num_comments
+                        }
+                        if submission.num_comments == tracked[submission.fullname]:
                             continue
-                        
-                        # Process new comment
-                        comment_sightings = self._extract_sightings_from_text(
-                            comment_content, 
-                            f"https://reddit.com{comment.permalink}"
-                        )
-                        
-                        if comment_sightings:
-                            validated_comment_sightings = self.validator.validate_sightings_batch(comment_sightings)
-                            
-                            for sighting in validated_comment_sightings:
-                                sighting['reddit_post_title'] = submission.title
-                                sighting['sighting_date'] = datetime.fromtimestamp(comment.created_utc)
-                                sighting['subreddit'] = subreddit_name
-                                sighting['is_comment'] = True
-                                sighting['comment_id'] = comment.id
-                            
-                            sightings.extend(validated_comment_sightings)
-                            self.validator.update_cache(comment_id, comment_content, validated_comment_sightings,
-                                                      post_datetime=comment_date,
-                                                      post_title=f"Comment on: {submission.title}")
-                        else:
-                            self.validator.update_cache(comment_id, comment_content, [],
-                                                      post_datetime=comment_date,
-                                                      post_title=f"Comment on: {submission.title}")
+                        comment_rechecks += 1
+                        for sighting in self._iter_comment_sightings(submission, subreddit_name, new_only=True):
+                            found += 1
+                            yield sighting
+                    
+                    # Retry posts an earlier sweep walked past but could not analyze
+                    retry = [fullname for fullname in watermarks.failed_posts(subreddit_name, cutoff_utc)
+                             if fullname not in walked]
+                    for submission in (self.reddit.info(fullnames=retry) if retry else []):
+                        post_id = f"reddit_{submission.id}"
+                        content = f"{submission.title} {submission.selftext}"
+                        post_date = datetime.fromtimestamp(submission.created_utc)
+                        if not self.validator.should_process_post(post_id, content, post_datetime=post_date,
+                                                                  post_title=submission.title):
+                            continue  # Analyzed since (e.g. by the stream daemon)
+                        mentions = self._extract_potential_wildlife_mentions(content, submission.url)
+                        if mentions:
+                            retried += 1
+                            pending_posts.append((submission, post_id, content, post_date, mentions))
+                
+                # Analyze queued posts with batched LLM calls
+                failed_posts = []
+                post_sightings = self._analyze_pending_posts(pending_posts, subreddit_name, failed_posts)
+                found += len(post_sightings)
+                yield from post_sightings
                 
-                logger.info(f"r/{subreddit_name}: Checked {posts_checked} posts, processed {new_posts} new, {cache_hits} from cache, found {len(sightings)} sightings")
+                # Stage the watermark only after a complete sweep; commit()
+                # applies it once the consumer has saved what was yielded.
+                # Posts that failed analysis stay listed so the next sweep retries them
+                if watermarks and newest:
+                    if reached_cutoff:
+                        oldest_utc = cutoff_utc
+                    self._pending_watermarks[subreddit_name] = {
+                        'newest_utc': newest[0],
+                        'newest_fullname': newest[1],
+                        'oldest_utc': oldest_utc if oldest_utc is not None else newest[0],
+                        'posts': seen_posts,
+                        'prune_before_utc': cutoff_utc,
+                        'failed': {submission.fullname: submission.created_utc for submission in failed_posts}
+                    }
+                
+                logger.info(f"r/{subreddit_name}: Checked {posts_checked} posts ({posts_skipped} already swept), "
+                            f"processed {new_posts} new, {cache_hits} from cache, retried {retried}, "
+                            f"rechecked comments on {comment_rechecks}, found {found} sightings")
                         
             except Exception as e:
                 logger.error(f"Error scraping r/{subreddit_name}: {e}")
         else:
             raise Exception(f"Reddit API not available for r/{subreddit_name}. Real data only mode.")
+    
+    def _iter_comment_sightings(self, submission, subreddit_name: str,
+                                new_only: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yield sightings from a post's top comments (with caching).
+        
+        Args:
+            submission: PRAW submission
+            subreddit_name: Name of the subreddit
+            new_only: Skip comments already in the cache instead of yielding
+                their cached sightings (for re-reads of earlier posts)
+            
+        Yields:
+            Validated comment sightings
+        """
+        submission.comments.replace_more(limit=0)
+        for comment in submission.comments[:10]:  # Top 10 comments
+            yield from self._process_comment(comment, submission.title, subreddit_name, new_only)
+    
+    def _process_comment(self, comment, post_title: str, subreddit_name: str,
+                         new_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Validate one comment's wildlife mentions, using the cache when unchanged.
+        
+        Args:
+            comment: PRAW comment
+            post_title: Title of the post the comment belongs to
+            subreddit_name: Name of the subreddit
+            new_only: Return nothing for an unchanged cached comment
+            
+        Returns:
+            Validated comment sightings
+        """
+        comment_id = f"reddit_comment_{comment.id}"
+        comment_content = comment.body
+        
+        # Check cache for comment - use comment datetime for caching
+        comment_date = datetime.fromtimestamp(comment.created_utc)
+        if not self.validator.should_process_post(comment_id, comment_content,
+                                                post_datetime=comment_date,
+                                                post_title=f"Comment on: {post_title}"):
+            return [] if new_only else self.validator.get_cached_sightings(comment_id)
+        
+        # Process new comment
+        comment_sightings = self._extract_sightings_from_text(
+            comment_content, 
+            f"https://reddit.com{comment.permalink}"
+        )
+        
+        validated_comment_sightings = []
+        if comment_sightings:
+            validated_comment_sightings = self.validator.validate_sightings_batch(comment_sightings)
+            
+            for sighting in validated_comment_sightings:
+                sighting['reddit_post_title'] = post_title
+                sighting['sighting_date'] = comment_date
+                sighting['subreddit'] = subreddit_name
+                sighting['is_comment'] = True
+                sighting['comment_id'] = comment.id
+        
+        self.validator.update_cache(comment_id, comment_content, validated_comment_sightings,
+                                  post_datetime=comment_date,
+                                  post_title=f"Comment on: {post_title}")
+        return validated_comment_sightings
+    
+    def _analyze_pending_posts(self, pending_posts: List[tuple], subreddit_name: str,
+                               failed_posts: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Run batched LLM analysis for posts queued during a subreddit walk.
+        
+        Each post's sightings are cached as soon as the batch holding its last
+        mention returns, so an interrupted run keeps completed batches. Nothing
+        is saved here; the caller owns persisting the returned sightings.
+        
+        A post with any mention that could not be analyzed is neither cached
+        nor returned, so it is analyzed again on the next run.
+        
+        Args:
+            pending_posts: (submission, post_id, content, post_date, mentions) tuples
+            subreddit_name: Name of the subreddit
+            failed_posts: Optional list receiving the submissions whose analysis failed
+            
+        Returns:
+            List of validated sightings
+        """
+        sightings = []
+        items = [(post_index, mention)
+                 for post_index, pending in enumerate(pending_posts)
+                 for mention in pending[4]]
+        remaining = [len(pending[4]) for pending in pending_posts]
+        post_sightings = [[] for _ in pending_posts]
+        post_failed = [False] * len(pending_posts)
+        
+        def handle_result(item_index: int, analysis: Optional[Dict[str, Any]]):
+            post_index, mention = items[item_index]
+            submission, post_id, content, post_date, _ = pending_posts[post_index]
+            
+            if analysis and analysis.get('analysis_failed'):
+                post_failed[post_index] = True
+            elif analysis and analysis.get('is_sighting'):
+                sighting = self._build_post_sighting(submission, mention, analysis,
+                                                     post_date, subreddit_name)
+                post_sightings[post_index].append(sighting)
+            
+            remaining[post_index] -= 1
+            if remaining[post_index] == 0:
+                if post_failed[post_index]:
+                    logger.warning(f"Analysis of {post_id} failed; it will be retried on the next run")
+                    if failed_posts is not None:
+                        failed_posts.append(submission)
+                    return
+                sightings.extend(post_sightings[post_index])
+                
+                # Update cache with results FOR THIS POST ONLY - include datetime and title
+                self.validator.update_cache(post_id, content, post_sightings[post_index],
+                                           post_datetime=post_date,
+                                           post_title=submission.title)
+        
+        self.validator.analyze_texts_batch(
+            [{
+                'full_text': mention['full_text'],
+                'species_mentioned': mention['species_mentioned'],
+                'subreddit': subreddit_name  # Pass subreddit for location context
+            } for _, mention in items],
+            on_result=handle_result
+        )
         
         return sightings
     
+    def _build_post_sighting(self, submission, mention: Dict[str, Any], analysis: Dict[str, Any],
+                             post_date: datetime, subreddit_name: str) -> Dict[str, Any]:
+        """
+        Build a validated sighting record from an LLM analysis of a post.
+        
+        Args:
+            submission: PRAW submission
+            mention: Potential wildlife mention that was analyzed
+            analysis: Result of analyze_full_text_for_sighting
+            post_date: Post creation datetime
+            subreddit_name: Name of the subreddit
+            
+        Returns:
+            Sighting dictionary with location data
+        """
+        sighting = {
+            'species': analysis['species'],
+            'confidence': analysis['confidence'],
+            'llm_validated': True,
+            'location_confidence_radius': analysis.get('location_confidence_radius'),
+            'reddit_post_title': submission.title,
+            'sighting_date': post_date,
+            'subreddit': subreddit_name,
+            'post_id': submission.id,
+            'source_url': mention['source_url'],
+            'source_type': 'reddit',
+            'raw_text': mention['full_text'][:200] + '...' if len(mention['full_text']) > 200 else mention['full_text']
+        }
+        
+        # Add location data from LLM analysis
+        location_fields = ['gmu_number', 'county', 'location_name', 'coordinates', 'elevation', 'location_description']
+        for field in location_fields:
+            if field in analysis:
+                sighting[field] = analysis[field]
+        
+        return sighting
+    
     def _get_simulated_posts(self, subreddit_name: str) -> List[Dict[str, Any]]:
         """
         Get simulated Reddit posts for testing without API access.
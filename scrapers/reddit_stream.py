@@ -0,0 +1,378 @@
+"""
+Long-running Reddit ingestion from PRAW submission and comment streams.
+
+Items flow through three stages connected by bounded queues:
+
+    stream reader -> [item queue] -> analysis workers -> [save queue] -> saver
+
+The reader prefilters with the keyword matcher so only posts and comments
+mentioning game species are queued. When the LLM workers or the database
+fall behind, the bounded queues fill and the reader blocks, which simply
+pauses stream polling (PRAW remembers what it has already yielded). A
+checkpoint of the newest fully saved post and comment is written after
+every save, and on restart the daemon skips streamed items at or before it
+and catches up on any gap with a watermark sweep.
+"""
+
+import json
+import math
+import os
+import queue
+import signal
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+
+from .reddit_scraper import RedditScraper
+
+
+CHECKPOINT_FILENAME = "reddit_stream_checkpoint.json"
+
+# Longest gap caught up with a sweep on restart; older gaps are left to batch runs
+MAX_CATCH_UP_DAYS = 7
+
+# Longest wait between retries of a failed batch write (seconds)
+MAX_SAVE_BACKOFF = 300.0
+
+_STOP = object()
+
+
+class _Checkpoint:
+    """
+    Newest created_utc per stream whose item and every earlier item are done.
+
+    Items finish out of order across analysis workers, so each is given a
+    sequence number when read and the checkpoint only advances over a
+    contiguous run of finished items.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.state = {'submission': 0.0, 'comment': 0.0}
+        self._lock = threading.Lock()
+        self._next_seq = 0
+        self._pending: Dict[int, tuple] = {}
+        self._done: Dict[int, bool] = {}
+        self._low = 0
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    self.state.update(json.load(f))
+            except Exception as e:
+                logger.error(f"Failed to load stream checkpoint from {self.path}: {e}")
+
+    def seen(self, kind: str, created_utc: float) -> bool:
+        """True if an item is at or before the saved checkpoint."""
+        return created_utc <= self.state[kind]
+
+    def begin(self, kind: str, created_utc: float) -> int:
+        """Register an item read from a stream; returns its sequence number."""
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._pending[seq] = (kind, created_utc)
+            return seq
+
+    def finish(self, seq: int) -> bool:
+        """Mark an item done; returns True if the checkpoint advanced."""
+        with self._lock:
+            self._done[seq] = True
+            advanced = False
+            while self._done.pop(self._low, False):
+                kind, created_utc = self._pending.pop(self._low)
+                self.state[kind] = max(self.state[kind], created_utc)
+                self._low += 1
+                advanced = True
+            return advanced
+
+    def save(self):
+        with self._lock:
+            state = dict(self.state)
+        try:
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save stream checkpoint to {self.path}: {e}")
+
+
+class RedditStreamDaemon:
+    """
+    Continuously ingest new posts and comments from the scraper's subreddits.
+
+    Reuses the RedditScraper's PRAW client, keyword matcher, LLM validator
+    (and its parsed-post cache) and sighting builders.
+    """
+
+    def __init__(self, scraper: RedditScraper,
+                 subreddits: Optional[List[str]] = None,
+                 save_batch: Optional[Callable[[List[Dict[str, Any]], str], Any]] = None,
+                 queue_size: int = 100,
+                 analysis_workers: int = 2,
+                 save_batch_size: int = 25,
+                 save_interval: float = 5.0,
+                 checkpoint_path: Optional[Path] = None):
+        """
+        Configure the daemon.
+
+        Args:
+            scraper: RedditScraper with a live PRAW client
+            subreddits: Subreddits to stream (defaults to RedditScraper.SUBREDDITS)
+            save_batch: Called as save_batch(sightings, source_name); must raise
+                when the database is unreachable so the batch is retried.
+                Defaults to database_saver.bulk_save_sightings
+            queue_size: Capacity of each stage queue (the backpressure bound)
+            analysis_workers: Threads running LLM analysis
+            save_batch_size: Sightings per database write
+            save_interval: Seconds before a partial batch is written anyway
+            checkpoint_path: Checkpoint file (defaults next to the post cache)
+        """
+        if not scraper.reddit:
+            raise RuntimeError("Reddit API not available - streaming needs PRAW credentials")
+
+        self.scraper = scraper
+        self.subreddits = subreddits or list(RedditScraper.SUBREDDITS)
+        if save_batch is None:
+            from .database_saver import bulk_save_sightings
+            save_batch = lambda sightings, source_name: bulk_save_sightings(sightings, source_name, raise_errors=True)
+        self.save_batch = save_batch
+        self.analysis_workers = analysis_workers
+        self.save_batch_size = save_batch_size
+        self.save_interval = save_interval
+
+        self.item_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.save_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.checkpoint = _Checkpoint(checkpoint_path or scraper.validator.cache_dir / CHECKPOINT_FILENAME)
+        self.stop_event = threading.Event()
+        self.stats = {'submissions': 0, 'comments': 0, 'queued': 0, 'sightings': 0, 'saved': 0, 'stream_errors': 0}
+        self._threads: List[threading.Thread] = []
+
+    def run(self, catch_up: bool = True):
+        """
+        Run until stop() is called or SIGINT/SIGTERM is received.
+
+        Args:
+            catch_up: Sweep the subreddits for anything posted since the
+                checkpoint before streaming
+        """
+        self._install_signal_handlers()
+        logger.info(f"Streaming r/{'+'.join(self.subreddits)} "
+                    f"({self.analysis_workers} analysis workers, queue size {self.item_queue.maxsize})")
+
+        self._threads = [threading.Thread(target=self._save_loop, name="reddit-stream-saver", daemon=True)]
+        self._threads += [
+            threading.Thread(target=self._analysis_loop, name=f"reddit-stream-analysis-{i}", daemon=True)
+            for i in range(self.analysis_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        try:
+            if catch_up:
+                self._catch_up()
+            self._read_streams()
+        finally:
+            self._shutdown()
+
+    def stop(self):
+        """Ask the daemon to finish queued work and exit."""
+        self.stop_event.set()
+
+    def _install_signal_handlers(self):
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: self.stop())
+
+    def _catch_up(self):
+        """Sweep the gap between the checkpoint and now, if there is one."""
+        last = max(self.checkpoint.state.values())
+        if not last:
+            return
+        gap_days = (time.time() - last) / 86400
+        if gap_days > MAX_CATCH_UP_DAYS:
+            logger.warning(f"Checkpoint is {gap_days:.1f} days old; catching up the last {MAX_CATCH_UP_DAYS} days only")
+        lookback_days = min(max(math.ceil(gap_days), 1), MAX_CATCH_UP_DAYS)
+        logger.info(f"Catching up {lookback_days} day(s) since the last checkpoint")
+
+        # The sweeps' watermarks are left uncommitted: the saver writes
+        # asynchronously, and the stream checkpoint tracks progress here
+        for subreddit_name in self.subreddits:
+            if self.stop_event.is_set():
+                return
+            for sighting in self.scraper._iter_subreddit(subreddit_name, lookback_days):
+                self._put(self.save_queue, (None, sighting))
+
+    def _read_streams(self):
+        """Poll the submission and comment streams, queueing prefiltered items."""
+        backoff = 1.0
+        while not self.stop_event.is_set():
+            try:
+                subreddit = self.scraper.reddit.subreddit('+'.join(self.subreddits))
+                # pause_after=0 yields None when a stream has nothing new, so one
+                # thread can alternate between the two streams
+                submissions = subreddit.stream.submissions(pause_after=0)
+                comments = subreddit.stream.comments(pause_after=0)
+                while not self.stop_event.is_set():
+                    idle = True
+                    for kind, stream in (('submission', submissions), ('comment', comments)):
+                        for item in stream:
+                            if item is None or self.stop_event.is_set():
+                                break
+                            idle = False
+                            self._enqueue(kind, item)
+                    if idle:
+                        self.stop_event.wait(1.0)
+                    backoff = 1.0
+            except Exception as e:
+                # prawcore raises on network errors and 5xx; recreate the streams
+                self.stats['stream_errors'] += 1
+                logger.error(f"Reddit stream error: {e}; reconnecting in {backoff:.0f}s")
+                self.stop_event.wait(backoff)
+                backoff = min(backoff * 2, 300)
+
+    def _enqueue(self, kind: str, item):
+        """Prefilter one streamed item and queue it for analysis."""
+        self.stats['submissions' if kind == 'submission' else 'comments'] += 1
+        if self.checkpoint.seen(kind, item.created_utc):
+            return  # Already processed before a restart
+
+        text = f"{item.title} {item.selftext}" if kind == 'submission' else item.body
+        if not self.scraper.keyword_matcher.first_hit_per_species(text):
+            return
+
+        seq = self.checkpoint.begin(kind, item.created_utc)
+        self.stats['queued'] += 1
+        self._put(self.item_queue, (seq, kind, item))
+
+    def _put(self, target: queue.Queue, value):
+        """Blocking put that still notices shutdown (this is where backpressure applies)."""
+        while True:
+            try:
+                target.put(value, timeout=1.0)
+                return
+            except queue.Full:
+                if self.stop_event.is_set() and target is self.item_queue:
+                    logger.warning("Dropping streamed item on shutdown; it will be caught up on restart")
+                    return
+
+    def _analysis_loop(self):
+        """Worker: run LLM analysis on queued items and pass sightings to the saver."""
+        while True:
+            work = self.item_queue.get()
+            if work is _STOP:
+                return
+            seq, kind, item = work
+            try:
+                subreddit_name = item.subreddit.display_name
+                if kind == 'submission':
+                    sightings = self._analyze_submission(item, subreddit_name)
+                else:
+                    sightings = self.scraper._process_comment(item, getattr(item, 'link_title', ''), subreddit_name)
+            except Exception as e:
+                logger.error(f"Failed to analyze Reddit {kind} {item.id}: {e}")
+                sightings = []
+
+            self.stats['sightings'] += len(sightings)
+            for sighting in sightings:
+                self._put(self.save_queue, (None, sighting))
+            # The saver acknowledges the item after everything queued before it is written
+            self._put(self.save_queue, (seq, None))
+
+    def _analyze_submission(self, submission, subreddit_name: str) -> List[Dict[str, Any]]:
+        post_id = f"reddit_{submission.id}"
+        content = f"{submission.title} {submission.selftext}"
+        post_date = datetime.fromtimestamp(submission.created_utc)
+        if not self.scraper.validator.should_process_post(post_id, content, post_datetime=post_date,
+                                                         post_title=submission.title):
+            return []  # Seen by a batch run already
+
+        mentions = self.scraper._extract_potential_wildlife_mentions(content, submission.url)
+        pending = [(submission, post_id, content, post_date, mentions)]
+        return self.scraper._analyze_pending_posts(pending, subreddit_name)
+
+    def _save_loop(self):
+        """Saver: write sightings in batches, then advance the checkpoint."""
+        batch: List[Dict[str, Any]] = []
+        acks: List[int] = []
+        last_flush = time.monotonic()
+        while True:
+            try:
+                work = self.save_queue.get(timeout=self.save_interval)
+            except queue.Empty:
+                work = None
+
+            if work is _STOP:
+                self._save_or_journal(batch, acks)
+                return
+            if work is not None:
+                seq, sighting = work
+                if sighting is not None:
+                    batch.append(sighting)
+                if seq is not None:
+                    acks.append(seq)
+
+            if len(batch) >= self.save_batch_size or (
+                    (batch or acks) and time.monotonic() - last_flush >= self.save_interval):
+                self._save_or_journal(batch, acks)
+                batch, acks = [], []
+                last_flush = time.monotonic()
+
+    def _save_or_journal(self, batch: List[Dict[str, Any]], acks: List[int]):
+        """
+        Write a batch and acknowledge its items, retrying while the database is down.
+
+        While the saver waits the bounded queues fill and the reader pauses.
+        Once the daemon is stopping, a batch that still cannot be written is
+        journaled instead. The posts behind it are already
+        cached as processed, so a catch-up sweep would never find them again;
+        the items are only acknowledged once their sightings are durable.
+        """
+        backoff = self.save_interval
+        while not self._flush(batch):
+            if self.stop_event.wait(backoff):
+                if not self._flush(batch):
+                    self._journal(batch)
+                break
+            backoff = min(backoff * 2, MAX_SAVE_BACKOFF)
+        if any([self.checkpoint.finish(seq) for seq in acks]):
+            self.checkpoint.save()
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> bool:
+        """Write a batch; returns False if the write raised."""
+        if not batch:
+            return True
+        try:
+            saved = self.save_batch(batch, self.scraper.source_name)
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} streamed sightings: {e}")
+            return False
+        self.stats['saved'] += saved.get('saved', 0) if isinstance(saved, dict) else int(saved or 0)
+        return True
+
+    def _journal(self, batch: List[Dict[str, Any]]):
+        """Hand a batch to the sighting buffer, which journals it if the write fails again."""
+        from .sighting_buffer import get_sighting_buffer
+
+        buffer = get_sighting_buffer()
+        buffer.extend(batch, self.scraper.source_name)
+        buffer.flush()
+        logger.warning(f"Handed {len(batch)} unsaved streamed sightings to the sighting buffer")
+
+    def _shutdown(self):
+        """Drain the queues, flush the saver and persist the checkpoint."""
+        logger.info("Stopping Reddit stream: draining queues...")
+        self.stop_event.set()
+        for _ in range(self.analysis_workers):
+            self.item_queue.put(_STOP)
+        for thread in self._threads[1:]:
+            thread.join()
+        self.save_queue.put(_STOP)
+        self._threads[0].join()
+        self.checkpoint.save()
+        self.scraper.validator._save_cache()
+        logger.info(f"Reddit stream stopped: {self.stats}")
@@ -0,0 +1,146 @@
+"""
+Per-subreddit high-water marks for incremental Reddit sweeps.
+
+For each subreddit the store remembers the time range of new-post listings
+already walked (newest/oldest created_utc plus the newest fullname) and the
+comment count of every post seen inside the tracking window. A daily run
+can then stop walking at the first already-seen post and re-read comments
+only for posts whose num_comments changed. Posts whose analysis failed are
+remembered separately so the next run retries them even though they lie
+inside the walked range.
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+
+WATERMARK_FILENAME = "reddit_watermarks.json"
+
+
+class RedditWatermarks:
+    """
+    JSON-backed store of per-subreddit sweep state.
+
+    State per subreddit:
+        newest_utc / newest_fullname: newest post walked
+        oldest_utc: every post between oldest_utc and newest_utc was walked
+        posts: {fullname: {'created_utc': float, 'num_comments': int}}
+        failed: {fullname: created_utc} of walked posts still to be analyzed
+        updated_at: when the state was last saved
+    """
+
+    def __init__(self, path: Path):
+        """
+        Load the store.
+
+        Args:
+            path: JSON file holding the state
+        """
+        self.path = Path(path)
+        self._data: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    self._data = json.load(f)
+            except Exception as e:
+                logger.error(f"Failed to load Reddit watermarks from {self.path}: {e}")
+
+    def get(self, subreddit: str) -> Optional[Dict[str, Any]]:
+        """State for a subreddit, or None if it has never been swept."""
+        return self._data.get(subreddit.lower())
+
+    def covers(self, subreddit: str, created_utc: float) -> bool:
+        """True if a post created at created_utc was walked by an earlier sweep."""
+        mark = self.get(subreddit)
+        return bool(mark) and mark['oldest_utc'] <= created_utc <= mark['newest_utc']
+
+    def tracked_posts(self, subreddit: str, since_utc: float) -> Dict[str, int]:
+        """
+        Posts from earlier sweeps created at or after since_utc.
+
+        Returns:
+            Dict of fullname -> last seen num_comments
+        """
+        mark = self.get(subreddit) or {}
+        return {
+            fullname: post['num_comments']
+            for fullname, post in mark.get('posts', {}).items()
+            if post['created_utc'] >= since_utc
+        }
+
+    def failed_posts(self, subreddit: str, since_utc: float) -> List[str]:
+        """Fullnames of walked posts created at or after since_utc whose analysis failed."""
+        mark = self.get(subreddit) or {}
+        return [fullname for fullname, created_utc in mark.get('failed', {}).items()
+                if created_utc >= since_utc]
+
+    def update(self, subreddit: str, newest_utc: float, newest_fullname: Optional[str],
+               oldest_utc: float, posts: Dict[str, Dict[str, Any]], prune_before_utc: float,
+               failed: Optional[Dict[str, float]] = None):
+        """
+        Merge the result of a completed sweep.
+
+        The walked range is only extended when it touches the stored range,
+        so the store never claims coverage of a gap.
+
+        Args:
+            subreddit: Subreddit name
+            newest_utc: created_utc of the newest post walked
+            newest_fullname: Fullname of that post
+            oldest_utc: Oldest time covered by this sweep
+            posts: {fullname: {'created_utc', 'num_comments'}} seen or refreshed
+            prune_before_utc: Drop tracked posts created before this time
+            failed: {fullname: created_utc} of posts whose analysis failed in
+                this sweep; replaces the stored set, since every sweep retries it
+        """
+        key = subreddit.lower()
+        mark = self._data.get(key)
+        if mark and oldest_utc <= mark['newest_utc'] and newest_utc >= mark['oldest_utc']:
+            if newest_utc >= mark['newest_utc']:
+                mark['newest_utc'] = newest_utc
+                mark['newest_fullname'] = newest_fullname
+            mark['oldest_utc'] = min(mark['oldest_utc'], oldest_utc)
+        else:
+            mark = {
+                'newest_utc': newest_utc,
+                'newest_fullname': newest_fullname,
+                'oldest_utc': oldest_utc,
+                'posts': (mark or {}).get('posts', {})
+            }
+            self._data[key] = mark
+
+        mark['posts'].update(posts)
+        mark['posts'] = {
+            fullname: post for fullname, post in mark['posts'].items()
+            if post['created_utc'] >= prune_before_utc
+        }
+        mark['failed'] = {
+            fullname: created_utc for fullname, created_utc in (failed or {}).items()
+            if created_utc >= prune_before_utc
+        }
+        mark['updated_at'] = time.time()
+
+    def reset(self, subreddit: Optional[str] = None):
+        """Forget one subreddit's state (or all of it) to force a full sweep."""
+        if subreddit is None:
+            self._data.clear()
+        else:
+            self._data.pop(subreddit.lower(), None)
+
+    def subreddits(self) -> List[str]:
+        return list(self._data)
+
+    def save(self):
+        """Write the store atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self._data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save Reddit watermarks to {self.path}: {e}")
@@ -0,0 +1,97 @@
+"""
+Registry of scraper sources, imported lazily by name.
+
+Each entry maps a source name to the module and class implementing it, so
+importing the registry costs nothing and a scraper's dependencies (PRAW,
+BeautifulSoup, the LLM validator, ...) are only imported when that source
+is first requested.
+"""
+
+import re
+import importlib
+from typing import Dict, List, Tuple, Type
+
+# Source name -> (module relative to this package, class name)
+SCRAPER_REGISTRY: Dict[str, Tuple[str, str]] = {
+    'reddit': ('.reddit_scraper', 'RedditScraper'),
+    '14ers': ('.fourteeners_scraper_real', 'FourteenersRealScraper'),
+    'google_places': ('.google_places_scraper', 'GooglePlacesScraper'),
+    'inaturalist': ('.inaturalist_scraper', 'INaturalistScraper'),
+    'observation_org': ('.observation_org_scraper', 'ObservationOrgScraper')
+}
+
+# Other spellings of source names (display names and BaseScraper.source_name values)
+SOURCE_ALIASES = {
+    '14ers.com': '14ers',
+    'fourteeners': '14ers',
+    'google places': 'google_places',
+    'google': 'google_places',
+    'observation.org': 'observation_org'
+}
+
+
+def normalize_source(name: str) -> str:
+    """
+    Map a source name or alias to its registry key.
+
+    Args:
+        name: Source name, e.g. 'Reddit', '14ers.com' or 'google_places'
+
+    Returns:
+        Registry key
+
+    Raises:
+        KeyError: If the source is unknown
+    """
+    key = name.strip().lower()
+    key = SOURCE_ALIASES.get(key, key)
+    if key not in SCRAPER_REGISTRY:
+        key = re.sub(r'[\s\-]+', '_', key)
+    if key not in SCRAPER_REGISTRY:
+        raise KeyError(f"Unknown scraper source '{name}'. Available: {', '.join(available_sources())}")
+    return key
+
+
+def available_sources() -> List[str]:
+    """Registered source names."""
+    return list(SCRAPER_REGISTRY)
+
+
+def register_scraper(name: str, module: str, class_name: str):
+    """
+    Register (or replace) a source.
+
+    Args:
+        name: Source name
+        module: Module path, absolute or relative to the scrapers package
+        class_name: BaseScraper subclass in that module
+    """
+    SCRAPER_REGISTRY[name.lower()] = (module, class_name)
+
+
+def get_scraper_class(name: str) -> Type:
+    """
+    Import and return the scraper class for a source.
+
+    Args:
+        name: Source name or alias
+
+    Returns:
+        BaseScraper subclass
+    """
+    module, class_name = SCRAPER_REGISTRY[normalize_source(name)]
+    return getattr(importlib.import_module(module, __package__), class_name)
+
+
+def create_scraper(name: str, **kwargs):
+    """
+    Instantiate the scraper for a source.
+
+    Args:
+        name: Source name or alias
+        **kwargs: Arguments for the scraper's constructor
+
+    Returns:
+        Scraper instance
+    """
+    return get_scraper_class(name)(**kwargs)
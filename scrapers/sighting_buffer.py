@@ -0,0 +1,282 @@
+"""
+Write-behind buffer for validated sightings.
+
+Scrapers add sightings as soon as they are validated; a background thread
+writes them in batches when SIGHTING_BUFFER_ROWS sightings are waiting or
+the oldest has waited SIGHTING_BUFFER_SECONDS. If the database cannot be
+reached the batch is appended to a local NDJSON journal instead, and the
+journal is replayed once writes succeed again, so nothing found during an
+outage is lost. The buffer is flushed on close, at interpreter exit and on
+SIGTERM.
+"""
+
+import os
+import json
+import time
+import atexit
+import signal
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+
+
+DEFAULT_MAX_ROWS = 50
+DEFAULT_MAX_AGE_SECONDS = 5.0
+# While the database is down, batches go straight to the journal and a
+# write is only retried this often
+DEFAULT_RETRY_SECONDS = 30.0
+JOURNAL_FILENAME = "sighting_journal.ndjson"
+
+_shared_buffer: Optional['SightingBuffer'] = None
+_shared_buffer_lock = threading.Lock()
+
+
+class SightingBuffer:
+    """
+    Batch sightings per source and write them from a background thread.
+
+    save_batch must raise when the database is unreachable; a batch whose
+    write raises is journaled rather than dropped.
+    """
+
+    def __init__(self, save_batch: Callable[[List[Dict[str, Any]], str], Any],
+                 journal_path: Path,
+                 max_rows: int = DEFAULT_MAX_ROWS,
+                 max_age: float = DEFAULT_MAX_AGE_SECONDS,
+                 retry_interval: float = DEFAULT_RETRY_SECONDS):
+        """
+        Start the buffer and its flusher thread.
+
+        Args:
+            save_batch: Called as save_batch(sightings, source_name)
+            journal_path: NDJSON file for batches that could not be written
+            max_rows: Flush once this many sightings are waiting
+            max_age: Flush once the oldest waiting sighting is this old (seconds)
+            retry_interval: Seconds between write attempts while the database is down
+        """
+        self.save_batch = save_batch
+        self.journal_path = Path(journal_path)
+        self.max_rows = max_rows
+        self.max_age = max_age
+        self.retry_interval = retry_interval
+        self.stats = {'added': 0, 'saved': 0, 'duplicates': 0, 'journaled': 0, 'replayed': 0, 'flushes': 0}
+
+        self._pending: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._pending_count = 0
+        self._oldest: Optional[float] = None
+        self._retry_after = 0.0
+        self._closed = False
+        self._condition = threading.Condition()
+        # Reentrant so a SIGTERM arriving mid-flush can still flush
+        self._write_lock = threading.RLock()
+        self._thread = threading.Thread(target=self._run, name="sighting-buffer-flusher", daemon=True)
+        self._thread.start()
+
+    def add(self, sighting: Dict[str, Any], source_name: str):
+        """Queue one sighting."""
+        self.extend([sighting], source_name)
+
+    def extend(self, sightings: List[Dict[str, Any]], source_name: str):
+        """
+        Queue sightings for the next batch.
+
+        Args:
+            sightings: Validated sighting dictionaries
+            source_name: Source passed to save_batch
+        """
+        if not sightings:
+            return
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SightingBuffer is closed")
+            self._pending[source_name].extend(sightings)
+            self._pending_count += len(sightings)
+            self.stats['added'] += len(sightings)
+            if self._oldest is None:
+                # Wake the flusher so it starts the age timer
+                self._oldest = time.monotonic()
+                self._condition.notify()
+            elif self._pending_count >= self.max_rows:
+                self._condition.notify()
+
+    def flush(self):
+        """Write everything queued so far, in the calling thread."""
+        with self._condition:
+            batches = self._take()
+        self._write(batches)
+
+    def close(self):
+        """Flush what is queued, stop the flusher thread and replay the journal if possible."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+        logger.info(f"Sighting buffer closed: {self.stats}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def flush_on_signals(self, signums=(signal.SIGTERM,)):
+        """
+        Flush before the process is terminated by a signal.
+
+        The previous handler still runs afterwards. Only possible from the
+        main thread; elsewhere this does nothing.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for signum in signums:
+            previous = signal.getsignal(signum)
+
+            def handler(received, frame, previous=previous):
+                logger.info(f"Signal {received} received; flushing sighting buffer")
+                self.close()
+                if callable(previous):
+                    previous(received, frame)
+                elif previous == signal.SIG_DFL:
+                    signal.signal(received, signal.SIG_DFL)
+                    os.kill(os.getpid(), received)
+
+            signal.signal(signum, handler)
+
+    def _run(self):
+        """Flusher thread: wait for the size or age trigger, then write."""
+        while True:
+            with self._condition:
+                while not self._closed and not self._due():
+                    timeout = None
+                    if self._oldest is not None:
+                        timeout = max(self.max_age - (time.monotonic() - self._oldest), 0.01)
+                    elif self._journal_waiting():
+                        timeout = self.retry_interval
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                batches = self._take()
+            self._write(batches)
+
+    def _due(self) -> bool:
+        if self._pending_count >= self.max_rows:
+            return True
+        if self._oldest is not None and time.monotonic() - self._oldest >= self.max_age:
+            return True
+        return self._journal_waiting() and time.monotonic() >= self._retry_after
+
+    def _take(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Remove and return the pending batches (caller holds the condition)."""
+        batches = dict(self._pending)
+        self._pending = defaultdict(list)
+        self._pending_count = 0
+        self._oldest = None
+        return batches
+
+    @property
+    def _replay_path(self) -> Path:
+        return self.journal_path.with_suffix('.replay')
+
+    def _journal_waiting(self) -> bool:
+        return any(path.exists() and path.stat().st_size > 0 for path in (self.journal_path, self._replay_path))
+
+    def _write(self, batches: Dict[str, List[Dict[str, Any]]]):
+        """Write batches, journaling them if the database is unreachable."""
+        with self._write_lock:
+            if self._journal_waiting() and time.monotonic() >= self._retry_after:
+                self._replay_journal()
+
+            for source_name, sightings in batches.items():
+                if time.monotonic() < self._retry_after or not self._save(sightings, source_name):
+                    self._append_journal(sightings, source_name)
+            if batches:
+                self.stats['flushes'] += 1
+
+    def _save(self, sightings: List[Dict[str, Any]], source_name: str) -> bool:
+        try:
+            result = self.save_batch(sightings, source_name)
+        except Exception as e:
+            logger.warning(f"Database write failed for {len(sightings)} {source_name} sightings ({e}); "
+                           f"journaling to {self.journal_path}")
+            self._retry_after = time.monotonic() + self.retry_interval
+            return False
+        if isinstance(result, dict):
+            self.stats['saved'] += result.get('saved', 0)
+            self.stats['duplicates'] += result.get('duplicates', 0)
+        else:
+            self.stats['saved'] += int(result or 0)
+        self._retry_after = 0.0
+        return True
+
+    def _append_journal(self, sightings: List[Dict[str, Any]], source_name: str, count: bool = True):
+        """Append a batch to the journal (one JSON line per sighting)."""
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, 'a') as f:
+            for sighting in sightings:
+                # default=str renders datetimes the way content hashes format them
+                f.write(json.dumps({'source_name': source_name, 'sighting': sighting}, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        if count:
+            self.stats['journaled'] += len(sightings)
+
+    def _replay_journal(self):
+        """Write journaled sightings; batches that fail go back to the journal."""
+        replay_path = self._replay_path
+        if self.journal_path.exists():
+            if replay_path.exists():
+                # Left over from a replay interrupted by a crash
+                with open(replay_path, 'a') as dest, open(self.journal_path, 'r') as src:
+                    dest.write(src.read())
+                self.journal_path.unlink()
+            else:
+                os.replace(self.journal_path, replay_path)
+
+        batches: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        with open(replay_path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from a crash mid-write
+                batches[entry['source_name']].append(entry['sighting'])
+
+        logger.info(f"Replaying {sum(len(b) for b in batches.values())} journaled sightings")
+        for source_name, sightings in batches.items():
+            for start in range(0, len(sightings), self.max_rows):
+                chunk = sightings[start:start + self.max_rows]
+                if self._retry_after == 0.0 and self._save(chunk, source_name):
+                    self.stats['replayed'] += len(chunk)
+                else:
+                    self._append_journal(chunk, source_name, count=False)
+        replay_path.unlink()
+
+
+def get_sighting_buffer() -> SightingBuffer:
+    """
+    Process-wide buffer writing through database_saver.bulk_save_sightings.
+
+    Configured by SIGHTING_BUFFER_ROWS, SIGHTING_BUFFER_SECONDS and
+    SIGHTING_JOURNAL (journal file, by default next to the parsed-post cache).
+    It is closed, and so flushed, at interpreter exit and on SIGTERM.
+    """
+    global _shared_buffer
+    with _shared_buffer_lock:
+        if _shared_buffer is None:
+            from .database_saver import bulk_save_sightings
+
+            cache_dir = "/tmp/cache" if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else "data/cache"
+            _shared_buffer = SightingBuffer(
+                lambda sightings, source_name: bulk_save_sightings(sightings, source_name, raise_errors=True),
+                journal_path=Path(os.getenv('SIGHTING_JOURNAL', str(Path(cache_dir) / JOURNAL_FILENAME))),
+                max_rows=int(os.getenv('SIGHTING_BUFFER_ROWS', DEFAULT_MAX_ROWS)),
+                max_age=float(os.getenv('SIGHTING_BUFFER_SECONDS', DEFAULT_MAX_AGE_SECONDS))
+            )
+            atexit.register(_shared_buffer.close)
+            _shared_buffer.flush_on_signals()
+        return _shared_buffer
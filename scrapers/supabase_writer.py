@@ -0,0 +1,177 @@
+"""
+Batched Supabase writes for sighting records.
+
+One Supabase client is shared by the whole process, so its HTTP connection
+pool (keep-alive connections to PostgREST) is reused across writes instead
+of a new client and TLS handshake per call. Records are written in chunks
+with upsert(on_conflict='content_hash', ignore_duplicates=True): one request
+per chunk, duplicates skipped by the database, and the inserted count read
+back from the response, so there is no per-row existence check and no
+parsing of 'duplicate' error messages.
+"""
+
+import os
+import threading
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+
+DEFAULT_CHUNK_SIZE = 500
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_supabase_client():
+    """
+    Get the process-wide Supabase client (service role).
+
+    Returns:
+        supabase Client, created on first use from SUPABASE_URL and SUPABASE_SERVICE_KEY
+
+    Raises:
+        RuntimeError: If the credentials are not configured
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            url = os.getenv('SUPABASE_URL')
+            key = os.getenv('SUPABASE_SERVICE_KEY')
+            if not url or not key:
+                raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
+            from supabase import create_client
+            _shared_client = create_client(url, key)
+        return _shared_client
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """True for transport failures (as opposed to PostgREST rejecting the data)."""
+    try:
+        import httpx
+    except ImportError:
+        return isinstance(error, (ConnectionError, TimeoutError))
+    return isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError))
+
+
+class SupabaseSightingWriter:
+    """
+    Chunked, duplicate-ignoring upserts into a Supabase table.
+
+    Records must already be in the table's column format and carry the
+    conflict column (content_hash).
+    """
+
+    def __init__(self, client=None, table: str = 'sightings', chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 on_conflict: str = 'content_hash'):
+        """
+        Args:
+            client: Supabase client (defaults to get_supabase_client())
+            table: Target table
+            chunk_size: Records per upsert request
+            on_conflict: Unique column used to skip duplicates
+        """
+        self._client = client
+        self.table = table
+        self.chunk_size = chunk_size
+        self.on_conflict = on_conflict
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_supabase_client()
+        return self._client
+
+    def write(self, records: List[Dict[str, Any]], source_name: str = '',
+              inserted_keys: Optional[List[Any]] = None) -> Dict[str, int]:
+        """
+        Upsert records, ignoring ones whose content hash already exists.
+
+        A chunk rejected by the database is retried record by record so one
+        bad record does not drop the rest; transport errors are raised.
+
+        Args:
+            records: Rows for the table
+            source_name: Name used in log messages
+            inserted_keys: If given, the on_conflict values of the rows
+                actually inserted are appended to it (the inserted rows are
+                then returned by the database instead of only counted)
+
+        Returns:
+            {'saved': inserted rows, 'duplicates': rows skipped as duplicates,
+             'failed': rows that could not be inserted}
+        """
+        unique: Dict[Any, Dict[str, Any]] = {}
+        for record in records:
+            unique.setdefault(record.get(self.on_conflict), record)
+        result = {'saved': 0, 'duplicates': len(records) - len(unique), 'failed': 0}
+
+        for chunk in self._chunks(list(unique.values())):
+            failed = 0
+            try:
+                inserted = self._upsert(chunk, inserted_keys)
+            except Exception as e:
+                if _is_connection_error(e):
+                    raise
+                logger.warning(f"{source_name}: chunk upsert failed ({e}); retrying row by row")
+                inserted = 0
+                for record in chunk:
+                    try:
+                        inserted += self._upsert([record], inserted_keys)
+                    except Exception as row_error:
+                        if _is_connection_error(row_error):
+                            raise
+                        failed += 1
+                        logger.warning(f"Failed to save sighting: {row_error}")
+            result['saved'] += inserted
+            result['failed'] += failed
+            result['duplicates'] += len(chunk) - inserted - failed
+
+        logger.info(f"{source_name}: Saved {result['saved']} new sightings to Supabase "
+                    f"({result['duplicates']} duplicates skipped"
+                    + (f", {result['failed']} failed)" if result['failed'] else ")"))
+        return result
+
+    def _chunks(self, records: List[Dict[str, Any]]):
+        """
+        Split records into request-sized chunks with identical keys.
+
+        PostgREST bulk inserts need every object in a request to have the
+        same keys; grouping (instead of filling missing keys with None)
+        keeps column defaults for keys a record does not set.
+        """
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for record in records:
+            groups.setdefault(frozenset(record), []).append(record)
+        for group in groups.values():
+            for start in range(0, len(group), self.chunk_size):
+                yield group[start:start + self.chunk_size]
+
+    def _upsert(self, chunk: List[Dict[str, Any]], inserted_keys: Optional[List[Any]] = None) -> int:
+        """Send one upsert request and return how many rows were inserted."""
+        response = self.client.table(self.table).upsert(
+            chunk,
+            on_conflict=self.on_conflict,
+            ignore_duplicates=True,
+            count='exact',
+            returning='minimal' if inserted_keys is None else 'representation'
+        ).execute()
+        if inserted_keys is not None:
+            # With ignore_duplicates only inserted rows are returned
+            inserted_keys.extend(row[self.on_conflict] for row in response.data or [])
+            return len(response.data or [])
+        # With ignore_duplicates the exact count covers inserted rows only
+        if response.count is not None:
+            return response.count
+        return len(response.data or [])
+
+
+_shared_writer: Optional[SupabaseSightingWriter] = None
+
+
+def get_supabase_writer() -> SupabaseSightingWriter:
+    """Process-wide writer for the sightings table, using the shared client."""
+    global _shared_writer
+    with _shared_client_lock:
+        if _shared_writer is None:
+            _shared_writer = SupabaseSightingWriter()
+        return _shared_writer
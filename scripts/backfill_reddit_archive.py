@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Backfill Reddit sightings from offline submission/comment dumps.
+
+Reads Pushshift / Arctic Shift style NDJSON dumps (.zst, .gz or plain),
+keeps the configured subreddits and date range, and runs keyword-matching
+items through the same LLM analysis as the live Reddit scraper. Results are
+saved through the write-behind sighting buffer; posts already in the
+parsed-post cache are not re-analyzed, so an interrupted backfill can simply
+be re-run.
+
+Usage:
+    python scripts/backfill_reddit_archive.py dumps/RS_2024-*.zst dumps/RC_2024-*.zst \
+        --start 2024-09-01 --end 2024-11-30 [--subreddits elkhunting,coloradohikers] [--processes 8]
+    python scripts/backfill_reddit_archive.py dumps/ --dry-run
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import argparse
+from pathlib import Path
+from loguru import logger
+
+from scrapers.reddit_scraper import RedditScraper
+from scrapers.reddit_archive import iter_dump_records
+
+DUMP_SUFFIXES = ('.zst', '.gz', '.ndjson', '.jsonl', '.json')
+
+
+def collect_paths(inputs):
+    """Expand directories to the dump files they contain."""
+    paths = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(p for p in path.iterdir() if p.suffix in DUMP_SUFFIXES))
+        elif path.exists():
+            paths.append(path)
+        else:
+            logger.warning(f"Skipping missing dump file: {path}")
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help="Dump files or directories")
+    parser.add_argument('--start', default=None, help="First day to keep (YYYY-MM-DD)")
+    parser.add_argument('--end', default=None, help="Last day to keep (YYYY-MM-DD)")
+    parser.add_argument('--subreddits', default=None,
+                        help="Comma-separated subreddits (default: RedditScraper.SUBREDDITS)")
+    parser.add_argument('--processes', type=int, default=None,
+                        help="Decompression/prefilter worker processes (default: CPU count)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Only count keyword-matching items; no LLM calls or database writes")
+    args = parser.parse_args()
+
+    paths = collect_paths(args.paths)
+    if not paths:
+        logger.error("No dump files found")
+        sys.exit(1)
+    subreddits = [s.strip() for s in args.subreddits.split(',')] if args.subreddits else RedditScraper.SUBREDDITS
+
+    start_time = time.time()
+    stats = {}
+
+    if args.dry_run:
+        kinds = {'submission': 0, 'comment': 0}
+        for record in iter_dump_records(paths, subreddits, args.start, args.end,
+                                        processes=args.processes, stats=stats):
+            kinds[record['_kind']] += 1
+        logger.info(f"Keyword matches: {kinds['submission']} submissions, {kinds['comment']} comments")
+    else:
+        from scrapers.sighting_buffer import get_sighting_buffer
+
+        scraper = RedditScraper(use_watermarks=False)
+        buffer = get_sighting_buffer()
+        found = 0
+        for sighting in scraper.iter_archive_sightings(paths, args.start, args.end, subreddits=subreddits,
+                                                       processes=args.processes, stats=stats):
+            found += 1
+            buffer.add(sighting, "reddit_archive")
+        buffer.close()
+        logger.success(f"Backfill found {found} sightings, saved {buffer.stats['saved']} "
+                       f"({buffer.stats['journaled']} journaled for a later retry)")
+
+    elapsed = time.time() - start_time
+    lines = stats.get('lines', 0)
+    logger.info(f"Scanned {lines} lines from {len(paths)} files in {elapsed:.1f}s "
+                f"({lines / max(elapsed, 1e-9):,.0f} lines/s); {stats.get('in_range', 0)} in subreddits/date range, "
+                f"{stats.get('matched', 0)} keyword matches, {stats.get('bad_lines', 0)} unparseable lines")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark point-to-GMU lookup latency.
+
+Compares the original iterrows() scan over every GMU polygon with the
+STRtree-backed GMUProcessor.find_gmu_for_point, the bulk
+GMUProcessor.find_gmus_for_points and the precomputed lookup grid, using the trail/peak
+index as the query points. If the full GMU GeoJSON is not present, a
+synthetic 185-unit layer covering Colorado is generated instead.
+
+Usage:
+    python scripts/benchmark_gmu_lookup.py [--gmu-path PATH] [--points N]
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import argparse
+import tempfile
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import shapely
+from shapely.geometry import Point, MultiPoint, box
+
+from processors.gmu_processor import GMUProcessor
+
+# Colorado bounds (west, south, east, north)
+COLORADO_BOUNDS = (-109.06, 36.99, -102.04, 41.00)
+
+
+def synthetic_gmu_layer(n_units: int = 185, seed: int = 42) -> gpd.GeoDataFrame:
+    """Voronoi tessellation of Colorado with densified edges, standing in for real GMUs."""
+    rng = np.random.default_rng(seed)
+    west, south, east, north = COLORADO_BOUNDS
+    seeds = MultiPoint(np.column_stack([
+        rng.uniform(west, east, n_units),
+        rng.uniform(south, north, n_units)
+    ]))
+    colorado = box(*COLORADO_BOUNDS)
+    cells = [cell.intersection(colorado) for cell in shapely.voronoi_polygons(seeds, extend_to=colorado).geoms]
+    # Real GMU boundaries follow rivers and ridges; densify to a realistic vertex count
+    cells = [shapely.segmentize(cell, 0.005) for cell in cells]
+    return gpd.GeoDataFrame(
+        {'GMUID': [str(i + 1) for i in range(len(cells))]},
+        geometry=cells,
+        crs="EPSG:4326"
+    )
+
+
+def scan_lookup(gmu_gdf: gpd.GeoDataFrame, lat: float, lon: float):
+    """The original find_gmu_for_point implementation."""
+    point = Point(lon, lat)
+    for idx, row in gmu_gdf.iterrows():
+        if row.geometry.contains(point):
+            if 'GMUID' in row:
+                return str(row['GMUID'])
+            elif 'DAU' in row:
+                return str(row['DAU'])
+            else:
+                return str(idx)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gmu-path', default="data/gmu/colorado_gmu.geojson")
+    parser.add_argument('--points-path', default="data/trails/colorado_trails_peaks_with_gmu.csv")
+    parser.add_argument('--points', type=int, default=2000, help="Points for the slow scan baseline")
+    args = parser.parse_args()
+
+    processor = GMUProcessor(args.gmu_path)
+    if Path(args.gmu_path).exists():
+        processor.load_gmu_data()
+        source = args.gmu_path
+    else:
+        processor.gmu_gdf = synthetic_gmu_layer()
+        source = "synthetic 185-unit layer"
+    print(f"GMU layer: {source} ({len(processor.gmu_gdf)} polygons)")
+
+    points = pd.read_csv(args.points_path)[['lat', 'lon']].to_numpy()
+    print(f"Query points: {len(points)} from {args.points_path}")
+
+    start = time.perf_counter()
+    processor.find_gmu_for_point(*points[0])  # Builds the index
+    print(f"Index build: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    sample = points[:args.points]
+    start = time.perf_counter()
+    baseline = [scan_lookup(processor.gmu_gdf, lat, lon) for lat, lon in sample]
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [processor.find_gmu_for_point(lat, lon) for lat, lon in points]
+    index_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = processor.find_gmus_for_points(points[:, 0], points[:, 1])
+    bulk_seconds = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(baseline, indexed) if a != b)
+    bulk_mismatches = sum(1 for a, b in zip(indexed, bulk) if a != b)
+    scan_us = scan_seconds / len(sample) * 1e6
+    index_us = index_seconds / len(points) * 1e6
+
+    print(f"\niterrows scan : {scan_us:10.1f} us/point ({len(sample)} points)")
+    print(f"STRtree lookup: {index_us:10.1f} us/point ({len(points)} points)")
+    print(f"Speedup       : {scan_us / index_us:10.1f}x")
+    print(f"Mismatches    : {mismatches}")
+    print(f"Bulk query    : {bulk_seconds * 1000:10.1f} ms total ({bulk_seconds / len(points) * 1e6:.2f} us/point, "
+          f"{bulk_mismatches} mismatches vs STRtree lookup)")
+    print(f"Full index ({len(points)} points) estimated: "
+          f"{scan_us * len(points) / 1e6:.1f}s before, {index_seconds:.2f}s after")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        grid_path = processor.build_lookup_grid(str(Path(tmp) / "gmu.grid.npy"))
+        build_seconds = time.perf_counter() - start
+
+        gridded = GMUProcessor(args.gmu_path)
+        gridded.gmu_gdf = processor.gmu_gdf  # Reuse the loaded polygons for boundary cells
+        start = time.perf_counter()
+        gridded.load_lookup_grid(grid_path)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        grid_results = [gridded.find_gmu_for_point(lat, lon) for lat, lon in points]
+        grid_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        grid_bulk = gridded.find_gmus_for_points(points[:, 0], points[:, 1])
+        grid_bulk_seconds = time.perf_counter() - start
+
+    grid_mismatches = sum(1 for a, b in zip(indexed, grid_results) if a != b)
+    grid_mismatches += sum(1 for a, b in zip(indexed, grid_bulk) if a != b)
+    print(f"\nGrid build    : {build_seconds:10.1f} s, load {load_ms:.1f} ms")
+    print(f"Grid lookup   : {grid_seconds / len(points) * 1e6:10.1f} us/point, "
+          f"bulk {grid_bulk_seconds * 1000:.1f} ms ({grid_mismatches} mismatches)")
+
+
+if __name__ == "__main__":
+    main()
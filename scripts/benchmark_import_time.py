@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark package import (cold start) time.
+
+Runs each target statement in a fresh interpreter with `python -X importtime`,
+reports the median total import time and the slowest top-level imports, and
+checks that heavy optional dependencies are not imported by statements that
+should not need them. Exits non-zero if a budget or a forbidden-module check
+fails, so it can run in CI to catch startup regressions.
+
+Usage:
+    python scripts/benchmark_import_time.py [--repeat N] [--top N] [--budget-ms MS]
+"""
+
+import sys
+import os
+import re
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['praw', 'openai', 'httpx', 'bs4', 'pandas', 'geopandas', 'shapely', 'pyproj']
+
+# (label, statement, modules that must not be imported)
+TARGETS = [
+    ("import scrapers", "import scrapers", HEAVY_MODULES),
+    ("import processors", "import processors", HEAVY_MODULES),
+    ("registry: inaturalist", "import scrapers; scrapers.get_scraper_class('inaturalist')",
+     ['praw', 'bs4', 'pandas', 'geopandas', 'shapely', 'pyproj']),
+    ("registry: 14ers", "import scrapers; scrapers.get_scraper_class('14ers')",
+     ['praw', 'pandas', 'geopandas', 'shapely', 'pyproj']),
+    ("orchestrator", "import scrapers.orchestrator",
+     ['praw', 'openai', 'bs4', 'pandas', 'geopandas', 'shapely', 'pyproj']),
+    ("processors.GMUProcessor", "from processors import GMUProcessor", []),
+]
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def measure(statement: str, baseline: frozenset = frozenset()):
+    """
+    Run a statement under -X importtime.
+
+    Top-level imports named in baseline (interpreter startup: site,
+    encodings, ...) are left out of the total.
+
+    Returns:
+        (total microseconds, [(cumulative us, module)] top-level imports, all module names)
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [REPO_ROOT, os.path.join(REPO_ROOT, 'backend')] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{result.stderr[-2000:]}")
+
+    top_level = []
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        modules.add(name)
+        if indent == 1 and name not in baseline:
+            top_level.append((cumulative, name))
+    return sum(us for us, _ in top_level), top_level, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument('--top', type=int, default=5, help="Slowest top-level imports to show")
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help="Fail if 'import scrapers' takes longer than this (median)")
+    args = parser.parse_args()
+
+    # Modules every interpreter imports at startup
+    baseline = frozenset(name for _, name in measure("pass")[1])
+
+    failures = []
+    for label, statement, forbidden in TARGETS:
+        runs = [measure(statement, baseline) for _ in range(args.repeat)]
+        median_ms = statistics.median(total for total, _, _ in runs) / 1000
+        _, top_level, modules = runs[-1]
+
+        print(f"\n{label}: {median_ms:8.1f} ms  ({statement})")
+        for cumulative, name in sorted(top_level, reverse=True)[:args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+        leaked = [name for name in forbidden if name in modules]
+        if leaked:
+            print(f"    heavy modules imported: {', '.join(leaked)}")
+            failures.append(f"{label} imports {', '.join(leaked)}")
+        if args.budget_ms is not None and statement == "import scrapers" and median_ms > args.budget_ms:
+            failures.append(f"{label} took {median_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nAll import checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark wildlife keyword extraction.
+
+Compares the original one-regex-per-keyword scan with the compiled
+single-pass KeywordMatcher on the bundled 14ers trip report
+(trip_report.html) and the scraped Reddit/Google/14ers sighting texts
+in data/sightings/latest_sightings.json, and checks both find the same
+(species, keyword, offset) hits.
+
+Usage:
+    python scripts/benchmark_keyword_matcher.py [--repeat N]
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import re
+import json
+import time
+import argparse
+from pathlib import Path
+from bs4 import BeautifulSoup
+
+from scrapers.keyword_matcher import get_keyword_matcher
+
+
+def legacy_hits(game_species, text):
+    """The original BaseScraper._extract_sightings_from_text matching loop."""
+    hits = []
+    text_lower = text.lower()
+    for species, keywords in game_species.items():
+        for keyword in keywords:
+            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
+            for match in re.finditer(pattern, text_lower):
+                hits.append((species, keyword.lower(), match.start()))
+    return hits
+
+
+def load_corpus(trip_report_path: Path, sightings_path: Path):
+    """Trip report page text plus every sighting raw_text."""
+    texts = []
+    if trip_report_path.exists():
+        with open(trip_report_path, 'r', encoding='utf-8', errors='ignore') as f:
+            texts.append(BeautifulSoup(f.read(), 'html.parser').get_text(separator=' '))
+    if sightings_path.exists():
+        with open(sightings_path, 'r') as f:
+            texts.extend(s['raw_text'] for s in json.load(f) if s.get('raw_text'))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trip-report', default="trip_report.html")
+    parser.add_argument('--sightings', default="data/sightings/latest_sightings.json")
+    parser.add_argument('--repeat', type=int, default=20, help="Passes over the corpus per timing")
+    args = parser.parse_args()
+
+    texts = load_corpus(Path(args.trip_report), Path(args.sightings))
+    total_chars = sum(len(text) for text in texts)
+    print(f"Corpus: {len(texts)} documents, {total_chars / 1024:.0f} KB")
+
+    matcher = get_keyword_matcher()
+    keyword_count = sum(len(keywords) for keywords in matcher.game_species.values())
+    print(f"Keywords: {keyword_count} across {len(matcher.game_species)} species")
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        legacy = [legacy_hits(matcher.game_species, text) for text in texts]
+    legacy_seconds = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        compiled = [matcher.find_all(text) for text in texts]
+    compiled_seconds = (time.perf_counter() - start) / args.repeat
+
+    mismatches = sum(1 for old, new in zip(legacy, compiled) if set(old) != {tuple(hit) for hit in new})
+    hit_count = sum(len(hits) for hits in compiled)
+    mb = total_chars / 1e6
+
+    print(f"\nPer-keyword regex: {legacy_seconds * 1000:8.1f} ms/pass ({mb / legacy_seconds:6.1f} MB/s)")
+    print(f"Compiled matcher : {compiled_seconds * 1000:8.1f} ms/pass ({mb / compiled_seconds:6.1f} MB/s)")
+    print(f"Speedup          : {legacy_seconds / compiled_seconds:8.1f}x")
+    print(f"Hits             : {hit_count} ({mismatches} documents differ)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Build the ingest-time dedup index for sightings already in the table.
+
+Runs every stored sighting, oldest first, through the same
+IncrementalDeduplicator that bulk_save_sightings uses at insert (with an
+in-memory key index standing in for the dedup_keys column), then writes
+minhash, minhash_bands, near_duplicate_of, dedup_keys and cluster_id back.
+Run it once after applying backend/scripts/add_dedup_index_fields.sql and
+before turning INGEST_DEDUP on; from then on every insert keeps the index
+current and the full-table duplicate scans are no longer needed.
+
+Usage:
+    python scripts/build_dedup_index.py [--dry-run]
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import argparse
+from collections import defaultdict
+from typing import Any, Dict, List
+from dotenv import load_dotenv
+from loguru import logger
+
+from processors.incremental_dedup import IncrementalDeduplicator
+from scrapers.database_saver import DEDUP_CANDIDATE_COLUMNS
+from scrapers.supabase_writer import get_supabase_client
+
+load_dotenv()
+
+PAGE_SIZE = 1000
+BATCH_SIZE = 200
+
+
+class MemoryKeyIndex:
+    """dedup_keys index over sightings already processed, for lookup/relink."""
+
+    def __init__(self):
+        self.rows: Dict[Any, Dict[str, Any]] = {}
+        self._by_key: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._members: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+    def add(self, rows: List[Dict[str, Any]]):
+        for row in rows:
+            self.rows[row['id']] = row
+            for key in row.get('dedup_keys') or ():
+                self._by_key[key].append(row)
+            if row.get('cluster_id'):
+                self._members[row['cluster_id']].append(row)
+
+    def lookup(self, keys: List[str]) -> List[Dict[str, Any]]:
+        found = {}
+        for key in keys:
+            for row in self._by_key.get(key, ()):
+                found[row['id']] = row
+        return list(found.values())
+
+    def relink(self, cluster_id: str, cluster_ids: List[str], sighting_ids: List[Any]):
+        moved = [row for old in cluster_ids for row in self._members.pop(old, [])]
+        moved.extend(self.rows[sighting_id] for sighting_id in sighting_ids)
+        for row in moved:
+            row['cluster_id'] = cluster_id
+        self._members[cluster_id].extend(moved)
+
+
+def fetch_sightings(supabase) -> List[Dict[str, Any]]:
+    """Fetch the columns dedup compares, plus raw_text and location, oldest first."""
+    columns = ','.join(DEDUP_CANDIDATE_COLUMNS + ['raw_text', 'location'])
+    sightings = []
+    offset = 0
+    while True:
+        response = supabase.table('sightings') \
+            .select(columns) \
+            .order('created_at', desc=False) \
+            .order('id', desc=False) \
+            .range(offset, offset + PAGE_SIZE - 1) \
+            .execute()
+        if not response.data:
+            break
+        sightings.extend(response.data)
+        offset += PAGE_SIZE
+    return sightings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dry-run', action='store_true', help="Build the index and report without writing it")
+    args = parser.parse_args()
+
+    supabase = get_supabase_client()
+    start_time = time.time()
+
+    logger.info("Fetching sightings...")
+    sightings = fetch_sightings(supabase)
+    logger.info(f"Fetched {len(sightings)} sightings")
+
+    index = MemoryKeyIndex()
+    deduplicator = IncrementalDeduplicator(index.lookup, index.relink)
+    totals = {'matched': 0, 'new_clusters': 0, 'merged_clusters': 0}
+    for start in range(0, len(sightings), BATCH_SIZE):
+        batch = sightings[start:start + BATCH_SIZE]
+        result = deduplicator.assign(batch)
+        index.add(batch)
+        for key in totals:
+            totals[key] += result[key]
+
+    clusters = defaultdict(list)
+    for row in sightings:
+        if row['cluster_id']:
+            clusters[row['cluster_id']].append(row['id'])
+    logger.info(f"Indexed {len(sightings)} sightings in {time.time() - start_time:.1f}s: "
+                f"{len(clusters)} duplicate clusters covering "
+                f"{sum(len(members) for members in clusters.values())} sightings "
+                f"({totals['merged_clusters']} clusters merged along the way)")
+
+    if args.dry_run:
+        return
+
+    logger.info("Writing index...")
+    for row in sightings:
+        supabase.table('sightings').update({
+            'minhash': row['minhash'],
+            'minhash_bands': row['minhash_bands'],
+            'near_duplicate_of': row['near_duplicate_of'],
+            'dedup_keys': row['dedup_keys'],
+            'cluster_id': row['cluster_id']
+        }).eq('id', row['id']).execute()
+    logger.success(f"Dedup index written for {len(sightings)} sightings; INGEST_DEDUP can be enabled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed GMU lookup grid and warm the GMU layer cache.
+
+Bakes the GMU polygons into a quantized lat/lon uint16 grid saved next to
+the GMU file (colorado_gmu.grid.npy + colorado_gmu.grid.json). Rerun this
+whenever the GMU GeoJSON changes; GMUProcessor.load_lookup_grid() refuses
+grids older than their source file. Loading the polygons also refreshes
+the binary layer cache (colorado_gmu.cache.pkl) if it is stale.
+
+Usage:
+    python scripts/build_gmu_grid.py [--gmu-path PATH] [--cell-size DEGREES] [--output PATH]
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import argparse
+
+from processors.gmu_processor import GMUProcessor, DEFAULT_GRID_CELL_SIZE
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gmu-path', default="data/gmu/colorado_gmu.geojson")
+    parser.add_argument('--cell-size', type=float, default=DEFAULT_GRID_CELL_SIZE,
+                        help="Cell edge length in degrees")
+    parser.add_argument('--output', help="Output .npy path (defaults to <gmu file>.grid.npy)")
+    args = parser.parse_args()
+
+    processor = GMUProcessor(args.gmu_path)
+    processor.load_gmu_data()
+
+    start = time.perf_counter()
+    grid_path = processor.build_lookup_grid(args.output, cell_size=args.cell_size)
+    print(f"Built grid in {time.perf_counter() - start:.1f}s: {grid_path}")
+
+    check = GMUProcessor(args.gmu_path)
+    start = time.perf_counter()
+    check.load_lookup_grid(grid_path)
+    print(f"Grid loads in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({os.path.getsize(grid_path) / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
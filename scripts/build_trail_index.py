@@ -12,7 +12,6 @@ from processors.gmu_processor import GMUProcessor
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
-from rich.progress import track
 import pandas as pd
 import json
 
@@ -39,10 +38,14 @@ def build_trail_index():
  # Step 3: Map to GMUs
  console.print("\n[yellow]Step 3: Mapping trails/peaks to GMUs...[/yellow]")
 
- # Add GMU column
- for item in track(trails_peaks, description="Mapping to GMUs"):
- gmu = gmu_processor.find_gmu_for_point(item['lat'], item['lon'])
- item['gmu'] = gmu if gmu else 'Unknown'
+ # Add GMU column (single bulk point-in-polygon query)
+ gmus = gmu_processor.find_gmus_for_points(
+ [item['lat'] for item in trails_peaks],
+ [item['lon'] for item in trails_peaks],
+ missing='Unknown'
+ )
+ for item, gmu in zip(trails_peaks, gmus):
+ item['gmu'] = gmu
 
  # Step 4: Save results
  console.print("\n[yellow]Step 4: Saving results...[/yellow]")
@@ -8,11 +8,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scrapers.reddit_scraper import RedditScraper
+from scrapers.post_cache import open_post_cache
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
-import json
+from itertools import islice
+from pathlib import Path
 
 console = Console()
 
@@ -79,16 +81,13 @@ def diagnose_reddit_content():
     console.print("\n[bold cyan]Cache Analysis:[/bold cyan]")
     console.print("-" * 70)
     
-    cache_file = "data/cache/parsed_posts.json"
-    if os.path.exists(cache_file):
-        with open(cache_file, 'r') as f:
-            cache = json.load(f)
-        
+    cache = open_post_cache(Path("data/cache"))
+    if len(cache):
         # Count posts with wildlife keywords in cache
         posts_with_keywords = 0
         example_texts = []
         
-        for post_id, data in list(cache.items())[:50]:  # Check first 50
+        for post_id, data in islice(cache.items(), 50):  # Check first 50
             if 'content_hash' in data:
                 # Can't see original content, but check sighting count
                 if data.get('sighting_count', 0) > 0:
@@ -96,6 +95,7 @@ def diagnose_reddit_content():
         
         console.print(f"Cache contains {len(cache)} posts")
         console.print(f"Posts marked as having sightings: {posts_with_keywords}")
+    cache.close()
 
 if __name__ == "__main__":
     diagnose_reddit_content()
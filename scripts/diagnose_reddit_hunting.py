@@ -8,11 +8,12 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scrapers.reddit_scraper import RedditScraper
+from scrapers.post_cache import open_post_cache
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
-import json
+from pathlib import Path
 
 console = Console()
 
@@ -30,12 +31,9 @@ def diagnose_hunting_content():
     
     # Check cache to see what's really there
     console.print("\n[bold yellow]Analyzing Cache Contents[/bold yellow]")
-    cache_file = "data/cache/parsed_posts.json"
+    cache = open_post_cache(Path("data/cache"))
     
-    if os.path.exists(cache_file):
-        with open(cache_file, 'r') as f:
-            cache = json.load(f)
-        
+    if len(cache):
         console.print(f"Total cached posts: {len(cache)}")
         
         # Find posts with wildlife mentions
@@ -59,6 +57,7 @@ def diagnose_hunting_content():
                 console.print(f"Sighting count: {data['sighting_count']}")
                 for s in data['sightings'][:2]:
                     console.print(f"  - {s.get('species', 'unknown')}: {s.get('raw_text', '')[:100]}...")
+    cache.close()
     
     # Now let's manually check some hunting posts
     console.print("\n[bold yellow]Manually Checking r/cohunting Posts[/bold yellow]")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate sightings across the whole sightings table.
+
+Every sighting's raw_text gets a MinHash signature (stored ones are reused,
+missing ones are computed); LSH banding then finds candidate pairs in one
+pass instead of comparing every pair, and candidates whose estimated
+Jaccard similarity reaches the threshold are clustered. Crossposts, quoted
+comments and lightly edited reposts end up in the same cluster even though
+their content hashes differ.
+
+Requires backend/scripts/add_near_duplicate_fields.sql.
+
+Usage:
+    python scripts/find_near_duplicates.py                  # report only
+    python scripts/find_near_duplicates.py --store-signatures
+    python scripts/find_near_duplicates.py --apply          # link duplicates to the oldest sighting
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import argparse
+from typing import Dict, List
+from dotenv import load_dotenv
+from loguru import logger
+
+from processors.near_duplicates import (
+    DEFAULT_BANDS, DEFAULT_THRESHOLD, MinHasher, band_keys, cluster_near_duplicates,
+    decode_signature, encode_signature, shingles
+)
+from scrapers.supabase_writer import DEFAULT_CHUNK_SIZE, get_supabase_client
+
+load_dotenv()
+
+PAGE_SIZE = 1000
+UPDATE_CHUNK = DEFAULT_CHUNK_SIZE
+
+
+def fetch_sightings(supabase) -> List[Dict]:
+    """Fetch id, raw_text, minhash and created_at of every sighting, oldest first."""
+    sightings = []
+    offset = 0
+    while True:
+        response = supabase.table('sightings') \
+            .select('id,raw_text,minhash,created_at') \
+            .order('created_at', desc=False) \
+            .order('id', desc=False) \
+            .range(offset, offset + PAGE_SIZE - 1) \
+            .execute()
+        if not response.data:
+            break
+        sightings.extend(response.data)
+        offset += PAGE_SIZE
+    return sightings
+
+
+def store_updates(supabase, updates: List[Dict]):
+    """
+    Write signature and near_duplicate_of updates with set_near_duplicate_fields,
+    one request (and one UPDATE statement) per UPDATE_CHUNK rows.
+    """
+    for start in range(0, len(updates), UPDATE_CHUNK):
+        supabase.rpc('set_near_duplicate_fields', {'updates': updates[start:start + UPDATE_CHUNK]}).execute()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Minimum estimated Jaccard similarity (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument('--bands', type=int, default=DEFAULT_BANDS,
+                        help=f"LSH bands (default: {DEFAULT_BANDS})")
+    parser.add_argument('--store-signatures', action='store_true',
+                        help="Save computed signatures for sightings that have none")
+    parser.add_argument('--apply', action='store_true',
+                        help="Set near_duplicate_of on every cluster member to the cluster's oldest sighting "
+                             "(implies --store-signatures)")
+    parser.add_argument('--examples', type=int, default=5, help="Clusters to print")
+    args = parser.parse_args()
+
+    supabase = get_supabase_client()
+    start_time = time.time()
+
+    logger.info("Fetching sightings...")
+    sightings = fetch_sightings(supabase)
+    logger.info(f"Fetched {len(sightings)} sightings")
+
+    hasher = MinHasher()
+    signatures = []
+    computed = {}
+    for sighting in sightings:
+        if len(shingles(sighting.get('raw_text') or '')) < hasher.min_shingles:
+            # Too short to compare, including signatures stored before the minimum existed
+            continue
+        if sighting.get('minhash'):
+            signature = decode_signature(sighting['minhash'])
+        else:
+            signature = hasher.signature(sighting.get('raw_text') or '')
+            if signature is None:
+                continue
+            computed[sighting['id']] = signature
+        signatures.append((sighting['id'], signature))
+    logger.info(f"Computed {len(computed)} missing signatures")
+
+    clusters = cluster_near_duplicates(signatures, args.threshold, args.bands)
+    duplicates = sum(len(cluster) - 1 for cluster in clusters)
+    logger.info(f"Found {len(clusters)} near-duplicate clusters covering {duplicates} redundant sightings "
+                f"in {time.time() - start_time:.1f}s")
+
+    texts = {sighting['id']: sighting.get('raw_text') or '' for sighting in sightings}
+    for cluster in sorted(clusters, key=len, reverse=True)[:args.examples]:
+        logger.info(f"Cluster of {len(cluster)} (keeping {cluster[0]}):")
+        for sighting_id in cluster[:3]:
+            logger.info(f"  {sighting_id}: {texts[sighting_id][:100]!r}")
+
+    updates: Dict[str, Dict] = {}
+    if args.store_signatures or args.apply:
+        for sighting_id, signature in computed.items():
+            updates[sighting_id] = {
+                'id': sighting_id,
+                'minhash': encode_signature(signature),
+                'minhash_bands': band_keys(signature, DEFAULT_BANDS)
+            }
+    linked = 0
+    if args.apply:
+        for cluster in clusters:
+            canonical, others = cluster[0], cluster[1:]
+            for sighting_id in others:
+                updates.setdefault(sighting_id, {'id': sighting_id})['near_duplicate_of'] = canonical
+            linked += len(others)
+
+    if updates:
+        logger.info(f"Storing {len(computed)} signatures"
+                    + (f" and {linked} near-duplicate links" if args.apply else "") + "...")
+        store_updates(supabase, list(updates.values()))
+    if args.apply:
+        logger.success(f"Linked {linked} sightings to the oldest sighting of their cluster")
+
+
+if __name__ == "__main__":
+    main()
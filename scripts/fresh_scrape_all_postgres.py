@@ -12,6 +12,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import json
+import shutil
 import psycopg2
 from pathlib import Path
 from loguru import logger
@@ -26,6 +27,8 @@ from scrapers import (
     FourteenersRealScraper,
     INaturalistScraper
 )
+from scrapers.orchestrator import ScrapeOrchestrator
+from scrapers.bulk_writer import BulkSightingWriter
 
 # Load environment variables
 load_dotenv()
@@ -49,93 +52,80 @@ def get_db_connection():
         database=parsed.path.lstrip('/') or 'hunting_sightings'
     )
 
-def save_to_database(sightings: List[Dict[str, Any]], source_name: str) -> int:
-    """Save sightings to the PostgreSQL sightings table with correct field mapping."""
-    
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    saved_count = 0
-    duplicate_count = 0
+# Columns written to the backend sightings table
+SIGHTINGS_COLUMNS = [
+    'species', 'raw_text', 'keyword_matched', 'source_url', 'source_type',
+    'extracted_at', 'trail_name', 'sighting_date', 'gmu_unit', 'location',
+    'confidence_score', 'reddit_post_title', 'subreddit',
+    'location_confidence_radius', 'content_hash'
+]
+
+def sightings_row(sighting: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a scraped sighting to backend sightings columns."""
+    # Convert sighting date to proper format
+    sighting_date = sighting.get('sighting_date', datetime.now().isoformat())
+    if isinstance(sighting_date, str) and sighting_date.endswith('Z'):
+        sighting_date = sighting_date.replace('Z', '+00:00')
+    
+    # Create PostGIS point from coordinates if available
+    location = None
+    if sighting.get('latitude') and sighting.get('longitude'):
+        location = f"POINT({sighting['longitude']} {sighting['latitude']})"
+    
+    return {
+        'species': sighting.get('species'),
+        'raw_text': sighting.get('raw_text', '')[:500],  # Limit description length
+        'keyword_matched': sighting.get('keyword_matched'),
+        'source_url': sighting.get('source_url'),
+        'source_type': sighting.get('source_type'),
+        'extracted_at': sighting.get('extracted_at', datetime.now()),
+        'trail_name': sighting.get('location_name'),  # Maps to trail_name
+        'sighting_date': sighting_date,
+        'gmu_unit': sighting.get('gmu'),
+        'location': location,
+        'confidence_score': sighting.get('confidence', 80) / 100.0,  # Convert to decimal
+        'reddit_post_title': sighting.get('reddit_post_title'),
+        'subreddit': sighting.get('subreddit'),
+        'location_confidence_radius': sighting.get('location_confidence_radius'),
+        'content_hash': generate_content_hash(sighting)
+    }
+
+# One writer (and database connection) shared by all source threads
+sightings_writer = BulkSightingWriter(
+    get_db_connection, 'sightings', SIGHTINGS_COLUMNS, sightings_row,
+    expressions={'location': 'ST_GeogFromText(%s)'}
+)
+
+def save_to_database(sightings: List[Dict[str, Any]], source_name: str) -> Dict[str, int]:
+    """
+    Save sightings to the PostgreSQL sightings table with correct field mapping.
     
-    for sighting in sightings:
-        try:
-            # Generate content hash
-            content_hash = generate_content_hash(sighting)
-            
-            # Convert sighting date to proper format
-            sighting_date = sighting.get('sighting_date', datetime.now().isoformat())
-            if isinstance(sighting_date, str) and sighting_date.endswith('Z'):
-                sighting_date = sighting_date.replace('Z', '+00:00')
-            
-            # Create PostGIS point from coordinates if available
-            location = None
-            if sighting.get('latitude') and sighting.get('longitude'):
-                location = f"POINT({sighting['longitude']} {sighting['latitude']})"
-            
-            # Map fields to backend schema
-            cursor.execute("""
-                INSERT INTO sightings (
-                    species, raw_text, keyword_matched, source_url, source_type,
-                    extracted_at, trail_name, sighting_date, gmu_unit, location,
-                    confidence_score, reddit_post_title, subreddit,
-                    location_confidence_radius, content_hash
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, ST_GeogFromText(%s),
-                    %s, %s, %s, %s, %s
-                )
-                ON CONFLICT (content_hash) DO NOTHING
-            """, (
-                sighting.get('species'),
-                sighting.get('raw_text', '')[:500],  # Limit description length
-                sighting.get('keyword_matched'),
-                sighting.get('source_url'),
-                sighting.get('source_type'),
-                sighting.get('extracted_at', datetime.now()),
-                sighting.get('location_name'),  # Maps to trail_name
-                sighting_date,
-                sighting.get('gmu'),
-                location,
-                sighting.get('confidence', 80) / 100.0,  # Convert to decimal
-                sighting.get('reddit_post_title'),
-                sighting.get('subreddit'),
-                sighting.get('location_confidence_radius'),
-                content_hash
-            ))
-            
-            # Check if row was inserted
-            if cursor.rowcount > 0:
-                saved_count += 1
-            else:
-                duplicate_count += 1
-                
-        except Exception as e:
-            logger.error(f"Error saving sighting: {e}")
-            logger.debug(f"Sighting data: {sighting}")
+    All sightings go out in one batched insert.
     
-    conn.commit()
-    cursor.close()
-    conn.close()
-    
-    logger.info(f"{source_name}: Saved {saved_count} new sightings ({duplicate_count} duplicates skipped)")
-    return saved_count
+    Returns:
+        {'saved': n, 'duplicates': n, 'failed': n}
+    """
+    return sightings_writer.write(sightings, source_name)
+
+# Sightings buffered per source before each database write
+SAVE_BATCH_SIZE = 50
+
+# Per-source time budget in seconds; a source over budget is cancelled
+SOURCE_TIMEOUT = int(os.getenv('SCRAPE_SOURCE_TIMEOUT', 45 * 60))
 
 def run_all_scrapers(lookback_days: int = 60) -> Dict[str, Any]:
     """
-    Run all scrapers with specified lookback period.
+    Run all scrapers concurrently with specified lookback period.
+    
+    Each source runs in its own thread under ScrapeOrchestrator with a time
+    budget. Sightings are consumed from each scraper's iter_sightings()
+    generator and written to the database and JSON output in small batches
+    while scraping continues, so memory stays flat on long backfills.
     
     Returns:
         Summary statistics of the scraping run
     """
     
-    results = {
-        'start_time': datetime.now().isoformat(),
-        'lookback_days': lookback_days,
-        'sources': {},
-        'total_sightings': 0,
-        'total_with_radius': 0
-    }
-    
     # Define scrapers to run
     scrapers = [
         ('Reddit', RedditScraper),
@@ -144,84 +134,96 @@ def run_all_scrapers(lookback_days: int = 60) -> Dict[str, Any]:
         ('iNaturalist', INaturalistScraper)
     ]
     
-    all_sightings = []
+    with SightingsJSONWriter() as json_writer:
+        orchestrator = ScrapeOrchestrator(
+            scrapers,
+            save_batch=save_to_database,
+            on_sighting=lambda sighting, name: json_writer.write(sighting),
+            timeout=SOURCE_TIMEOUT,
+            batch_size=SAVE_BATCH_SIZE
+        )
+        report = orchestrator.run(lookback_days=lookback_days)
+    sightings_writer.close()
     
-    for name, scraper_class in scrapers:
-        logger.info(f"\n{'='*50}")
-        logger.info(f"Running {name} scraper...")
-        logger.info(f"{'='*50}")
-        
-        try:
-            # Initialize scraper
-            scraper = scraper_class()
-            
-            # Run scraping
-            start_time = datetime.now()
-            sightings = scraper.scrape(lookback_days=lookback_days)
-            end_time = datetime.now()
-            
-            # Count sightings with location_confidence_radius
-            with_radius = sum(1 for s in sightings if s.get('location_confidence_radius') is not None)
-            
-            # Save to PostgreSQL database
-            saved_count = save_to_database(sightings, name)
-            
-            # Record results
+    results = {
+        'start_time': report['start_time'],
+        'end_time': report['end_time'],
+        'lookback_days': lookback_days,
+        'duration_seconds': report['duration_seconds'],
+        'sources': {},
+        'total_sightings': report['total_found'],
+        'total_with_radius': 0
+    }
+    
+    for name, stats in report['sources'].items():
+        results['total_with_radius'] += stats['with_radius']
+        if stats['status'] != 'ok':
+            results['sources'][name] = {
+                'error': stats.get('error', stats['status']),
+                'total_found': stats['found'],
+                'saved_to_db': stats['saved'],
+                'duration_seconds': stats['duration_seconds']
+            }
+        else:
             results['sources'][name] = {
-                'total_found': len(sightings),
-                'saved_to_db': saved_count,
-                'with_radius': with_radius,
-                'duration_seconds': (end_time - start_time).total_seconds()
+                'total_found': stats['found'],
+                'saved_to_db': stats['saved'],
+                'with_radius': stats['with_radius'],
+                'duration_seconds': stats['duration_seconds']
             }
-            
-            # Add to combined list
-            all_sightings.extend(sightings)
-            
-            logger.success(f"{name} complete: {len(sightings)} found, {with_radius} with radius")
-            
-        except Exception as e:
-            logger.error(f"Error running {name} scraper: {e}")
-            import traceback
-            traceback.print_exc()
-            results['sources'][name] = {'error': str(e)}
     
-    # Calculate totals
-    results['total_sightings'] = len(all_sightings)
-    results['total_with_radius'] = sum(1 for s in all_sightings if s.get('location_confidence_radius') is not None)
-    results['end_time'] = datetime.now().isoformat()
+    return results
+
+class SightingsJSONWriter:
+    """
+    Stream sightings into a JSON array file one at a time.
     
-    # Save all sightings to JSON
-    save_sightings_json(all_sightings)
+    Writes data/sightings/fresh_scrape_<timestamp>.json and, once closed,
+    copies it to latest_sightings.json.
+    """
     
-    return results
+    def __init__(self, output_dir: Path = Path("data/sightings")):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.output_file = self.output_dir / f"fresh_scrape_{timestamp}.json"
+        self.count = 0
+        self._file = None
+    
+    def __enter__(self):
+        self._file = open(self.output_file, 'w')
+        self._file.write('[')
+        return self
+    
+    def write(self, sighting: Dict[str, Any]):
+        """Append one sighting to the array."""
+        self._file.write(',\n' if self.count else '\n')
+        self._file.write(json.dumps(_json_ready(sighting), default=str))
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._file.write('\n]\n')
+        self._file.close()
+        
+        # Also save as latest
+        shutil.copyfile(self.output_file, self.output_dir / "latest_sightings.json")
+        logger.info(f"Saved {self.count} sightings to {self.output_file}")
+        return False
+
+def _json_ready(sighting: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a sighting with datetime fields converted to ISO strings."""
+    sighting = dict(sighting)
+    for field in ('sighting_date', 'extracted_at'):
+        if hasattr(sighting.get(field), 'isoformat'):
+            sighting[field] = sighting[field].isoformat()
+    return sighting
 
 def save_sightings_json(sightings: List[Dict[str, Any]]):
     """Save sightings to JSON files."""
     
-    output_dir = Path("data/sightings")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Convert datetime objects to strings
-    for sighting in sightings:
-        if 'sighting_date' in sighting:
-            if hasattr(sighting['sighting_date'], 'isoformat'):
-                sighting['sighting_date'] = sighting['sighting_date'].isoformat()
-        if 'extracted_at' in sighting and hasattr(sighting['extracted_at'], 'isoformat'):
-            sighting['extracted_at'] = sighting['extracted_at'].isoformat()
-    
-    # Save timestamped file
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    output_file = output_dir / f"fresh_scrape_{timestamp}.json"
-    
-    with open(output_file, 'w') as f:
-        json.dump(sightings, f, indent=2, default=str)
-    
-    # Also save as latest
-    latest_file = output_dir / "latest_sightings.json"
-    with open(latest_file, 'w') as f:
-        json.dump(sightings, f, indent=2, default=str)
-    
-    logger.info(f"Saved {len(sightings)} sightings to {output_file}")
+    with SightingsJSONWriter() as json_writer:
+        for sighting in sightings:
+            json_writer.write(sighting)
 
 def print_summary(results: Dict[str, Any]):
     """Print a summary of the scraping results."""
@@ -232,12 +234,13 @@ def print_summary(results: Dict[str, Any]):
     
     logger.info(f"\nLookback period: {results['lookback_days']} days")
     logger.info(f"Started: {results['start_time']}")
-    logger.info(f"Ended: {results['end_time']}")
+    logger.info(f"Ended: {results['end_time']} ({results['duration_seconds']:.1f}s)")
     
     logger.info(f"\nResults by source:")
     for source, stats in results['sources'].items():
         if 'error' in stats:
-            logger.error(f"  {source}: ERROR - {stats['error']}")
+            logger.error(f"  {source}: ERROR - {stats['error']} "
+                         f"({stats['total_found']} found, {stats['saved_to_db']} saved in {stats['duration_seconds']:.1f}s)")
         else:
             logger.info(f"  {source}:")
             logger.info(f"    - Found: {stats['total_found']}")
@@ -2,13 +2,33 @@
 """
 Merge duplicate sightings in the database.
 Identifies duplicates based on species, location, date, and source.
+
+Duplicates are found with a spatio-temporal clustering pass: sightings of
+the same species within their combined location_confidence_radius and
+--window-days of each other are grouped, so reports of the same herd a few
+hundred metres or a day apart are merged too.
+
+Once the dedup index is built (scripts/build_dedup_index.py) and
+INGEST_DEDUP is on, sightings are clustered as they are inserted and only
+clusters whose canonical sighting changed since the last completed run
+(kept in --state-file) are read here; --all-clusters reads every cluster
+and --rescan clusters the whole table again.
+
+Duplicates are no longer rewritten or deleted: each group is linked into
+one cluster with merge_sighting_clusters, and the database keeps one
+canonical sighting per cluster with every report listed as its provenance
+(backend/scripts/add_canonical_sightings.sql). Reports from different
+sources are linked too; they become cross-source confirmations.
 """
 import os
 import sys
+import argparse
+import json
+import uuid
 import hashlib
-from datetime import datetime
-from typing import List, Dict, Set
-from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Optional
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -16,8 +36,17 @@ from dotenv import load_dotenv
 from supabase import create_client
 from loguru import logger
 
+from processors.spatiotemporal_clusters import (
+    DEFAULT_MAX_DISTANCE_MILES, DEFAULT_WINDOW_DAYS, cluster_sightings
+)
+
 load_dotenv()
 
+PAGE_SIZE = 1000
+# Cluster ids per in.() filter, keeping request URLs short
+CLUSTER_CHUNK = 100
+DEFAULT_STATE_FILE = Path("data/cache/merge_duplicates_state.json")
+
 # Initialize Supabase
 supabase = create_client(
     os.getenv('SUPABASE_URL'),
@@ -57,8 +86,115 @@ def get_location_key(sighting: Dict) -> str:
         location_name = 'unknown'
     return location_name.lower().strip()
 
-def find_duplicate_groups() -> Dict[str, List[Dict]]:
-    """Find groups of duplicate sightings."""
+def load_last_run(state_file: Path) -> Optional[str]:
+    """Start time (ISO, UTC) of the last completed run, or None."""
+    if not state_file.exists():
+        return None
+    try:
+        with open(state_file, 'r') as f:
+            return json.load(f).get('last_run')
+    except Exception as e:
+        logger.warning(f"Could not read {state_file} ({e}); reading every cluster")
+        return None
+
+def save_last_run(state_file: Path, started_at: str):
+    """Record the start time of a completed run."""
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(state_file, 'w') as f:
+        json.dump({'last_run': started_at}, f)
+
+def fetch_touched_cluster_ids(since: str) -> List[str]:
+    """
+    Clusters with more than one report whose canonical sighting was rebuilt
+    since the given time; the canonical trigger stamps updated_at whenever a
+    member is inserted, changed or relinked.
+    """
+    cluster_ids = []
+    last_id = None
+    while True:
+        query = supabase.table('canonical_sightings') \
+            .select('id') \
+            .gte('updated_at', since) \
+            .gt('report_count', 1)
+        if last_id is not None:
+            query = query.gt('id', last_id)
+        response = query.order('id', desc=False).limit(PAGE_SIZE).execute()
+        if not response.data:
+            break
+        cluster_ids.extend(row['id'] for row in response.data)
+        last_id = response.data[-1]['id']
+    return cluster_ids
+
+def fetch_clustered_sightings(since: Optional[str] = None) -> List[Dict]:
+    """
+    Fetch sightings the ingest-time dedup put in a cluster, oldest first.
+
+    Args:
+        since: Only read clusters touched at or after this time (ISO); every
+            clustered sighting when None
+    """
+    if since is None:
+        sightings = []
+        offset = 0
+        while True:
+            response = supabase.table('sightings') \
+                .select("*") \
+                .not_.is_('cluster_id', 'null') \
+                .order('created_at', desc=False) \
+                .order('id', desc=False) \
+                .range(offset, offset + PAGE_SIZE - 1) \
+                .execute()
+            if not response.data:
+                break
+            sightings.extend(response.data)
+            offset += PAGE_SIZE
+        return sightings
+
+    cluster_ids = fetch_touched_cluster_ids(since)
+    logger.info(f"{len(cluster_ids)} duplicate clusters touched since {since}")
+    sightings = []
+    for start in range(0, len(cluster_ids), CLUSTER_CHUNK):
+        chunk = cluster_ids[start:start + CLUSTER_CHUNK]
+        offset = 0
+        while True:
+            response = supabase.table('sightings') \
+                .select("*") \
+                .in_('cluster_id', chunk) \
+                .order('id', desc=False) \
+                .range(offset, offset + PAGE_SIZE - 1) \
+                .execute()
+            if not response.data:
+                break
+            sightings.extend(response.data)
+            offset += PAGE_SIZE
+    sightings.sort(key=lambda s: s.get('created_at') or '')
+    return sightings
+
+def find_duplicate_groups(window_days: int = DEFAULT_WINDOW_DAYS,
+                          max_distance_miles: float = DEFAULT_MAX_DISTANCE_MILES,
+                          rescan: bool = False,
+                          since: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """
+    Find groups of duplicate sightings.
+
+    Args:
+        window_days: Maximum days between sightings of one group (rescan only)
+        max_distance_miles: Cap on the combined location_confidence_radius (rescan only)
+        rescan: Cluster the whole table instead of reading the clusters
+            maintained at ingest
+        since: Only read clusters touched since this time (ignored by rescan)
+
+    Returns:
+        Groups keyed by "species|location|date" of their oldest sighting
+    """
+    if not rescan:
+        logger.info("Fetching clustered sightings from database...")
+        clusters = {}
+        for sighting in fetch_clustered_sightings(since):
+            clusters.setdefault(sighting['cluster_id'], []).append(sighting)
+        clusters = [cluster for cluster in clusters.values() if len(cluster) > 1]
+        return _group_clusters(clusters)
+    
     logger.info("Fetching all sightings from database...")
     
     # Fetch all sightings
@@ -80,197 +216,144 @@ def find_duplicate_groups() -> Dict[str, List[Dict]]:
     
     logger.info(f"Found {len(all_sightings)} total sightings")
     
-    # Group by potential duplicate key
-    duplicate_groups = defaultdict(list)
-    
-    for sighting in all_sightings:
-        # Create a key for grouping potential duplicates
-        species = sighting.get('species', '').lower().strip()
-        location_key = get_location_key(sighting)
-        date = str(sighting.get('sighting_date', ''))
-        
-        # Group by species, location, and date
-        group_key = f"{species}|{location_key}|{date}"
-        duplicate_groups[group_key].append(sighting)
-    
-    # Filter to only groups with duplicates
-    actual_duplicates = {
-        key: sightings 
-        for key, sightings in duplicate_groups.items() 
-        if len(sightings) > 1
-    }
+    # Cluster sightings of the same species, place and time (oldest first)
+    return _group_clusters(cluster_sightings(all_sightings, window_days=window_days,
+                                             max_distance_miles=max_distance_miles))
+
+def _group_clusters(clusters: List[List[Dict]]) -> Dict[str, List[Dict]]:
+    """Key clusters (oldest sighting first) by "species|location|date" of that sighting."""
+    actual_duplicates = {}
+    for cluster in clusters:
+        canonical = cluster[0]
+        species = (canonical.get('species') or '').lower().strip()
+        group_key = f"{species}|{get_location_key(canonical)}|{canonical.get('sighting_date', '')}"
+        if group_key in actual_duplicates:
+            group_key += f" ({canonical.get('id')})"
+        actual_duplicates[group_key] = cluster
     
     logger.info(f"Found {len(actual_duplicates)} groups with potential duplicates")
     
     return actual_duplicates
 
-def merge_sighting_data(sightings: List[Dict]) -> Dict:
-    """Merge multiple duplicate sightings into one comprehensive record."""
-    # Start with the oldest sighting as base
-    merged = sightings[0].copy()
-    
-    # Track which fields have been updated
-    updates = set()
-    
-    for sighting in sightings[1:]:
-        # Merge coordinates (prefer non-null)
-        if not merged.get('location') and sighting.get('location'):
-            merged['location'] = sighting['location']
-            updates.add('location')
-        
-        # Merge location confidence radius (prefer smaller/more specific)
-        if sighting.get('location_confidence_radius'):
-            current_radius = merged.get('location_confidence_radius')
-            new_radius = sighting['location_confidence_radius']
-            if not current_radius or new_radius < current_radius:
-                merged['location_confidence_radius'] = new_radius
-                updates.add('location_confidence_radius')
-        
-        # Merge description (prefer longer)
-        if sighting.get('description'):
-            current_desc = merged.get('description', '')
-            new_desc = sighting['description']
-            if len(new_desc) > len(current_desc or ''):
-                merged['description'] = new_desc
-                updates.add('description')
-        
-        # Merge raw_text (prefer longer)
-        if sighting.get('raw_text'):
-            current_text = merged.get('raw_text', '')
-            new_text = sighting['raw_text']
-            if len(new_text) > len(current_text or ''):
-                merged['raw_text'] = new_text
-                updates.add('raw_text')
-        
-        # Keep highest confidence score
-        if sighting.get('confidence_score'):
-            current_conf = merged.get('confidence_score', 0)
-            new_conf = sighting['confidence_score']
-            if new_conf > current_conf:
-                merged['confidence_score'] = new_conf
-                updates.add('confidence_score')
-        
-        # Combine source URLs
-        if sighting.get('source_url'):
-            current_url = merged.get('source_url', '')
-            new_url = sighting['source_url']
-            if new_url not in current_url:
-                if current_url:
-                    merged['source_url'] = f"{current_url}; {new_url}"
-                else:
-                    merged['source_url'] = new_url
-                updates.add('source_url')
-    
-    # Update content hash
-    merged['content_hash'] = generate_content_hash(merged)
-    
-    # Update timestamps
-    merged['updated_at'] = datetime.now().isoformat()
+def link_group(sightings: List[Dict]) -> Optional[str]:
+    """
+    Put a group of duplicate sightings (oldest first) into one cluster.
+
+    The group joins the cluster of its oldest clustered member, or a new
+    one; other clusters it touches are merged into it by a single
+    merge_sighting_clusters call.
+
+    Returns:
+        The group's cluster id, or None if it was already one cluster
+    """
+    cluster_ids = [s['cluster_id'] for s in sightings if s.get('cluster_id')]
+    unclustered = [s['id'] for s in sightings if not s.get('cluster_id')]
+    if not unclustered and len(set(cluster_ids)) == 1:
+        return None
     
-    return merged, updates
+    target = cluster_ids[0] if cluster_ids else str(uuid.uuid4())
+    supabase.rpc('merge_sighting_clusters', {
+        'target': target,
+        'cluster_ids': sorted(set(cluster_ids) - {target}),
+        'sighting_ids': unclustered
+    }).execute()
+    return target
 
 def main():
     """Main deduplication process."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--window-days', type=int, default=DEFAULT_WINDOW_DAYS,
+                        help=f"Maximum days between duplicate sightings (default: {DEFAULT_WINDOW_DAYS})")
+    parser.add_argument('--max-distance-miles', type=float, default=DEFAULT_MAX_DISTANCE_MILES,
+                        help=f"Cap on the combined confidence radius (default: {DEFAULT_MAX_DISTANCE_MILES})")
+    parser.add_argument('--rescan', action='store_true',
+                        help="Cluster the whole table instead of using the clusters maintained at ingest")
+    parser.add_argument('--all-clusters', action='store_true',
+                        help="Read every cluster, not just those touched since the last run")
+    parser.add_argument('--state-file', type=Path, default=DEFAULT_STATE_FILE,
+                        help=f"Where the last run time is kept (default: {DEFAULT_STATE_FILE})")
+    args = parser.parse_args()
+    
     logger.info("Starting sighting deduplication process...")
+    started_at = datetime.now(timezone.utc).isoformat()
+    since = None if args.rescan or args.all_clusters else load_last_run(args.state_file)
     
     # Find duplicate groups
-    duplicate_groups = find_duplicate_groups()
+    duplicate_groups = find_duplicate_groups(args.window_days, args.max_distance_miles, args.rescan, since)
     
     if not duplicate_groups:
         logger.info("No duplicates found!")
+        save_last_run(args.state_file, started_at)
         return
     
     # Process each duplicate group
-    total_deleted = 0
-    total_merged = 0
+    total_linked = 0
+    total_reports = 0
     merge_log = []
+    failed_groups = 0
     
     for group_key, sightings in duplicate_groups.items():
         if len(sightings) < 2:
             continue
         
-        # Sort by created_at to keep oldest
+        # Sort by created_at so the oldest cluster is kept
         sightings.sort(key=lambda x: x.get('created_at', ''))
         
         # Log the group
         species, location, date = group_key.split('|')
-        logger.info(f"\nProcessing {len(sightings)} duplicates: {species} at {location} on {date}")
-        
-        # Check if they're truly duplicates or just similar
         unique_sources = set(s.get('source_type') for s in sightings)
-        
+        logger.info(f"\nProcessing {len(sightings)} duplicates: {species} at {location} on {date}")
         if len(unique_sources) > 1:
-            # Different sources - might be legitimate different sightings
-            logger.warning(f"  Multiple sources found: {unique_sources} - skipping merge")
-            continue
-        
-        # Merge the sightings
-        merged_sighting, updated_fields = merge_sighting_data(sightings)
-        
-        # Keep the first (oldest) sighting and update it
-        keep_id = sightings[0]['id']
-        delete_ids = [s['id'] for s in sightings[1:]]
+            logger.info(f"  Confirmed by multiple sources: {unique_sources}")
         
-        # Update the keeper with merged data
         try:
-            # Remove fields that can't be updated
-            update_data = merged_sighting.copy()
-            for field in ['id', 'created_at']:
-                update_data.pop(field, None)
-            
-            response = supabase.table('sightings') \
-                .update(update_data) \
-                .eq('id', keep_id) \
-                .execute()
-            
-            if response.data:
-                logger.success(f"  Updated sighting {keep_id} with fields: {updated_fields}")
-                total_merged += 1
-                
-                # Delete the duplicates
-                for delete_id in delete_ids:
-                    del_response = supabase.table('sightings') \
-                        .delete() \
-                        .eq('id', delete_id) \
-                        .execute()
-                    
-                    if del_response.data:
-                        total_deleted += 1
-                        logger.debug(f"  Deleted duplicate {delete_id}")
-                
-                merge_log.append({
-                    'group': group_key,
-                    'kept_id': keep_id,
-                    'deleted_ids': delete_ids,
-                    'updated_fields': list(updated_fields),
-                    'sources': list(unique_sources)
-                })
-                
+            cluster_id = link_group(sightings)
         except Exception as e:
-            logger.error(f"  Failed to merge group: {e}")
+            logger.error(f"  Failed to link group: {e}")
+            failed_groups += 1
+            continue
+        
+        if cluster_id is None:
+            logger.debug("  Already one canonical sighting")
+            continue
+        
+        logger.success(f"  Linked {len(sightings)} reports into canonical sighting {cluster_id}")
+        total_linked += 1
+        total_reports += len(sightings)
+        merge_log.append({
+            'group': group_key,
+            'cluster_id': cluster_id,
+            'sighting_ids': [s['id'] for s in sightings],
+            'sources': sorted(str(source) for source in unique_sources)
+        })
     
     # Generate summary report
     logger.info(f"\n{'='*60}")
     logger.info("DEDUPLICATION COMPLETE")
     logger.info(f"{'='*60}")
     logger.info(f"Total groups processed: {len(duplicate_groups)}")
-    logger.info(f"Sightings merged: {total_merged}")
-    logger.info(f"Duplicates deleted: {total_deleted}")
+    logger.info(f"Canonical sightings linked: {total_linked}")
+    logger.info(f"Reports linked: {total_reports}")
     
     # Save merge log
     if merge_log:
-        import json
         log_file = f"merge_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         with open(log_file, 'w') as f:
             json.dump({
                 'timestamp': datetime.now().isoformat(),
                 'total_groups': len(duplicate_groups),
-                'merged': total_merged,
-                'deleted': total_deleted,
+                'linked': total_linked,
+                'reports': total_reports,
                 'merges': merge_log
             }, f, indent=2)
         logger.info(f"\nMerge log saved to: {log_file}")
     
+    # Groups that failed to link are read again next run
+    if failed_groups:
+        logger.warning(f"{failed_groups} groups failed to link; not advancing {args.state_file}")
+    else:
+        save_last_run(args.state_file, started_at)
+    
     # Add content hashes for records that don't have them
     logger.info("\nAdding content hashes to records without them...")
     
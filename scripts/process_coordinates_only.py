@@ -15,6 +15,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 from supabase import create_client
 from openai import OpenAI
+from processors.gazetteer import Gazetteer
 
 load_dotenv()
 
@@ -188,21 +189,40 @@ def main():
     
     logger.info(f"Processing {len(all_sightings)} sightings for coordinates...")
     
-    # Process in batches
-    batch_size = 5
     coordinate_updates = []
     start_time = time.time()
     
-    for i in range(0, len(all_sightings), batch_size):
-        batch = all_sightings[i:i + batch_size]
+    # Resolve known place names locally; only gazetteer misses go to the LLM
+    gazetteer = Gazetteer()
+    llm_sightings = []
+    for sighting in all_sightings:
+        geo = gazetteer.geocode(sighting['location_name'])
+        if geo:
+            coordinate_updates.append({
+                'id': sighting['id'],
+                'location_name': sighting['location_name'],
+                'species': sighting['species'],
+                'coordinates': geo['coordinates']
+            })
+        else:
+            llm_sightings.append(sighting)
+    
+    logger.info(f"Gazetteer resolved {len(coordinate_updates)} sightings; "
+                f"{len(llm_sightings)} need LLM geocoding")
+    
+    # Process in batches
+    batch_size = 5
+    
+    for i in range(0, len(llm_sightings), batch_size):
+        batch = llm_sightings[i:i + batch_size]
         batch_num = i // batch_size + 1
-        total_batches = (len(all_sightings) + batch_size - 1) // batch_size
+        total_batches = (len(llm_sightings) + batch_size - 1) // batch_size
         
         if batch_num % 10 == 1:
             elapsed = time.time() - start_time
             rate = i / elapsed if elapsed > 0 else 0
-            eta = (len(all_sightings) - i) / rate if rate > 0 else 0
-            logger.info(f"Progress: Batch {batch_num}/{total_batches} ({i}/{len(all_sightings)}) - ETA: {eta/60:.1f} min")
+            eta = (len(llm_sightings) - i) / rate if rate > 0 else 0
+            logger.info(f"Progress: Batch {batch_num}/{total_batches} ({i}/{len(llm_sightings)}) - ETA: {eta/60:.1f} min")
         
         results = process_batch_for_coordinates(batch)
         if results:
@@ -210,7 +230,7 @@ def main():
             logger.debug(f"Batch {batch_num}: {len(results)} coordinates extracted")
         
         # Rate limit
-        if i + batch_size < len(all_sightings):
+        if i + batch_size < len(llm_sightings):
             time.sleep(1.5)
     
     # Generate results
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Run Reddit ingestion as a long-lived streaming daemon.
+
+New posts and comments in the configured subreddits are keyword-prefiltered,
+analyzed by the LLM validator and saved to the database within about a
+minute of being posted. Stop with Ctrl+C or SIGTERM; queued work is flushed
+and the checkpoint saved, and the next start resumes from it.
+
+Usage:
+    python scripts/reddit_stream_daemon.py [--subreddits a,b] [--workers N] [--no-catch-up]
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+from loguru import logger
+
+from scrapers.reddit_scraper import RedditScraper
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--subreddits', default=None,
+                        help="Comma-separated subreddits (default: RedditScraper.SUBREDDITS)")
+    parser.add_argument('--workers', type=int, default=2, help="LLM analysis threads")
+    parser.add_argument('--queue-size', type=int, default=100, help="Capacity of each stage queue")
+    parser.add_argument('--save-batch-size', type=int, default=25, help="Sightings per database write")
+    parser.add_argument('--no-catch-up', action='store_true',
+                        help="Do not sweep posts made since the last checkpoint before streaming")
+    args = parser.parse_args()
+
+    scraper = RedditScraper()
+    if not scraper.reddit:
+        logger.error("Reddit API credentials are required for streaming (REDDIT_CLIENT_ID, ...)")
+        sys.exit(1)
+
+    scraper.stream(
+        catch_up=not args.no_catch_up,
+        subreddits=[s.strip() for s in args.subreddits.split(',')] if args.subreddits else None,
+        analysis_workers=args.workers,
+        queue_size=args.queue_size,
+        save_batch_size=args.save_batch_size
+    )
+
+
+if __name__ == "__main__":
+    main()
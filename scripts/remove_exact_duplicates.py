@@ -2,9 +2,14 @@
 """
 Remove exact duplicates based on raw_text content.
 More aggressive deduplication for sources with clear duplicates.
+
+With the ingest-time dedup index in place (INGEST_DEDUP), identical texts
+of one species always share a duplicate cluster, so only clustered
+sightings are read; --rescan reads the whole table instead.
 """
 import os
 import sys
+import argparse
 from datetime import datetime
 from typing import List, Dict
 
@@ -22,8 +27,14 @@ supabase = create_client(
     os.getenv('SUPABASE_KEY')
 )
 
-def remove_exact_text_duplicates():
-    """Remove exact text duplicates, keeping the oldest record."""
+def remove_exact_text_duplicates(rescan: bool = False):
+    """
+    Remove exact text duplicates, keeping the oldest record.
+
+    Args:
+        rescan: Read the whole table instead of only the sightings the
+            ingest-time dedup put in a cluster
+    """
     logger.info("Finding exact text duplicates...")
     
     # First, get all duplicates grouped by raw_text
@@ -31,8 +42,10 @@ def remove_exact_text_duplicates():
     offset = 0
     
     while True:
-        response = supabase.table('sightings') \
-            .select("*") \
+        query = supabase.table('sightings').select("*")
+        if not rescan:
+            query = query.not_.is_('cluster_id', 'null')
+        response = query \
             .order('created_at', desc=False) \
             .range(offset, offset + 999) \
             .execute()
@@ -45,14 +58,15 @@ def remove_exact_text_duplicates():
     
     logger.info(f"Loaded {len(all_sightings)} total sightings")
     
-    # Group by raw_text
+    # Group by raw_text (within a duplicate cluster unless rescanning)
     text_groups = {}
     for sighting in all_sightings:
         text = sighting.get('raw_text', '')
         if text:  # Only process non-empty texts
-            if text not in text_groups:
-                text_groups[text] = []
-            text_groups[text].append(sighting)
+            key = text if rescan else (sighting['cluster_id'], text)
+            if key not in text_groups:
+                text_groups[key] = []
+            text_groups[key].append(sighting)
     
     # Find duplicates
     duplicate_groups = {
@@ -67,7 +81,8 @@ def remove_exact_text_duplicates():
     total_deleted = 0
     deletion_log = []
     
-    for text, sightings in duplicate_groups.items():
+    for key, sightings in duplicate_groups.items():
+        text = key if rescan else key[1]
         # Sort by created_at to keep oldest
         sightings.sort(key=lambda x: x.get('created_at', ''))
         
@@ -172,10 +187,15 @@ def remove_null_text_duplicates():
 
 def main():
     """Main deduplication process."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rescan', action='store_true',
+                        help="Read the whole table instead of the clusters maintained at ingest")
+    args = parser.parse_args()
+    
     logger.info("Starting aggressive deduplication process...")
     
     # Remove exact text duplicates
-    remove_exact_text_duplicates()
+    remove_exact_text_duplicates(args.rescan)
     
     # Remove null text duplicates
     remove_null_text_duplicates()
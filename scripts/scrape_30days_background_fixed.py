@@ -8,7 +8,6 @@ import sys
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from supabase import create_client
 from loguru import logger
 import time
 from dotenv import load_dotenv
@@ -19,6 +18,8 @@ load_dotenv()
 sys.path.append(str(Path(__file__).parent.parent))
 
 from processors.gmu_processor import GMUProcessor
+from scrapers.database_saver import sighting_content_hash
+from scrapers.supabase_writer import SupabaseSightingWriter, get_supabase_client
 
 # Initialize GMU processor
 gmu_processor = GMUProcessor()
@@ -38,6 +39,7 @@ os.environ['GOOGLE_PLACES_API_KEY'] = os.getenv('GOOGLE_PLACES_API_KEY', '')
 # Supabase
 SUPABASE_URL = os.getenv('SUPABASE_URL', 'https://rvrdbtrxwndeerqmziuo.supabase.co')
 SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_KEY', '')
+os.environ.setdefault('SUPABASE_URL', SUPABASE_URL)
 
 # Configure logging
 logger.add("logs/background_scrape_fixed_{time}.log", rotation="1 day")
@@ -65,10 +67,10 @@ def save_progress(progress):
     with open(PROGRESS_FILE, 'w') as f:
         json.dump(progress, f, indent=2)
 
-def store_sighting(supabase, sighting_data, source_type):
-    """Store a sighting with proper geometry formatting."""
+def build_record(sighting_data, source_type):
+    """Map a sighting to a Supabase row with proper geometry formatting (None if unusable)."""
     try:
-        logger.debug(f"Storing {source_type} sighting: {json.dumps(sighting_data, default=str)[:200]}...")
+        logger.debug(f"Preparing {source_type} sighting: {json.dumps(sighting_data, default=str)[:200]}...")
         # Parse date
         sighting_date = sighting_data.get('date') or sighting_data.get('sighting_date') or datetime.now().date()
         if isinstance(sighting_date, str):
@@ -143,22 +145,34 @@ def store_sighting(supabase, sighting_data, source_type):
         if lat and lon:
             data['location'] = f"POINT({float(lon)} {float(lat)})"
         
-        # Check if exists
-        if data['source_url']:
-            existing = supabase.table('sightings').select('id').eq('source_url', data['source_url']).execute()
-            if not existing.data:
-                result = supabase.table('sightings').insert(data).execute()
-                logger.info(f"✓ Stored: {data['species']} at {location_name or 'Unknown'} on {sighting_date}")
-                return True
-            else:
-                logger.debug(f"Skipping duplicate: {data['source_url']}")
-        else:
+        if not data['source_url']:
             logger.warning(f"No URL for sighting: {data['species']} from {source_type}")
+            return None
+        
+        data['content_hash'] = sighting_content_hash(data)
+        return data
             
     except Exception as e:
-        logger.error(f"Error storing {source_type} sighting: {e}")
+        logger.error(f"Error preparing {source_type} sighting: {e}")
         logger.debug(f"Sighting data: {sighting_data}")
-    return False
+    return None
+
+def store_sightings(supabase, sightings, source_type):
+    """
+    Store sightings with one chunked upsert; duplicates are skipped by content hash.
+    
+    Returns:
+        Number of sightings stored
+    """
+    records = [record for record in (build_record(s, source_type) for s in sightings) if record]
+    if not records:
+        return 0
+    try:
+        result = SupabaseSightingWriter(supabase).write(records, source_type)
+    except Exception as e:
+        logger.error(f"Error storing {source_type} sightings: {e}")
+        return 0
+    return result['saved']
 
 class ProgressTrackingRedditScraper:
     """Reddit scraper that saves sightings immediately and tracks progress."""
@@ -193,12 +207,9 @@ class ProgressTrackingRedditScraper:
             # Scrape subreddit
             sightings = self.scraper._scrape_subreddit(subreddit, lookback_days=lookback_days)
             
-            # Save each sighting immediately
-            stored_count = 0
-            for sighting in sightings:
-                if store_sighting(self.supabase, sighting, 'reddit'):
-                    stored_count += 1
-                    total_stored += 1
+            # Save the subreddit's sightings immediately
+            stored_count = store_sightings(self.supabase, sightings, 'reddit')
+            total_stored += stored_count
             
             # Update progress
             self.progress['reddit']['posts_processed'] += 100  # Approximate
@@ -219,7 +230,7 @@ def main():
     """Run the background scraper with fixed geometry."""
     try:
         # Initialize Supabase
-        supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+        supabase = get_supabase_client()
         logger.info("Connected to Supabase")
         
         # Initialize progress
@@ -242,10 +253,7 @@ def main():
             inaturalist_scraper = INaturalistScraper()
             observations = inaturalist_scraper.scrape(lookback_days=30)
             
-            stored_count = 0
-            for obs in observations:
-                if store_sighting(supabase, obs, 'inaturalist'):
-                    stored_count += 1
+            stored_count = store_sightings(supabase, observations, 'inaturalist')
             
             progress['inaturalist']['status'] = 'completed'
             progress['inaturalist']['observations_processed'] = len(observations)
@@ -265,10 +273,7 @@ def main():
             places_scraper = GooglePlacesScraper()
             wildlife_areas = places_scraper.scrape(lookback_days=30)
             
-            stored_count = 0
-            for area in wildlife_areas:
-                if store_sighting(supabase, area, 'google_places'):
-                    stored_count += 1
+            stored_count = store_sightings(supabase, wildlife_areas, 'google_places')
             
             progress['google_places']['status'] = 'completed'
             progress['google_places']['places_processed'] = len(wildlife_areas)
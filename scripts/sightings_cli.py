@@ -15,13 +15,16 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from loguru import logger
 
-from scrapers import FourteenersRealScraper, RedditScraper
-from processors import GMUProcessor, TrailProcessor
+from scrapers import create_scraper
+
+# Scraper modules and the geospatial stack are imported on first use, so
+# --help and --no-scrape runs start quickly
+DEFAULT_SOURCES = '14ers,reddit'
 
 console = Console()
 
-def map_sighting_to_gmu(sighting: Dict[str, Any], trail_processor: TrailProcessor,
-                        gmu_processor: GMUProcessor) -> Optional[str]:
+def map_sighting_to_gmu(sighting: Dict[str, Any], trail_processor: 'TrailProcessor',
+                        gmu_processor: 'GMUProcessor') -> Optional[str]:
     """
     Map a sighting to its GMU based on trail location.
 
@@ -47,22 +50,20 @@ def map_sighting_to_gmu(sighting: Dict[str, Any], trail_processor: TrailProcesso
 
     return None
 
-def run_scrapers(lookback_days: int = 1) -> List[Dict[str, Any]]:
+def run_scrapers(lookback_days: int = 1, sources: str = DEFAULT_SOURCES) -> List[Dict[str, Any]]:
     """
-    Run all enabled scrapers and collect sightings.
+    Run the selected scrapers and collect sightings.
 
     Args:
         lookback_days: Days to look back for content
+        sources: Comma-separated scraper registry names
 
     Returns:
         Combined list of all sightings
     """
     all_sightings = []
 
-    scrapers = [
-        ('14ers.com', FourteenersRealScraper),
-        ('Reddit', RedditScraper)
-    ]
+    scrapers = [name.strip() for name in sources.split(',') if name.strip()]
 
     with Progress(
         SpinnerColumn(),
@@ -70,11 +71,11 @@ def run_scrapers(lookback_days: int = 1) -> List[Dict[str, Any]]:
         console=console
     ) as progress:
 
-        for name, scraper_class in scrapers:
+        for name in scrapers:
             task = progress.add_task(f"Scraping {name}...", total=None)
 
             try:
-                scraper = scraper_class()
+                scraper = create_scraper(name)
                 sightings = scraper.scrape(lookback_days)
                 all_sightings.extend(sightings)
 
@@ -211,7 +212,9 @@ def display_sightings(sightings: List[Dict[str, Any]]):
               help='Days to look back when scraping (default: 1)')
 @click.option('--no-scrape', is_flag=True,
               help='Skip scraping and use cached data')
-def main(date, units, species, lookback, no_scrape):
+@click.option('--sources', default=DEFAULT_SOURCES,
+              help=f'Comma-separated scraper sources (default: {DEFAULT_SOURCES})')
+def main(date, units, species, lookback, no_scrape, sources):
     """
     Hunt Sightings CLI - Query wildlife sightings by date, GMU, and species.
 
@@ -219,7 +222,10 @@ def main(date, units, species, lookback, no_scrape):
         python sightings_cli.py --date yesterday --units 12,201 --species elk
         python sightings_cli.py --date 2025-06-03 --species bear
         python sightings_cli.py --lookback 7
+        python sightings_cli.py --sources inaturalist,observation_org
     """
+    from processors import GMUProcessor, TrailProcessor
+
     console.print("[bold green] Hunting Sightings Channel CLI[/bold green]\n")
 
     # Load processors
@@ -242,7 +248,7 @@ def main(date, units, species, lookback, no_scrape):
         sightings = []
     else:
         console.print(f"Scraping sources (looking back {lookback} days)...\n")
-        sightings = run_scrapers(lookback)
+        sightings = run_scrapers(lookback, sources)
 
     # Map sightings to GMUs
     console.print("\nMapping sightings to GMUs...")
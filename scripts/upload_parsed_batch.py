@@ -10,6 +10,9 @@ from pathlib import Path
 from supabase import create_client
 from loguru import logger
 from dotenv import load_dotenv
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.post_cache import open_post_cache
 
 # Load environment variables
 load_dotenv()
@@ -71,7 +74,7 @@ def prepare_sighting_record(sighting):
         return None
 
 def upload_sightings():
-    """Upload sightings from parsed_posts.json to Supabase using batch operations."""
+    """Upload sightings from the parsed-post cache to Supabase using batch operations."""
     
     # Initialize Supabase
     if not SUPABASE_SERVICE_KEY:
@@ -81,15 +84,14 @@ def upload_sightings():
     supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
     logger.info(f"Connected to Supabase at {SUPABASE_URL}")
     
-    # Load parsed posts
-    cache_file = Path("data/cache/parsed_posts.json")
-    if not cache_file.exists():
-        logger.error(f"Cache file not found: {cache_file}")
+    # Load parsed posts (SQLite store, importing any legacy parsed_posts.json)
+    cache_dir = Path("data/cache")
+    if not cache_dir.exists():
+        logger.error(f"Cache directory not found: {cache_dir}")
         return
     
-    logger.info(f"Loading parsed posts from {cache_file}")
-    with open(cache_file, 'r') as f:
-        parsed_posts = json.load(f)
+    parsed_posts = open_post_cache(cache_dir)
+    logger.info(f"Loading parsed posts from {parsed_posts.cache_file}")
     
     # Extract all sightings with source URLs
     all_sightings = []
@@ -87,13 +87,19 @@ def verify_all_gmus():
     # Test 10 random GMUs
     test_gmus = random.sample(list(gmu_bounds.keys()), min(10, len(gmu_bounds)))
     
-    for gmu_id in sorted(test_gmus):
+    test_gmus = sorted(test_gmus)
+    
+    # Test if each center point maps back to the same GMU
+    mapped_gmus = gmu_processor.find_gmus_for_points(
+        [gmu_bounds[gmu_id]['center_lat'] for gmu_id in test_gmus],
+        [gmu_bounds[gmu_id]['center_lon'] for gmu_id in test_gmus]
+    )
+    
+    for gmu_id, mapped_gmu in zip(test_gmus, mapped_gmus):
         bounds = gmu_bounds[gmu_id]
         test_lat = bounds['center_lat']
         test_lon = bounds['center_lon']
         
-        # Test if the center point maps back to the same GMU
-        mapped_gmu = gmu_processor.find_gmu_for_point(test_lat, test_lon)
         status = "✓ PASS" if str(mapped_gmu) == str(gmu_id) else "✗ FAIL"
         
         table.add_row(
@@ -174,8 +180,12 @@ def test_known_colorado_locations(gmu_processor):
     
     gmu_set = set()
     
-    for i, (name, lat, lon) in enumerate(test_locations):
-        gmu = gmu_processor.find_gmu_for_point(lat, lon)
+    gmus = gmu_processor.find_gmus_for_points(
+        [lat for _, lat, _ in test_locations],
+        [lon for _, _, lon in test_locations]
+    )
+    
+    for i, ((name, lat, lon), gmu) in enumerate(zip(test_locations, gmus)):
         if gmu:
             gmu_set.add(gmu)
         